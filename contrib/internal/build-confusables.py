@@ -6,6 +6,10 @@ from unicode.org and generate a mapping of confusables that we want to scan
 for when displaying diffs. The result will be a new
 :file:`reviewboard/codesafety/_unicode_confusables.py` file.
 
+Version Changed:
+    6.0:
+    Updated to generate a compact, array-backed table of confusables.
+
 Version Changed:
     5.0.2:
     Updated to generate mappings of languages (aliases) to code ranges, and
@@ -67,6 +71,11 @@ scripts_dir = os.path.abspath(os.path.dirname(__file__))
 dest_filename = os.path.abspath(os.path.join(
     scripts_dir, '..', '..', 'reviewboard', 'codesafety', '_confusables.py'))
 
+sys.path.insert(0, os.path.abspath(os.path.join(scripts_dir, '..', '..')))
+
+from reviewboard.codesafety.confusables import \
+    ConfusablesTable  # noqa: E402
+
 
 categories_data: Dict[str, Any] = {}
 aliases: Dict[str, List[str]] = {}
@@ -377,25 +386,63 @@ def update_confusables() -> List[ConfusableEntry]:
     return confusables
 
 
-def build_confusables_file() -> None:
-    """Build the confusables file.
+def write_confusables_file(
+    filename: str,
+    entries: List[Tuple[str, str, Optional[int]]],
+    alias_names: List[str],
+) -> None:
+    """Write the confusables module.
 
-    This will generate :file:`reviewboard/codesafety/_unicode_confusables.py`.
-    It will contain a dictionary mapping the confusables that we've decided
-    to look for in source code.
+    The confusables are written as parallel arrays: a string of the
+    confusable characters (sorted by codepoint), a string of the characters
+    they're confused with, and a :py:class:`bytes` of language IDs. These
+    are wrapped in a
+    :py:class:`~reviewboard.codesafety.confusables.ConfusablesTable`.
 
-    Raises:
-        RuntimeError:
-            This cannot be run on the current version of Python.
+    Version Added:
+        6.0
+
+    Args:
+        filename (str):
+            The path to the module to write.
+
+        entries (list of tuple):
+            The confusables, sorted by codepoint. Each is a 3-tuple of the
+            confusable character, the character it's confused with, and the
+            index of its alias in ``alias_names`` (or ``None``).
+
+        alias_names (list of str):
+            The human-readable names of the aliases that can be customized.
     """
-    build_categories()
-    confusables = update_confusables()
+    assert len(alias_names) < ConfusablesTable.NO_LANG_ID
 
-    found_aliases_map: Dict[str, int] = {}
+    chars = ''.join(
+        _entry[0]
+        for _entry in entries
+    )
+    confused_with = ''.join(
+        _entry[1]
+        for _entry in entries
+    )
+    lang_ids = bytes(
+        ConfusablesTable.NO_LANG_ID if _entry[2] is None else _entry[2]
+        for _entry in entries
+    )
 
-    filename = os.path.abspath(os.path.join(
-        __file__, '..', '..', '..', 'reviewboard', 'codesafety',
-        '_unicode_confusables.py'))
+    def _write_chunks(fp, name, type_name, data):
+        # Split the data across lines, keeping each line within 79
+        # characters once escaped.
+        fp.write('%s: %s = (\n' % (name, type_name))
+
+        start = 0
+
+        for i in range(len(data)):
+            if len(ascii(data[start:i + 1])) > 74:
+                fp.write('    %s\n' % ascii(data[start:i]))
+                start = i
+
+        fp.write('    %s\n' % ascii(data[start:]))
+        fp.write(')\n')
 
     with open(filename, 'w') as fp:
         fp.write('# coding: utf-8\n')
@@ -405,52 +452,83 @@ def build_confusables_file() -> None:
         fp.write('# To update this file, run '
                  './contrib/internal/build-confusables.py\n')
         fp.write('\n')
-        fp.write('from typing import Dict, Optional, Tuple\n')
+        fp.write('from typing import Dict, Tuple\n')
         fp.write('\n')
-        fp.write('from typing_extensions import TypeAlias\n')
+        fp.write('from reviewboard.codesafety.confusables import '
+                 'ConfusablesTable\n')
         fp.write('\n')
         fp.write('\n')
-        fp.write('ConfusablesMapValue: TypeAlias ='
-                 ' Tuple[str, Optional[int]]\n')
-        fp.write('ConfusablesMap: TypeAlias ='
-                 ' Dict[str, ConfusablesMapValue]\n')
+        _write_chunks(fp, '_CONFUSABLE_CHARS', 'str', chars)
         fp.write('\n')
+        _write_chunks(fp, '_CONFUSED_WITH_CHARS', 'str', confused_with)
         fp.write('\n')
-        fp.write('COMMON_CONFUSABLES_MAP: ConfusablesMap = {\n')
-
-        alias_index: Optional[int]
-
-        for codepoint, confusable_char, confused_with_char in confusables:
-            alias_id, alias_name = get_alias(codepoint)
-
-            if alias_id in DISPLAY_ALIASES:
-                assert alias_name
-
-                alias_index = found_aliases_map.setdefault(
-                    alias_name, len(found_aliases_map))
-            else:
-                alias_index = None
-
-            fp.write('    %r: (%r, %r),  # %X; %s\n' %
-                     (confusable_char, confused_with_char, alias_index,
-                      codepoint, alias_id))
-
-        fp.write('}\n')
+        _write_chunks(fp, '_LANG_IDS', 'bytes', lang_ids)
+        fp.write('\n')
+        fp.write('COMMON_CONFUSABLES_MAP = ConfusablesTable(\n')
+        fp.write('    chars=_CONFUSABLE_CHARS,\n')
+        fp.write('    confused_with=_CONFUSED_WITH_CHARS,\n')
+        fp.write('    lang_ids=_LANG_IDS)\n')
         fp.write('\n')
         fp.write('CONFUSABLES_ID_TO_ALIAS_MAP: Tuple[str, ...] = (\n')
 
-        for alias_name in found_aliases_map.keys():
+        for alias_name in alias_names:
             fp.write('    %r,\n' % alias_name)
 
         fp.write(')\n')
         fp.write('\n')
         fp.write('CONFUSABLES_ALIAS_TO_ID_MAP: Dict[str, int] = {\n')
 
-        for alias_name, alias_index in found_aliases_map.items():
+        for alias_index, alias_name in enumerate(alias_names):
             fp.write('    %r: %r,\n' % (alias_name, alias_index))
 
         fp.write('}\n')
 
+
+def build_confusables_file() -> None:
+    """Build the confusables file.
+
+    This will generate :file:`reviewboard/codesafety/_unicode_confusables.py`.
+    It will contain a compact table of the confusables that we've decided
+    to look for in source code.
+
+    Version Changed:
+        6.0:
+        The confusables are now written as a compact, array-backed table,
+        rather than a dictionary.
+
+    Raises:
+        RuntimeError:
+            This cannot be run on the current version of Python.
+    """
+    build_categories()
+    confusables = update_confusables()
+
+    found_aliases_map: Dict[str, int] = {}
+    entries: List[Tuple[str, str, Optional[int]]] = []
+
+    filename = os.path.abspath(os.path.join(
+        __file__, '..', '..', '..', 'reviewboard', 'codesafety',
+        '_unicode_confusables.py'))
+
+    alias_index: Optional[int]
+
+    for codepoint, confusable_char, confused_with_char in confusables:
+        alias_id, alias_name = get_alias(codepoint)
+
+        if alias_id in DISPLAY_ALIASES:
+            assert alias_name
+
+            alias_index = found_aliases_map.setdefault(
+                alias_name, len(found_aliases_map))
+        else:
+            alias_index = None
+
+        entries.append((confusable_char, confused_with_char, alias_index))
+
+    write_confusables_file(filename=filename,
+                           entries=entries,
+                           alias_names=list(found_aliases_map.keys()))
+
     print('Wrote Unicode confusables file: %s' % filename)
 
 
@@ -0,0 +1,276 @@
+#!/usr/bin/env python3
+"""Benchmark code safety checks when generating diff chunks.
+
+This generates a large file and a modified version of it, containing a mix
+of ASCII lines and lines with non-ASCII (but safe) characters, and then
+times generating diff chunks for the pair with and without code safety
+checks. It also times
+:py:meth:`~reviewboard.codesafety.checkers.trojan_source.
+TrojanSourceCodeSafetyChecker.check_content` on its own for each line,
+compared to checking each character in turn.
+
+No database access is needed. Default site configuration settings are
+used.
+
+The checker's per-line results cache is cleared before each run, so
+results don't carry over between runs.
+
+Usage:
+    ./contrib/profiling/benchmark_code_safety.py [--lines N] [--repeat N]
+
+Version Added:
+    6.0
+"""
+
+import argparse
+import os
+import random
+import sys
+import timeit
+
+
+scripts_dir = os.path.abspath(os.path.dirname(__file__))
+sys.path.insert(0, os.path.abspath(os.path.join(scripts_dir, '..', '..')))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'reviewboard.settings')
+
+import django  # noqa: E402
+
+django.setup()
+
+from djblets.siteconfig.models import SiteConfiguration  # noqa: E402
+
+from reviewboard.admin.siteconfig import defaults  # noqa: E402
+from reviewboard.codesafety import code_safety_checker_registry  # noqa
+from reviewboard.codesafety._unicode_confusables import (  # noqa: E402
+    COMMON_CONFUSABLES_MAP)
+from reviewboard.diffviewer.chunk_generator import (  # noqa: E402
+    RawDiffChunkGenerator)
+from reviewboard.diffviewer.settings import DiffSettings  # noqa: E402
+
+
+#: Lines with safe non-ASCII characters, mixed in with the ASCII lines.
+NON_ASCII_LINES = [
+    '    # Café naïve über résumé',
+    '    # 日本語のコメント',
+    '    label = "☃ ❤ © 2023"',
+    '    # Спасибо',
+]
+
+
+class NoCodeSafetyChunkGenerator(RawDiffChunkGenerator):
+    """A chunk generator that skips code safety checks."""
+
+    def check_line_code_safety(self, *args, **kwargs):
+        """Return no code safety results.
+
+        Args:
+            *args (tuple, unused):
+                Positional arguments.
+
+            **kwargs (dict, unused):
+                Keyword arguments.
+
+        Returns:
+            list:
+            An empty list.
+        """
+        return []
+
+
+class DefaultSiteConfiguration(object):
+    """A stand-in for the site configuration, using default settings."""
+
+    def get(self, key, default=None):
+        """Return the default value for a setting.
+
+        Args:
+            key (str):
+                The setting key.
+
+            default (object, optional):
+                The value to return if the setting has no default.
+
+        Returns:
+            object:
+            The default value.
+        """
+        return defaults.get(key, default)
+
+
+def iter_unsafe_chars_per_char(line, checks_map):
+    """Check each character in a line for unsafe characters.
+
+    This is how lines were checked before checks were precompiled into a
+    regex, and is used as a point of comparison.
+
+    Args:
+        line (str):
+            The line to check.
+
+        checks_map (dict):
+            The mapping of unsafe Unicode ranges to result IDs.
+
+    Yields:
+        str:
+        The result ID for each unsafe character.
+    """
+    for c in line:
+        if ord(c) < 128:
+            continue
+
+        if c in COMMON_CONFUSABLES_MAP:
+            yield 'confusable'
+        else:
+            codepoint = ord(c)
+
+            for check_range, check_name in checks_map.items():
+                if check_range[0] <= codepoint <= check_range[1]:
+                    yield check_name
+                    break
+
+
+def build_files(num_lines, non_ascii_ratio, seed):
+    """Build the contents of an original and modified file.
+
+    Args:
+        num_lines (int):
+            The number of lines in the original file.
+
+        non_ascii_ratio (float):
+            The fraction of lines containing non-ASCII characters.
+
+        seed (int):
+            The seed used to generate the files.
+
+    Returns:
+        tuple:
+        A 2-tuple of ``(old_lines, new_lines)``.
+    """
+    rand = random.Random(seed)
+    old_lines = []
+
+    for i in range(num_lines):
+        if rand.random() < non_ascii_ratio:
+            old_lines.append(rand.choice(NON_ASCII_LINES))
+        else:
+            old_lines.append('    value_%d = compute(%d, "item %d")'
+                             % (i, i * 7, i))
+
+    new_lines = []
+
+    for line in old_lines:
+        kind = rand.random()
+
+        if kind < 0.05:
+            # Modified.
+            new_lines.append(line + '  # changed')
+        elif kind < 0.07:
+            # Deleted.
+            continue
+        else:
+            new_lines.append(line)
+
+            if kind < 0.09:
+                # Inserted.
+                new_lines.append(rand.choice(NON_ASCII_LINES))
+
+    return old_lines, new_lines
+
+
+def main():
+    """Run the benchmarks."""
+    parser = argparse.ArgumentParser(
+        description='Benchmark code safety checks.')
+    parser.add_argument(
+        '--lines',
+        type=int,
+        default=50000,
+        help='The number of lines in the file being diffed.')
+    parser.add_argument(
+        '--non-ascii-ratio',
+        type=float,
+        default=0.1,
+        help='The fraction of lines containing non-ASCII characters.')
+    parser.add_argument(
+        '--repeat',
+        type=int,
+        default=5,
+        help='The number of times to run each benchmark.')
+    parser.add_argument(
+        '--seed',
+        type=int,
+        default=8142,
+        help='The seed used to generate the files.')
+    options = parser.parse_args()
+
+    # Chunk generation reads from the site configuration. Use the default
+    # settings, rather than loading them from the database.
+    SiteConfiguration.objects.get_current = lambda: DefaultSiteConfiguration()
+
+    old_lines, new_lines = build_files(options.lines,
+                                       options.non_ascii_ratio,
+                                       options.seed)
+    old = '\n'.join(old_lines).encode('utf-8')
+    new = '\n'.join(new_lines).encode('utf-8')
+    all_lines = old_lines + new_lines
+    checker = code_safety_checker_registry.get_checker('trojan_source')
+    diff_settings = DiffSettings(
+        code_safety_configs={},
+        context_num_lines=5,
+        custom_pygments_lexers={},
+        diff_time_budget=0,
+        move_detection_max_lines=0,
+        include_space_patterns=[],
+        paginate_by=20,
+        paginate_orphans=10,
+        syntax_highlighting=False,
+        syntax_highlighting_threshold=0)
+
+    def _run_chunks(generator_cls):
+        checker._get_line_check_names.cache_clear()
+
+        generator = generator_cls(old=old,
+                                  new=new,
+                                  orig_filename='file.py',
+                                  modified_filename='file.py',
+                                  diff_settings=diff_settings)
+
+        return list(generator.get_chunks_uncached())
+
+    def _run_check_lines():
+        checker._get_line_check_names.cache_clear()
+
+        for line in all_lines:
+            checker.check_content(content_items=[{
+                'path': 'file.py',
+                'lines': [line],
+            }])
+
+    def _run_check_lines_per_char():
+        checks_map = checker._get_unsafe_unicode_check_map()
+
+        for line in all_lines:
+            set(iter_unsafe_chars_per_char(line, checks_map))
+
+    print('%d lines on the left, %d lines on the right, %d%% non-ASCII'
+          % (len(old_lines), len(new_lines),
+             options.non_ascii_ratio * 100))
+    print()
+    print('%-40s %12s' % ('Benchmark', 'Best (ms)'))
+
+    benchmarks = (
+        ('Chunks without code safety checks',
+         lambda: _run_chunks(NoCodeSafetyChunkGenerator)),
+        ('Chunks with code safety checks',
+         lambda: _run_chunks(RawDiffChunkGenerator)),
+        ('Check each line', _run_check_lines),
+        ('Check each line per character', _run_check_lines_per_char),
+    )
+
+    for label, func in benchmarks:
+        best = min(timeit.repeat(func, number=1, repeat=options.repeat))
+        print('%-40s %12.2f' % (label, best * 1000))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""Benchmark the differs against the diffviewer test data.
+
+This runs each :py:class:`~reviewboard.diffviewer.differ.DifferEngine` and
+the histogram differ over the old/new file pairs in
+:file:`reviewboard/diffviewer/testdata`, verifies that all Myers engines
+produce identical opcodes and that the histogram differ's opcodes are valid,
+and reports the timings and number of changed lines.
+
+Pairs of files are found by looking for ``*-old.*`` and ``*-new.*`` files in
+each directory. Use ``--scale`` to repeat the contents of each file, in order
+to simulate very large files.
+
+Usage:
+    ./contrib/profiling/benchmark_differs.py [--scale N] [--repeat N]
+
+Version Added:
+    6.0
+"""
+
+import argparse
+import os
+import sys
+import timeit
+
+
+scripts_dir = os.path.abspath(os.path.dirname(__file__))
+sys.path.insert(0, os.path.abspath(os.path.join(scripts_dir, '..', '..')))
+
+from reviewboard.diffviewer.differ import (DiffCompatVersion,  # noqa: E402
+                                           DifferEngine,
+                                           get_differ)
+
+
+TESTDATA_DIR = os.path.abspath(os.path.join(
+    scripts_dir, '..', '..', 'reviewboard', 'diffviewer', 'testdata'))
+
+
+def find_file_pairs(path):
+    """Yield all old/new file pairs in the test data directory.
+
+    Args:
+        path (str):
+            The path to the test data directory.
+
+    Yields:
+        tuple:
+        A 3-tuple of ``(name, old_path, new_path)``.
+    """
+    for dirpath, dirnames, filenames in sorted(os.walk(path)):
+        for filename in sorted(filenames):
+            if '-old.' not in filename:
+                continue
+
+            new_filename = filename.replace('-old.', '-new.')
+
+            if new_filename in filenames:
+                yield (os.path.relpath(os.path.join(dirpath, filename), path),
+                       os.path.join(dirpath, filename),
+                       os.path.join(dirpath, new_filename))
+
+
+def get_differ_configs():
+    """Return the differ configurations to benchmark.
+
+    Returns:
+        list of tuple:
+        A list of ``(label, compat_version, engine)`` tuples. The first item
+        is the configuration other Myers engines are compared to.
+    """
+    configs = [
+        ('myers-%s' % engine, DiffCompatVersion.DEFAULT, engine)
+        for engine in DifferEngine.ALL
+    ]
+    configs.append(('histogram', DiffCompatVersion.HISTOGRAM,
+                    DifferEngine.DEFAULT))
+
+    return configs
+
+
+def check_opcodes(a, b, opcodes):
+    """Return whether opcodes correctly transform one file into another.
+
+    Args:
+        a (list of str):
+            The original lines.
+
+        b (list of str):
+            The modified lines.
+
+        opcodes (list of tuple):
+            The opcodes to check.
+
+    Returns:
+        bool:
+        Whether the opcodes are valid.
+    """
+    i = j = 0
+
+    for tag, i1, i2, j1, j2 in opcodes:
+        if i1 != i or j1 != j:
+            return False
+
+        if tag == 'equal':
+            # Leading whitespace is ignored when comparing lines.
+            if ([line.lstrip() for line in a[i1:i2]] !=
+                [line.lstrip() for line in b[j1:j2]]):
+                return False
+        elif tag == 'replace':
+            if i2 - i1 != j2 - j1:
+                return False
+
+        i = i2
+        j = j2
+
+    return i == len(a) and j == len(b)
+
+
+def load_lines(path, scale):
+    """Load the lines from a file.
+
+    Args:
+        path (str):
+            The path to the file.
+
+        scale (int):
+            The number of times to repeat the file's contents.
+
+    Returns:
+        list of str:
+        The lines of the file.
+    """
+    with open(path, 'r', encoding='utf-8') as fp:
+        lines = fp.read().splitlines()
+
+    return lines * scale
+
+
+def main():
+    """Run the benchmarks."""
+    parser = argparse.ArgumentParser(
+        description='Compare the performance of the differs.')
+    parser.add_argument(
+        '--scale',
+        type=int,
+        default=1,
+        help='The number of times to repeat the contents of each file.')
+    parser.add_argument(
+        '--repeat',
+        type=int,
+        default=5,
+        help='The number of times to run each benchmark.')
+    parser.add_argument(
+        '--testdata',
+        default=TESTDATA_DIR,
+        help='The directory containing old/new file pairs.')
+    options = parser.parse_args()
+
+    configs = get_differ_configs()
+
+    print('%-40s %10s %16s %12s %10s'
+          % ('File', 'Lines', 'Differ', 'Best (ms)', 'Changed'))
+
+    for name, old_path, new_path in find_file_pairs(options.testdata):
+        a = load_lines(old_path, options.scale)
+        b = load_lines(new_path, options.scale)
+        expected = None
+
+        for label, compat_version, engine in configs:
+            def _run():
+                differ = get_differ(
+                    a, b,
+                    ignore_space=True,
+                    compat_version=compat_version,
+                    engine=engine)
+                differ.add_interesting_lines_for_headers(old_path)
+
+                return list(differ.get_opcodes())
+
+            opcodes = _run()
+            best = min(timeit.repeat(_run, number=1,
+                                     repeat=options.repeat))
+            changed = sum(
+                max(i2 - i1, j2 - j1)
+                for tag, i1, i2, j1, j2 in opcodes
+                if tag != 'equal'
+            )
+
+            print('%-40s %10d %16s %12.2f %10d'
+                  % (name, max(len(a), len(b)), label, best * 1000,
+                     changed))
+
+            if compat_version in DiffCompatVersion.MYERS_VERSIONS:
+                if expected is None:
+                    expected = opcodes
+                elif opcodes != expected:
+                    sys.stderr.write('Opcodes for differ "%s" differ from '
+                                     '"%s" on %s!\n'
+                                     % (label, configs[0][0], name))
+                    sys.exit(1)
+
+            if not check_opcodes(a, b, opcodes):
+                sys.stderr.write('Opcodes for differ "%s" are invalid on '
+                                 '%s!\n'
+                                 % (label, name))
+                sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,826 @@
+#!/usr/bin/env python3
+"""Benchmark the stages of the diff viewer.
+
+This times each stage involved in displaying a diff:
+
+``parse``
+    Parsing a unified diff containing every file with
+    :py:class:`~reviewboard.diffviewer.parser.DiffParser`.
+
+``differ``
+    Generating opcodes for each file with
+    :py:func:`~reviewboard.diffviewer.differ.get_differ`.
+
+``moves``
+    Generating opcodes and detecting moved lines with
+    :py:class:`~reviewboard.diffviewer.opcode_generator.DiffOpcodeGenerator`.
+
+``pygments``
+    Syntax-highlighting both versions of each file.
+
+``code-safety``
+    Running the Trojan Source code safety checker over every line.
+
+``render``
+    Generating chunks and rendering each file with
+    :py:meth:`DiffRenderer.render_to_string
+    <reviewboard.diffviewer.renderers.DiffRenderer.render_to_string>`.
+
+``rows``
+    Rendering each file from previously-generated chunks, reported in
+    rows per second.
+
+``rows-template``
+    The same as ``rows``, but rendering chunks through the template instead
+    of :py:func:`~reviewboard.diffviewer.templatetags.difftags.diff_chunks`,
+    as done for renderers customized by extensions.
+
+``cache``
+    Storing and loading previously-generated lines in the format used for
+    the chunk cache, reported in rows per second.
+
+``intraline``
+    Computing the changed regions for each pair of replaced lines with
+    :py:func:`~reviewboard.diffviewer.diffutils.get_line_changed_regions`,
+    with an empty in-process cache, reported in line pairs per second.
+
+These run over a corpus of generated files, containing modified, inserted,
+deleted and moved lines, along with the old/new file pairs in
+:file:`reviewboard/diffviewer/testdata`. The size of the generated corpus is
+configurable, and it's the same for a given seed.
+
+Results can be saved as JSON with ``--output``, and compared against
+previously-saved results with ``--baseline``. Any benchmark slower than the
+baseline by more than ``--threshold`` is reported as a regression, and the
+script will exit with a non-zero status.
+
+No database access is needed. Default site configuration settings are
+used, FileDiffs are never saved, and nothing is cached between runs.
+
+Usage:
+    ./contrib/profiling/benchmark_diffviewer.py [--files N] [--lines N]
+                                                [--benchmark NAME]
+                                                [--output FILE]
+                                                [--baseline FILE]
+
+Version Added:
+    6.0
+"""
+
+import argparse
+import difflib
+import json
+import os
+import pickle
+import platform
+import random
+import statistics
+import sys
+import timeit
+import zlib
+
+
+scripts_dir = os.path.abspath(os.path.dirname(__file__))
+sys.path.insert(0, os.path.abspath(os.path.join(scripts_dir, '..', '..')))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'reviewboard.settings')
+
+import django  # noqa: E402
+
+django.setup()
+
+import pygments.util  # noqa: E402
+from djblets.siteconfig.models import SiteConfiguration  # noqa: E402
+from pygments import highlight  # noqa: E402
+from pygments.lexers import guess_lexer_for_filename  # noqa: E402
+
+import reviewboard  # noqa: E402
+from reviewboard.admin.siteconfig import defaults  # noqa: E402
+from reviewboard.codesafety import code_safety_checker_registry  # noqa
+from reviewboard.diffviewer import diffutils  # noqa: E402
+from reviewboard.diffviewer.chunk_generator import (  # noqa: E402
+    NoWrapperHtmlFormatter,
+    RawDiffChunkGenerator)
+from reviewboard.diffviewer.chunk_lines import (  # noqa: E402
+    deserialize_lines,
+    serialize_lines)
+from reviewboard.diffviewer.differ import get_differ  # noqa: E402
+from reviewboard.diffviewer.models import FileDiff  # noqa: E402
+from reviewboard.diffviewer.opcode_generator import (  # noqa: E402
+    get_diff_opcode_generator)
+from reviewboard.diffviewer.parser import DiffParser  # noqa: E402
+from reviewboard.diffviewer.renderers import DiffRenderer  # noqa: E402
+from reviewboard.diffviewer.settings import DiffSettings  # noqa: E402
+
+
+TESTDATA_DIR = os.path.abspath(os.path.join(
+    scripts_dir, '..', '..', 'reviewboard', 'diffviewer', 'testdata'))
+
+
+#: The version of the results file format.
+RESULTS_VERSION = 1
+
+
+#: Templates for the lines in generated files.
+LINE_TEMPLATES = [
+    'def function_%(n)d(value, *args, **kwargs):',
+    '    """Compute result %(n)d for the value."""',
+    '    result_%(n)d = compute(value, %(m)d, "item %(n)d")',
+    '    if result_%(n)d > %(m)d:',
+    '        return result_%(n)d * %(m)d',
+    '    # Handle the remaining cases for item %(n)d.',
+    '    items.append({"id": %(n)d, "name": "Item %(n)d"})',
+    '',
+]
+
+
+#: Lines with safe non-ASCII characters, mixed in with the generated lines.
+NON_ASCII_LINES = [
+    '    # Café naïve über résumé',
+    '    # 日本語のコメント',
+    '    label = "☃ ❤ © 2023"',
+    '    # Спасибо',
+]
+
+
+class DefaultSiteConfiguration(object):
+    """A stand-in for the site configuration, using default settings."""
+
+    def get(self, key, default=None):
+        """Return the default value for a setting.
+
+        Args:
+            key (str):
+                The setting key.
+
+            default (object, optional):
+                The value to return if the setting has no default.
+
+        Returns:
+            object:
+            The default value.
+        """
+        return defaults.get(key, default)
+
+
+class CorpusFile(object):
+    """An original and modified file in the benchmark corpus.
+
+    Attributes:
+        filename (str):
+            The name of the file.
+
+        new (bytes):
+            The contents of the modified file.
+
+        new_lines (list of str):
+            The lines of the modified file.
+
+        old (bytes):
+            The contents of the original file.
+
+        old_lines (list of str):
+            The lines of the original file.
+    """
+
+    def __init__(self, filename, old_lines, new_lines):
+        """Initialize the file.
+
+        Args:
+            filename (str):
+                The name of the file.
+
+            old_lines (list of str):
+                The lines of the original file.
+
+            new_lines (list of str):
+                The lines of the modified file.
+        """
+        self.filename = filename
+        self.old_lines = old_lines
+        self.new_lines = new_lines
+        self.old = ''.join('%s\n' % line for line in old_lines).encode('utf-8')
+        self.new = ''.join('%s\n' % line for line in new_lines).encode('utf-8')
+
+    @property
+    def num_lines(self):
+        """The total number of lines in both versions of the file.
+
+        Type:
+            int
+        """
+        return len(self.old_lines) + len(self.new_lines)
+
+
+def build_generated_file(index, num_lines, non_ascii_ratio, rand):
+    """Build a generated file for the corpus.
+
+    The modified file contains a mix of modified, inserted, deleted and
+    moved lines.
+
+    Args:
+        index (int):
+            The index of the file in the corpus.
+
+        num_lines (int):
+            The number of lines in the original file.
+
+        non_ascii_ratio (float):
+            The fraction of lines containing non-ASCII characters.
+
+        rand (random.Random):
+            The random number generator to use.
+
+    Returns:
+        CorpusFile:
+        The generated file.
+    """
+    old_lines = []
+
+    for i in range(num_lines):
+        if rand.random() < non_ascii_ratio:
+            old_lines.append(rand.choice(NON_ASCII_LINES))
+        else:
+            old_lines.append(LINE_TEMPLATES[i % len(LINE_TEMPLATES)] % {
+                'm': rand.randint(0, 1000),
+                'n': i,
+            })
+
+    new_lines = []
+
+    for line in old_lines:
+        kind = rand.random()
+
+        if kind < 0.04:
+            # Modified.
+            new_lines.append(line.replace('result', 'value'))
+        elif kind < 0.06:
+            # Deleted.
+            continue
+        else:
+            new_lines.append(line)
+
+            if kind < 0.08:
+                # Inserted.
+                new_lines.append('    log("inserted %d")' % len(new_lines))
+
+    # Move a few blocks of lines elsewhere in the file.
+    for i in range(max(1, num_lines // 1000)):
+        if len(new_lines) < 40:
+            break
+
+        start = rand.randint(0, len(new_lines) - 20)
+        block = new_lines[start:start + rand.randint(5, 20)]
+        del new_lines[start:start + len(block)]
+
+        dest = rand.randint(0, len(new_lines))
+        new_lines[dest:dest] = block
+
+    return CorpusFile('src/module%d.py' % index, old_lines, new_lines)
+
+
+def find_recorded_files(path):
+    """Return the old/new file pairs in the test data directory.
+
+    Pairs of files are found by looking for ``*-old.*`` and ``*-new.*``
+    files in each directory.
+
+    Args:
+        path (str):
+            The path to the test data directory.
+
+    Returns:
+        list of CorpusFile:
+        The files in the test data directory.
+    """
+    files = []
+
+    for dirpath, dirnames, filenames in sorted(os.walk(path)):
+        for filename in sorted(filenames):
+            if '-old.' not in filename:
+                continue
+
+            new_filename = filename.replace('-old.', '-new.')
+
+            if new_filename in filenames:
+                lines = []
+
+                for name in (filename, new_filename):
+                    with open(os.path.join(dirpath, name), 'r',
+                              encoding='utf-8') as fp:
+                        lines.append(fp.read().splitlines())
+
+                files.append(CorpusFile(
+                    os.path.relpath(
+                        os.path.join(dirpath,
+                                     filename.replace('-old.', '.')),
+                        path),
+                    *lines))
+
+    return files
+
+
+def build_diff(files):
+    """Build a unified diff containing every file in the corpus.
+
+    Args:
+        files (list of CorpusFile):
+            The files in the corpus.
+
+    Returns:
+        bytes:
+        The diff.
+    """
+    diff = []
+
+    for corpus_file in files:
+        diff += difflib.unified_diff(corpus_file.old_lines,
+                                     corpus_file.new_lines,
+                                     fromfile=corpus_file.filename,
+                                     tofile=corpus_file.filename,
+                                     fromfiledate='abc123',
+                                     tofiledate='def456',
+                                     lineterm='')
+
+    return ('\n'.join(diff) + '\n').encode('utf-8')
+
+
+def build_diff_file(index, corpus_file):
+    """Build the diff file information used to render a file.
+
+    This mirrors the information returned by
+    :py:func:`~reviewboard.diffviewer.diffutils.get_diff_files`.
+
+    Args:
+        index (int):
+            The index of the file in the diff.
+
+        corpus_file (CorpusFile):
+            The file to render.
+
+    Returns:
+        dict:
+        The diff file information.
+    """
+    filediff = FileDiff(pk=index + 1,
+                        source_file=corpus_file.filename,
+                        dest_file=corpus_file.filename,
+                        source_revision='abc123',
+                        dest_detail='def456')
+
+    # This is used to generate chunks from the corpus instead of from the
+    # repository.
+    filediff._corpus_file = corpus_file
+
+    return {
+        'base_filediff': None,
+        'binary': False,
+        'chunks_loaded': False,
+        'copied': False,
+        'deleted': False,
+        'depot_filename': corpus_file.filename,
+        'dest_filename': corpus_file.filename,
+        'dest_revision': 'def456',
+        'filediff': filediff,
+        'force_interdiff': False,
+        'index': index,
+        'interfilediff': None,
+        'is_new_file': False,
+        'is_symlink': False,
+        'moved': False,
+        'moved_or_copied': False,
+        'newfile': False,
+        'public': True,
+        'revision': 'abc123',
+    }
+
+
+def get_corpus_chunk_generator(diff_file, *, request, diff_settings):
+    """Return a chunk generator for a file in the corpus.
+
+    This replaces
+    :py:func:`reviewboard.diffviewer.diffutils._get_diff_file_chunk_generator`
+    so that files don't need to be fetched from a repository.
+
+    Args:
+        diff_file (dict):
+            The diff file information.
+
+        request (django.http.HttpRequest, unused):
+            The HTTP request from the client.
+
+        diff_settings (reviewboard.diffviewer.settings.DiffSettings):
+            The settings used to control the display of diffs.
+
+    Returns:
+        reviewboard.diffviewer.chunk_generator.RawDiffChunkGenerator:
+        The chunk generator for the file.
+    """
+    corpus_file = diff_file['filediff']._corpus_file
+
+    return RawDiffChunkGenerator(old=corpus_file.old,
+                                 new=corpus_file.new,
+                                 orig_filename=corpus_file.filename,
+                                 modified_filename=corpus_file.filename,
+                                 diff_settings=diff_settings)
+
+
+class TemplateChunksDiffRenderer(DiffRenderer):
+    """A diff renderer that renders chunks through the template."""
+
+    use_chunks_renderer = False
+
+
+def get_benchmarks(files, diff_settings):
+    """Return the benchmarks to run over a corpus.
+
+    Args:
+        files (list of CorpusFile):
+            The files in the corpus.
+
+        diff_settings (reviewboard.diffviewer.settings.DiffSettings):
+            The settings used to control the display of diffs.
+
+    Returns:
+        dict:
+        A mapping of benchmark names to 3-tuples of ``(func, num_items,
+        item_name)``, where ``func`` runs the benchmark and ``num_items`` is
+        the number of ``item_name`` items it processes.
+    """
+    num_lines = sum(
+        corpus_file.num_lines
+        for corpus_file in files
+    )
+    diff = build_diff(files)
+    checker = code_safety_checker_registry.get_checker('trojan_source')
+    lexers = []
+
+    for corpus_file in files:
+        try:
+            lexer = guess_lexer_for_filename(
+                corpus_file.filename,
+                '\n'.join(corpus_file.old_lines[:100]),
+                stripnl=False,
+                encoding='utf-8')
+        except pygments.util.ClassNotFound:
+            lexer = None
+
+        lexers.append(lexer)
+
+    def _parse():
+        DiffParser(diff).parse_diff()
+
+    def _differ():
+        for corpus_file in files:
+            differ = get_differ(corpus_file.old_lines,
+                                corpus_file.new_lines,
+                                ignore_space=True)
+            differ.add_interesting_lines_for_headers(corpus_file.filename)
+            list(differ.get_opcodes())
+
+    def _moves():
+        for corpus_file in files:
+            differ = get_differ(corpus_file.old_lines,
+                                corpus_file.new_lines,
+                                ignore_space=True)
+            list(get_diff_opcode_generator(differ,
+                                           diff_settings=diff_settings))
+
+    def _pygments():
+        formatter = NoWrapperHtmlFormatter()
+
+        for corpus_file, lexer in zip(files, lexers):
+            if lexer is not None:
+                highlight(corpus_file.old, lexer, formatter)
+                highlight(corpus_file.new, lexer, formatter)
+
+    def _code_safety():
+        checker._get_line_check_names.cache_clear()
+
+        for corpus_file in files:
+            checker.check_content(content_items=[
+                {
+                    'path': corpus_file.filename,
+                    'lines': corpus_file.old_lines,
+                },
+                {
+                    'path': corpus_file.filename,
+                    'lines': corpus_file.new_lines,
+                },
+            ])
+
+    def _render():
+        for i, corpus_file in enumerate(files):
+            renderer = DiffRenderer(build_diff_file(i, corpus_file),
+                                    collapse_all=False,
+                                    allow_caching=False,
+                                    diff_settings=diff_settings)
+            renderer.render_to_string(None)
+
+    # Generate the chunks up-front for rendering rows.
+    diff_files = [
+        build_diff_file(i, corpus_file)
+        for i, corpus_file in enumerate(files)
+    ]
+    diffutils.populate_diff_chunks(files=diff_files,
+                                   diff_settings=diff_settings)
+
+    num_rows = sum(
+        len(chunk['lines'])
+        for diff_file in diff_files
+        for chunk in diff_file['chunks']
+    )
+
+    def _render_rows(renderer_cls):
+        for diff_file in diff_files:
+            renderer = renderer_cls(diff_file,
+                                    collapse_all=False,
+                                    allow_caching=False,
+                                    diff_settings=diff_settings)
+            renderer.render_to_string(None)
+
+    segment_num_lines = RawDiffChunkGenerator.CACHE_SEGMENT_NUM_LINES
+    all_lines = [
+        line
+        for diff_file in diff_files
+        for chunk in diff_file['chunks']
+        for line in chunk['lines']
+    ]
+    segments = [
+        all_lines[i:i + segment_num_lines]
+        for i in range(0, len(all_lines), segment_num_lines)
+    ]
+
+    line_pairs = []
+
+    for corpus_file in files:
+        differ = get_differ(corpus_file.old_lines,
+                            corpus_file.new_lines,
+                            ignore_space=True)
+
+        for tag, i1, i2, j1, j2 in differ.get_opcodes():
+            if tag == 'replace':
+                line_pairs += zip(corpus_file.old_lines[i1:i2],
+                                  corpus_file.new_lines[j1:j2])
+
+    def _intraline():
+        diffutils._get_cached_line_changed_regions.cache_clear()
+
+        for old_line, new_line in line_pairs:
+            diffutils.get_line_changed_regions(old_line, new_line)
+
+    def _cache():
+        # This pickles and compresses the lines the same way as
+        # cache_memoize(..., large_data=True).
+        for segment in segments:
+            data = zlib.compress(pickle.dumps(serialize_lines(segment),
+                                              protocol=0))
+            deserialize_lines(pickle.loads(zlib.decompress(data)))
+
+    return {
+        'parse': (_parse, num_lines, 'lines'),
+        'differ': (_differ, num_lines, 'lines'),
+        'moves': (_moves, num_lines, 'lines'),
+        'pygments': (_pygments, num_lines, 'lines'),
+        'code-safety': (_code_safety, num_lines, 'lines'),
+        'render': (_render, num_lines, 'lines'),
+        'rows': (lambda: _render_rows(DiffRenderer), num_rows, 'rows'),
+        'rows-template': (lambda: _render_rows(TemplateChunksDiffRenderer),
+                          num_rows, 'rows'),
+        'cache': (_cache, num_rows, 'rows'),
+        'intraline': (_intraline, len(line_pairs), 'line pairs'),
+    }
+
+
+def run_benchmarks(names, benchmarks, repeat):
+    """Run benchmarks and return the results.
+
+    Args:
+        names (list of str):
+            The names of the benchmarks to run.
+
+        benchmarks (dict):
+            The benchmarks returned by :py:func:`get_benchmarks`.
+
+        repeat (int):
+            The number of times to run each benchmark.
+
+    Returns:
+        dict:
+        A mapping of benchmark names to results.
+    """
+    results = {}
+
+    for name in names:
+        func, num_items, item_name = benchmarks[name]
+
+        # Run once to warm up any module-level caches and imports.
+        func()
+
+        timings = timeit.repeat(func, number=1, repeat=repeat)
+        best = min(timings)
+        rate = num_items / best if best else 0
+
+        results[name] = {
+            'best': best,
+            'median': statistics.median(timings),
+            '%s_per_second' % item_name: rate,
+        }
+
+        print('%-16s %12.2f %12.2f %12.0f %s/s'
+              % (name, best * 1000, results[name]['median'] * 1000,
+                 rate, item_name))
+
+    return results
+
+
+def compare_results(results, baseline, threshold):
+    """Compare results against a baseline.
+
+    Args:
+        results (dict):
+            The results file data for this run.
+
+        baseline (dict):
+            The results file data for the baseline.
+
+        threshold (float):
+            The fraction a benchmark can be slower than the baseline before
+            it's considered a regression.
+
+    Returns:
+        list of str:
+        The names of any benchmarks that regressed.
+    """
+    if baseline.get('version') != RESULTS_VERSION:
+        sys.stderr.write('The baseline results file is in an unsupported '
+                         'format.\n')
+        sys.exit(1)
+
+    if baseline['corpus'] != results['corpus']:
+        sys.stderr.write('Warning: The baseline was run with a different '
+                         'corpus (%s). Timings may not be comparable.\n'
+                         % json.dumps(baseline['corpus'], sort_keys=True))
+
+    regressions = []
+
+    print()
+    print('%-16s %12s %12s %10s' % ('Benchmark', 'Base (ms)', 'Best (ms)',
+                                    'Change'))
+
+    for name, result in results['results'].items():
+        base_result = baseline['results'].get(name)
+
+        if not base_result:
+            continue
+
+        change = result['best'] / base_result['best'] - 1
+        status = ''
+
+        if change > threshold:
+            status = '  REGRESSION'
+            regressions.append(name)
+
+        print('%-16s %12.2f %12.2f %+9.1f%%%s'
+              % (name, base_result['best'] * 1000, result['best'] * 1000,
+                 change * 100, status))
+
+    return regressions
+
+
+def main():
+    """Run the benchmarks."""
+    parser = argparse.ArgumentParser(
+        description='Benchmark the stages of the diff viewer.')
+    parser.add_argument(
+        '--files',
+        type=int,
+        default=10,
+        help='The number of generated files in the corpus.')
+    parser.add_argument(
+        '--lines',
+        type=int,
+        default=2000,
+        help='The number of lines in each generated file.')
+    parser.add_argument(
+        '--non-ascii-ratio',
+        type=float,
+        default=0.05,
+        help='The fraction of generated lines containing non-ASCII '
+             'characters.')
+    parser.add_argument(
+        '--seed',
+        type=int,
+        default=8142,
+        help='The seed used to generate the files.')
+    parser.add_argument(
+        '--testdata',
+        default=TESTDATA_DIR,
+        help='The directory containing old/new file pairs to include in '
+             'the corpus.')
+    parser.add_argument(
+        '--no-testdata',
+        action='store_false',
+        dest='use_testdata',
+        help="Don't include the test data files in the corpus.")
+    parser.add_argument(
+        '--benchmark',
+        action='append',
+        dest='benchmarks',
+        choices=('parse', 'differ', 'moves', 'pygments', 'code-safety',
+                 'render', 'rows', 'rows-template', 'cache', 'intraline'),
+        help='A benchmark to run. This can be specified multiple times. '
+             'Defaults to all benchmarks.')
+    parser.add_argument(
+        '--repeat',
+        type=int,
+        default=5,
+        help='The number of times to run each benchmark.')
+    parser.add_argument(
+        '--output',
+        help='The path to write the results to, as JSON.')
+    parser.add_argument(
+        '--baseline',
+        help='The path to results from a previous run to compare to.')
+    parser.add_argument(
+        '--threshold',
+        type=float,
+        default=0.1,
+        help='The fraction a benchmark can be slower than the baseline '
+             'before it is considered a regression. Defaults to 0.1.')
+    options = parser.parse_args()
+
+    # Chunk generation reads from the site configuration. Use the default
+    # settings, rather than loading them from the database.
+    SiteConfiguration.objects.get_current = lambda: DefaultSiteConfiguration()
+
+    # Generate chunks from the corpus, rather than from a repository.
+    diffutils._get_diff_file_chunk_generator = get_corpus_chunk_generator
+
+    rand = random.Random(options.seed)
+    files = [
+        build_generated_file(i, options.lines, options.non_ascii_ratio, rand)
+        for i in range(options.files)
+    ]
+
+    if options.use_testdata:
+        files += find_recorded_files(options.testdata)
+
+    num_lines = sum(
+        corpus_file.num_lines
+        for corpus_file in files
+    )
+
+    # Syntax highlighting is benchmarked on its own, since highlighted
+    # lines are cached between runs when generating chunks.
+    diff_settings = DiffSettings.create(syntax_highlighting=False)
+    diff_settings.diff_time_budget = 0
+
+    benchmarks = get_benchmarks(files, diff_settings)
+    names = options.benchmarks or list(benchmarks.keys())
+
+    print('%d files, %d lines in total' % (len(files), num_lines))
+    print()
+    print('%-16s %12s %12s %12s'
+          % ('Benchmark', 'Best (ms)', 'Median (ms)', 'Rate'))
+
+    results = {
+        'version': RESULTS_VERSION,
+        'corpus': {
+            'files': options.files,
+            'lines': options.lines,
+            'non_ascii_ratio': options.non_ascii_ratio,
+            'seed': options.seed,
+            'testdata': [
+                corpus_file.filename
+                for corpus_file in files[options.files:]
+            ],
+            'total_lines': num_lines,
+        },
+        'environment': {
+            'pygments': pygments.__version__,
+            'python': platform.python_version(),
+            'reviewboard': reviewboard.get_package_version(),
+        },
+        'results': run_benchmarks(names, benchmarks, options.repeat),
+    }
+
+    if options.output:
+        with open(options.output, 'w') as fp:
+            json.dump(results, fp, indent=2, sort_keys=True)
+
+    if options.baseline:
+        with open(options.baseline, 'r') as fp:
+            baseline = json.load(fp)
+
+        regressions = compare_results(results, baseline, options.threshold)
+
+        if regressions:
+            sys.stderr.write('\n%d benchmark(s) regressed by more than '
+                             '%d%%: %s\n'
+                             % (len(regressions), options.threshold * 100,
+                                ', '.join(regressions)))
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""Benchmark interdiff file matching on large diffsets.
+
+This builds two in-memory revisions of a diff with many files, covering
+modified files, files renamed between revisions, added and deleted files,
+and a large drop of new vendored files, and then times
+:py:func:`~reviewboard.diffviewer.diffutils.get_matched_interdiff_files` and
+:py:func:`~reviewboard.diffviewer.diffutils.get_filediffs_match` over them.
+
+No database access is needed. FileDiffs are never saved, and their diffs are
+represented only by their stored hash IDs.
+
+Usage:
+    ./contrib/profiling/benchmark_interdiff_matching.py [--files N]
+                                                        [--repeat N]
+
+Version Added:
+    6.0
+"""
+
+import argparse
+import os
+import random
+import sys
+import timeit
+
+
+scripts_dir = os.path.abspath(os.path.dirname(__file__))
+sys.path.insert(0, os.path.abspath(os.path.join(scripts_dir, '..', '..')))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'reviewboard.settings')
+
+import django  # noqa: E402
+
+django.setup()
+
+from reviewboard.diffviewer.diffutils import (  # noqa: E402
+    get_filediffs_match,
+    get_matched_interdiff_files)
+from reviewboard.diffviewer.models import FileDiff  # noqa: E402
+from reviewboard.diffviewer.parser import DiffParser  # noqa: E402
+from reviewboard.scmtools.core import PRE_CREATION  # noqa: E402
+
+
+class BenchmarkTool(object):
+    """A minimal stand-in for an SCMTool.
+
+    Only the diff parser is needed for matching files.
+    """
+
+    def get_parser(self, data):
+        """Return a diff parser.
+
+        Args:
+            data (bytes):
+                The diff data.
+
+        Returns:
+            reviewboard.diffviewer.parser.DiffParser:
+            The diff parser.
+        """
+        return DiffParser(data)
+
+
+def build_filediffs(num_files, seed):
+    """Build the FileDiffs for two revisions of a diff.
+
+    Args:
+        num_files (int):
+            The approximate number of files in each revision.
+
+        seed (int):
+            The seed for generating changes between revisions.
+
+    Returns:
+        tuple:
+        A 2-tuple of ``(filediffs, interfilediffs)``.
+    """
+    rand = random.Random(seed)
+    next_id = iter(range(1, num_files * 4))
+    filediffs = []
+    interfilediffs = []
+
+    def _make_filediff(source_file, dest_file, status, diff_hash_id,
+                       source_revision='abc123'):
+        return FileDiff(pk=next(next_id),
+                        source_file=source_file,
+                        dest_file=dest_file,
+                        source_revision=source_revision,
+                        dest_detail='',
+                        status=status,
+                        diff_hash_id=diff_hash_id)
+
+    for i in range(num_files):
+        path = 'src/module%d/file%d.py' % (i % 100, i)
+        diff_hash_id = i + 1
+        kind = rand.random()
+
+        filediffs.append(_make_filediff(path, path, FileDiff.MODIFIED,
+                                        diff_hash_id))
+
+        if kind < 0.6:
+            # Unchanged between revisions.
+            interfilediffs.append(_make_filediff(
+                path, path, FileDiff.MODIFIED, diff_hash_id))
+        elif kind < 0.8:
+            # Modified again.
+            interfilediffs.append(_make_filediff(
+                path, path, FileDiff.MODIFIED, num_files + diff_hash_id))
+        elif kind < 0.9:
+            # Renamed in the second revision.
+            interfilediffs.append(_make_filediff(
+                '/' + path, 'lib/module%d/file%d.py' % (i % 100, i),
+                FileDiff.MOVED, num_files + diff_hash_id))
+        elif kind < 0.95:
+            # Deleted in the second revision.
+            interfilediffs.append(_make_filediff(
+                path, path, FileDiff.DELETED, num_files + diff_hash_id))
+
+        # The remainder are reverted in the second revision.
+
+    # A vendor drop of new files in the second revision.
+    for i in range(num_files // 10):
+        path = 'vendor/package%d/file%d.js' % (i % 50, i)
+        interfilediffs.append(_make_filediff(
+            path, path, FileDiff.MODIFIED, num_files * 2 + i + 1,
+            source_revision=PRE_CREATION))
+
+    rand.shuffle(interfilediffs)
+
+    return filediffs, interfilediffs
+
+
+def main():
+    """Run the benchmarks."""
+    parser = argparse.ArgumentParser(
+        description='Benchmark interdiff file matching.')
+    parser.add_argument(
+        '--files',
+        type=int,
+        default=10000,
+        help='The number of files in each revision of the diff.')
+    parser.add_argument(
+        '--repeat',
+        type=int,
+        default=5,
+        help='The number of times to run each benchmark.')
+    parser.add_argument(
+        '--seed',
+        type=int,
+        default=4371,
+        help='The seed used to generate changes between revisions.')
+    options = parser.parse_args()
+
+    tool = BenchmarkTool()
+    filediffs, interfilediffs = build_filediffs(options.files, options.seed)
+    matches = list(get_matched_interdiff_files(tool=tool,
+                                               filediffs=filediffs,
+                                               interfilediffs=interfilediffs))
+
+    def _run_matching():
+        return list(get_matched_interdiff_files(
+            tool=tool,
+            filediffs=filediffs,
+            interfilediffs=interfilediffs))
+
+    def _run_comparisons():
+        return [
+            get_filediffs_match(filediff, interfilediff)
+            for filediff, interfilediff in matches
+        ]
+
+    num_changed = sum(
+        not matched
+        for matched in _run_comparisons()
+    )
+
+    print('%d files on the left, %d files on the right'
+          % (len(filediffs), len(interfilediffs)))
+    print('%d matched pairs, %d with changes'
+          % (len(matches), num_changed))
+    print()
+    print('%-40s %12s' % ('Benchmark', 'Best (ms)'))
+
+    for label, func in (('get_matched_interdiff_files', _run_matching),
+                        ('get_filediffs_match', _run_comparisons)):
+        best = min(timeit.repeat(func, number=1, repeat=options.repeat))
+        print('%-40s %12.2f' % (label, best * 1000))
+
+
+if __name__ == '__main__':
+    main()
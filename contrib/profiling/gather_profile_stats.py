@@ -3,14 +3,14 @@
 """
 gather_profile_stats.py /path/to/dir/of/profiles
 
-Note that the aggregated profiles must be read with pstats.Stats, not
-hotshot.stats (the formats are incompatible)
+This aggregates profiles written by cProfile (such as those from the
+djblets logging middleware) into one ``.agg.prof`` file per path. Both the
+individual and the aggregated profiles can be read with pstats.Stats.
 """
 
 import os
 import pstats
 import sys
-from hotshot import stats
 
 
 def gather_stats(p):
@@ -22,7 +22,7 @@ def gather_stats(p):
         elif f.endswith('.prof'):
             bits = f.split('.')
             path = ".".join(bits[:-3])
-            prof = stats.load(os.path.join(p, f))
+            prof = pstats.Stats(os.path.join(p, f))
         else:
             continue
         print("Processing %s" % f)
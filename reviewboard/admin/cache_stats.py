@@ -4,6 +4,8 @@ import socket
 from django.conf import settings
 from djblets.cache.forwarding_backend import DEFAULT_FORWARD_CACHE_ALIAS
 
+from reviewboard.diffviewer.syntax_highlighting import get_cache_access_counts
+
 
 logger = logging.getLogger(__name__)
 
@@ -111,3 +113,46 @@ def get_cache_stats():
         all_stats.append((hostname, stats))
 
     return all_stats
+
+
+def get_syntax_highlighting_cache_stats():
+    """Return statistics for the shared syntax highlighting cache.
+
+    These are counted for all processes sharing the cache, and work with any
+    cache backend.
+
+    Version Added:
+        6.0
+
+    Returns:
+        dict:
+        A dictionary with the following keys:
+
+        ``hits`` (:py:class:`int`):
+            The number of times highlighted file contents were found in the
+            cache.
+
+        ``misses`` (:py:class:`int`):
+            The number of times file contents had to be highlighted.
+
+        ``total`` (:py:class:`int`):
+            The total number of lookups.
+
+        ``hit_rate`` (:py:class:`float`):
+            The percentage of lookups that were hits.
+
+        ``miss_rate`` (:py:class:`float`):
+            The percentage of lookups that were misses.
+    """
+    stats = get_cache_access_counts()
+    total = stats['hits'] + stats['misses']
+    stats['total'] = total
+
+    if total == 0:
+        stats['hit_rate'] = 0
+        stats['miss_rate'] = 0
+    else:
+        stats['hit_rate'] = 100 * stats['hits'] / total
+        stats['miss_rate'] = 100 * stats['misses'] / total
+
+    return stats
@@ -14,6 +14,10 @@ from djblets.siteconfig.forms import SiteSettingsForm
 from reviewboard.admin.form_widgets import LexersMappingWidget
 from reviewboard.codesafety.checkers.trojan_source import \
     TrojanSourceCodeSafetyChecker
+from reviewboard.diffviewer.compression import \
+    diff_compression_codec_registry
+from reviewboard.diffviewer.filecache import \
+    file_content_cache_backend_registry
 
 
 class DiffSettingsForm(SiteSettingsForm):
@@ -39,6 +43,27 @@ class DiffSettingsForm(SiteSettingsForm):
         required=False,
         widget=forms.TextInput(attrs={'size': '5'}))
 
+    diffviewer_move_detection_max_lines = forms.IntegerField(
+        label=_('Max changed lines for move detection'),
+        help_text=_(
+            'Files with more inserted and deleted lines than this number '
+            'will not show moved lines. Enter 0 to disable limits.'
+        ),
+        min_value=0,
+        required=False,
+        widget=forms.TextInput(attrs={'size': '5'}))
+
+    diffviewer_diff_time_budget = forms.IntegerField(
+        label=_('Max seconds to compute each file\'s diff'),
+        help_text=_(
+            'Files that take longer than this number of seconds to diff '
+            'will show a simplified diff, without moved lines or '
+            'highlighted changes within lines. Enter 0 to disable limits.'
+        ),
+        min_value=0,
+        required=False,
+        widget=forms.TextInput(attrs={'size': '5'}))
+
     diffviewer_custom_pygments_lexers = ListEditDictionaryField(
         label=_('Custom file highlighting'),
         help_text=_(
@@ -67,6 +92,115 @@ class DiffSettingsForm(SiteSettingsForm):
         ),
         widget=forms.TextInput(attrs={'size': '50'}))
 
+    diffviewer_use_histogram_differ = forms.BooleanField(
+        label=_('Use the histogram diff algorithm for new diffs'),
+        help_text=_(
+            'The histogram algorithm (used by Git) scales better on large '
+            'files with many unique lines, and produces fewer spurious '
+            'matches when code is moved around. Existing diffs will '
+            'continue to use the algorithm they were uploaded with.'
+        ),
+        required=False)
+
+    diffviewer_file_cache_backend = forms.ChoiceField(
+        label=_('File content cache'),
+        help_text=_(
+            'Where to cache the contents of original and patched files. '
+            'The cache server will not store very large files, so the local '
+            'disk is recommended for repositories with large files.'
+        ),
+        required=False)
+
+    diffviewer_file_cache_path = forms.CharField(
+        label=_('File content cache path'),
+        help_text=_(
+            'The directory used to cache file contents on the local disk. '
+            'If empty, a directory in the site\'s data directory will be '
+            'used.'
+        ),
+        required=False,
+        widget=forms.TextInput(attrs={'size': '50'}))
+
+    diffviewer_file_cache_max_size = forms.IntegerField(
+        label=_('Max file content cache size in bytes'),
+        help_text=_(
+            'The maximum total size of file contents cached on the local '
+            'disk. The least-recently used files will be removed once this '
+            'is exceeded.'
+        ),
+        min_value=0,
+        widget=forms.TextInput(attrs={'size': '15'}))
+
+    diffviewer_chunk_generation_max_workers = forms.IntegerField(
+        label=_('Max files to diff at once'),
+        help_text=_(
+            'The maximum number of files to fetch and diff at once when '
+            'showing several files in a diff. Higher values can speed up '
+            'large diffs when the repository is slow to respond, at the '
+            'expense of more load on the server. Enter 1 to diff one file '
+            'at a time.'
+        ),
+        initial=1,
+        min_value=1,
+        widget=forms.TextInput(attrs={'size': '5'}))
+
+    diffviewer_chunk_warmup_max_workers = forms.IntegerField(
+        label=_('Max diffs to pre-generate at once'),
+        help_text=_(
+            'The maximum number of newly-published diffs to generate in '
+            'the background at once, so they display quickly for the '
+            'first reviewer. Enter 0 to disable pre-generating diffs.'
+        ),
+        initial=1,
+        min_value=0,
+        widget=forms.TextInput(attrs={'size': '5'}))
+
+    diffviewer_chunk_warmup_max_pending = forms.IntegerField(
+        label=_('Max diffs waiting to be pre-generated'),
+        help_text=_(
+            'The maximum number of newly-published diffs that can be '
+            'waiting to be generated in the background. Any further diffs '
+            'will be generated when first viewed. Enter 0 to disable '
+            'limits.'
+        ),
+        initial=20,
+        min_value=0,
+        widget=forms.TextInput(attrs={'size': '5'}))
+
+    diffviewer_file_exists_max_workers = forms.IntegerField(
+        label=_('Max files to check for at once'),
+        help_text=_(
+            'The maximum number of files to check for in the repository at '
+            'once when validating an uploaded diff. Higher values can speed '
+            'up uploading large diffs to repositories on hosting services. '
+            'Enter 1 to check one file at a time.'
+        ),
+        initial=1,
+        min_value=1,
+        widget=forms.TextInput(attrs={'size': '5'}))
+
+    diffviewer_compression_codec = forms.ChoiceField(
+        label=_('Diff compression'),
+        help_text=_(
+            'How to compress newly-uploaded diffs in the database. BZip2 '
+            'uses the least space, but is slow to store and load diffs. '
+            'zlib and Zstandard are much faster, but use a bit more space. '
+            'Existing diffs can be converted with '
+            '<code>rb-site manage /path/to/site condensediffs -- '
+            '--recompress</code>.'
+        ))
+
+    diffviewer_compression_level = forms.IntegerField(
+        label=_('Diff compression level'),
+        help_text=_(
+            'Higher levels use less space, but take longer to store diffs. '
+            'Leave this blank to use the default level for the selected '
+            'compression.'
+        ),
+        required=False,
+        min_value=1,
+        widget=forms.TextInput(attrs={'size': '5'}))
+
     diffviewer_context_num_lines = forms.IntegerField(
         label=_('Lines of context'),
         help_text=_('The number of unchanged lines shown above and below '
@@ -132,6 +266,34 @@ class DiffSettingsForm(SiteSettingsForm):
         required=False,
         widget=forms.widgets.CheckboxSelectMultiple())
 
+    def __init__(self, *args, **kwargs) -> None:
+        """Initialize the settings form.
+
+        This will populate the choices for the file content cache backends
+        and diff compression codecs.
+
+        Args:
+            *args (tuple):
+                Additional positional arguments for the parent class.
+
+            **kwargs (dict):
+                Additional keyword arguments for the parent class.
+        """
+        super().__init__(*args, **kwargs)
+
+        self.fields['diffviewer_file_cache_backend'].choices = [
+            ('', _('Disabled')),
+        ] + [
+            (backend.backend_id, backend.name)
+            for backend in file_content_cache_backend_registry
+        ]
+
+        self.fields['diffviewer_compression_codec'].choices = [
+            (codec.codec_id, codec.name)
+            for codec in diff_compression_codec_registry
+            if codec.is_available()
+        ]
+
     def load(self):
         """Load settings from the form.
 
@@ -220,6 +382,8 @@ class DiffSettingsForm(SiteSettingsForm):
                 'fields': (
                     'diffviewer_max_diff_size',
                     'diffviewer_syntax_highlighting_threshold',
+                    'diffviewer_move_detection_max_lines',
+                    'diffviewer_diff_time_budget',
                 ),
             },
             {
@@ -248,6 +412,16 @@ class DiffSettingsForm(SiteSettingsForm):
                 'classes': ('wide',),
                 'fields': (
                     'include_space_patterns',
+                    'diffviewer_use_histogram_differ',
+                    'diffviewer_file_cache_backend',
+                    'diffviewer_file_cache_path',
+                    'diffviewer_file_cache_max_size',
+                    'diffviewer_chunk_generation_max_workers',
+                    'diffviewer_chunk_warmup_max_workers',
+                    'diffviewer_chunk_warmup_max_pending',
+                    'diffviewer_file_exists_max_workers',
+                    'diffviewer_compression_codec',
+                    'diffviewer_compression_level',
                     'diffviewer_context_num_lines',
                     'diffviewer_paginate_by',
                     'diffviewer_paginate_orphans',
@@ -145,13 +145,26 @@ defaults.update({
     'company': '',
     'default_use_rich_text': True,
     'diffviewer_context_num_lines': 5,
+    'diffviewer_diff_time_budget': 20,
     'diffviewer_include_space_patterns': [],
     'diffviewer_max_diff_size': 2_097_152,
+    'diffviewer_move_detection_max_lines': 50_000,
     'diffviewer_paginate_by': 20,
     'diffviewer_paginate_orphans': 10,
     'diffviewer_syntax_highlighting': True,
     'diffviewer_syntax_highlighting_threshold': 20_000,
     'diffviewer_custom_pygments_lexers': {'.less': 'LessCss'},
+    'diffviewer_differ_engine': 'python',
+    'diffviewer_use_histogram_differ': False,
+    'diffviewer_file_cache_backend': 'cache',
+    'diffviewer_file_cache_path': '',
+    'diffviewer_file_cache_max_size': 1_073_741_824,
+    'diffviewer_chunk_generation_max_workers': 1,
+    'diffviewer_chunk_warmup_max_pending': 20,
+    'diffviewer_chunk_warmup_max_workers': 1,
+    'diffviewer_file_exists_max_workers': 1,
+    'diffviewer_compression_codec': 'B',
+    'diffviewer_compression_level': None,
     'diffviewer_show_trailing_whitespace': True,
     'mail_send_review_mail': False,
     'mail_send_new_user_mail': False,
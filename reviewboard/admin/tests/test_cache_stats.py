@@ -0,0 +1,39 @@
+"""Unit tests for reviewboard.admin.cache_stats."""
+
+from pygments.lexers import PythonLexer
+
+from reviewboard.admin.cache_stats import get_syntax_highlighting_cache_stats
+from reviewboard.diffviewer.syntax_highlighting import get_highlighted_lines
+from reviewboard.testing import TestCase
+
+
+class GetSyntaxHighlightingCacheStatsTests(TestCase):
+    """Unit tests for get_syntax_highlighting_cache_stats."""
+
+    def test_without_lookups(self):
+        """Testing get_syntax_highlighting_cache_stats without any lookups"""
+        self.assertEqual(get_syntax_highlighting_cache_stats(), {
+            'hits': 0,
+            'misses': 0,
+            'total': 0,
+            'hit_rate': 0,
+            'miss_rate': 0,
+        })
+
+    def test_with_lookups(self):
+        """Testing get_syntax_highlighting_cache_stats with lookups"""
+        def _highlight(data, lexer):
+            return data.splitlines()
+
+        for i in range(3):
+            get_highlighted_lines('x = 1\n', PythonLexer(), _highlight)
+
+        get_highlighted_lines('x = 2\n', PythonLexer(), _highlight)
+
+        self.assertEqual(get_syntax_highlighting_cache_stats(), {
+            'hits': 2,
+            'misses': 2,
+            'total': 4,
+            'hit_rate': 50.0,
+            'miss_rate': 50.0,
+        })
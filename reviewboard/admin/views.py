@@ -13,7 +13,9 @@ from django.views.decorators.csrf import csrf_protect
 from djblets.cache.forwarding_backend import DEFAULT_FORWARD_CACHE_ALIAS
 from djblets.siteconfig.views import site_settings as djblets_site_settings
 
-from reviewboard.admin.cache_stats import get_cache_stats
+from reviewboard.admin.cache_stats import (
+    get_cache_stats,
+    get_syntax_highlighting_cache_stats)
 from reviewboard.admin.decorators import superuser_required
 from reviewboard.admin.forms.ssh_settings import SSHSettingsForm
 from reviewboard.admin.security_checks import SecurityCheckRunner
@@ -103,7 +105,7 @@ def cache_stats(request, template_name="admin/cache_stats.html"):
     """Display statistics on the cache.
 
     This includes such pieces of information as memory used, cache misses, and
-    uptime.
+    uptime, along with hit rates for the shared syntax highlighting cache.
     """
     cache_stats = get_cache_stats()
     cache_info = settings.CACHES[DEFAULT_FORWARD_CACHE_ALIAS]
@@ -114,6 +116,7 @@ def cache_stats(request, template_name="admin/cache_stats.html"):
         context={
             'cache_hosts': cache_stats,
             'cache_backend': cache_info['BACKEND'],
+            'syntax_highlighting_stats': get_syntax_highlighting_cache_stats(),
             'title': _('Server Cache'),
             'root_path': reverse('admin:index'),
         })
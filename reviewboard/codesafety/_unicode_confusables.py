@@ -4,1543 +4,320 @@
 #
 # To update this file, run ./contrib/internal/build-confusables.py
 
-from typing import Dict, Optional, Tuple
+from typing import Dict, Tuple
 
-from typing_extensions import TypeAlias
+from reviewboard.codesafety.confusables import ConfusablesTable
 
 
-ConfusablesMapValue: TypeAlias = Tuple[str, Optional[int]]
-ConfusablesMap: TypeAlias = Dict[str, ConfusablesMapValue]
+_CONFUSABLE_CHARS: str = (
+    '\xa0\xb4\xb8\xd7\u0131\u017f\u0184\u018d\u0196\u01a6\u01a7\u01b7\u01bc'
+    '\u01bd\u01c0\u01c3\u021c\u0222\u0223\u0241\u0251\u0261\u0263\u0269\u026a'
+    '\u026f\u028b\u028f\u0294\u02b9\u02bb\u02bc\u02bd\u02be\u02c2\u02c3\u02c4'
+    '\u02c6\u02c8\u02ca\u02cb\u02d0\u02d7\u02db\u02dc\u02f4\u02f8\u0374\u037a'
+    '\u037e\u037f\u0384\u0391\u0392\u0395\u0396\u0397\u0399\u039a\u039c\u039d'
+    '\u039f\u03a1\u03a4\u03a5\u03a7\u03b1\u03b3\u03b9\u03bd\u03bf\u03c1\u03c3'
+    '\u03c5\u03d2\u03dc\u03e8\u03f1\u03f2\u03f3\u03f9\u03fa\u0405\u0406\u0408'
+    '\u0410\u0412\u0415\u0417\u041a\u041c\u041d\u041e\u0420\u0421\u0422\u0423'
+    '\u0425\u042c\u0430\u0431\u0433\u0435\u043e\u0440\u0441\u0443\u0445\u0455'
+    '\u0456\u0458\u0461\u0474\u0475\u04ae\u04af\u04bb\u04bd\u04c0\u04cf\u04e0'
+    '\u0501\u050c\u051b\u051c\u051d\u054d\u054f\u0555\u055a\u055d\u0561\u0563'
+    '\u0566\u0570\u0578\u057c\u057d\u0581\u0584\u0585\u0589\u05c0\u05c3\u05d5'
+    '\u05d8\u05d9\u05df\u05e1\u05f3\u060d\u0627\u0647\u0660\u0661\u0665\u0667'
+    '\u066b\u066d\u06be\u06c1\u06d4\u06d5\u06f0\u06f1\u06f5\u06f7\u0701\u0702'
+    '\u0703\u0704\u07c0\u07ca\u07f4\u07f5\u07fa\u0903\u0966\u097d\u09e6\u09ea'
+    '\u09ed\u0a66\u0a67\u0a6a\u0a83\u0ae6\u0b03\u0b20\u0b66\u0b68\u0be6\u0c02'
+    '\u0c66\u0c82\u0ce6\u0d02\u0d20\u0d66\u0d6d\u0d82\u0e50\u0ed0\u101d\u1040'
+    '\u10e7\u10ff\u1200\u12d0\u13a0\u13a1\u13a2\u13a5\u13a9\u13aa\u13ab\u13ac'
+    '\u13ae\u13b3\u13b7\u13bb\u13bd\u13c0\u13c2\u13c3\u13ce\u13cf\u13d2\u13d4'
+    '\u13d5\u13d9\u13da\u13de\u13df\u13e2\u13e6\u13e7\u13ee\u13f3\u13f4\u1400'
+    '\u142f\u1433\u1438\u144a\u144c\u146d\u146f\u1472\u148d\u14aa\u14bf\u1541'
+    '\u157c\u157d\u1587\u15af\u15b4\u15c5\u15de\u15ea\u15f0\u15f7\u166d\u166e'
+    '\u1680\u16b2\u16b7\u16c1\u16cc\u16d5\u16d6\u16ec\u16ed\u1735\u1803\u1809'
+    '\u1d04\u1d0f\u1d11\u1d1c\u1d20\u1d21\u1d22\u1d26\u1d83\u1d8c\u1e9d\u1eff'
+    '\u1fbd\u1fbe\u1fbf\u1fc0\u1fef\u1ffd\u1ffe\u2000\u2001\u2002\u2003\u2004'
+    '\u2005\u2006\u2007\u2008\u2009\u200a\u2010\u2011\u2012\u2013\u2018\u2019'
+    '\u201a\u201b\u2024\u2028\u2029\u202f\u2032\u2035\u2039\u203a\u2041\u2043'
+    '\u2044\u204e\u2053\u205a\u205f\u2102\u210a\u210b\u210c\u210d\u210e\u2110'
+    '\u2111\u2112\u2113\u2115\u2119\u211a\u211b\u211c\u211d\u2124\u2128\u212a'
+    '\u212c\u212d\u212e\u212f\u2130\u2131\u2133\u2134\u2139\u213d\u2145\u2146'
+    '\u2147\u2148\u2149\u2160\u2164\u2169\u216c\u216d\u216e\u216f\u2170\u2174'
+    '\u2179\u217c\u217d\u217e\u2212\u2215\u2216\u2217\u2223\u2228\u222a\u2236'
+    '\u223c\u22a4\u22c1\u22c3\u22ff\u2373\u2374\u237a\u23fd\u2571\u2573\u2768'
+    '\u2769\u276e\u276f\u2772\u2773\u2774\u2775\u2795\u2796\u27cb\u27cd\u27d9'
+    '\u292b\u292c\u29f5\u29f8\u29f9\u2a2f\u2c85\u2c8e\u2c92\u2c94\u2c98\u2c9a'
+    '\u2c9e\u2c9f\u2ca2\u2ca3\u2ca4\u2ca5\u2ca6\u2ca8\u2cac\u2cba\u2cc6\u2cca'
+    '\u2ccc\u2cd0\u2cd2\u2d38\u2d39\u2d4f\u2d51\u2d54\u2d55\u2d5d\u2e40\u2f02'
+    '\u2f03\u3007\u3014\u3015\u3033\u30a0\u30ce\u31d3\u31d4\u4e36\u4e3f\ua4d0'
+    '\ua4d1\ua4d2\ua4d3\ua4d4\ua4d6\ua4d7\ua4d9\ua4da\ua4dc\ua4dd\ua4df\ua4e0'
+    '\ua4e1\ua4e2\ua4e3\ua4e6\ua4e7\ua4ea\ua4eb\ua4ec\ua4ee\ua4f0\ua4f2\ua4f3'
+    '\ua4f4\ua4f8\ua4f9\ua4fd\ua4ff\ua60e\ua644\ua647\ua6df\ua6eb\ua6ef\ua731'
+    '\ua75a\ua76a\ua76e\ua778\ua789\ua78c\ua798\ua799\ua79f\ua7ab\ua7b2\ua7b3'
+    '\ua7b4\uab32\uab35\uab3d\uab47\uab48\uab4e\uab52\uab5a\uab75\uab81\uab83'
+    '\uab93\uaba9\uabaa\uabaf\ufba6\ufba7\ufba8\ufba9\ufbaa\ufbab\ufbac\ufbad'
+    '\ufd3e\ufd3f\ufe30\ufe4d\ufe4e\ufe4f\ufe58\ufe68\ufe8d\ufe8e\ufee9\ufeea'
+    '\ufeeb\ufeec\uff01\uff07\uff1a\uff21\uff22\uff23\uff25\uff28\uff29\uff2a'
+    '\uff2b\uff2d\uff2e\uff2f\uff30\uff33\uff34\uff38\uff39\uff3a\uff3b\uff3c'
+    '\uff3d\uff40\uff41\uff43\uff45\uff47\uff48\uff49\uff4a\uff4c\uff4f\uff50'
+    '\uff53\uff56\uff58\uff59\uffe8\U00010282\U00010286\U00010287\U0001028a'
+    '\U00010290\U00010292\U00010295\U00010296\U00010297\U0001029b\U000102a0'
+    '\U000102a1\U000102a2\U000102a5\U000102ab\U000102b0\U000102b1\U000102b2'
+    '\U000102b4\U000102cf\U000102f5\U00010301\U00010302\U00010309\U00010311'
+    '\U00010315\U00010317\U0001031a\U0001031f\U00010320\U00010322\U00010404'
+    '\U00010415\U0001041b\U00010420\U0001042c\U0001043d\U00010448\U000104b4'
+    '\U000104c2\U000104ce\U000104d2\U000104ea\U000104f6\U00010513\U00010516'
+    '\U00010518\U0001051c\U0001051d\U00010525\U00010526\U00010527\U00010a50'
+    '\U000114d0\U00011706\U0001170a\U0001170e\U0001170f\U000118a0\U000118a2'
+    '\U000118a3\U000118a4\U000118a6\U000118a9\U000118ac\U000118ae\U000118af'
+    '\U000118b2\U000118b5\U000118b8\U000118bb\U000118bc\U000118c0\U000118c1'
+    '\U000118c2\U000118c3\U000118c4\U000118c6\U000118c8\U000118ca\U000118cc'
+    '\U000118d5\U000118d6\U000118d7\U000118d8\U000118dc\U000118e0\U000118e5'
+    '\U000118e6\U000118e9\U000118ec\U000118ef\U000118f2\U00016f08\U00016f0a'
+    '\U00016f16\U00016f28\U00016f35\U00016f3a\U00016f3b\U00016f3f\U00016f40'
+    '\U00016f42\U00016f43\U00016f51\U00016f52\U0001d114\U0001d16d\U0001d206'
+    '\U0001d20d\U0001d20f\U0001d212\U0001d213\U0001d216\U0001d22a\U0001d236'
+    '\U0001d237\U0001d23a\U0001d23b\U0001d400\U0001d401\U0001d402\U0001d403'
+    '\U0001d404\U0001d405\U0001d406\U0001d407\U0001d408\U0001d409\U0001d40a'
+    '\U0001d40b\U0001d40c\U0001d40d\U0001d40e\U0001d40f\U0001d410\U0001d411'
+    '\U0001d412\U0001d413\U0001d414\U0001d415\U0001d416\U0001d417\U0001d418'
+    '\U0001d419\U0001d41a\U0001d41b\U0001d41c\U0001d41d\U0001d41e\U0001d41f'
+    '\U0001d420\U0001d421\U0001d422\U0001d423\U0001d424\U0001d425\U0001d427'
+    '\U0001d428\U0001d429\U0001d42a\U0001d42b\U0001d42c\U0001d42d\U0001d42e'
+    '\U0001d42f\U0001d430\U0001d431\U0001d432\U0001d433\U0001d434\U0001d435'
+    '\U0001d436\U0001d437\U0001d438\U0001d439\U0001d43a\U0001d43b\U0001d43c'
+    '\U0001d43d\U0001d43e\U0001d43f\U0001d440\U0001d441\U0001d442\U0001d443'
+    '\U0001d444\U0001d445\U0001d446\U0001d447\U0001d448\U0001d449\U0001d44a'
+    '\U0001d44b\U0001d44c\U0001d44d\U0001d44e\U0001d44f\U0001d450\U0001d451'
+    '\U0001d452\U0001d453\U0001d454\U0001d456\U0001d457\U0001d458\U0001d459'
+    '\U0001d45b\U0001d45c\U0001d45d\U0001d45e\U0001d45f\U0001d460\U0001d461'
+    '\U0001d462\U0001d463\U0001d464\U0001d465\U0001d466\U0001d467\U0001d468'
+    '\U0001d469\U0001d46a\U0001d46b\U0001d46c\U0001d46d\U0001d46e\U0001d46f'
+    '\U0001d470\U0001d471\U0001d472\U0001d473\U0001d474\U0001d475\U0001d476'
+    '\U0001d477\U0001d478\U0001d479\U0001d47a\U0001d47b\U0001d47c\U0001d47d'
+    '\U0001d47e\U0001d47f\U0001d480\U0001d481\U0001d482\U0001d483\U0001d484'
+    '\U0001d485\U0001d486\U0001d487\U0001d488\U0001d489\U0001d48a\U0001d48b'
+    '\U0001d48c\U0001d48d\U0001d48f\U0001d490\U0001d491\U0001d492\U0001d493'
+    '\U0001d494\U0001d495\U0001d496\U0001d497\U0001d498\U0001d499\U0001d49a'
+    '\U0001d49b\U0001d49c\U0001d49e\U0001d49f\U0001d4a2\U0001d4a5\U0001d4a6'
+    '\U0001d4a9\U0001d4aa\U0001d4ab\U0001d4ac\U0001d4ae\U0001d4af\U0001d4b0'
+    '\U0001d4b1\U0001d4b2\U0001d4b3\U0001d4b4\U0001d4b5\U0001d4b6\U0001d4b7'
+    '\U0001d4b8\U0001d4b9\U0001d4bb\U0001d4bd\U0001d4be\U0001d4bf\U0001d4c0'
+    '\U0001d4c1\U0001d4c3\U0001d4c5\U0001d4c6\U0001d4c7\U0001d4c8\U0001d4c9'
+    '\U0001d4ca\U0001d4cb\U0001d4cc\U0001d4cd\U0001d4ce\U0001d4cf\U0001d4d0'
+    '\U0001d4d1\U0001d4d2\U0001d4d3\U0001d4d4\U0001d4d5\U0001d4d6\U0001d4d7'
+    '\U0001d4d8\U0001d4d9\U0001d4da\U0001d4db\U0001d4dc\U0001d4dd\U0001d4de'
+    '\U0001d4df\U0001d4e0\U0001d4e1\U0001d4e2\U0001d4e3\U0001d4e4\U0001d4e5'
+    '\U0001d4e6\U0001d4e7\U0001d4e8\U0001d4e9\U0001d4ea\U0001d4eb\U0001d4ec'
+    '\U0001d4ed\U0001d4ee\U0001d4ef\U0001d4f0\U0001d4f1\U0001d4f2\U0001d4f3'
+    '\U0001d4f4\U0001d4f5\U0001d4f7\U0001d4f8\U0001d4f9\U0001d4fa\U0001d4fb'
+    '\U0001d4fc\U0001d4fd\U0001d4fe\U0001d4ff\U0001d500\U0001d501\U0001d502'
+    '\U0001d503\U0001d504\U0001d505\U0001d507\U0001d508\U0001d509\U0001d50a'
+    '\U0001d50d\U0001d50e\U0001d50f\U0001d510\U0001d511\U0001d512\U0001d513'
+    '\U0001d514\U0001d516\U0001d517\U0001d518\U0001d519\U0001d51a\U0001d51b'
+    '\U0001d51c\U0001d51e\U0001d51f\U0001d520\U0001d521\U0001d522\U0001d523'
+    '\U0001d524\U0001d525\U0001d526\U0001d527\U0001d528\U0001d529\U0001d52b'
+    '\U0001d52c\U0001d52d\U0001d52e\U0001d52f\U0001d530\U0001d531\U0001d532'
+    '\U0001d533\U0001d534\U0001d535\U0001d536\U0001d537\U0001d538\U0001d539'
+    '\U0001d53b\U0001d53c\U0001d53d\U0001d53e\U0001d540\U0001d541\U0001d542'
+    '\U0001d543\U0001d544\U0001d546\U0001d54a\U0001d54b\U0001d54c\U0001d54d'
+    '\U0001d54e\U0001d54f\U0001d550\U0001d552\U0001d553\U0001d554\U0001d555'
+    '\U0001d556\U0001d557\U0001d558\U0001d559\U0001d55a\U0001d55b\U0001d55c'
+    '\U0001d55d\U0001d55f\U0001d560\U0001d561\U0001d562\U0001d563\U0001d564'
+    '\U0001d565\U0001d566\U0001d567\U0001d568\U0001d569\U0001d56a\U0001d56b'
+    '\U0001d56c\U0001d56d\U0001d56e\U0001d56f\U0001d570\U0001d571\U0001d572'
+    '\U0001d573\U0001d574\U0001d575\U0001d576\U0001d577\U0001d578\U0001d579'
+    '\U0001d57a\U0001d57b\U0001d57c\U0001d57d\U0001d57e\U0001d57f\U0001d580'
+    '\U0001d581\U0001d582\U0001d583\U0001d584\U0001d585\U0001d586\U0001d587'
+    '\U0001d588\U0001d589\U0001d58a\U0001d58b\U0001d58c\U0001d58d\U0001d58e'
+    '\U0001d58f\U0001d590\U0001d591\U0001d593\U0001d594\U0001d595\U0001d596'
+    '\U0001d597\U0001d598\U0001d599\U0001d59a\U0001d59b\U0001d59c\U0001d59d'
+    '\U0001d59e\U0001d59f\U0001d5a0\U0001d5a1\U0001d5a2\U0001d5a3\U0001d5a4'
+    '\U0001d5a5\U0001d5a6\U0001d5a7\U0001d5a8\U0001d5a9\U0001d5aa\U0001d5ab'
+    '\U0001d5ac\U0001d5ad\U0001d5ae\U0001d5af\U0001d5b0\U0001d5b1\U0001d5b2'
+    '\U0001d5b3\U0001d5b4\U0001d5b5\U0001d5b6\U0001d5b7\U0001d5b8\U0001d5b9'
+    '\U0001d5ba\U0001d5bb\U0001d5bc\U0001d5bd\U0001d5be\U0001d5bf\U0001d5c0'
+    '\U0001d5c1\U0001d5c2\U0001d5c3\U0001d5c4\U0001d5c5\U0001d5c7\U0001d5c8'
+    '\U0001d5c9\U0001d5ca\U0001d5cb\U0001d5cc\U0001d5cd\U0001d5ce\U0001d5cf'
+    '\U0001d5d0\U0001d5d1\U0001d5d2\U0001d5d3\U0001d5d4\U0001d5d5\U0001d5d6'
+    '\U0001d5d7\U0001d5d8\U0001d5d9\U0001d5da\U0001d5db\U0001d5dc\U0001d5dd'
+    '\U0001d5de\U0001d5df\U0001d5e0\U0001d5e1\U0001d5e2\U0001d5e3\U0001d5e4'
+    '\U0001d5e5\U0001d5e6\U0001d5e7\U0001d5e8\U0001d5e9\U0001d5ea\U0001d5eb'
+    '\U0001d5ec\U0001d5ed\U0001d5ee\U0001d5ef\U0001d5f0\U0001d5f1\U0001d5f2'
+    '\U0001d5f3\U0001d5f4\U0001d5f5\U0001d5f6\U0001d5f7\U0001d5f8\U0001d5f9'
+    '\U0001d5fb\U0001d5fc\U0001d5fd\U0001d5fe\U0001d5ff\U0001d600\U0001d601'
+    '\U0001d602\U0001d603\U0001d604\U0001d605\U0001d606\U0001d607\U0001d608'
+    '\U0001d609\U0001d60a\U0001d60b\U0001d60c\U0001d60d\U0001d60e\U0001d60f'
+    '\U0001d610\U0001d611\U0001d612\U0001d613\U0001d614\U0001d615\U0001d616'
+    '\U0001d617\U0001d618\U0001d619\U0001d61a\U0001d61b\U0001d61c\U0001d61d'
+    '\U0001d61e\U0001d61f\U0001d620\U0001d621\U0001d622\U0001d623\U0001d624'
+    '\U0001d625\U0001d626\U0001d627\U0001d628\U0001d629\U0001d62a\U0001d62b'
+    '\U0001d62c\U0001d62d\U0001d62f\U0001d630\U0001d631\U0001d632\U0001d633'
+    '\U0001d634\U0001d635\U0001d636\U0001d637\U0001d638\U0001d639\U0001d63a'
+    '\U0001d63b\U0001d63c\U0001d63d\U0001d63e\U0001d63f\U0001d640\U0001d641'
+    '\U0001d642\U0001d643\U0001d644\U0001d645\U0001d646\U0001d647\U0001d648'
+    '\U0001d649\U0001d64a\U0001d64b\U0001d64c\U0001d64d\U0001d64e\U0001d64f'
+    '\U0001d650\U0001d651\U0001d652\U0001d653\U0001d654\U0001d655\U0001d656'
+    '\U0001d657\U0001d658\U0001d659\U0001d65a\U0001d65b\U0001d65c\U0001d65d'
+    '\U0001d65e\U0001d65f\U0001d660\U0001d661\U0001d663\U0001d664\U0001d665'
+    '\U0001d666\U0001d667\U0001d668\U0001d669\U0001d66a\U0001d66b\U0001d66c'
+    '\U0001d66d\U0001d66e\U0001d66f\U0001d670\U0001d671\U0001d672\U0001d673'
+    '\U0001d674\U0001d675\U0001d676\U0001d677\U0001d678\U0001d679\U0001d67a'
+    '\U0001d67b\U0001d67c\U0001d67d\U0001d67e\U0001d67f\U0001d680\U0001d681'
+    '\U0001d682\U0001d683\U0001d684\U0001d685\U0001d686\U0001d687\U0001d688'
+    '\U0001d689\U0001d68a\U0001d68b\U0001d68c\U0001d68d\U0001d68e\U0001d68f'
+    '\U0001d690\U0001d691\U0001d692\U0001d693\U0001d694\U0001d695\U0001d697'
+    '\U0001d698\U0001d699\U0001d69a\U0001d69b\U0001d69c\U0001d69d\U0001d69e'
+    '\U0001d69f\U0001d6a0\U0001d6a1\U0001d6a2\U0001d6a3\U0001d6a4\U0001d6a8'
+    '\U0001d6a9\U0001d6ac\U0001d6ad\U0001d6ae\U0001d6b0\U0001d6b1\U0001d6b3'
+    '\U0001d6b4\U0001d6b6\U0001d6b8\U0001d6bb\U0001d6bc\U0001d6be\U0001d6c2'
+    '\U0001d6c4\U0001d6ca\U0001d6ce\U0001d6d0\U0001d6d2\U0001d6d4\U0001d6d6'
+    '\U0001d6e0\U0001d6e2\U0001d6e3\U0001d6e6\U0001d6e7\U0001d6e8\U0001d6ea'
+    '\U0001d6eb\U0001d6ed\U0001d6ee\U0001d6f0\U0001d6f2\U0001d6f5\U0001d6f6'
+    '\U0001d6f8\U0001d6fc\U0001d6fe\U0001d704\U0001d708\U0001d70a\U0001d70c'
+    '\U0001d70e\U0001d710\U0001d71a\U0001d71c\U0001d71d\U0001d720\U0001d721'
+    '\U0001d722\U0001d724\U0001d725\U0001d727\U0001d728\U0001d72a\U0001d72c'
+    '\U0001d72f\U0001d730\U0001d732\U0001d736\U0001d738\U0001d73e\U0001d742'
+    '\U0001d744\U0001d746\U0001d748\U0001d74a\U0001d754\U0001d756\U0001d757'
+    '\U0001d75a\U0001d75b\U0001d75c\U0001d75e\U0001d75f\U0001d761\U0001d762'
+    '\U0001d764\U0001d766\U0001d769\U0001d76a\U0001d76c\U0001d770\U0001d772'
+    '\U0001d778\U0001d77c\U0001d77e\U0001d780\U0001d782\U0001d784\U0001d78e'
+    '\U0001d790\U0001d791\U0001d794\U0001d795\U0001d796\U0001d798\U0001d799'
+    '\U0001d79b\U0001d79c\U0001d79e\U0001d7a0\U0001d7a3\U0001d7a4\U0001d7a6'
+    '\U0001d7aa\U0001d7ac\U0001d7b2\U0001d7b6\U0001d7b8\U0001d7ba\U0001d7bc'
+    '\U0001d7be\U0001d7c8\U0001d7ca\U0001d7ce\U0001d7cf\U0001d7d0\U0001d7d1'
+    '\U0001d7d2\U0001d7d3\U0001d7d4\U0001d7d5\U0001d7d6\U0001d7d7\U0001d7d8'
+    '\U0001d7d9\U0001d7da\U0001d7db\U0001d7dc\U0001d7dd\U0001d7de\U0001d7df'
+    '\U0001d7e0\U0001d7e1\U0001d7e2\U0001d7e3\U0001d7e4\U0001d7e5\U0001d7e6'
+    '\U0001d7e7\U0001d7e8\U0001d7e9\U0001d7ea\U0001d7eb\U0001d7ec\U0001d7ed'
+    '\U0001d7ee\U0001d7ef\U0001d7f0\U0001d7f1\U0001d7f2\U0001d7f3\U0001d7f4'
+    '\U0001d7f5\U0001d7f6\U0001d7f7\U0001d7f8\U0001d7f9\U0001d7fa\U0001d7fb'
+    '\U0001d7fc\U0001d7fd\U0001d7fe\U0001d7ff\U0001e8c7\U0001e8cb\U0001ee00'
+    '\U0001ee24\U0001ee64\U0001ee80\U0001ee84\U0001f74c\U0001f768\U0001fbf0'
+    '\U0001fbf1\U0001fbf2\U0001fbf3\U0001fbf4\U0001fbf5\U0001fbf6\U0001fbf7'
+    '\U0001fbf8\U0001fbf9'
+)
 
+_CONFUSED_WITH_CHARS: str = (
+    " ',xifbglR235sl!388?agyiiwuy?'''''<>^^''':-i~':'i;J'ABEZHlKMNOPTYXayivop"
+    "ouYF2pcjCMSlJABE3KMHOPCTYXba6reopcyxsijwVvYyheli3dGqWwUSO''wqqhnnugfo:l:"
+    "lv'lo',lo.loV,*oo-o.loV..::Ol''_:o?O89o98:o8OO9oooooooo9oooooyoUODRTiYAJ"
+    "E?WMHYGhZ4bRWSVSLCPKd6GB=V><'UPdbJL2xHxRbFADDMBXx <Xl'KM:+/::coouvwzrgyf"
+    "y'i'~'''           ----'','.   ''<>/-/*~: CgHHHhllLlNPQRRRZZKBCeeEFMoiyD"
+    'deijlVXLCDMivxlcd-/\\*lvU:~TvUEipal/X()<>(){}+-/\\Txx\\/\\xrHlKMNOoPpCcT'
+    'YX-/93L6VEl!OQX=\\/O()/=//\\\\/BPdDTGKJCZFMNLSRVHWXYAElOU.,:=.2iV?2s239&'
+    ":'Ffu3JXBeforruuyirwzvscoooooooo():___-\\lloooo!':ABCEHlJKMNOPSTXYZ(\\)'"
+    'aceghijlopsvxylBEFlXOPST+ABCFOMTYXHZBClMTX8*lXOCLSocsROU7ouNOKCVFLX.Ovww'
+    "wVFLYEZ9E4LOU5TvsFiz7o3969ouyOZWCXWCVTLlRS3>AUY''{.3V\\7FRL<>/\\ABCDEFGH"
+    'lJKLMNOPQRSTUVWXYZabcdefghijklnopqrstuvwxyzABCDEFGHlJKLMNOPQRSTUVWXYZabc'
+    'defgijklnopqrstuvwxyzABCDEFGHlJKLMNOPQRSTUVWXYZabcdefghijklnopqrstuvwxyz'
+    'ACDGJKNOPQSTUVWXYZabcdfhijklnpqrstuvwxyzABCDEFGHlJKLMNOPQRSTUVWXYZabcdef'
+    'ghijklnopqrstuvwxyzABDEFGJKLMNOPQSTUVWXYabcdefghijklnopqrstuvwxyzABDEFGl'
+    'JKLMOSTUVWXYabcdefghijklnopqrstuvwxyzABCDEFGHlJKLMNOPQRSTUVWXYZabcdefghi'
+    'jklnopqrstuvwxyzABCDEFGHlJKLMNOPQRSTUVWXYZabcdefghijklnopqrstuvwxyzABCDE'
+    'FGHlJKLMNOPQRSTUVWXYZabcdefghijklnopqrstuvwxyzABCDEFGHlJKLMNOPQRSTUVWXYZ'
+    'abcdefghijklnopqrstuvwxyzABCDEFGHlJKLMNOPQRSTUVWXYZabcdefghijklnopqrstuv'
+    'wxyzABCDEFGHlJKLMNOPQRSTUVWXYZabcdefghijklnopqrstuvwxyziABEZHlKMNOPTYXay'
+    'ivopoupABEZHlKMNOPTYXayivopoupABEZHlKMNOPTYXayivopoupABEZHlKMNOPTYXayivo'
+    'poupABEZHlKMNOPTYXayivopoupFOl23456789Ol23456789Ol23456789Ol23456789Ol23'
+    '456789l8looloCTOl23456789'
+)
 
-COMMON_CONFUSABLES_MAP: ConfusablesMap = {
-    '\xa0': (' ', None),  # A0; COMMON
-    '´': ("'", None),  # B4; COMMON
-    '¸': (',', None),  # B8; COMMON
-    '×': ('x', None),  # D7; COMMON
-    'ı': ('i', None),  # 131; LATIN
-    'ſ': ('f', None),  # 17F; LATIN
-    'Ƅ': ('b', None),  # 184; LATIN
-    'ƍ': ('g', None),  # 18D; LATIN
-    'Ɩ': ('l', None),  # 196; LATIN
-    'Ʀ': ('R', None),  # 1A6; LATIN
-    'Ƨ': ('2', None),  # 1A7; LATIN
-    'Ʒ': ('3', None),  # 1B7; LATIN
-    'Ƽ': ('5', None),  # 1BC; LATIN
-    'ƽ': ('s', None),  # 1BD; LATIN
-    'ǀ': ('l', None),  # 1C0; LATIN
-    'ǃ': ('!', None),  # 1C3; LATIN
-    'Ȝ': ('3', None),  # 21C; LATIN
-    'Ȣ': ('8', None),  # 222; LATIN
-    'ȣ': ('8', None),  # 223; LATIN
-    'Ɂ': ('?', None),  # 241; LATIN
-    'ɑ': ('a', None),  # 251; LATIN
-    'ɡ': ('g', None),  # 261; LATIN
-    'ɣ': ('y', None),  # 263; LATIN
-    'ɩ': ('i', None),  # 269; LATIN
-    'ɪ': ('i', None),  # 26A; LATIN
-    'ɯ': ('w', None),  # 26F; LATIN
-    'ʋ': ('u', None),  # 28B; LATIN
-    'ʏ': ('y', None),  # 28F; LATIN
-    'ʔ': ('?', None),  # 294; LATIN
-    'ʹ': ("'", None),  # 2B9; COMMON
-    'ʻ': ("'", None),  # 2BB; COMMON
-    'ʼ': ("'", None),  # 2BC; COMMON
-    'ʽ': ("'", None),  # 2BD; COMMON
-    'ʾ': ("'", None),  # 2BE; COMMON
-    '˂': ('<', None),  # 2C2; COMMON
-    '˃': ('>', None),  # 2C3; COMMON
-    '˄': ('^', None),  # 2C4; COMMON
-    'ˆ': ('^', None),  # 2C6; COMMON
-    'ˈ': ("'", None),  # 2C8; COMMON
-    'ˊ': ("'", None),  # 2CA; COMMON
-    'ˋ': ("'", None),  # 2CB; COMMON
-    'ː': (':', None),  # 2D0; COMMON
-    '˗': ('-', None),  # 2D7; COMMON
-    '˛': ('i', None),  # 2DB; COMMON
-    '˜': ('~', None),  # 2DC; COMMON
-    '˴': ("'", None),  # 2F4; COMMON
-    '˸': (':', None),  # 2F8; COMMON
-    'ʹ': ("'", None),  # 374; COMMON
-    'ͺ': ('i', 0),  # 37A; GREEK
-    ';': (';', None),  # 37E; COMMON
-    'Ϳ': ('J', 0),  # 37F; GREEK
-    '΄': ("'", 0),  # 384; GREEK
-    'Α': ('A', 0),  # 391; GREEK
-    'Β': ('B', 0),  # 392; GREEK
-    'Ε': ('E', 0),  # 395; GREEK
-    'Ζ': ('Z', 0),  # 396; GREEK
-    'Η': ('H', 0),  # 397; GREEK
-    'Ι': ('l', 0),  # 399; GREEK
-    'Κ': ('K', 0),  # 39A; GREEK
-    'Μ': ('M', 0),  # 39C; GREEK
-    'Ν': ('N', 0),  # 39D; GREEK
-    'Ο': ('O', 0),  # 39F; GREEK
-    'Ρ': ('P', 0),  # 3A1; GREEK
-    'Τ': ('T', 0),  # 3A4; GREEK
-    'Υ': ('Y', 0),  # 3A5; GREEK
-    'Χ': ('X', 0),  # 3A7; GREEK
-    'α': ('a', 0),  # 3B1; GREEK
-    'γ': ('y', 0),  # 3B3; GREEK
-    'ι': ('i', 0),  # 3B9; GREEK
-    'ν': ('v', 0),  # 3BD; GREEK
-    'ο': ('o', 0),  # 3BF; GREEK
-    'ρ': ('p', 0),  # 3C1; GREEK
-    'σ': ('o', 0),  # 3C3; GREEK
-    'υ': ('u', 0),  # 3C5; GREEK
-    'ϒ': ('Y', 0),  # 3D2; GREEK
-    'Ϝ': ('F', 0),  # 3DC; GREEK
-    'Ϩ': ('2', None),  # 3E8; COPTIC
-    'ϱ': ('p', 0),  # 3F1; GREEK
-    'ϲ': ('c', 0),  # 3F2; GREEK
-    'ϳ': ('j', 0),  # 3F3; GREEK
-    'Ϲ': ('C', 0),  # 3F9; GREEK
-    'Ϻ': ('M', 0),  # 3FA; GREEK
-    'Ѕ': ('S', 1),  # 405; CYRILLIC
-    'І': ('l', 1),  # 406; CYRILLIC
-    'Ј': ('J', 1),  # 408; CYRILLIC
-    'А': ('A', 1),  # 410; CYRILLIC
-    'В': ('B', 1),  # 412; CYRILLIC
-    'Е': ('E', 1),  # 415; CYRILLIC
-    'З': ('3', 1),  # 417; CYRILLIC
-    'К': ('K', 1),  # 41A; CYRILLIC
-    'М': ('M', 1),  # 41C; CYRILLIC
-    'Н': ('H', 1),  # 41D; CYRILLIC
-    'О': ('O', 1),  # 41E; CYRILLIC
-    'Р': ('P', 1),  # 420; CYRILLIC
-    'С': ('C', 1),  # 421; CYRILLIC
-    'Т': ('T', 1),  # 422; CYRILLIC
-    'У': ('Y', 1),  # 423; CYRILLIC
-    'Х': ('X', 1),  # 425; CYRILLIC
-    'Ь': ('b', 1),  # 42C; CYRILLIC
-    'а': ('a', 1),  # 430; CYRILLIC
-    'б': ('6', 1),  # 431; CYRILLIC
-    'г': ('r', 1),  # 433; CYRILLIC
-    'е': ('e', 1),  # 435; CYRILLIC
-    'о': ('o', 1),  # 43E; CYRILLIC
-    'р': ('p', 1),  # 440; CYRILLIC
-    'с': ('c', 1),  # 441; CYRILLIC
-    'у': ('y', 1),  # 443; CYRILLIC
-    'х': ('x', 1),  # 445; CYRILLIC
-    'ѕ': ('s', 1),  # 455; CYRILLIC
-    'і': ('i', 1),  # 456; CYRILLIC
-    'ј': ('j', 1),  # 458; CYRILLIC
-    'ѡ': ('w', 1),  # 461; CYRILLIC
-    'Ѵ': ('V', 1),  # 474; CYRILLIC
-    'ѵ': ('v', 1),  # 475; CYRILLIC
-    'Ү': ('Y', 1),  # 4AE; CYRILLIC
-    'ү': ('y', 1),  # 4AF; CYRILLIC
-    'һ': ('h', 1),  # 4BB; CYRILLIC
-    'ҽ': ('e', 1),  # 4BD; CYRILLIC
-    'Ӏ': ('l', 1),  # 4C0; CYRILLIC
-    'ӏ': ('i', 1),  # 4CF; CYRILLIC
-    'Ӡ': ('3', 1),  # 4E0; CYRILLIC
-    'ԁ': ('d', 1),  # 501; CYRILLIC
-    'Ԍ': ('G', 1),  # 50C; CYRILLIC
-    'ԛ': ('q', 1),  # 51B; CYRILLIC
-    'Ԝ': ('W', 1),  # 51C; CYRILLIC
-    'ԝ': ('w', 1),  # 51D; CYRILLIC
-    'Ս': ('U', 2),  # 54D; ARMENIAN
-    'Տ': ('S', 2),  # 54F; ARMENIAN
-    'Օ': ('O', 2),  # 555; ARMENIAN
-    '՚': ("'", 2),  # 55A; ARMENIAN
-    '՝': ("'", 2),  # 55D; ARMENIAN
-    'ա': ('w', 2),  # 561; ARMENIAN
-    'գ': ('q', 2),  # 563; ARMENIAN
-    'զ': ('q', 2),  # 566; ARMENIAN
-    'հ': ('h', 2),  # 570; ARMENIAN
-    'ո': ('n', 2),  # 578; ARMENIAN
-    'ռ': ('n', 2),  # 57C; ARMENIAN
-    'ս': ('u', 2),  # 57D; ARMENIAN
-    'ց': ('g', 2),  # 581; ARMENIAN
-    'ք': ('f', 2),  # 584; ARMENIAN
-    'օ': ('o', 2),  # 585; ARMENIAN
-    '։': (':', 2),  # 589; ARMENIAN
-    '׀': ('l', None),  # 5C0; HEBREW
-    '׃': (':', None),  # 5C3; HEBREW
-    'ו': ('l', None),  # 5D5; HEBREW
-    'ט': ('v', None),  # 5D8; HEBREW
-    'י': ("'", None),  # 5D9; HEBREW
-    'ן': ('l', None),  # 5DF; HEBREW
-    'ס': ('o', None),  # 5E1; HEBREW
-    '׳': ("'", None),  # 5F3; HEBREW
-    '؍': (',', 3),  # 60D; ARABIC
-    'ا': ('l', 3),  # 627; ARABIC
-    'ه': ('o', 3),  # 647; ARABIC
-    '٠': ('.', 3),  # 660; ARABIC
-    '١': ('l', 3),  # 661; ARABIC
-    '٥': ('o', 3),  # 665; ARABIC
-    '٧': ('V', 3),  # 667; ARABIC
-    '٫': (',', 3),  # 66B; ARABIC
-    '٭': ('*', 3),  # 66D; ARABIC
-    'ھ': ('o', 3),  # 6BE; ARABIC
-    'ہ': ('o', 3),  # 6C1; ARABIC
-    '۔': ('-', 3),  # 6D4; ARABIC
-    'ە': ('o', 3),  # 6D5; ARABIC
-    '۰': ('.', 3),  # 6F0; ARABIC
-    '۱': ('l', 3),  # 6F1; ARABIC
-    '۵': ('o', 3),  # 6F5; ARABIC
-    '۷': ('V', 3),  # 6F7; ARABIC
-    '܁': ('.', None),  # 701; SYRIAC
-    '܂': ('.', None),  # 702; SYRIAC
-    '܃': (':', None),  # 703; SYRIAC
-    '܄': (':', None),  # 704; SYRIAC
-    '߀': ('O', None),  # 7C0; NKO
-    'ߊ': ('l', None),  # 7CA; NKO
-    'ߴ': ("'", None),  # 7F4; NKO
-    'ߵ': ("'", None),  # 7F5; NKO
-    'ߺ': ('_', None),  # 7FA; NKO
-    'ः': (':', 4),  # 903; DEVANAGARI
-    '०': ('o', 4),  # 966; DEVANAGARI
-    'ॽ': ('?', 4),  # 97D; DEVANAGARI
-    '০': ('O', 5),  # 9E6; BENGALI
-    '৪': ('8', 5),  # 9EA; BENGALI
-    '৭': ('9', 5),  # 9ED; BENGALI
-    '੦': ('o', 6),  # A66; GURMUKHI
-    '੧': ('9', 6),  # A67; GURMUKHI
-    '੪': ('8', 6),  # A6A; GURMUKHI
-    'ઃ': (':', 7),  # A83; GUJARATI
-    '૦': ('o', 7),  # AE6; GUJARATI
-    'ଃ': ('8', 8),  # B03; ORIYA
-    'ଠ': ('O', 8),  # B20; ORIYA
-    '୦': ('O', 8),  # B66; ORIYA
-    '୨': ('9', 8),  # B68; ORIYA
-    '௦': ('o', None),  # BE6; TAMIL
-    'ం': ('o', 9),  # C02; TELUGU
-    '౦': ('o', 9),  # C66; TELUGU
-    'ಂ': ('o', 10),  # C82; KANNADA
-    '೦': ('o', 10),  # CE6; KANNADA
-    'ം': ('o', None),  # D02; MALAYALAM
-    'ഠ': ('o', None),  # D20; MALAYALAM
-    '൦': ('o', None),  # D66; MALAYALAM
-    '൭': ('9', None),  # D6D; MALAYALAM
-    'ං': ('o', None),  # D82; SINHALA
-    '๐': ('o', None),  # E50; THAI
-    '໐': ('o', None),  # ED0; LAO
-    'ဝ': ('o', None),  # 101D; MYANMAR
-    '၀': ('o', None),  # 1040; MYANMAR
-    'ყ': ('y', None),  # 10E7; GEORGIAN
-    'ჿ': ('o', None),  # 10FF; GEORGIAN
-    'ሀ': ('U', None),  # 1200; ETHIOPIC
-    'ዐ': ('O', None),  # 12D0; ETHIOPIC
-    'Ꭰ': ('D', None),  # 13A0; CHEROKEE
-    'Ꭱ': ('R', None),  # 13A1; CHEROKEE
-    'Ꭲ': ('T', None),  # 13A2; CHEROKEE
-    'Ꭵ': ('i', None),  # 13A5; CHEROKEE
-    'Ꭹ': ('Y', None),  # 13A9; CHEROKEE
-    'Ꭺ': ('A', None),  # 13AA; CHEROKEE
-    'Ꭻ': ('J', None),  # 13AB; CHEROKEE
-    'Ꭼ': ('E', None),  # 13AC; CHEROKEE
-    'Ꭾ': ('?', None),  # 13AE; CHEROKEE
-    'Ꮃ': ('W', None),  # 13B3; CHEROKEE
-    'Ꮇ': ('M', None),  # 13B7; CHEROKEE
-    'Ꮋ': ('H', None),  # 13BB; CHEROKEE
-    'Ꮍ': ('Y', None),  # 13BD; CHEROKEE
-    'Ꮐ': ('G', None),  # 13C0; CHEROKEE
-    'Ꮒ': ('h', None),  # 13C2; CHEROKEE
-    'Ꮓ': ('Z', None),  # 13C3; CHEROKEE
-    'Ꮞ': ('4', None),  # 13CE; CHEROKEE
-    'Ꮟ': ('b', None),  # 13CF; CHEROKEE
-    'Ꮢ': ('R', None),  # 13D2; CHEROKEE
-    'Ꮤ': ('W', None),  # 13D4; CHEROKEE
-    'Ꮥ': ('S', None),  # 13D5; CHEROKEE
-    'Ꮩ': ('V', None),  # 13D9; CHEROKEE
-    'Ꮪ': ('S', None),  # 13DA; CHEROKEE
-    'Ꮮ': ('L', None),  # 13DE; CHEROKEE
-    'Ꮯ': ('C', None),  # 13DF; CHEROKEE
-    'Ꮲ': ('P', None),  # 13E2; CHEROKEE
-    'Ꮶ': ('K', None),  # 13E6; CHEROKEE
-    'Ꮷ': ('d', None),  # 13E7; CHEROKEE
-    'Ꮾ': ('6', None),  # 13EE; CHEROKEE
-    'Ᏻ': ('G', None),  # 13F3; CHEROKEE
-    'Ᏼ': ('B', None),  # 13F4; CHEROKEE
-    '᐀': ('=', None),  # 1400; CANADIAN_ABORIGINAL
-    'ᐯ': ('V', None),  # 142F; CANADIAN_ABORIGINAL
-    'ᐳ': ('>', None),  # 1433; CANADIAN_ABORIGINAL
-    'ᐸ': ('<', None),  # 1438; CANADIAN_ABORIGINAL
-    'ᑊ': ("'", None),  # 144A; CANADIAN_ABORIGINAL
-    'ᑌ': ('U', None),  # 144C; CANADIAN_ABORIGINAL
-    'ᑭ': ('P', None),  # 146D; CANADIAN_ABORIGINAL
-    'ᑯ': ('d', None),  # 146F; CANADIAN_ABORIGINAL
-    'ᑲ': ('b', None),  # 1472; CANADIAN_ABORIGINAL
-    'ᒍ': ('J', None),  # 148D; CANADIAN_ABORIGINAL
-    'ᒪ': ('L', None),  # 14AA; CANADIAN_ABORIGINAL
-    'ᒿ': ('2', None),  # 14BF; CANADIAN_ABORIGINAL
-    'ᕁ': ('x', None),  # 1541; CANADIAN_ABORIGINAL
-    'ᕼ': ('H', None),  # 157C; CANADIAN_ABORIGINAL
-    'ᕽ': ('x', None),  # 157D; CANADIAN_ABORIGINAL
-    'ᖇ': ('R', None),  # 1587; CANADIAN_ABORIGINAL
-    'ᖯ': ('b', None),  # 15AF; CANADIAN_ABORIGINAL
-    'ᖴ': ('F', None),  # 15B4; CANADIAN_ABORIGINAL
-    'ᗅ': ('A', None),  # 15C5; CANADIAN_ABORIGINAL
-    'ᗞ': ('D', None),  # 15DE; CANADIAN_ABORIGINAL
-    'ᗪ': ('D', None),  # 15EA; CANADIAN_ABORIGINAL
-    'ᗰ': ('M', None),  # 15F0; CANADIAN_ABORIGINAL
-    'ᗷ': ('B', None),  # 15F7; CANADIAN_ABORIGINAL
-    '᙭': ('X', None),  # 166D; CANADIAN_ABORIGINAL
-    '᙮': ('x', None),  # 166E; CANADIAN_ABORIGINAL
-    '\u1680': (' ', None),  # 1680; OGHAM
-    'ᚲ': ('<', None),  # 16B2; RUNIC
-    'ᚷ': ('X', None),  # 16B7; RUNIC
-    'ᛁ': ('l', None),  # 16C1; RUNIC
-    'ᛌ': ("'", None),  # 16CC; RUNIC
-    'ᛕ': ('K', None),  # 16D5; RUNIC
-    'ᛖ': ('M', None),  # 16D6; RUNIC
-    '᛬': (':', None),  # 16EC; COMMON
-    '᛭': ('+', None),  # 16ED; COMMON
-    '᜵': ('/', None),  # 1735; COMMON
-    '᠃': (':', None),  # 1803; COMMON
-    '᠉': (':', None),  # 1809; MONGOLIAN
-    'ᴄ': ('c', None),  # 1D04; LATIN
-    'ᴏ': ('o', None),  # 1D0F; LATIN
-    'ᴑ': ('o', None),  # 1D11; LATIN
-    'ᴜ': ('u', None),  # 1D1C; LATIN
-    'ᴠ': ('v', None),  # 1D20; LATIN
-    'ᴡ': ('w', None),  # 1D21; LATIN
-    'ᴢ': ('z', None),  # 1D22; LATIN
-    'ᴦ': ('r', 0),  # 1D26; GREEK
-    'ᶃ': ('g', None),  # 1D83; LATIN
-    'ᶌ': ('y', None),  # 1D8C; LATIN
-    'ẝ': ('f', None),  # 1E9D; LATIN
-    'ỿ': ('y', None),  # 1EFF; LATIN
-    '᾽': ("'", 0),  # 1FBD; GREEK
-    'ι': ('i', 0),  # 1FBE; GREEK
-    '᾿': ("'", 0),  # 1FBF; GREEK
-    '῀': ('~', 0),  # 1FC0; GREEK
-    '`': ("'", 0),  # 1FEF; GREEK
-    '´': ("'", 0),  # 1FFD; GREEK
-    '῾': ("'", 0),  # 1FFE; GREEK
-    '\u2000': (' ', None),  # 2000; COMMON
-    '\u2001': (' ', None),  # 2001; COMMON
-    '\u2002': (' ', None),  # 2002; COMMON
-    '\u2003': (' ', None),  # 2003; COMMON
-    '\u2004': (' ', None),  # 2004; COMMON
-    '\u2005': (' ', None),  # 2005; COMMON
-    '\u2006': (' ', None),  # 2006; COMMON
-    '\u2007': (' ', None),  # 2007; COMMON
-    '\u2008': (' ', None),  # 2008; COMMON
-    '\u2009': (' ', None),  # 2009; COMMON
-    '\u200a': (' ', None),  # 200A; COMMON
-    '‐': ('-', None),  # 2010; COMMON
-    '‑': ('-', None),  # 2011; COMMON
-    '‒': ('-', None),  # 2012; COMMON
-    '–': ('-', None),  # 2013; COMMON
-    '‘': ("'", None),  # 2018; COMMON
-    '’': ("'", None),  # 2019; COMMON
-    '‚': (',', None),  # 201A; COMMON
-    '‛': ("'", None),  # 201B; COMMON
-    '․': ('.', None),  # 2024; COMMON
-    '\u2028': (' ', None),  # 2028; COMMON
-    '\u2029': (' ', None),  # 2029; COMMON
-    '\u202f': (' ', None),  # 202F; COMMON
-    '′': ("'", None),  # 2032; COMMON
-    '‵': ("'", None),  # 2035; COMMON
-    '‹': ('<', None),  # 2039; COMMON
-    '›': ('>', None),  # 203A; COMMON
-    '⁁': ('/', None),  # 2041; COMMON
-    '⁃': ('-', None),  # 2043; COMMON
-    '⁄': ('/', None),  # 2044; COMMON
-    '⁎': ('*', None),  # 204E; COMMON
-    '⁓': ('~', None),  # 2053; COMMON
-    '⁚': (':', None),  # 205A; COMMON
-    '\u205f': (' ', None),  # 205F; COMMON
-    'ℂ': ('C', None),  # 2102; COMMON
-    'ℊ': ('g', None),  # 210A; COMMON
-    'ℋ': ('H', None),  # 210B; COMMON
-    'ℌ': ('H', None),  # 210C; COMMON
-    'ℍ': ('H', None),  # 210D; COMMON
-    'ℎ': ('h', None),  # 210E; COMMON
-    'ℐ': ('l', None),  # 2110; COMMON
-    'ℑ': ('l', None),  # 2111; COMMON
-    'ℒ': ('L', None),  # 2112; COMMON
-    'ℓ': ('l', None),  # 2113; COMMON
-    'ℕ': ('N', None),  # 2115; COMMON
-    'ℙ': ('P', None),  # 2119; COMMON
-    'ℚ': ('Q', None),  # 211A; COMMON
-    'ℛ': ('R', None),  # 211B; COMMON
-    'ℜ': ('R', None),  # 211C; COMMON
-    'ℝ': ('R', None),  # 211D; COMMON
-    'ℤ': ('Z', None),  # 2124; COMMON
-    'ℨ': ('Z', None),  # 2128; COMMON
-    'K': ('K', None),  # 212A; LATIN
-    'ℬ': ('B', None),  # 212C; COMMON
-    'ℭ': ('C', None),  # 212D; COMMON
-    '℮': ('e', None),  # 212E; COMMON
-    'ℯ': ('e', None),  # 212F; COMMON
-    'ℰ': ('E', None),  # 2130; COMMON
-    'ℱ': ('F', None),  # 2131; COMMON
-    'ℳ': ('M', None),  # 2133; COMMON
-    'ℴ': ('o', None),  # 2134; COMMON
-    'ℹ': ('i', None),  # 2139; COMMON
-    'ℽ': ('y', None),  # 213D; COMMON
-    'ⅅ': ('D', None),  # 2145; COMMON
-    'ⅆ': ('d', None),  # 2146; COMMON
-    'ⅇ': ('e', None),  # 2147; COMMON
-    'ⅈ': ('i', None),  # 2148; COMMON
-    'ⅉ': ('j', None),  # 2149; COMMON
-    'Ⅰ': ('l', None),  # 2160; LATIN
-    'Ⅴ': ('V', None),  # 2164; LATIN
-    'Ⅹ': ('X', None),  # 2169; LATIN
-    'Ⅼ': ('L', None),  # 216C; LATIN
-    'Ⅽ': ('C', None),  # 216D; LATIN
-    'Ⅾ': ('D', None),  # 216E; LATIN
-    'Ⅿ': ('M', None),  # 216F; LATIN
-    'ⅰ': ('i', None),  # 2170; LATIN
-    'ⅴ': ('v', None),  # 2174; LATIN
-    'ⅹ': ('x', None),  # 2179; LATIN
-    'ⅼ': ('l', None),  # 217C; LATIN
-    'ⅽ': ('c', None),  # 217D; LATIN
-    'ⅾ': ('d', None),  # 217E; LATIN
-    '−': ('-', None),  # 2212; COMMON
-    '∕': ('/', None),  # 2215; COMMON
-    '∖': ('\\', None),  # 2216; COMMON
-    '∗': ('*', None),  # 2217; COMMON
-    '∣': ('l', None),  # 2223; COMMON
-    '∨': ('v', None),  # 2228; COMMON
-    '∪': ('U', None),  # 222A; COMMON
-    '∶': (':', None),  # 2236; COMMON
-    '∼': ('~', None),  # 223C; COMMON
-    '⊤': ('T', None),  # 22A4; COMMON
-    '⋁': ('v', None),  # 22C1; COMMON
-    '⋃': ('U', None),  # 22C3; COMMON
-    '⋿': ('E', None),  # 22FF; COMMON
-    '⍳': ('i', None),  # 2373; COMMON
-    '⍴': ('p', None),  # 2374; COMMON
-    '⍺': ('a', None),  # 237A; COMMON
-    '⏽': ('l', None),  # 23FD; COMMON
-    '╱': ('/', None),  # 2571; COMMON
-    '╳': ('X', None),  # 2573; COMMON
-    '❨': ('(', None),  # 2768; COMMON
-    '❩': (')', None),  # 2769; COMMON
-    '❮': ('<', None),  # 276E; COMMON
-    '❯': ('>', None),  # 276F; COMMON
-    '❲': ('(', None),  # 2772; COMMON
-    '❳': (')', None),  # 2773; COMMON
-    '❴': ('{', None),  # 2774; COMMON
-    '❵': ('}', None),  # 2775; COMMON
-    '➕': ('+', None),  # 2795; COMMON
-    '➖': ('-', None),  # 2796; COMMON
-    '⟋': ('/', None),  # 27CB; COMMON
-    '⟍': ('\\', None),  # 27CD; COMMON
-    '⟙': ('T', None),  # 27D9; COMMON
-    '⤫': ('x', None),  # 292B; COMMON
-    '⤬': ('x', None),  # 292C; COMMON
-    '⧵': ('\\', None),  # 29F5; COMMON
-    '⧸': ('/', None),  # 29F8; COMMON
-    '⧹': ('\\', None),  # 29F9; COMMON
-    '⨯': ('x', None),  # 2A2F; COMMON
-    'ⲅ': ('r', None),  # 2C85; COPTIC
-    'Ⲏ': ('H', None),  # 2C8E; COPTIC
-    'Ⲓ': ('l', None),  # 2C92; COPTIC
-    'Ⲕ': ('K', None),  # 2C94; COPTIC
-    'Ⲙ': ('M', None),  # 2C98; COPTIC
-    'Ⲛ': ('N', None),  # 2C9A; COPTIC
-    'Ⲟ': ('O', None),  # 2C9E; COPTIC
-    'ⲟ': ('o', None),  # 2C9F; COPTIC
-    'Ⲣ': ('P', None),  # 2CA2; COPTIC
-    'ⲣ': ('p', None),  # 2CA3; COPTIC
-    'Ⲥ': ('C', None),  # 2CA4; COPTIC
-    'ⲥ': ('c', None),  # 2CA5; COPTIC
-    'Ⲧ': ('T', None),  # 2CA6; COPTIC
-    'Ⲩ': ('Y', None),  # 2CA8; COPTIC
-    'Ⲭ': ('X', None),  # 2CAC; COPTIC
-    'Ⲻ': ('-', None),  # 2CBA; COPTIC
-    'Ⳇ': ('/', None),  # 2CC6; COPTIC
-    'Ⳋ': ('9', None),  # 2CCA; COPTIC
-    'Ⳍ': ('3', None),  # 2CCC; COPTIC
-    'Ⳑ': ('L', None),  # 2CD0; COPTIC
-    'Ⳓ': ('6', None),  # 2CD2; COPTIC
-    'ⴸ': ('V', None),  # 2D38; TIFINAGH
-    'ⴹ': ('E', None),  # 2D39; TIFINAGH
-    'ⵏ': ('l', None),  # 2D4F; TIFINAGH
-    'ⵑ': ('!', None),  # 2D51; TIFINAGH
-    'ⵔ': ('O', None),  # 2D54; TIFINAGH
-    'ⵕ': ('Q', None),  # 2D55; TIFINAGH
-    'ⵝ': ('X', None),  # 2D5D; TIFINAGH
-    '⹀': ('=', None),  # 2E40; COMMON
-    '⼂': ('\\', None),  # 2F02; HAN
-    '⼃': ('/', None),  # 2F03; HAN
-    '〇': ('O', None),  # 3007; HAN
-    '〔': ('(', None),  # 3014; COMMON
-    '〕': (')', None),  # 3015; COMMON
-    '〳': ('/', None),  # 3033; COMMON
-    '゠': ('=', None),  # 30A0; COMMON
-    'ノ': ('/', 11),  # 30CE; KATAKANA
-    '㇓': ('/', None),  # 31D3; COMMON
-    '㇔': ('\\', None),  # 31D4; COMMON
-    '丶': ('\\', None),  # 4E36; HAN
-    '丿': ('/', None),  # 4E3F; HAN
-    'ꓐ': ('B', None),  # A4D0; LISU
-    'ꓑ': ('P', None),  # A4D1; LISU
-    'ꓒ': ('d', None),  # A4D2; LISU
-    'ꓓ': ('D', None),  # A4D3; LISU
-    'ꓔ': ('T', None),  # A4D4; LISU
-    'ꓖ': ('G', None),  # A4D6; LISU
-    'ꓗ': ('K', None),  # A4D7; LISU
-    'ꓙ': ('J', None),  # A4D9; LISU
-    'ꓚ': ('C', None),  # A4DA; LISU
-    'ꓜ': ('Z', None),  # A4DC; LISU
-    'ꓝ': ('F', None),  # A4DD; LISU
-    'ꓟ': ('M', None),  # A4DF; LISU
-    'ꓠ': ('N', None),  # A4E0; LISU
-    'ꓡ': ('L', None),  # A4E1; LISU
-    'ꓢ': ('S', None),  # A4E2; LISU
-    'ꓣ': ('R', None),  # A4E3; LISU
-    'ꓦ': ('V', None),  # A4E6; LISU
-    'ꓧ': ('H', None),  # A4E7; LISU
-    'ꓪ': ('W', None),  # A4EA; LISU
-    'ꓫ': ('X', None),  # A4EB; LISU
-    'ꓬ': ('Y', None),  # A4EC; LISU
-    'ꓮ': ('A', None),  # A4EE; LISU
-    'ꓰ': ('E', None),  # A4F0; LISU
-    'ꓲ': ('l', None),  # A4F2; LISU
-    'ꓳ': ('O', None),  # A4F3; LISU
-    'ꓴ': ('U', None),  # A4F4; LISU
-    'ꓸ': ('.', None),  # A4F8; LISU
-    'ꓹ': (',', None),  # A4F9; LISU
-    'ꓽ': (':', None),  # A4FD; LISU
-    '꓿': ('=', None),  # A4FF; LISU
-    '꘎': ('.', None),  # A60E; VAI
-    'Ꙅ': ('2', 1),  # A644; CYRILLIC
-    'ꙇ': ('i', 1),  # A647; CYRILLIC
-    'ꛟ': ('V', None),  # A6DF; BAMUM
-    'ꛫ': ('?', None),  # A6EB; BAMUM
-    'ꛯ': ('2', None),  # A6EF; BAMUM
-    'ꜱ': ('s', None),  # A731; LATIN
-    'Ꝛ': ('2', None),  # A75A; LATIN
-    'Ꝫ': ('3', None),  # A76A; LATIN
-    'Ꝯ': ('9', None),  # A76E; LATIN
-    'ꝸ': ('&', None),  # A778; LATIN
-    '꞉': (':', None),  # A789; COMMON
-    'ꞌ': ("'", None),  # A78C; LATIN
-    'Ꞙ': ('F', None),  # A798; LATIN
-    'ꞙ': ('f', None),  # A799; LATIN
-    'ꞟ': ('u', None),  # A79F; LATIN
-    'Ɜ': ('3', None),  # A7AB; LATIN
-    'Ʝ': ('J', None),  # A7B2; LATIN
-    'Ꭓ': ('X', None),  # A7B3; LATIN
-    'Ꞵ': ('B', None),  # A7B4; LATIN
-    'ꬲ': ('e', None),  # AB32; LATIN
-    'ꬵ': ('f', None),  # AB35; LATIN
-    'ꬽ': ('o', None),  # AB3D; LATIN
-    'ꭇ': ('r', None),  # AB47; LATIN
-    'ꭈ': ('r', None),  # AB48; LATIN
-    'ꭎ': ('u', None),  # AB4E; LATIN
-    'ꭒ': ('u', None),  # AB52; LATIN
-    'ꭚ': ('y', None),  # AB5A; LATIN
-    'ꭵ': ('i', None),  # AB75; CHEROKEE
-    'ꮁ': ('r', None),  # AB81; CHEROKEE
-    'ꮃ': ('w', None),  # AB83; CHEROKEE
-    'ꮓ': ('z', None),  # AB93; CHEROKEE
-    'ꮩ': ('v', None),  # ABA9; CHEROKEE
-    'ꮪ': ('s', None),  # ABAA; CHEROKEE
-    'ꮯ': ('c', None),  # ABAF; CHEROKEE
-    'ﮦ': ('o', 3),  # FBA6; ARABIC
-    'ﮧ': ('o', 3),  # FBA7; ARABIC
-    'ﮨ': ('o', 3),  # FBA8; ARABIC
-    'ﮩ': ('o', 3),  # FBA9; ARABIC
-    'ﮪ': ('o', 3),  # FBAA; ARABIC
-    'ﮫ': ('o', 3),  # FBAB; ARABIC
-    'ﮬ': ('o', 3),  # FBAC; ARABIC
-    'ﮭ': ('o', 3),  # FBAD; ARABIC
-    '﴾': ('(', None),  # FD3E; COMMON
-    '﴿': (')', None),  # FD3F; COMMON
-    '︰': (':', None),  # FE30; COMMON
-    '﹍': ('_', None),  # FE4D; COMMON
-    '﹎': ('_', None),  # FE4E; COMMON
-    '﹏': ('_', None),  # FE4F; COMMON
-    '﹘': ('-', None),  # FE58; COMMON
-    '﹨': ('\\', None),  # FE68; COMMON
-    'ﺍ': ('l', 3),  # FE8D; ARABIC
-    'ﺎ': ('l', 3),  # FE8E; ARABIC
-    'ﻩ': ('o', 3),  # FEE9; ARABIC
-    'ﻪ': ('o', 3),  # FEEA; ARABIC
-    'ﻫ': ('o', 3),  # FEEB; ARABIC
-    'ﻬ': ('o', 3),  # FEEC; ARABIC
-    '！': ('!', None),  # FF01; COMMON
-    '＇': ("'", None),  # FF07; COMMON
-    '：': (':', None),  # FF1A; COMMON
-    'Ａ': ('A', None),  # FF21; LATIN
-    'Ｂ': ('B', None),  # FF22; LATIN
-    'Ｃ': ('C', None),  # FF23; LATIN
-    'Ｅ': ('E', None),  # FF25; LATIN
-    'Ｈ': ('H', None),  # FF28; LATIN
-    'Ｉ': ('l', None),  # FF29; LATIN
-    'Ｊ': ('J', None),  # FF2A; LATIN
-    'Ｋ': ('K', None),  # FF2B; LATIN
-    'Ｍ': ('M', None),  # FF2D; LATIN
-    'Ｎ': ('N', None),  # FF2E; LATIN
-    'Ｏ': ('O', None),  # FF2F; LATIN
-    'Ｐ': ('P', None),  # FF30; LATIN
-    'Ｓ': ('S', None),  # FF33; LATIN
-    'Ｔ': ('T', None),  # FF34; LATIN
-    'Ｘ': ('X', None),  # FF38; LATIN
-    'Ｙ': ('Y', None),  # FF39; LATIN
-    'Ｚ': ('Z', None),  # FF3A; LATIN
-    '［': ('(', None),  # FF3B; COMMON
-    '＼': ('\\', None),  # FF3C; COMMON
-    '］': (')', None),  # FF3D; COMMON
-    '｀': ("'", None),  # FF40; COMMON
-    'ａ': ('a', None),  # FF41; LATIN
-    'ｃ': ('c', None),  # FF43; LATIN
-    'ｅ': ('e', None),  # FF45; LATIN
-    'ｇ': ('g', None),  # FF47; LATIN
-    'ｈ': ('h', None),  # FF48; LATIN
-    'ｉ': ('i', None),  # FF49; LATIN
-    'ｊ': ('j', None),  # FF4A; LATIN
-    'ｌ': ('l', None),  # FF4C; LATIN
-    'ｏ': ('o', None),  # FF4F; LATIN
-    'ｐ': ('p', None),  # FF50; LATIN
-    'ｓ': ('s', None),  # FF53; LATIN
-    'ｖ': ('v', None),  # FF56; LATIN
-    'ｘ': ('x', None),  # FF58; LATIN
-    'ｙ': ('y', None),  # FF59; LATIN
-    '￨': ('l', None),  # FFE8; COMMON
-    '𐊂': ('B', None),  # 10282; LYCIAN
-    '𐊆': ('E', None),  # 10286; LYCIAN
-    '𐊇': ('F', None),  # 10287; LYCIAN
-    '𐊊': ('l', None),  # 1028A; LYCIAN
-    '𐊐': ('X', None),  # 10290; LYCIAN
-    '𐊒': ('O', None),  # 10292; LYCIAN
-    '𐊕': ('P', None),  # 10295; LYCIAN
-    '𐊖': ('S', None),  # 10296; LYCIAN
-    '𐊗': ('T', None),  # 10297; LYCIAN
-    '𐊛': ('+', None),  # 1029B; LYCIAN
-    '𐊠': ('A', None),  # 102A0; CARIAN
-    '𐊡': ('B', None),  # 102A1; CARIAN
-    '𐊢': ('C', None),  # 102A2; CARIAN
-    '𐊥': ('F', None),  # 102A5; CARIAN
-    '𐊫': ('O', None),  # 102AB; CARIAN
-    '𐊰': ('M', None),  # 102B0; CARIAN
-    '𐊱': ('T', None),  # 102B1; CARIAN
-    '𐊲': ('Y', None),  # 102B2; CARIAN
-    '𐊴': ('X', None),  # 102B4; CARIAN
-    '𐋏': ('H', None),  # 102CF; CARIAN
-    '𐋵': ('Z', None),  # 102F5; COMMON
-    '𐌁': ('B', None),  # 10301; OLD_ITALIC
-    '𐌂': ('C', None),  # 10302; OLD_ITALIC
-    '𐌉': ('l', None),  # 10309; OLD_ITALIC
-    '𐌑': ('M', None),  # 10311; OLD_ITALIC
-    '𐌕': ('T', None),  # 10315; OLD_ITALIC
-    '𐌗': ('X', None),  # 10317; OLD_ITALIC
-    '𐌚': ('8', None),  # 1031A; OLD_ITALIC
-    '𐌟': ('*', None),  # 1031F; OLD_ITALIC
-    '𐌠': ('l', None),  # 10320; OLD_ITALIC
-    '𐌢': ('X', None),  # 10322; OLD_ITALIC
-    '𐐄': ('O', None),  # 10404; DESERET
-    '𐐕': ('C', None),  # 10415; DESERET
-    '𐐛': ('L', None),  # 1041B; DESERET
-    '𐐠': ('S', None),  # 10420; DESERET
-    '𐐬': ('o', None),  # 1042C; DESERET
-    '𐐽': ('c', None),  # 1043D; DESERET
-    '𐑈': ('s', None),  # 10448; DESERET
-    '𐒴': ('R', None),  # 104B4; OSAGE
-    '𐓂': ('O', None),  # 104C2; OSAGE
-    '𐓎': ('U', None),  # 104CE; OSAGE
-    '𐓒': ('7', None),  # 104D2; OSAGE
-    '𐓪': ('o', None),  # 104EA; OSAGE
-    '𐓶': ('u', None),  # 104F6; OSAGE
-    '𐔓': ('N', None),  # 10513; ELBASAN
-    '𐔖': ('O', None),  # 10516; ELBASAN
-    '𐔘': ('K', None),  # 10518; ELBASAN
-    '𐔜': ('C', None),  # 1051C; ELBASAN
-    '𐔝': ('V', None),  # 1051D; ELBASAN
-    '𐔥': ('F', None),  # 10525; ELBASAN
-    '𐔦': ('L', None),  # 10526; ELBASAN
-    '𐔧': ('X', None),  # 10527; ELBASAN
-    '𐩐': ('.', None),  # 10A50; KHAROSHTHI
-    '𑓐': ('O', None),  # 114D0; TIRHUTA
-    '𑜆': ('v', None),  # 11706; AHOM
-    '𑜊': ('w', None),  # 1170A; AHOM
-    '𑜎': ('w', None),  # 1170E; AHOM
-    '𑜏': ('w', None),  # 1170F; AHOM
-    '𑢠': ('V', None),  # 118A0; WARANG_CITI
-    '𑢢': ('F', None),  # 118A2; WARANG_CITI
-    '𑢣': ('L', None),  # 118A3; WARANG_CITI
-    '𑢤': ('Y', None),  # 118A4; WARANG_CITI
-    '𑢦': ('E', None),  # 118A6; WARANG_CITI
-    '𑢩': ('Z', None),  # 118A9; WARANG_CITI
-    '𑢬': ('9', None),  # 118AC; WARANG_CITI
-    '𑢮': ('E', None),  # 118AE; WARANG_CITI
-    '𑢯': ('4', None),  # 118AF; WARANG_CITI
-    '𑢲': ('L', None),  # 118B2; WARANG_CITI
-    '𑢵': ('O', None),  # 118B5; WARANG_CITI
-    '𑢸': ('U', None),  # 118B8; WARANG_CITI
-    '𑢻': ('5', None),  # 118BB; WARANG_CITI
-    '𑢼': ('T', None),  # 118BC; WARANG_CITI
-    '𑣀': ('v', None),  # 118C0; WARANG_CITI
-    '𑣁': ('s', None),  # 118C1; WARANG_CITI
-    '𑣂': ('F', None),  # 118C2; WARANG_CITI
-    '𑣃': ('i', None),  # 118C3; WARANG_CITI
-    '𑣄': ('z', None),  # 118C4; WARANG_CITI
-    '𑣆': ('7', None),  # 118C6; WARANG_CITI
-    '𑣈': ('o', None),  # 118C8; WARANG_CITI
-    '𑣊': ('3', None),  # 118CA; WARANG_CITI
-    '𑣌': ('9', None),  # 118CC; WARANG_CITI
-    '𑣕': ('6', None),  # 118D5; WARANG_CITI
-    '𑣖': ('9', None),  # 118D6; WARANG_CITI
-    '𑣗': ('o', None),  # 118D7; WARANG_CITI
-    '𑣘': ('u', None),  # 118D8; WARANG_CITI
-    '𑣜': ('y', None),  # 118DC; WARANG_CITI
-    '𑣠': ('O', None),  # 118E0; WARANG_CITI
-    '𑣥': ('Z', None),  # 118E5; WARANG_CITI
-    '𑣦': ('W', None),  # 118E6; WARANG_CITI
-    '𑣩': ('C', None),  # 118E9; WARANG_CITI
-    '𑣬': ('X', None),  # 118EC; WARANG_CITI
-    '𑣯': ('W', None),  # 118EF; WARANG_CITI
-    '𑣲': ('C', None),  # 118F2; WARANG_CITI
-    '𖼈': ('V', None),  # 16F08; MIAO
-    '𖼊': ('T', None),  # 16F0A; MIAO
-    '𖼖': ('L', None),  # 16F16; MIAO
-    '𖼨': ('l', None),  # 16F28; MIAO
-    '𖼵': ('R', None),  # 16F35; MIAO
-    '𖼺': ('S', None),  # 16F3A; MIAO
-    '𖼻': ('3', None),  # 16F3B; MIAO
-    '𖼿': ('>', None),  # 16F3F; MIAO
-    '𖽀': ('A', None),  # 16F40; MIAO
-    '𖽂': ('U', None),  # 16F42; MIAO
-    '𖽃': ('Y', None),  # 16F43; MIAO
-    '𖽑': ("'", None),  # 16F51; MIAO
-    '𖽒': ("'", None),  # 16F52; MIAO
-    '𝄔': ('{', None),  # 1D114; COMMON
-    '𝅭': ('.', None),  # 1D16D; COMMON
-    '𝈆': ('3', 0),  # 1D206; GREEK
-    '𝈍': ('V', 0),  # 1D20D; GREEK
-    '𝈏': ('\\', 0),  # 1D20F; GREEK
-    '𝈒': ('7', 0),  # 1D212; GREEK
-    '𝈓': ('F', 0),  # 1D213; GREEK
-    '𝈖': ('R', 0),  # 1D216; GREEK
-    '𝈪': ('L', 0),  # 1D22A; GREEK
-    '𝈶': ('<', 0),  # 1D236; GREEK
-    '𝈷': ('>', 0),  # 1D237; GREEK
-    '𝈺': ('/', 0),  # 1D23A; GREEK
-    '𝈻': ('\\', 0),  # 1D23B; GREEK
-    '𝐀': ('A', None),  # 1D400; COMMON
-    '𝐁': ('B', None),  # 1D401; COMMON
-    '𝐂': ('C', None),  # 1D402; COMMON
-    '𝐃': ('D', None),  # 1D403; COMMON
-    '𝐄': ('E', None),  # 1D404; COMMON
-    '𝐅': ('F', None),  # 1D405; COMMON
-    '𝐆': ('G', None),  # 1D406; COMMON
-    '𝐇': ('H', None),  # 1D407; COMMON
-    '𝐈': ('l', None),  # 1D408; COMMON
-    '𝐉': ('J', None),  # 1D409; COMMON
-    '𝐊': ('K', None),  # 1D40A; COMMON
-    '𝐋': ('L', None),  # 1D40B; COMMON
-    '𝐌': ('M', None),  # 1D40C; COMMON
-    '𝐍': ('N', None),  # 1D40D; COMMON
-    '𝐎': ('O', None),  # 1D40E; COMMON
-    '𝐏': ('P', None),  # 1D40F; COMMON
-    '𝐐': ('Q', None),  # 1D410; COMMON
-    '𝐑': ('R', None),  # 1D411; COMMON
-    '𝐒': ('S', None),  # 1D412; COMMON
-    '𝐓': ('T', None),  # 1D413; COMMON
-    '𝐔': ('U', None),  # 1D414; COMMON
-    '𝐕': ('V', None),  # 1D415; COMMON
-    '𝐖': ('W', None),  # 1D416; COMMON
-    '𝐗': ('X', None),  # 1D417; COMMON
-    '𝐘': ('Y', None),  # 1D418; COMMON
-    '𝐙': ('Z', None),  # 1D419; COMMON
-    '𝐚': ('a', None),  # 1D41A; COMMON
-    '𝐛': ('b', None),  # 1D41B; COMMON
-    '𝐜': ('c', None),  # 1D41C; COMMON
-    '𝐝': ('d', None),  # 1D41D; COMMON
-    '𝐞': ('e', None),  # 1D41E; COMMON
-    '𝐟': ('f', None),  # 1D41F; COMMON
-    '𝐠': ('g', None),  # 1D420; COMMON
-    '𝐡': ('h', None),  # 1D421; COMMON
-    '𝐢': ('i', None),  # 1D422; COMMON
-    '𝐣': ('j', None),  # 1D423; COMMON
-    '𝐤': ('k', None),  # 1D424; COMMON
-    '𝐥': ('l', None),  # 1D425; COMMON
-    '𝐧': ('n', None),  # 1D427; COMMON
-    '𝐨': ('o', None),  # 1D428; COMMON
-    '𝐩': ('p', None),  # 1D429; COMMON
-    '𝐪': ('q', None),  # 1D42A; COMMON
-    '𝐫': ('r', None),  # 1D42B; COMMON
-    '𝐬': ('s', None),  # 1D42C; COMMON
-    '𝐭': ('t', None),  # 1D42D; COMMON
-    '𝐮': ('u', None),  # 1D42E; COMMON
-    '𝐯': ('v', None),  # 1D42F; COMMON
-    '𝐰': ('w', None),  # 1D430; COMMON
-    '𝐱': ('x', None),  # 1D431; COMMON
-    '𝐲': ('y', None),  # 1D432; COMMON
-    '𝐳': ('z', None),  # 1D433; COMMON
-    '𝐴': ('A', None),  # 1D434; COMMON
-    '𝐵': ('B', None),  # 1D435; COMMON
-    '𝐶': ('C', None),  # 1D436; COMMON
-    '𝐷': ('D', None),  # 1D437; COMMON
-    '𝐸': ('E', None),  # 1D438; COMMON
-    '𝐹': ('F', None),  # 1D439; COMMON
-    '𝐺': ('G', None),  # 1D43A; COMMON
-    '𝐻': ('H', None),  # 1D43B; COMMON
-    '𝐼': ('l', None),  # 1D43C; COMMON
-    '𝐽': ('J', None),  # 1D43D; COMMON
-    '𝐾': ('K', None),  # 1D43E; COMMON
-    '𝐿': ('L', None),  # 1D43F; COMMON
-    '𝑀': ('M', None),  # 1D440; COMMON
-    '𝑁': ('N', None),  # 1D441; COMMON
-    '𝑂': ('O', None),  # 1D442; COMMON
-    '𝑃': ('P', None),  # 1D443; COMMON
-    '𝑄': ('Q', None),  # 1D444; COMMON
-    '𝑅': ('R', None),  # 1D445; COMMON
-    '𝑆': ('S', None),  # 1D446; COMMON
-    '𝑇': ('T', None),  # 1D447; COMMON
-    '𝑈': ('U', None),  # 1D448; COMMON
-    '𝑉': ('V', None),  # 1D449; COMMON
-    '𝑊': ('W', None),  # 1D44A; COMMON
-    '𝑋': ('X', None),  # 1D44B; COMMON
-    '𝑌': ('Y', None),  # 1D44C; COMMON
-    '𝑍': ('Z', None),  # 1D44D; COMMON
-    '𝑎': ('a', None),  # 1D44E; COMMON
-    '𝑏': ('b', None),  # 1D44F; COMMON
-    '𝑐': ('c', None),  # 1D450; COMMON
-    '𝑑': ('d', None),  # 1D451; COMMON
-    '𝑒': ('e', None),  # 1D452; COMMON
-    '𝑓': ('f', None),  # 1D453; COMMON
-    '𝑔': ('g', None),  # 1D454; COMMON
-    '𝑖': ('i', None),  # 1D456; COMMON
-    '𝑗': ('j', None),  # 1D457; COMMON
-    '𝑘': ('k', None),  # 1D458; COMMON
-    '𝑙': ('l', None),  # 1D459; COMMON
-    '𝑛': ('n', None),  # 1D45B; COMMON
-    '𝑜': ('o', None),  # 1D45C; COMMON
-    '𝑝': ('p', None),  # 1D45D; COMMON
-    '𝑞': ('q', None),  # 1D45E; COMMON
-    '𝑟': ('r', None),  # 1D45F; COMMON
-    '𝑠': ('s', None),  # 1D460; COMMON
-    '𝑡': ('t', None),  # 1D461; COMMON
-    '𝑢': ('u', None),  # 1D462; COMMON
-    '𝑣': ('v', None),  # 1D463; COMMON
-    '𝑤': ('w', None),  # 1D464; COMMON
-    '𝑥': ('x', None),  # 1D465; COMMON
-    '𝑦': ('y', None),  # 1D466; COMMON
-    '𝑧': ('z', None),  # 1D467; COMMON
-    '𝑨': ('A', None),  # 1D468; COMMON
-    '𝑩': ('B', None),  # 1D469; COMMON
-    '𝑪': ('C', None),  # 1D46A; COMMON
-    '𝑫': ('D', None),  # 1D46B; COMMON
-    '𝑬': ('E', None),  # 1D46C; COMMON
-    '𝑭': ('F', None),  # 1D46D; COMMON
-    '𝑮': ('G', None),  # 1D46E; COMMON
-    '𝑯': ('H', None),  # 1D46F; COMMON
-    '𝑰': ('l', None),  # 1D470; COMMON
-    '𝑱': ('J', None),  # 1D471; COMMON
-    '𝑲': ('K', None),  # 1D472; COMMON
-    '𝑳': ('L', None),  # 1D473; COMMON
-    '𝑴': ('M', None),  # 1D474; COMMON
-    '𝑵': ('N', None),  # 1D475; COMMON
-    '𝑶': ('O', None),  # 1D476; COMMON
-    '𝑷': ('P', None),  # 1D477; COMMON
-    '𝑸': ('Q', None),  # 1D478; COMMON
-    '𝑹': ('R', None),  # 1D479; COMMON
-    '𝑺': ('S', None),  # 1D47A; COMMON
-    '𝑻': ('T', None),  # 1D47B; COMMON
-    '𝑼': ('U', None),  # 1D47C; COMMON
-    '𝑽': ('V', None),  # 1D47D; COMMON
-    '𝑾': ('W', None),  # 1D47E; COMMON
-    '𝑿': ('X', None),  # 1D47F; COMMON
-    '𝒀': ('Y', None),  # 1D480; COMMON
-    '𝒁': ('Z', None),  # 1D481; COMMON
-    '𝒂': ('a', None),  # 1D482; COMMON
-    '𝒃': ('b', None),  # 1D483; COMMON
-    '𝒄': ('c', None),  # 1D484; COMMON
-    '𝒅': ('d', None),  # 1D485; COMMON
-    '𝒆': ('e', None),  # 1D486; COMMON
-    '𝒇': ('f', None),  # 1D487; COMMON
-    '𝒈': ('g', None),  # 1D488; COMMON
-    '𝒉': ('h', None),  # 1D489; COMMON
-    '𝒊': ('i', None),  # 1D48A; COMMON
-    '𝒋': ('j', None),  # 1D48B; COMMON
-    '𝒌': ('k', None),  # 1D48C; COMMON
-    '𝒍': ('l', None),  # 1D48D; COMMON
-    '𝒏': ('n', None),  # 1D48F; COMMON
-    '𝒐': ('o', None),  # 1D490; COMMON
-    '𝒑': ('p', None),  # 1D491; COMMON
-    '𝒒': ('q', None),  # 1D492; COMMON
-    '𝒓': ('r', None),  # 1D493; COMMON
-    '𝒔': ('s', None),  # 1D494; COMMON
-    '𝒕': ('t', None),  # 1D495; COMMON
-    '𝒖': ('u', None),  # 1D496; COMMON
-    '𝒗': ('v', None),  # 1D497; COMMON
-    '𝒘': ('w', None),  # 1D498; COMMON
-    '𝒙': ('x', None),  # 1D499; COMMON
-    '𝒚': ('y', None),  # 1D49A; COMMON
-    '𝒛': ('z', None),  # 1D49B; COMMON
-    '𝒜': ('A', None),  # 1D49C; COMMON
-    '𝒞': ('C', None),  # 1D49E; COMMON
-    '𝒟': ('D', None),  # 1D49F; COMMON
-    '𝒢': ('G', None),  # 1D4A2; COMMON
-    '𝒥': ('J', None),  # 1D4A5; COMMON
-    '𝒦': ('K', None),  # 1D4A6; COMMON
-    '𝒩': ('N', None),  # 1D4A9; COMMON
-    '𝒪': ('O', None),  # 1D4AA; COMMON
-    '𝒫': ('P', None),  # 1D4AB; COMMON
-    '𝒬': ('Q', None),  # 1D4AC; COMMON
-    '𝒮': ('S', None),  # 1D4AE; COMMON
-    '𝒯': ('T', None),  # 1D4AF; COMMON
-    '𝒰': ('U', None),  # 1D4B0; COMMON
-    '𝒱': ('V', None),  # 1D4B1; COMMON
-    '𝒲': ('W', None),  # 1D4B2; COMMON
-    '𝒳': ('X', None),  # 1D4B3; COMMON
-    '𝒴': ('Y', None),  # 1D4B4; COMMON
-    '𝒵': ('Z', None),  # 1D4B5; COMMON
-    '𝒶': ('a', None),  # 1D4B6; COMMON
-    '𝒷': ('b', None),  # 1D4B7; COMMON
-    '𝒸': ('c', None),  # 1D4B8; COMMON
-    '𝒹': ('d', None),  # 1D4B9; COMMON
-    '𝒻': ('f', None),  # 1D4BB; COMMON
-    '𝒽': ('h', None),  # 1D4BD; COMMON
-    '𝒾': ('i', None),  # 1D4BE; COMMON
-    '𝒿': ('j', None),  # 1D4BF; COMMON
-    '𝓀': ('k', None),  # 1D4C0; COMMON
-    '𝓁': ('l', None),  # 1D4C1; COMMON
-    '𝓃': ('n', None),  # 1D4C3; COMMON
-    '𝓅': ('p', None),  # 1D4C5; COMMON
-    '𝓆': ('q', None),  # 1D4C6; COMMON
-    '𝓇': ('r', None),  # 1D4C7; COMMON
-    '𝓈': ('s', None),  # 1D4C8; COMMON
-    '𝓉': ('t', None),  # 1D4C9; COMMON
-    '𝓊': ('u', None),  # 1D4CA; COMMON
-    '𝓋': ('v', None),  # 1D4CB; COMMON
-    '𝓌': ('w', None),  # 1D4CC; COMMON
-    '𝓍': ('x', None),  # 1D4CD; COMMON
-    '𝓎': ('y', None),  # 1D4CE; COMMON
-    '𝓏': ('z', None),  # 1D4CF; COMMON
-    '𝓐': ('A', None),  # 1D4D0; COMMON
-    '𝓑': ('B', None),  # 1D4D1; COMMON
-    '𝓒': ('C', None),  # 1D4D2; COMMON
-    '𝓓': ('D', None),  # 1D4D3; COMMON
-    '𝓔': ('E', None),  # 1D4D4; COMMON
-    '𝓕': ('F', None),  # 1D4D5; COMMON
-    '𝓖': ('G', None),  # 1D4D6; COMMON
-    '𝓗': ('H', None),  # 1D4D7; COMMON
-    '𝓘': ('l', None),  # 1D4D8; COMMON
-    '𝓙': ('J', None),  # 1D4D9; COMMON
-    '𝓚': ('K', None),  # 1D4DA; COMMON
-    '𝓛': ('L', None),  # 1D4DB; COMMON
-    '𝓜': ('M', None),  # 1D4DC; COMMON
-    '𝓝': ('N', None),  # 1D4DD; COMMON
-    '𝓞': ('O', None),  # 1D4DE; COMMON
-    '𝓟': ('P', None),  # 1D4DF; COMMON
-    '𝓠': ('Q', None),  # 1D4E0; COMMON
-    '𝓡': ('R', None),  # 1D4E1; COMMON
-    '𝓢': ('S', None),  # 1D4E2; COMMON
-    '𝓣': ('T', None),  # 1D4E3; COMMON
-    '𝓤': ('U', None),  # 1D4E4; COMMON
-    '𝓥': ('V', None),  # 1D4E5; COMMON
-    '𝓦': ('W', None),  # 1D4E6; COMMON
-    '𝓧': ('X', None),  # 1D4E7; COMMON
-    '𝓨': ('Y', None),  # 1D4E8; COMMON
-    '𝓩': ('Z', None),  # 1D4E9; COMMON
-    '𝓪': ('a', None),  # 1D4EA; COMMON
-    '𝓫': ('b', None),  # 1D4EB; COMMON
-    '𝓬': ('c', None),  # 1D4EC; COMMON
-    '𝓭': ('d', None),  # 1D4ED; COMMON
-    '𝓮': ('e', None),  # 1D4EE; COMMON
-    '𝓯': ('f', None),  # 1D4EF; COMMON
-    '𝓰': ('g', None),  # 1D4F0; COMMON
-    '𝓱': ('h', None),  # 1D4F1; COMMON
-    '𝓲': ('i', None),  # 1D4F2; COMMON
-    '𝓳': ('j', None),  # 1D4F3; COMMON
-    '𝓴': ('k', None),  # 1D4F4; COMMON
-    '𝓵': ('l', None),  # 1D4F5; COMMON
-    '𝓷': ('n', None),  # 1D4F7; COMMON
-    '𝓸': ('o', None),  # 1D4F8; COMMON
-    '𝓹': ('p', None),  # 1D4F9; COMMON
-    '𝓺': ('q', None),  # 1D4FA; COMMON
-    '𝓻': ('r', None),  # 1D4FB; COMMON
-    '𝓼': ('s', None),  # 1D4FC; COMMON
-    '𝓽': ('t', None),  # 1D4FD; COMMON
-    '𝓾': ('u', None),  # 1D4FE; COMMON
-    '𝓿': ('v', None),  # 1D4FF; COMMON
-    '𝔀': ('w', None),  # 1D500; COMMON
-    '𝔁': ('x', None),  # 1D501; COMMON
-    '𝔂': ('y', None),  # 1D502; COMMON
-    '𝔃': ('z', None),  # 1D503; COMMON
-    '𝔄': ('A', None),  # 1D504; COMMON
-    '𝔅': ('B', None),  # 1D505; COMMON
-    '𝔇': ('D', None),  # 1D507; COMMON
-    '𝔈': ('E', None),  # 1D508; COMMON
-    '𝔉': ('F', None),  # 1D509; COMMON
-    '𝔊': ('G', None),  # 1D50A; COMMON
-    '𝔍': ('J', None),  # 1D50D; COMMON
-    '𝔎': ('K', None),  # 1D50E; COMMON
-    '𝔏': ('L', None),  # 1D50F; COMMON
-    '𝔐': ('M', None),  # 1D510; COMMON
-    '𝔑': ('N', None),  # 1D511; COMMON
-    '𝔒': ('O', None),  # 1D512; COMMON
-    '𝔓': ('P', None),  # 1D513; COMMON
-    '𝔔': ('Q', None),  # 1D514; COMMON
-    '𝔖': ('S', None),  # 1D516; COMMON
-    '𝔗': ('T', None),  # 1D517; COMMON
-    '𝔘': ('U', None),  # 1D518; COMMON
-    '𝔙': ('V', None),  # 1D519; COMMON
-    '𝔚': ('W', None),  # 1D51A; COMMON
-    '𝔛': ('X', None),  # 1D51B; COMMON
-    '𝔜': ('Y', None),  # 1D51C; COMMON
-    '𝔞': ('a', None),  # 1D51E; COMMON
-    '𝔟': ('b', None),  # 1D51F; COMMON
-    '𝔠': ('c', None),  # 1D520; COMMON
-    '𝔡': ('d', None),  # 1D521; COMMON
-    '𝔢': ('e', None),  # 1D522; COMMON
-    '𝔣': ('f', None),  # 1D523; COMMON
-    '𝔤': ('g', None),  # 1D524; COMMON
-    '𝔥': ('h', None),  # 1D525; COMMON
-    '𝔦': ('i', None),  # 1D526; COMMON
-    '𝔧': ('j', None),  # 1D527; COMMON
-    '𝔨': ('k', None),  # 1D528; COMMON
-    '𝔩': ('l', None),  # 1D529; COMMON
-    '𝔫': ('n', None),  # 1D52B; COMMON
-    '𝔬': ('o', None),  # 1D52C; COMMON
-    '𝔭': ('p', None),  # 1D52D; COMMON
-    '𝔮': ('q', None),  # 1D52E; COMMON
-    '𝔯': ('r', None),  # 1D52F; COMMON
-    '𝔰': ('s', None),  # 1D530; COMMON
-    '𝔱': ('t', None),  # 1D531; COMMON
-    '𝔲': ('u', None),  # 1D532; COMMON
-    '𝔳': ('v', None),  # 1D533; COMMON
-    '𝔴': ('w', None),  # 1D534; COMMON
-    '𝔵': ('x', None),  # 1D535; COMMON
-    '𝔶': ('y', None),  # 1D536; COMMON
-    '𝔷': ('z', None),  # 1D537; COMMON
-    '𝔸': ('A', None),  # 1D538; COMMON
-    '𝔹': ('B', None),  # 1D539; COMMON
-    '𝔻': ('D', None),  # 1D53B; COMMON
-    '𝔼': ('E', None),  # 1D53C; COMMON
-    '𝔽': ('F', None),  # 1D53D; COMMON
-    '𝔾': ('G', None),  # 1D53E; COMMON
-    '𝕀': ('l', None),  # 1D540; COMMON
-    '𝕁': ('J', None),  # 1D541; COMMON
-    '𝕂': ('K', None),  # 1D542; COMMON
-    '𝕃': ('L', None),  # 1D543; COMMON
-    '𝕄': ('M', None),  # 1D544; COMMON
-    '𝕆': ('O', None),  # 1D546; COMMON
-    '𝕊': ('S', None),  # 1D54A; COMMON
-    '𝕋': ('T', None),  # 1D54B; COMMON
-    '𝕌': ('U', None),  # 1D54C; COMMON
-    '𝕍': ('V', None),  # 1D54D; COMMON
-    '𝕎': ('W', None),  # 1D54E; COMMON
-    '𝕏': ('X', None),  # 1D54F; COMMON
-    '𝕐': ('Y', None),  # 1D550; COMMON
-    '𝕒': ('a', None),  # 1D552; COMMON
-    '𝕓': ('b', None),  # 1D553; COMMON
-    '𝕔': ('c', None),  # 1D554; COMMON
-    '𝕕': ('d', None),  # 1D555; COMMON
-    '𝕖': ('e', None),  # 1D556; COMMON
-    '𝕗': ('f', None),  # 1D557; COMMON
-    '𝕘': ('g', None),  # 1D558; COMMON
-    '𝕙': ('h', None),  # 1D559; COMMON
-    '𝕚': ('i', None),  # 1D55A; COMMON
-    '𝕛': ('j', None),  # 1D55B; COMMON
-    '𝕜': ('k', None),  # 1D55C; COMMON
-    '𝕝': ('l', None),  # 1D55D; COMMON
-    '𝕟': ('n', None),  # 1D55F; COMMON
-    '𝕠': ('o', None),  # 1D560; COMMON
-    '𝕡': ('p', None),  # 1D561; COMMON
-    '𝕢': ('q', None),  # 1D562; COMMON
-    '𝕣': ('r', None),  # 1D563; COMMON
-    '𝕤': ('s', None),  # 1D564; COMMON
-    '𝕥': ('t', None),  # 1D565; COMMON
-    '𝕦': ('u', None),  # 1D566; COMMON
-    '𝕧': ('v', None),  # 1D567; COMMON
-    '𝕨': ('w', None),  # 1D568; COMMON
-    '𝕩': ('x', None),  # 1D569; COMMON
-    '𝕪': ('y', None),  # 1D56A; COMMON
-    '𝕫': ('z', None),  # 1D56B; COMMON
-    '𝕬': ('A', None),  # 1D56C; COMMON
-    '𝕭': ('B', None),  # 1D56D; COMMON
-    '𝕮': ('C', None),  # 1D56E; COMMON
-    '𝕯': ('D', None),  # 1D56F; COMMON
-    '𝕰': ('E', None),  # 1D570; COMMON
-    '𝕱': ('F', None),  # 1D571; COMMON
-    '𝕲': ('G', None),  # 1D572; COMMON
-    '𝕳': ('H', None),  # 1D573; COMMON
-    '𝕴': ('l', None),  # 1D574; COMMON
-    '𝕵': ('J', None),  # 1D575; COMMON
-    '𝕶': ('K', None),  # 1D576; COMMON
-    '𝕷': ('L', None),  # 1D577; COMMON
-    '𝕸': ('M', None),  # 1D578; COMMON
-    '𝕹': ('N', None),  # 1D579; COMMON
-    '𝕺': ('O', None),  # 1D57A; COMMON
-    '𝕻': ('P', None),  # 1D57B; COMMON
-    '𝕼': ('Q', None),  # 1D57C; COMMON
-    '𝕽': ('R', None),  # 1D57D; COMMON
-    '𝕾': ('S', None),  # 1D57E; COMMON
-    '𝕿': ('T', None),  # 1D57F; COMMON
-    '𝖀': ('U', None),  # 1D580; COMMON
-    '𝖁': ('V', None),  # 1D581; COMMON
-    '𝖂': ('W', None),  # 1D582; COMMON
-    '𝖃': ('X', None),  # 1D583; COMMON
-    '𝖄': ('Y', None),  # 1D584; COMMON
-    '𝖅': ('Z', None),  # 1D585; COMMON
-    '𝖆': ('a', None),  # 1D586; COMMON
-    '𝖇': ('b', None),  # 1D587; COMMON
-    '𝖈': ('c', None),  # 1D588; COMMON
-    '𝖉': ('d', None),  # 1D589; COMMON
-    '𝖊': ('e', None),  # 1D58A; COMMON
-    '𝖋': ('f', None),  # 1D58B; COMMON
-    '𝖌': ('g', None),  # 1D58C; COMMON
-    '𝖍': ('h', None),  # 1D58D; COMMON
-    '𝖎': ('i', None),  # 1D58E; COMMON
-    '𝖏': ('j', None),  # 1D58F; COMMON
-    '𝖐': ('k', None),  # 1D590; COMMON
-    '𝖑': ('l', None),  # 1D591; COMMON
-    '𝖓': ('n', None),  # 1D593; COMMON
-    '𝖔': ('o', None),  # 1D594; COMMON
-    '𝖕': ('p', None),  # 1D595; COMMON
-    '𝖖': ('q', None),  # 1D596; COMMON
-    '𝖗': ('r', None),  # 1D597; COMMON
-    '𝖘': ('s', None),  # 1D598; COMMON
-    '𝖙': ('t', None),  # 1D599; COMMON
-    '𝖚': ('u', None),  # 1D59A; COMMON
-    '𝖛': ('v', None),  # 1D59B; COMMON
-    '𝖜': ('w', None),  # 1D59C; COMMON
-    '𝖝': ('x', None),  # 1D59D; COMMON
-    '𝖞': ('y', None),  # 1D59E; COMMON
-    '𝖟': ('z', None),  # 1D59F; COMMON
-    '𝖠': ('A', None),  # 1D5A0; COMMON
-    '𝖡': ('B', None),  # 1D5A1; COMMON
-    '𝖢': ('C', None),  # 1D5A2; COMMON
-    '𝖣': ('D', None),  # 1D5A3; COMMON
-    '𝖤': ('E', None),  # 1D5A4; COMMON
-    '𝖥': ('F', None),  # 1D5A5; COMMON
-    '𝖦': ('G', None),  # 1D5A6; COMMON
-    '𝖧': ('H', None),  # 1D5A7; COMMON
-    '𝖨': ('l', None),  # 1D5A8; COMMON
-    '𝖩': ('J', None),  # 1D5A9; COMMON
-    '𝖪': ('K', None),  # 1D5AA; COMMON
-    '𝖫': ('L', None),  # 1D5AB; COMMON
-    '𝖬': ('M', None),  # 1D5AC; COMMON
-    '𝖭': ('N', None),  # 1D5AD; COMMON
-    '𝖮': ('O', None),  # 1D5AE; COMMON
-    '𝖯': ('P', None),  # 1D5AF; COMMON
-    '𝖰': ('Q', None),  # 1D5B0; COMMON
-    '𝖱': ('R', None),  # 1D5B1; COMMON
-    '𝖲': ('S', None),  # 1D5B2; COMMON
-    '𝖳': ('T', None),  # 1D5B3; COMMON
-    '𝖴': ('U', None),  # 1D5B4; COMMON
-    '𝖵': ('V', None),  # 1D5B5; COMMON
-    '𝖶': ('W', None),  # 1D5B6; COMMON
-    '𝖷': ('X', None),  # 1D5B7; COMMON
-    '𝖸': ('Y', None),  # 1D5B8; COMMON
-    '𝖹': ('Z', None),  # 1D5B9; COMMON
-    '𝖺': ('a', None),  # 1D5BA; COMMON
-    '𝖻': ('b', None),  # 1D5BB; COMMON
-    '𝖼': ('c', None),  # 1D5BC; COMMON
-    '𝖽': ('d', None),  # 1D5BD; COMMON
-    '𝖾': ('e', None),  # 1D5BE; COMMON
-    '𝖿': ('f', None),  # 1D5BF; COMMON
-    '𝗀': ('g', None),  # 1D5C0; COMMON
-    '𝗁': ('h', None),  # 1D5C1; COMMON
-    '𝗂': ('i', None),  # 1D5C2; COMMON
-    '𝗃': ('j', None),  # 1D5C3; COMMON
-    '𝗄': ('k', None),  # 1D5C4; COMMON
-    '𝗅': ('l', None),  # 1D5C5; COMMON
-    '𝗇': ('n', None),  # 1D5C7; COMMON
-    '𝗈': ('o', None),  # 1D5C8; COMMON
-    '𝗉': ('p', None),  # 1D5C9; COMMON
-    '𝗊': ('q', None),  # 1D5CA; COMMON
-    '𝗋': ('r', None),  # 1D5CB; COMMON
-    '𝗌': ('s', None),  # 1D5CC; COMMON
-    '𝗍': ('t', None),  # 1D5CD; COMMON
-    '𝗎': ('u', None),  # 1D5CE; COMMON
-    '𝗏': ('v', None),  # 1D5CF; COMMON
-    '𝗐': ('w', None),  # 1D5D0; COMMON
-    '𝗑': ('x', None),  # 1D5D1; COMMON
-    '𝗒': ('y', None),  # 1D5D2; COMMON
-    '𝗓': ('z', None),  # 1D5D3; COMMON
-    '𝗔': ('A', None),  # 1D5D4; COMMON
-    '𝗕': ('B', None),  # 1D5D5; COMMON
-    '𝗖': ('C', None),  # 1D5D6; COMMON
-    '𝗗': ('D', None),  # 1D5D7; COMMON
-    '𝗘': ('E', None),  # 1D5D8; COMMON
-    '𝗙': ('F', None),  # 1D5D9; COMMON
-    '𝗚': ('G', None),  # 1D5DA; COMMON
-    '𝗛': ('H', None),  # 1D5DB; COMMON
-    '𝗜': ('l', None),  # 1D5DC; COMMON
-    '𝗝': ('J', None),  # 1D5DD; COMMON
-    '𝗞': ('K', None),  # 1D5DE; COMMON
-    '𝗟': ('L', None),  # 1D5DF; COMMON
-    '𝗠': ('M', None),  # 1D5E0; COMMON
-    '𝗡': ('N', None),  # 1D5E1; COMMON
-    '𝗢': ('O', None),  # 1D5E2; COMMON
-    '𝗣': ('P', None),  # 1D5E3; COMMON
-    '𝗤': ('Q', None),  # 1D5E4; COMMON
-    '𝗥': ('R', None),  # 1D5E5; COMMON
-    '𝗦': ('S', None),  # 1D5E6; COMMON
-    '𝗧': ('T', None),  # 1D5E7; COMMON
-    '𝗨': ('U', None),  # 1D5E8; COMMON
-    '𝗩': ('V', None),  # 1D5E9; COMMON
-    '𝗪': ('W', None),  # 1D5EA; COMMON
-    '𝗫': ('X', None),  # 1D5EB; COMMON
-    '𝗬': ('Y', None),  # 1D5EC; COMMON
-    '𝗭': ('Z', None),  # 1D5ED; COMMON
-    '𝗮': ('a', None),  # 1D5EE; COMMON
-    '𝗯': ('b', None),  # 1D5EF; COMMON
-    '𝗰': ('c', None),  # 1D5F0; COMMON
-    '𝗱': ('d', None),  # 1D5F1; COMMON
-    '𝗲': ('e', None),  # 1D5F2; COMMON
-    '𝗳': ('f', None),  # 1D5F3; COMMON
-    '𝗴': ('g', None),  # 1D5F4; COMMON
-    '𝗵': ('h', None),  # 1D5F5; COMMON
-    '𝗶': ('i', None),  # 1D5F6; COMMON
-    '𝗷': ('j', None),  # 1D5F7; COMMON
-    '𝗸': ('k', None),  # 1D5F8; COMMON
-    '𝗹': ('l', None),  # 1D5F9; COMMON
-    '𝗻': ('n', None),  # 1D5FB; COMMON
-    '𝗼': ('o', None),  # 1D5FC; COMMON
-    '𝗽': ('p', None),  # 1D5FD; COMMON
-    '𝗾': ('q', None),  # 1D5FE; COMMON
-    '𝗿': ('r', None),  # 1D5FF; COMMON
-    '𝘀': ('s', None),  # 1D600; COMMON
-    '𝘁': ('t', None),  # 1D601; COMMON
-    '𝘂': ('u', None),  # 1D602; COMMON
-    '𝘃': ('v', None),  # 1D603; COMMON
-    '𝘄': ('w', None),  # 1D604; COMMON
-    '𝘅': ('x', None),  # 1D605; COMMON
-    '𝘆': ('y', None),  # 1D606; COMMON
-    '𝘇': ('z', None),  # 1D607; COMMON
-    '𝘈': ('A', None),  # 1D608; COMMON
-    '𝘉': ('B', None),  # 1D609; COMMON
-    '𝘊': ('C', None),  # 1D60A; COMMON
-    '𝘋': ('D', None),  # 1D60B; COMMON
-    '𝘌': ('E', None),  # 1D60C; COMMON
-    '𝘍': ('F', None),  # 1D60D; COMMON
-    '𝘎': ('G', None),  # 1D60E; COMMON
-    '𝘏': ('H', None),  # 1D60F; COMMON
-    '𝘐': ('l', None),  # 1D610; COMMON
-    '𝘑': ('J', None),  # 1D611; COMMON
-    '𝘒': ('K', None),  # 1D612; COMMON
-    '𝘓': ('L', None),  # 1D613; COMMON
-    '𝘔': ('M', None),  # 1D614; COMMON
-    '𝘕': ('N', None),  # 1D615; COMMON
-    '𝘖': ('O', None),  # 1D616; COMMON
-    '𝘗': ('P', None),  # 1D617; COMMON
-    '𝘘': ('Q', None),  # 1D618; COMMON
-    '𝘙': ('R', None),  # 1D619; COMMON
-    '𝘚': ('S', None),  # 1D61A; COMMON
-    '𝘛': ('T', None),  # 1D61B; COMMON
-    '𝘜': ('U', None),  # 1D61C; COMMON
-    '𝘝': ('V', None),  # 1D61D; COMMON
-    '𝘞': ('W', None),  # 1D61E; COMMON
-    '𝘟': ('X', None),  # 1D61F; COMMON
-    '𝘠': ('Y', None),  # 1D620; COMMON
-    '𝘡': ('Z', None),  # 1D621; COMMON
-    '𝘢': ('a', None),  # 1D622; COMMON
-    '𝘣': ('b', None),  # 1D623; COMMON
-    '𝘤': ('c', None),  # 1D624; COMMON
-    '𝘥': ('d', None),  # 1D625; COMMON
-    '𝘦': ('e', None),  # 1D626; COMMON
-    '𝘧': ('f', None),  # 1D627; COMMON
-    '𝘨': ('g', None),  # 1D628; COMMON
-    '𝘩': ('h', None),  # 1D629; COMMON
-    '𝘪': ('i', None),  # 1D62A; COMMON
-    '𝘫': ('j', None),  # 1D62B; COMMON
-    '𝘬': ('k', None),  # 1D62C; COMMON
-    '𝘭': ('l', None),  # 1D62D; COMMON
-    '𝘯': ('n', None),  # 1D62F; COMMON
-    '𝘰': ('o', None),  # 1D630; COMMON
-    '𝘱': ('p', None),  # 1D631; COMMON
-    '𝘲': ('q', None),  # 1D632; COMMON
-    '𝘳': ('r', None),  # 1D633; COMMON
-    '𝘴': ('s', None),  # 1D634; COMMON
-    '𝘵': ('t', None),  # 1D635; COMMON
-    '𝘶': ('u', None),  # 1D636; COMMON
-    '𝘷': ('v', None),  # 1D637; COMMON
-    '𝘸': ('w', None),  # 1D638; COMMON
-    '𝘹': ('x', None),  # 1D639; COMMON
-    '𝘺': ('y', None),  # 1D63A; COMMON
-    '𝘻': ('z', None),  # 1D63B; COMMON
-    '𝘼': ('A', None),  # 1D63C; COMMON
-    '𝘽': ('B', None),  # 1D63D; COMMON
-    '𝘾': ('C', None),  # 1D63E; COMMON
-    '𝘿': ('D', None),  # 1D63F; COMMON
-    '𝙀': ('E', None),  # 1D640; COMMON
-    '𝙁': ('F', None),  # 1D641; COMMON
-    '𝙂': ('G', None),  # 1D642; COMMON
-    '𝙃': ('H', None),  # 1D643; COMMON
-    '𝙄': ('l', None),  # 1D644; COMMON
-    '𝙅': ('J', None),  # 1D645; COMMON
-    '𝙆': ('K', None),  # 1D646; COMMON
-    '𝙇': ('L', None),  # 1D647; COMMON
-    '𝙈': ('M', None),  # 1D648; COMMON
-    '𝙉': ('N', None),  # 1D649; COMMON
-    '𝙊': ('O', None),  # 1D64A; COMMON
-    '𝙋': ('P', None),  # 1D64B; COMMON
-    '𝙌': ('Q', None),  # 1D64C; COMMON
-    '𝙍': ('R', None),  # 1D64D; COMMON
-    '𝙎': ('S', None),  # 1D64E; COMMON
-    '𝙏': ('T', None),  # 1D64F; COMMON
-    '𝙐': ('U', None),  # 1D650; COMMON
-    '𝙑': ('V', None),  # 1D651; COMMON
-    '𝙒': ('W', None),  # 1D652; COMMON
-    '𝙓': ('X', None),  # 1D653; COMMON
-    '𝙔': ('Y', None),  # 1D654; COMMON
-    '𝙕': ('Z', None),  # 1D655; COMMON
-    '𝙖': ('a', None),  # 1D656; COMMON
-    '𝙗': ('b', None),  # 1D657; COMMON
-    '𝙘': ('c', None),  # 1D658; COMMON
-    '𝙙': ('d', None),  # 1D659; COMMON
-    '𝙚': ('e', None),  # 1D65A; COMMON
-    '𝙛': ('f', None),  # 1D65B; COMMON
-    '𝙜': ('g', None),  # 1D65C; COMMON
-    '𝙝': ('h', None),  # 1D65D; COMMON
-    '𝙞': ('i', None),  # 1D65E; COMMON
-    '𝙟': ('j', None),  # 1D65F; COMMON
-    '𝙠': ('k', None),  # 1D660; COMMON
-    '𝙡': ('l', None),  # 1D661; COMMON
-    '𝙣': ('n', None),  # 1D663; COMMON
-    '𝙤': ('o', None),  # 1D664; COMMON
-    '𝙥': ('p', None),  # 1D665; COMMON
-    '𝙦': ('q', None),  # 1D666; COMMON
-    '𝙧': ('r', None),  # 1D667; COMMON
-    '𝙨': ('s', None),  # 1D668; COMMON
-    '𝙩': ('t', None),  # 1D669; COMMON
-    '𝙪': ('u', None),  # 1D66A; COMMON
-    '𝙫': ('v', None),  # 1D66B; COMMON
-    '𝙬': ('w', None),  # 1D66C; COMMON
-    '𝙭': ('x', None),  # 1D66D; COMMON
-    '𝙮': ('y', None),  # 1D66E; COMMON
-    '𝙯': ('z', None),  # 1D66F; COMMON
-    '𝙰': ('A', None),  # 1D670; COMMON
-    '𝙱': ('B', None),  # 1D671; COMMON
-    '𝙲': ('C', None),  # 1D672; COMMON
-    '𝙳': ('D', None),  # 1D673; COMMON
-    '𝙴': ('E', None),  # 1D674; COMMON
-    '𝙵': ('F', None),  # 1D675; COMMON
-    '𝙶': ('G', None),  # 1D676; COMMON
-    '𝙷': ('H', None),  # 1D677; COMMON
-    '𝙸': ('l', None),  # 1D678; COMMON
-    '𝙹': ('J', None),  # 1D679; COMMON
-    '𝙺': ('K', None),  # 1D67A; COMMON
-    '𝙻': ('L', None),  # 1D67B; COMMON
-    '𝙼': ('M', None),  # 1D67C; COMMON
-    '𝙽': ('N', None),  # 1D67D; COMMON
-    '𝙾': ('O', None),  # 1D67E; COMMON
-    '𝙿': ('P', None),  # 1D67F; COMMON
-    '𝚀': ('Q', None),  # 1D680; COMMON
-    '𝚁': ('R', None),  # 1D681; COMMON
-    '𝚂': ('S', None),  # 1D682; COMMON
-    '𝚃': ('T', None),  # 1D683; COMMON
-    '𝚄': ('U', None),  # 1D684; COMMON
-    '𝚅': ('V', None),  # 1D685; COMMON
-    '𝚆': ('W', None),  # 1D686; COMMON
-    '𝚇': ('X', None),  # 1D687; COMMON
-    '𝚈': ('Y', None),  # 1D688; COMMON
-    '𝚉': ('Z', None),  # 1D689; COMMON
-    '𝚊': ('a', None),  # 1D68A; COMMON
-    '𝚋': ('b', None),  # 1D68B; COMMON
-    '𝚌': ('c', None),  # 1D68C; COMMON
-    '𝚍': ('d', None),  # 1D68D; COMMON
-    '𝚎': ('e', None),  # 1D68E; COMMON
-    '𝚏': ('f', None),  # 1D68F; COMMON
-    '𝚐': ('g', None),  # 1D690; COMMON
-    '𝚑': ('h', None),  # 1D691; COMMON
-    '𝚒': ('i', None),  # 1D692; COMMON
-    '𝚓': ('j', None),  # 1D693; COMMON
-    '𝚔': ('k', None),  # 1D694; COMMON
-    '𝚕': ('l', None),  # 1D695; COMMON
-    '𝚗': ('n', None),  # 1D697; COMMON
-    '𝚘': ('o', None),  # 1D698; COMMON
-    '𝚙': ('p', None),  # 1D699; COMMON
-    '𝚚': ('q', None),  # 1D69A; COMMON
-    '𝚛': ('r', None),  # 1D69B; COMMON
-    '𝚜': ('s', None),  # 1D69C; COMMON
-    '𝚝': ('t', None),  # 1D69D; COMMON
-    '𝚞': ('u', None),  # 1D69E; COMMON
-    '𝚟': ('v', None),  # 1D69F; COMMON
-    '𝚠': ('w', None),  # 1D6A0; COMMON
-    '𝚡': ('x', None),  # 1D6A1; COMMON
-    '𝚢': ('y', None),  # 1D6A2; COMMON
-    '𝚣': ('z', None),  # 1D6A3; COMMON
-    '𝚤': ('i', None),  # 1D6A4; COMMON
-    '𝚨': ('A', None),  # 1D6A8; COMMON
-    '𝚩': ('B', None),  # 1D6A9; COMMON
-    '𝚬': ('E', None),  # 1D6AC; COMMON
-    '𝚭': ('Z', None),  # 1D6AD; COMMON
-    '𝚮': ('H', None),  # 1D6AE; COMMON
-    '𝚰': ('l', None),  # 1D6B0; COMMON
-    '𝚱': ('K', None),  # 1D6B1; COMMON
-    '𝚳': ('M', None),  # 1D6B3; COMMON
-    '𝚴': ('N', None),  # 1D6B4; COMMON
-    '𝚶': ('O', None),  # 1D6B6; COMMON
-    '𝚸': ('P', None),  # 1D6B8; COMMON
-    '𝚻': ('T', None),  # 1D6BB; COMMON
-    '𝚼': ('Y', None),  # 1D6BC; COMMON
-    '𝚾': ('X', None),  # 1D6BE; COMMON
-    '𝛂': ('a', None),  # 1D6C2; COMMON
-    '𝛄': ('y', None),  # 1D6C4; COMMON
-    '𝛊': ('i', None),  # 1D6CA; COMMON
-    '𝛎': ('v', None),  # 1D6CE; COMMON
-    '𝛐': ('o', None),  # 1D6D0; COMMON
-    '𝛒': ('p', None),  # 1D6D2; COMMON
-    '𝛔': ('o', None),  # 1D6D4; COMMON
-    '𝛖': ('u', None),  # 1D6D6; COMMON
-    '𝛠': ('p', None),  # 1D6E0; COMMON
-    '𝛢': ('A', None),  # 1D6E2; COMMON
-    '𝛣': ('B', None),  # 1D6E3; COMMON
-    '𝛦': ('E', None),  # 1D6E6; COMMON
-    '𝛧': ('Z', None),  # 1D6E7; COMMON
-    '𝛨': ('H', None),  # 1D6E8; COMMON
-    '𝛪': ('l', None),  # 1D6EA; COMMON
-    '𝛫': ('K', None),  # 1D6EB; COMMON
-    '𝛭': ('M', None),  # 1D6ED; COMMON
-    '𝛮': ('N', None),  # 1D6EE; COMMON
-    '𝛰': ('O', None),  # 1D6F0; COMMON
-    '𝛲': ('P', None),  # 1D6F2; COMMON
-    '𝛵': ('T', None),  # 1D6F5; COMMON
-    '𝛶': ('Y', None),  # 1D6F6; COMMON
-    '𝛸': ('X', None),  # 1D6F8; COMMON
-    '𝛼': ('a', None),  # 1D6FC; COMMON
-    '𝛾': ('y', None),  # 1D6FE; COMMON
-    '𝜄': ('i', None),  # 1D704; COMMON
-    '𝜈': ('v', None),  # 1D708; COMMON
-    '𝜊': ('o', None),  # 1D70A; COMMON
-    '𝜌': ('p', None),  # 1D70C; COMMON
-    '𝜎': ('o', None),  # 1D70E; COMMON
-    '𝜐': ('u', None),  # 1D710; COMMON
-    '𝜚': ('p', None),  # 1D71A; COMMON
-    '𝜜': ('A', None),  # 1D71C; COMMON
-    '𝜝': ('B', None),  # 1D71D; COMMON
-    '𝜠': ('E', None),  # 1D720; COMMON
-    '𝜡': ('Z', None),  # 1D721; COMMON
-    '𝜢': ('H', None),  # 1D722; COMMON
-    '𝜤': ('l', None),  # 1D724; COMMON
-    '𝜥': ('K', None),  # 1D725; COMMON
-    '𝜧': ('M', None),  # 1D727; COMMON
-    '𝜨': ('N', None),  # 1D728; COMMON
-    '𝜪': ('O', None),  # 1D72A; COMMON
-    '𝜬': ('P', None),  # 1D72C; COMMON
-    '𝜯': ('T', None),  # 1D72F; COMMON
-    '𝜰': ('Y', None),  # 1D730; COMMON
-    '𝜲': ('X', None),  # 1D732; COMMON
-    '𝜶': ('a', None),  # 1D736; COMMON
-    '𝜸': ('y', None),  # 1D738; COMMON
-    '𝜾': ('i', None),  # 1D73E; COMMON
-    '𝝂': ('v', None),  # 1D742; COMMON
-    '𝝄': ('o', None),  # 1D744; COMMON
-    '𝝆': ('p', None),  # 1D746; COMMON
-    '𝝈': ('o', None),  # 1D748; COMMON
-    '𝝊': ('u', None),  # 1D74A; COMMON
-    '𝝔': ('p', None),  # 1D754; COMMON
-    '𝝖': ('A', None),  # 1D756; COMMON
-    '𝝗': ('B', None),  # 1D757; COMMON
-    '𝝚': ('E', None),  # 1D75A; COMMON
-    '𝝛': ('Z', None),  # 1D75B; COMMON
-    '𝝜': ('H', None),  # 1D75C; COMMON
-    '𝝞': ('l', None),  # 1D75E; COMMON
-    '𝝟': ('K', None),  # 1D75F; COMMON
-    '𝝡': ('M', None),  # 1D761; COMMON
-    '𝝢': ('N', None),  # 1D762; COMMON
-    '𝝤': ('O', None),  # 1D764; COMMON
-    '𝝦': ('P', None),  # 1D766; COMMON
-    '𝝩': ('T', None),  # 1D769; COMMON
-    '𝝪': ('Y', None),  # 1D76A; COMMON
-    '𝝬': ('X', None),  # 1D76C; COMMON
-    '𝝰': ('a', None),  # 1D770; COMMON
-    '𝝲': ('y', None),  # 1D772; COMMON
-    '𝝸': ('i', None),  # 1D778; COMMON
-    '𝝼': ('v', None),  # 1D77C; COMMON
-    '𝝾': ('o', None),  # 1D77E; COMMON
-    '𝞀': ('p', None),  # 1D780; COMMON
-    '𝞂': ('o', None),  # 1D782; COMMON
-    '𝞄': ('u', None),  # 1D784; COMMON
-    '𝞎': ('p', None),  # 1D78E; COMMON
-    '𝞐': ('A', None),  # 1D790; COMMON
-    '𝞑': ('B', None),  # 1D791; COMMON
-    '𝞔': ('E', None),  # 1D794; COMMON
-    '𝞕': ('Z', None),  # 1D795; COMMON
-    '𝞖': ('H', None),  # 1D796; COMMON
-    '𝞘': ('l', None),  # 1D798; COMMON
-    '𝞙': ('K', None),  # 1D799; COMMON
-    '𝞛': ('M', None),  # 1D79B; COMMON
-    '𝞜': ('N', None),  # 1D79C; COMMON
-    '𝞞': ('O', None),  # 1D79E; COMMON
-    '𝞠': ('P', None),  # 1D7A0; COMMON
-    '𝞣': ('T', None),  # 1D7A3; COMMON
-    '𝞤': ('Y', None),  # 1D7A4; COMMON
-    '𝞦': ('X', None),  # 1D7A6; COMMON
-    '𝞪': ('a', None),  # 1D7AA; COMMON
-    '𝞬': ('y', None),  # 1D7AC; COMMON
-    '𝞲': ('i', None),  # 1D7B2; COMMON
-    '𝞶': ('v', None),  # 1D7B6; COMMON
-    '𝞸': ('o', None),  # 1D7B8; COMMON
-    '𝞺': ('p', None),  # 1D7BA; COMMON
-    '𝞼': ('o', None),  # 1D7BC; COMMON
-    '𝞾': ('u', None),  # 1D7BE; COMMON
-    '𝟈': ('p', None),  # 1D7C8; COMMON
-    '𝟊': ('F', None),  # 1D7CA; COMMON
-    '𝟎': ('O', None),  # 1D7CE; COMMON
-    '𝟏': ('l', None),  # 1D7CF; COMMON
-    '𝟐': ('2', None),  # 1D7D0; COMMON
-    '𝟑': ('3', None),  # 1D7D1; COMMON
-    '𝟒': ('4', None),  # 1D7D2; COMMON
-    '𝟓': ('5', None),  # 1D7D3; COMMON
-    '𝟔': ('6', None),  # 1D7D4; COMMON
-    '𝟕': ('7', None),  # 1D7D5; COMMON
-    '𝟖': ('8', None),  # 1D7D6; COMMON
-    '𝟗': ('9', None),  # 1D7D7; COMMON
-    '𝟘': ('O', None),  # 1D7D8; COMMON
-    '𝟙': ('l', None),  # 1D7D9; COMMON
-    '𝟚': ('2', None),  # 1D7DA; COMMON
-    '𝟛': ('3', None),  # 1D7DB; COMMON
-    '𝟜': ('4', None),  # 1D7DC; COMMON
-    '𝟝': ('5', None),  # 1D7DD; COMMON
-    '𝟞': ('6', None),  # 1D7DE; COMMON
-    '𝟟': ('7', None),  # 1D7DF; COMMON
-    '𝟠': ('8', None),  # 1D7E0; COMMON
-    '𝟡': ('9', None),  # 1D7E1; COMMON
-    '𝟢': ('O', None),  # 1D7E2; COMMON
-    '𝟣': ('l', None),  # 1D7E3; COMMON
-    '𝟤': ('2', None),  # 1D7E4; COMMON
-    '𝟥': ('3', None),  # 1D7E5; COMMON
-    '𝟦': ('4', None),  # 1D7E6; COMMON
-    '𝟧': ('5', None),  # 1D7E7; COMMON
-    '𝟨': ('6', None),  # 1D7E8; COMMON
-    '𝟩': ('7', None),  # 1D7E9; COMMON
-    '𝟪': ('8', None),  # 1D7EA; COMMON
-    '𝟫': ('9', None),  # 1D7EB; COMMON
-    '𝟬': ('O', None),  # 1D7EC; COMMON
-    '𝟭': ('l', None),  # 1D7ED; COMMON
-    '𝟮': ('2', None),  # 1D7EE; COMMON
-    '𝟯': ('3', None),  # 1D7EF; COMMON
-    '𝟰': ('4', None),  # 1D7F0; COMMON
-    '𝟱': ('5', None),  # 1D7F1; COMMON
-    '𝟲': ('6', None),  # 1D7F2; COMMON
-    '𝟳': ('7', None),  # 1D7F3; COMMON
-    '𝟴': ('8', None),  # 1D7F4; COMMON
-    '𝟵': ('9', None),  # 1D7F5; COMMON
-    '𝟶': ('O', None),  # 1D7F6; COMMON
-    '𝟷': ('l', None),  # 1D7F7; COMMON
-    '𝟸': ('2', None),  # 1D7F8; COMMON
-    '𝟹': ('3', None),  # 1D7F9; COMMON
-    '𝟺': ('4', None),  # 1D7FA; COMMON
-    '𝟻': ('5', None),  # 1D7FB; COMMON
-    '𝟼': ('6', None),  # 1D7FC; COMMON
-    '𝟽': ('7', None),  # 1D7FD; COMMON
-    '𝟾': ('8', None),  # 1D7FE; COMMON
-    '𝟿': ('9', None),  # 1D7FF; COMMON
-    '𞣇': ('l', None),  # 1E8C7; MENDE_KIKAKUI
-    '𞣋': ('8', None),  # 1E8CB; MENDE_KIKAKUI
-    '𞸀': ('l', 3),  # 1EE00; ARABIC
-    '𞸤': ('o', 3),  # 1EE24; ARABIC
-    '𞹤': ('o', 3),  # 1EE64; ARABIC
-    '𞺀': ('l', 3),  # 1EE80; ARABIC
-    '𞺄': ('o', 3),  # 1EE84; ARABIC
-    '🝌': ('C', None),  # 1F74C; COMMON
-    '🝨': ('T', None),  # 1F768; COMMON
-    '🯰': ('O', None),  # 1FBF0; COMMON
-    '🯱': ('l', None),  # 1FBF1; COMMON
-    '🯲': ('2', None),  # 1FBF2; COMMON
-    '🯳': ('3', None),  # 1FBF3; COMMON
-    '🯴': ('4', None),  # 1FBF4; COMMON
-    '🯵': ('5', None),  # 1FBF5; COMMON
-    '🯶': ('6', None),  # 1FBF6; COMMON
-    '🯷': ('7', None),  # 1FBF7; COMMON
-    '🯸': ('8', None),  # 1FBF8; COMMON
-    '🯹': ('9', None),  # 1FBF9; COMMON
-}
+_LANG_IDS: bytes = (
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x00\xff\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\xff\x00\x00\x00\x00\x00\x01\x01\x01'
+    b'\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01'
+    b'\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01'
+    b'\x01\x01\x01\x01\x01\x01\x01\x02\x02\x02\x02\x02\x02\x02\x02\x02\x02'
+    b'\x02\x02\x02\x02\x02\x02\xff\xff\xff\xff\xff\xff\xff\xff\x03\x03\x03'
+    b'\x03\x03\x03\x03\x03\x03\x03\x03\x03\x03\x03\x03\x03\x03\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\x04\x04\x04\x05\x05\x05\x06\x06\x06\x07\x07'
+    b'\x08\x08\x08\x08\xff\t\t\n\n\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x00\xff\xff\xff\xff\x00\x00'
+    b'\x00\x00\x00\x00\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\x0b\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\x01\x01\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\x03\x03\x03\x03\x03\x03\x03\x03'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\x03\x03\x03\x03\x03\x03\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x03\x03\x03\x03\x03\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+)
+
+COMMON_CONFUSABLES_MAP = ConfusablesTable(
+    chars=_CONFUSABLE_CHARS,
+    confused_with=_CONFUSED_WITH_CHARS,
+    lang_ids=_LANG_IDS)
 
 CONFUSABLES_ID_TO_ALIAS_MAP: Tuple[str, ...] = (
     'Greek',
@@ -7,10 +7,12 @@ Version Added:
 from __future__ import annotations
 
 import logging
+import re
 import unicodedata
-from itertools import chain
-from typing import (Dict, Iterable, Iterator, List, Optional, Sequence,
-                    Set, Tuple)
+from bisect import bisect_right
+from functools import lru_cache
+from typing import (Dict, FrozenSet, Iterator, List, Optional, Pattern,
+                    Sequence, Tuple)
 
 from django.utils.html import format_html
 from django.utils.safestring import SafeString, mark_safe
@@ -103,13 +105,41 @@ class TrojanSourceCodeSafetyChecker(BaseCodeSafetyChecker):
         'zws': _('Zero-width space characters (CVE-2021-42574)'),
     }
 
+    #: The maximum number of lines to cache check results for.
+    #:
+    #: Results are cached for each line's text and check options, since the
+    #: same lines are checked many times when generating chunks for
+    #: different revisions of a diff.
+    #:
+    #: Version Added:
+    #:     6.0
+    #:
+    #: Type:
+    #:     int
+    LINE_RESULTS_CACHE_SIZE = 10_000
+
     _unsafe_unicode_check_map: Optional[Dict[_UnicodeRange, str]] = None
 
+    _unsafe_unicode_sorted_ranges: Optional[
+        Tuple[List[int], List[int], List[str]]] = None
+
+    _unsafe_chars_regexes: Optional[Dict[bool, Pattern[str]]] = None
+
     _check_unicode_ranges = {
         'bidi': BIDI_UNICODE_RANGES,
         'zws': ZERO_WIDTH_UNICODE_CHAR_RANGES,
     }
 
+    def __init__(self) -> None:
+        """Initialize the checker.
+
+        Version Added:
+            6.0
+        """
+        self._get_line_check_names = lru_cache(
+            maxsize=self.LINE_RESULTS_CACHE_SIZE)(
+                self._get_line_check_names_uncached)
+
     @classmethod
     def get_main_confusable_aliases(
         cls,
@@ -164,36 +194,28 @@ class TrojanSourceCodeSafetyChecker(BaseCodeSafetyChecker):
         """
         num_possible_warnings = len(self.result_labels)
         warnings = set()
-
-        lines = (
-            _line
-            for _item in content_items
-            for _line in _item['lines']
-        )
-
-        # Iterate over all characters across the lines. Since we're only
-        # looking for Unicode characters, and we'll probably encounter a lot
-        # of simple ASCII characters, don't bother with anything under ASCII
-        # 128.
-        chars = (
-            _char
-            for _char in chain.from_iterable(lines)
-            if ord(_char) >= 128
-        )
-
-        unsafe_chars_iter = self._iter_unsafe_chars(
-            chars,
+        confusables_lang_ids_allowed = self._get_confusables_lang_ids_allowed(
             check_confusables=check_confusables,
             confusable_aliases_allowed=confusable_aliases_allowed)
 
-        for i, c, codepoint, check_name in unsafe_chars_iter:
-            warnings.add(check_name)
-
-            if len(warnings) == num_possible_warnings:
-                # We don't need to check any more characters. We've
-                # found at least one instance of everything we can
-                # report.
-                break
+        for item in content_items:
+            for line in item['lines']:
+                # Most lines will be plain ASCII, which can't contain any
+                # of the characters we're looking for.
+                if line.isascii():
+                    continue
+
+                warnings.update(self._get_line_check_names(
+                    line,
+                    check_confusables,
+                    confusables_lang_ids_allowed))
+
+                if len(warnings) == num_possible_warnings:
+                    # We don't need to check any more lines. We've found
+                    # at least one instance of everything we can report.
+                    return {
+                        'warnings': warnings,
+                    }
 
         return {
             'warnings': warnings,
@@ -235,13 +257,19 @@ class TrojanSourceCodeSafetyChecker(BaseCodeSafetyChecker):
             django.utils.safestring.SafeString:
             The updated HTML.
         """
+        if line_html.isascii():
+            return mark_safe(line_html)
+
         result = []
         last_append_i = 0
 
         unsafe_chars_iter = self._iter_unsafe_chars(
             line_html,
             check_confusables=check_confusables,
-            confusable_aliases_allowed=confusable_aliases_allowed)
+            confusables_lang_ids_allowed=(
+                self._get_confusables_lang_ids_allowed(
+                    check_confusables=check_confusables,
+                    confusable_aliases_allowed=confusable_aliases_allowed)))
 
         for i, c, codepoint, check_name in unsafe_chars_iter:
             result.append(line_html[last_append_i:i])
@@ -271,24 +299,105 @@ class TrojanSourceCodeSafetyChecker(BaseCodeSafetyChecker):
 
         return mark_safe(''.join(result))
 
-    def _iter_unsafe_chars(
+    def _get_line_check_names_uncached(
+        self,
+        line: str,
+        check_confusables: bool,
+        confusables_lang_ids_allowed: FrozenSet[int],
+    ) -> FrozenSet[str]:
+        """Return the IDs of all checks that fail for a line.
+
+        This is wrapped in a cache for each instance of the checker, and
+        should be called through ``_get_line_check_names()``.
+
+        Version Added:
+            6.0
+
+        Args:
+            line (str):
+                The line to check.
+
+            check_confusables (bool):
+                Whether to check the line for Unicode confusables.
+
+            confusables_lang_ids_allowed (frozenset of int):
+                The IDs of languages to exclude from Unicode confusables
+                checks.
+
+        Returns:
+            frozenset of str:
+            The IDs of the failed checks.
+        """
+        return frozenset(
+            _check_name
+            for _i, _c, _codepoint, _check_name in self._iter_unsafe_chars(
+                line,
+                check_confusables=check_confusables,
+                confusables_lang_ids_allowed=confusables_lang_ids_allowed)
+        )
+
+    def _get_confusables_lang_ids_allowed(
         self,
-        chars: Iterable[str],
         *,
         check_confusables: bool,
         confusable_aliases_allowed: List[str],
+    ) -> FrozenSet[int]:
+        """Return the IDs of languages to exclude from confusables checks.
+
+        Version Added:
+            6.0
+
+        Args:
+            check_confusables (bool):
+                Whether to check lines for Unicode confusables.
+
+            confusable_aliases_allowed (list of str):
+                A list of Unicode aliases to exclude from Unicode confusables
+                checks.
+
+        Returns:
+            frozenset of int:
+            The IDs of the languages.
+        """
+        if not check_confusables or not confusable_aliases_allowed:
+            return frozenset()
+
+        from reviewboard.codesafety._unicode_confusables import \
+            CONFUSABLES_ALIAS_TO_ID_MAP
+
+        return frozenset(
+            CONFUSABLES_ALIAS_TO_ID_MAP[_alias]
+            for _alias in confusable_aliases_allowed
+            if _alias in CONFUSABLES_ALIAS_TO_ID_MAP
+        )
+
+    def _iter_unsafe_chars(
+        self,
+        text: str,
+        *,
+        check_confusables: bool,
+        confusables_lang_ids_allowed: FrozenSet[int],
     ) -> Iterator[Tuple[int, str, int, str]]:
         """Iterate through a string, yielding unsafe characters.
 
+        Version Changed:
+            6.0:
+            * This now takes a string, rather than any iterable of
+              characters.
+            * Replaced ``confusable_aliases_allowed`` with
+              ``confusables_lang_ids_allowed``.
+            * Candidate characters are now found using a compiled regex,
+              rather than checking each character in turn.
+
         Args:
-            chars (str):
-                The characters to iterate through.
+            text (str):
+                The text to iterate through.
 
-            check_confusables (bool, optional):
+            check_confusables (bool):
                 Whether to check the line for Unicode confusables.
 
-            confusable_aliases_allowed (list of str, optional):
-                A list of Unicode aliases to exclude from Unicode confusables
+            confusables_lang_ids_allowed (frozenset of int):
+                The IDs of languages to exclude from Unicode confusables
                 checks.
 
         Yields:
@@ -308,42 +417,110 @@ class TrojanSourceCodeSafetyChecker(BaseCodeSafetyChecker):
                 3 (str):
                     The result ID.
         """
+        regex = self._get_unsafe_chars_regex(check_confusables)
+
         # We're importing this here, rather than at the module level, since
         # we want to avoid taking the hit until we need it the first time.
-        from reviewboard.codesafety._unicode_confusables import (
-            COMMON_CONFUSABLES_MAP,
-            CONFUSABLES_ALIAS_TO_ID_MAP,
-            ConfusablesMap,
-        )
+        from reviewboard.codesafety._unicode_confusables import \
+            COMMON_CONFUSABLES_MAP
+
+        range_starts, range_ends, range_check_names = \
+            self._get_unsafe_unicode_sorted_ranges()
 
-        confusables_map: ConfusablesMap = {}
-        confusables_lang_ids_allowed: Set[int] = set()
+        for m in regex.finditer(text):
+            c = m.group()
+            codepoint = ord(c)
+            confusable = COMMON_CONFUSABLES_MAP.get(c)
+
+            if confusable is not None:
+                if confusable[1] not in confusables_lang_ids_allowed:
+                    yield m.start(), c, codepoint, 'confusable'
+            else:
+                i = bisect_right(range_starts, codepoint) - 1
+
+                if i >= 0 and codepoint <= range_ends[i]:
+                    yield m.start(), c, codepoint, range_check_names[i]
+
+    @classmethod
+    def _get_unsafe_chars_regex(
+        cls,
+        check_confusables: bool,
+    ) -> Pattern[str]:
+        """Return a regex matching all possibly-unsafe characters.
+
+        This is a single character class covering all checked Unicode
+        ranges and (optionally) all Unicode confusables. It's compiled once
+        and cached for all future instances.
+
+        Version Added:
+            6.0
+
+        Args:
+            check_confusables (bool):
+                Whether to match Unicode confusables.
+
+        Returns:
+            re.Pattern:
+            The compiled regex.
+        """
+        regexes = cls._unsafe_chars_regexes or {}
+
+        try:
+            return regexes[check_confusables]
+        except KeyError:
+            pass
+
+        parts = [
+            '%s-%s' % (re.escape(chr(_start)), re.escape(chr(_end)))
+            for _start, _end in cls._get_unsafe_unicode_check_map()
+        ]
 
         if check_confusables:
-            confusables_map = COMMON_CONFUSABLES_MAP
-
-            # Check if any specific languages have been opted into. These will
-            # be excluded from any confusable checks.
-            confusables_lang_ids_allowed = {
-                CONFUSABLES_ALIAS_TO_ID_MAP[_alias]
-                for _alias in confusable_aliases_allowed
-                if _alias in CONFUSABLES_ALIAS_TO_ID_MAP
-            }
+            from reviewboard.codesafety._unicode_confusables import \
+                COMMON_CONFUSABLES_MAP
+
+            parts += [
+                re.escape(_c)
+                for _c in COMMON_CONFUSABLES_MAP
+            ]
+
+        regex = re.compile('[%s]' % ''.join(parts))
+        cls._unsafe_chars_regexes = {
+            **regexes,
+            check_confusables: regex,
+        }
 
-        checks_map = self._get_unsafe_unicode_check_map()
+        return regex
 
-        for i, c in enumerate(chars):
-            codepoint = ord(c)
+    @classmethod
+    def _get_unsafe_unicode_sorted_ranges(
+        cls,
+    ) -> Tuple[List[int], List[int], List[str]]:
+        """Return sorted ranges for matching unsafe Unicode characters.
 
-            if c in confusables_map:
-                if (not confusables_lang_ids_allowed or
-                    confusables_map[c][1] not in confusables_lang_ids_allowed):
-                    yield i, c, codepoint, 'confusable'
-            else:
-                for check_range, check_name in checks_map.items():
-                    if check_range[0] <= codepoint <= check_range[1]:
-                        yield i, c, codepoint, check_name
-                        break
+        This is cached for all future instances.
+
+        Version Added:
+            6.0
+
+        Returns:
+            tuple:
+            A 3-tuple of parallel lists, containing the start of each range,
+            the end of each range, and the result ID for each range. These
+            are sorted by the start of the range.
+        """
+        sorted_ranges = cls._unsafe_unicode_sorted_ranges
+
+        if sorted_ranges is None:
+            items = sorted(cls._get_unsafe_unicode_check_map().items())
+            sorted_ranges = (
+                [_range[0] for _range, _check_id in items],
+                [_range[1] for _range, _check_id in items],
+                [_check_id for _range, _check_id in items],
+            )
+            cls._unsafe_unicode_sorted_ranges = sorted_ranges
+
+        return sorted_ranges
 
     @classmethod
     def _get_unsafe_unicode_check_map(cls) -> Dict[_UnicodeRange, str]:
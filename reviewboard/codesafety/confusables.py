@@ -0,0 +1,176 @@
+"""Compact storage for the Unicode confusables table.
+
+Version Added:
+    6.0
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from typing import Iterator, Mapping, Optional, Tuple
+
+from typing_extensions import TypeAlias
+
+
+#: A value in the confusables table.
+#:
+#: This is a 2-tuple of the character being confused with and the ID of the
+#: language the confusable belongs to (or ``None``).
+ConfusablesMapValue: TypeAlias = Tuple[str, Optional[int]]
+
+
+class ConfusablesTable(Mapping[str, ConfusablesMapValue]):
+    """A read-only mapping of Unicode confusables.
+
+    This stores the confusables table as parallel arrays, rather than as a
+    dictionary of tuples, which keeps the generated module small and fast to
+    import and avoids allocating an object for every entry up-front.
+
+    The confusable characters are stored as a single sorted string, which is
+    searched using a binary search. The characters they're confused with
+    are stored as a string of the same length, and the language IDs as
+    a :py:class:`bytes` of the same length, with :py:attr:`NO_LANG_ID`
+    standing in for ``None``.
+
+    Lookups return the same values as the dictionary previously generated
+    for :py:data:`reviewboard.codesafety._unicode_confusables.
+    COMMON_CONFUSABLES_MAP`.
+
+    Version Added:
+        6.0
+    """
+
+    #: The stored language ID representing no language.
+    #:
+    #: Type:
+    #:     int
+    NO_LANG_ID = 0xFF
+
+    def __init__(
+        self,
+        chars: str,
+        confused_with: str,
+        lang_ids: bytes,
+    ) -> None:
+        """Initialize the table.
+
+        Args:
+            chars (str):
+                The confusable characters, sorted by codepoint.
+
+            confused_with (str):
+                The characters each confusable may be confused with, in the
+                same order as ``chars``.
+
+            lang_ids (bytes):
+                The language IDs of each confusable, in the same order as
+                ``chars``.
+
+        Raises:
+            ValueError:
+                The arrays were not the same length.
+        """
+        if not (len(chars) == len(confused_with) == len(lang_ids)):
+            raise ValueError(
+                'The confusables arrays must all be the same length.')
+
+        self._chars = chars
+        self._confused_with = confused_with
+        self._lang_ids = lang_ids
+
+    def get(
+        self,
+        key: str,
+        default: Optional[ConfusablesMapValue] = None,
+    ) -> Optional[ConfusablesMapValue]:
+        """Return information on a confusable character.
+
+        Args:
+            key (str):
+                The character to look up.
+
+            default (tuple, optional):
+                The value to return if the character is not a confusable.
+
+        Returns:
+            tuple:
+            A 2-tuple of the character being confused with and the language
+            ID of the confusable, or ``default`` if the character is not a
+            confusable.
+        """
+        chars = self._chars
+
+        if len(key) != 1:
+            return default
+
+        i = bisect_left(chars, key)
+
+        if i == len(chars) or chars[i] != key:
+            return default
+
+        lang_id: Optional[int] = self._lang_ids[i]
+
+        if lang_id == self.NO_LANG_ID:
+            lang_id = None
+
+        return self._confused_with[i], lang_id
+
+    def __getitem__(
+        self,
+        key: str,
+    ) -> ConfusablesMapValue:
+        """Return information on a confusable character.
+
+        Args:
+            key (str):
+                The character to look up.
+
+        Returns:
+            tuple:
+            A 2-tuple of the character being confused with and the language
+            ID of the confusable.
+
+        Raises:
+            KeyError:
+                The character is not a confusable.
+        """
+        value = self.get(key)
+
+        if value is None:
+            raise KeyError(key)
+
+        return value
+
+    def __contains__(
+        self,
+        key: object,
+    ) -> bool:
+        """Return whether a character is a confusable.
+
+        Args:
+            key (object):
+                The character to look up.
+
+        Returns:
+            bool:
+            ``True`` if the character is a confusable.
+        """
+        return isinstance(key, str) and self.get(key) is not None
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate through the confusable characters, in codepoint order.
+
+        Yields:
+            str:
+            Each confusable character.
+        """
+        return iter(self._chars)
+
+    def __len__(self) -> int:
+        """Return the number of confusables in the table.
+
+        Returns:
+            int:
+            The number of confusables.
+        """
+        return len(self._chars)
@@ -0,0 +1,81 @@
+"""Unit tests for reviewboard.codesafety.confusables."""
+
+from reviewboard.codesafety._unicode_confusables import (
+    COMMON_CONFUSABLES_MAP,
+    CONFUSABLES_ALIAS_TO_ID_MAP)
+from reviewboard.codesafety.confusables import ConfusablesTable
+from reviewboard.testing import TestCase
+
+
+class ConfusablesTableTests(TestCase):
+    """Unit tests for ConfusablesTable."""
+
+    def setUp(self):
+        super().setUp()
+
+        self.table = ConfusablesTable(
+            chars='Αа\U0001d400',
+            confused_with='AaA',
+            lang_ids=b'\x00\x01\xff')
+
+    def test_init_with_mismatched_lengths(self):
+        """Testing ConfusablesTable.__init__ with arrays of different
+        lengths
+        """
+        message = 'The confusables arrays must all be the same length.'
+
+        with self.assertRaisesMessage(ValueError, message):
+            ConfusablesTable(chars='Αа',
+                             confused_with='A',
+                             lang_ids=b'\x00\x01')
+
+    def test_get(self):
+        """Testing ConfusablesTable.get"""
+        self.assertEqual(self.table.get('Α'), ('A', 0))
+        self.assertEqual(self.table.get('а'), ('a', 1))
+        self.assertEqual(self.table.get('\U0001d400'), ('A', None))
+
+    def test_get_with_unknown(self):
+        """Testing ConfusablesTable.get with characters not in the table"""
+        self.assertIsNone(self.table.get('A'))
+        self.assertIsNone(self.table.get('Β'))
+        self.assertIsNone(self.table.get('\U0010ffff'))
+        self.assertIsNone(self.table.get('Αа'))
+        self.assertEqual(self.table.get('A', ('?', None)), ('?', None))
+
+    def test_getitem(self):
+        """Testing ConfusablesTable.__getitem__"""
+        self.assertEqual(self.table['Α'], ('A', 0))
+
+        with self.assertRaises(KeyError):
+            self.table['A']
+
+    def test_contains(self):
+        """Testing ConfusablesTable.__contains__"""
+        self.assertIn('а', self.table)
+        self.assertNotIn('a', self.table)
+        self.assertNotIn(0x430, self.table)
+
+    def test_iter(self):
+        """Testing ConfusablesTable.__iter__ and __len__"""
+        self.assertEqual(list(self.table), ['Α', 'а', '\U0001d400'])
+        self.assertEqual(len(self.table), 3)
+        self.assertEqual(
+            dict(self.table),
+            {
+                'Α': ('A', 0),
+                'а': ('a', 1),
+                '\U0001d400': ('A', None),
+            })
+
+    def test_common_confusables_map(self):
+        """Testing COMMON_CONFUSABLES_MAP lookups"""
+        chars = list(COMMON_CONFUSABLES_MAP)
+
+        self.assertEqual(chars, sorted(chars))
+        self.assertEqual(COMMON_CONFUSABLES_MAP['\xa0'], (' ', None))
+        self.assertEqual(COMMON_CONFUSABLES_MAP['а'],
+                         ('a', CONFUSABLES_ALIAS_TO_ID_MAP['Cyrillic']))
+        self.assertEqual(COMMON_CONFUSABLES_MAP['Α'],
+                         ('A', CONFUSABLES_ALIAS_TO_ID_MAP['Greek']))
+        self.assertNotIn('a', COMMON_CONFUSABLES_MAP)
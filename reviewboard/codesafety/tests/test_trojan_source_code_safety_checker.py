@@ -1,5 +1,6 @@
 """Unit tests for reviewboard.codesafety.checkers.trojan_source."""
 
+import kgb
 from django.utils.safestring import SafeString
 
 from reviewboard.codesafety._unicode_confusables import (
@@ -10,7 +11,7 @@ from reviewboard.codesafety.checkers.trojan_source import \
 from reviewboard.testing import TestCase
 
 
-class TrojanSourceCodeSafetyCheckerTests(TestCase):
+class TrojanSourceCodeSafetyCheckerTests(kgb.SpyAgency, TestCase):
     """Unit tests for reviewboard.codesafety.checkers.trojan_source."""
 
     def setUp(self):
@@ -181,6 +182,98 @@ class TrojanSourceCodeSafetyCheckerTests(TestCase):
                 'warnings': {'bidi', 'zws'},
             })
 
+    def test_check_content_with_mixed_scripts(self):
+        """Testing TrojanSourceCodeSafetyChecker.check_content with safe
+        non-ASCII characters
+        """
+        self.assertEqual(
+            self.checker.check_content(content_items=[{
+                'path': 'test.py',
+                'lines': [
+                    '# Caf\u00e9 \u00fcber na\u00efve',
+                    '# \u65e5\u672c\u8a9e\u306e\u30b3\u30e1\u30f3\u30c8',
+                    'x = "\u2603"',
+                ],
+            }]),
+            {
+                'warnings': set(),
+            })
+
+    def test_check_content_with_ascii_lines(self):
+        """Testing TrojanSourceCodeSafetyChecker.check_content skips checking
+        ASCII lines
+        """
+        self.spy_on(self.checker._get_line_check_names_uncached)
+
+        self.assertEqual(
+            self.checker.check_content(content_items=[{
+                'path': 'test.py',
+                'lines': ['def foo():', '    return 1'],
+            }]),
+            {
+                'warnings': set(),
+            })
+
+        self.assertSpyNotCalled(self.checker._get_line_check_names_uncached)
+
+    def test_check_content_caches_lines(self):
+        """Testing TrojanSourceCodeSafetyChecker.check_content caches
+        results for each line
+        """
+        self.spy_on(
+            TrojanSourceCodeSafetyChecker._get_line_check_names_uncached,
+            owner=TrojanSourceCodeSafetyChecker)
+        checker = TrojanSourceCodeSafetyChecker()
+
+        content_items = [{
+            'path': 'test.py',
+            'lines': ['def is_\u200Badmin'],
+        }]
+
+        for i in range(2):
+            self.assertEqual(
+                checker.check_content(content_items=content_items),
+                {
+                    'warnings': {'zws'},
+                })
+
+        self.assertSpyCallCount(
+            TrojanSourceCodeSafetyChecker._get_line_check_names_uncached, 1)
+
+        # Different options must not share results.
+        self.assertEqual(
+            checker.check_content(
+                content_items=[{
+                    'path': 'test.py',
+                    'lines': ['def foo\uff28'],
+                }],
+                check_confusables=False),
+            {
+                'warnings': set(),
+            })
+        self.assertEqual(
+            checker.check_content(content_items=[{
+                'path': 'test.py',
+                'lines': ['def foo\uff28'],
+            }]),
+            {
+                'warnings': {'confusable'},
+            })
+
+        self.assertSpyCallCount(
+            TrojanSourceCodeSafetyChecker._get_line_check_names_uncached, 3)
+
+    def test_update_line_html_with_ascii(self):
+        """Testing TrojanSourceCodeSafetyChecker.update_line_html with an
+        ASCII line
+        """
+        html = self.checker.update_line_html(
+            '<span>def</span> <span>foo</span>:',
+            result_ids=[])
+
+        self.assertIsInstance(html, SafeString)
+        self.assertEqual(html, '<span>def</span> <span>foo</span>:')
+
     def test_update_line_html_with_bidi(self):
         """Testing TrojanSourceCodeSafetyChecker.update_line_html with
         bi-directional characters
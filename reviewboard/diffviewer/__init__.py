@@ -0,0 +1,22 @@
+from django.dispatch import receiver
+
+from reviewboard.signals import initializing
+
+
+@receiver(initializing, dispatch_uid='diffviewer_connect_signals')
+def _on_initializing(*args, **kwargs):
+    """Handler for when Review Board is initializing.
+
+    This will begin listening for published review requests, in order to
+    pre-generate chunks for any new diffs.
+
+    We do this during the initializing process instead of when the module
+    is loaded in order to avoid any circular imports caused by
+    reviewboard.reviews.models.
+
+    Version Added:
+        6.0
+    """
+    from reviewboard.diffviewer.chunk_warmup import connect_signals
+
+    connect_signals()
@@ -2,15 +2,19 @@ import fnmatch
 import hashlib
 import logging
 import re
+from bisect import bisect_right
+from collections.abc import Sequence
+from functools import partial
 from itertools import zip_longest
 from typing import List
 
 import pygments.util
+from django.core.cache import cache
 from django.utils.encoding import force_str
 from django.utils.html import escape
 from django.utils.translation import get_language, gettext as _
 from djblets.log import log_timed
-from djblets.cache.backend import cache_memoize
+from djblets.cache.backend import cache_memoize, make_cache_key
 from djblets.siteconfig.models import SiteConfiguration
 from housekeeping.functions import deprecate_non_keyword_only_args
 from pygments import highlight
@@ -20,7 +24,14 @@ from pygments.lexers import (find_lexer_class,
 
 from reviewboard.codesafety import code_safety_checker_registry
 from reviewboard.deprecation import RemovedInReviewBoard70Warning
-from reviewboard.diffviewer.differ import DiffCompatVersion, get_differ
+from reviewboard.diffviewer.chunk_lines import (LINES_FORMAT_VERSION,
+                                                DiffLine,
+                                                deserialize_lines,
+                                                serialize_lines)
+from reviewboard.diffviewer.differ import (DiffCompatVersion,
+                                           DiffTimeBudget,
+                                           DifferEngine,
+                                           get_differ)
 from reviewboard.diffviewer.diffutils import (get_filediff_encodings,
                                               get_line_changed_regions,
                                               get_original_file,
@@ -30,6 +41,7 @@ from reviewboard.diffviewer.diffutils import (get_filediff_encodings,
 from reviewboard.diffviewer.opcode_generator import (DiffOpcodeGenerator,
                                                      get_diff_opcode_generator)
 from reviewboard.diffviewer.settings import DiffSettings
+from reviewboard.diffviewer.syntax_highlighting import get_highlighted_lines
 
 
 logger = logging.getLogger(__name__)
@@ -53,6 +65,115 @@ class NoWrapperHtmlFormatter(HtmlFormatter):
                 yield tup
 
 
+class CachedChunkLines(Sequence):
+    """A range of lines in a cached chunk, loaded on demand.
+
+    This is used in place of a list of lines when only a few lines of a
+    large chunk are likely to be needed, such as when expanding context
+    around a collapsed chunk. Slicing returns a new range without loading
+    any lines. Lines are only loaded from the cache when they're indexed or
+    iterated.
+
+    Version Added:
+        6.0
+    """
+
+    def __init__(self, load_lines, start, end):
+        """Initialize the range of lines.
+
+        Args:
+            load_lines (callable):
+                The function used to load lines. This takes ``start`` and
+                ``end`` keyword arguments and returns a list of lines.
+
+            start (int):
+                The offset of the first line in the range, relative to the
+                first line in the file.
+
+            end (int):
+                The offset after the last line in the range.
+        """
+        self._load_lines = load_lines
+        self._start = start
+        self._end = end
+
+    def __len__(self):
+        """Return the number of lines in the range.
+
+        Returns:
+            int:
+            The number of lines.
+        """
+        return self._end - self._start
+
+    def __getitem__(self, key):
+        """Return a line or a range of lines.
+
+        Args:
+            key (int or slice):
+                The index of the line, or a slice of lines.
+
+        Returns:
+            object:
+            The line at the index, or a new :py:class:`CachedChunkLines` for
+            a slice.
+
+        Raises:
+            IndexError:
+                The index is out of range.
+        """
+        num_lines = len(self)
+
+        if isinstance(key, slice):
+            start, stop, step = key.indices(num_lines)
+
+            if step != 1:
+                return list(self)[key]
+
+            return CachedChunkLines(load_lines=self._load_lines,
+                                    start=self._start + start,
+                                    end=self._start + max(start, stop))
+
+        if key < 0:
+            key += num_lines
+
+        if not 0 <= key < num_lines:
+            raise IndexError('Line index out of range')
+
+        line_offset = self._start + key
+
+        return self._load_lines(start=line_offset,
+                                end=line_offset + 1)[0]
+
+    def __iter__(self):
+        """Iterate through the lines in the range.
+
+        All lines in the range are loaded at once.
+
+        Yields:
+            object:
+            Each line.
+        """
+        yield from self._load_lines(start=self._start,
+                                    end=self._end)
+
+    def __eq__(self, other):
+        """Return whether the lines are equal to another sequence of lines.
+
+        Args:
+            other (object):
+                The object to compare to.
+
+        Returns:
+            bool:
+            Whether the lines are equal.
+        """
+        if isinstance(other, (list, CachedChunkLines)):
+            return list(self) == list(other)
+
+        return NotImplemented
+
+
 class RawDiffChunkGenerator(object):
     """A generator for chunks for a diff that can be used for rendering.
 
@@ -107,6 +228,17 @@ class RawDiffChunkGenerator(object):
     # Default tab size used in browsers.
     TAB_SIZE = DiffOpcodeGenerator.TAB_SIZE
 
+    #: The approximate number of lines stored in each cached segment.
+    #:
+    #: Chunks are cached in segments of roughly this many lines (a segment
+    #: always contains at least one full chunk), alongside a small index.
+    #: This keeps cache entries for very large files a manageable size, and
+    #: allows callers to fetch only the chunks they need.
+    #:
+    #: Version Added:
+    #:     6.0
+    CACHE_SEGMENT_NUM_LINES = 2000
+
     ######################
     # Instance variables #
     ######################
@@ -213,10 +345,17 @@ class RawDiffChunkGenerator(object):
         self._last_header = [None, None]
         self._last_header_index = [0, 0]
         self._chunk_index = 0
+        self._simplifications = set()
+        self._use_time_budget = True
+
+        # Cached indexes and segments of lines fetched for this generator.
+        self._chunks_indexes = {}
+        self._cached_segments = {}
 
     def get_opcode_generator(self):
         """Return the DiffOpcodeGenerator used to generate diff opcodes."""
-        return get_diff_opcode_generator(self.differ)
+        return get_diff_opcode_generator(self.differ,
+                                         diff_settings=self.diff_settings)
 
     def get_chunks(self, cache_key=None):
         """Return the chunks for the given diff information.
@@ -224,22 +363,677 @@ class RawDiffChunkGenerator(object):
         If a cache key is provided and there are chunks already computed in the
         cache, they will be yielded. Otherwise, new chunks will be generated,
         stored in cache (given a cache key), and yielded.
+
+        Version Changed:
+            6.0:
+            Chunks are now cached in segments. See
+            :py:attr:`CACHE_SEGMENT_NUM_LINES`.
         """
         if cache_key:
-            chunks = cache_memoize(cache_key,
-                                   lambda: list(self.get_chunks_uncached()),
-                                   large_data=True)
+            index = self._get_chunks_index(cache_key)
+            chunks = self._iter_indexed_chunks(cache_key=cache_key,
+                                               index=index,
+                                               start_index=0,
+                                               end_index=index['num_chunks'])
         else:
             chunks = self.get_chunks_uncached()
 
         for chunk in chunks:
             yield chunk
 
+    def get_chunks_info(self, cache_key=None):
+        """Return information on the chunks for the diff.
+
+        If a cache key is provided, this will only need to fetch a small
+        index from the cache, rather than all the chunks.
+
+        Version Added:
+            6.0
+
+        Args:
+            cache_key (str, optional):
+                The cache key for the chunks.
+
+        Returns:
+            dict:
+            A dictionary containing the following keys:
+
+            ``changed_chunk_indexes`` (list of int):
+                The indexes of all chunks that are not ``equal`` chunks.
+
+            ``num_chunks`` (int):
+                The total number of chunks.
+
+            ``simplified`` (bool):
+                Whether any changed chunks were simplified, due to the diff
+                exceeding its time budget.
+
+            ``whitespace_only`` (bool):
+                Whether all changed chunks only contain whitespace changes.
+                This is ``False`` if there are no chunks.
+        """
+        if cache_key:
+            index = self._get_chunks_index(cache_key)
+        else:
+            index = self._build_chunks_index(self._get_all_chunks_uncached())
+
+        return {
+            key: index[key]
+            for key in ('changed_chunk_indexes', 'num_chunks', 'simplified',
+                        'whitespace_only')
+        }
+
+    def get_chunk_range(self, start_index, end_index, cache_key=None, *,
+                        lazy_lines=False):
+        """Return a range of chunks for the diff.
+
+        If a cache key is provided, only the cached segments containing
+        the chunks will be fetched from the cache.
+
+        Version Added:
+            6.0
+
+        Args:
+            start_index (int):
+                The index of the first chunk to return.
+
+            end_index (int):
+                The index after the last chunk to return.
+
+            cache_key (str, optional):
+                The cache key for the chunks.
+
+            lazy_lines (bool, optional):
+                Whether to load the lines of each chunk only once they're
+                accessed. If set, and the chunks are stored in more than one
+                segment, each chunk's ``lines`` will be a
+                :py:class:`CachedChunkLines`, and only the segments
+                containing the lines that are accessed will be fetched. This
+                is useful when only a few lines of a large chunk will be
+                needed.
+
+        Yields:
+            dict:
+            Each chunk in the range. See :py:meth:`generate_chunks` for
+            the contents.
+        """
+        if cache_key:
+            index = self._get_chunks_index(cache_key)
+            chunks = self._iter_indexed_chunks(
+                cache_key=cache_key,
+                index=index,
+                start_index=max(start_index, 0),
+                end_index=min(end_index, index['num_chunks']),
+                lazy_lines=lazy_lines)
+        else:
+            chunks = self._get_all_chunks_uncached()[start_index:end_index]
+
+        for chunk in chunks:
+            yield chunk
+
+    def get_chunks_in_line_range(self, first_line, num_lines,
+                                 cache_key=None):
+        """Return the chunks overlapping a range of lines in the diff.
+
+        Each chunk will only contain the lines within the range. The chunks
+        containing the range are looked up in the index, and if a cache key
+        is provided, only the cached segments containing the lines will be
+        fetched from the cache. This keeps the cost proportional to the
+        number of lines in the range, rather than to the size of the file.
+
+        Version Added:
+            6.0
+
+        Args:
+            first_line (int):
+                The first virtual line number in the range.
+
+            num_lines (int):
+                The number of lines in the range.
+
+            cache_key (str, optional):
+                The cache key for the chunks.
+
+        Yields:
+            dict:
+            Each chunk overlapping the range, containing only the lines
+            within the range. See :py:meth:`generate_chunks` for the
+            contents.
+        """
+        if num_lines <= 0:
+            return
+
+        if cache_key:
+            index = self._get_chunks_index(cache_key)
+        else:
+            chunks = self._get_all_chunks_uncached()
+            index = self._build_chunks_index(chunks)
+            index['chunks'] = chunks
+
+        last_line = first_line + num_lines - 1
+        chunk_first_lines = index['chunk_first_lines']
+
+        yield from self._iter_indexed_chunks(
+            cache_key=cache_key,
+            index=index,
+            start_index=max(bisect_right(chunk_first_lines, first_line) - 1,
+                            0),
+            end_index=bisect_right(chunk_first_lines, last_line),
+            first_line=first_line,
+            last_line=last_line)
+
     def get_chunks_uncached(self):
         """Yield the list of chunks, bypassing the cache."""
         for chunk in self.generate_chunks(self.old, self.new):
             yield chunk
 
+    def _get_chunks_index(self, cache_key):
+        """Return the index for the cached chunks.
+
+        If the index isn't in the cache, all chunks will be generated and
+        stored in the cache, along with the new index.
+
+        Lines are stored in the cache using
+        :py:func:`~reviewboard.diffviewer.chunk_lines.serialize_lines`. The
+        index records the format of the stored lines in ``lines_format``, and
+        is rebuilt if it doesn't match the current format.
+
+        Version Added:
+            6.0
+
+        Args:
+            cache_key (str):
+                The cache key for the chunks.
+
+        Returns:
+            dict:
+            The index for the chunks. See :py:meth:`_build_chunks_index`.
+        """
+        def _build_index():
+            chunks = self._get_all_chunks_uncached()
+            index = self._build_chunks_index(chunks)
+            num_lines = index['num_lines']
+            segment_num_lines = index['segment_num_lines']
+
+            if num_lines <= segment_num_lines or index['simplified']:
+                # This is a small file, so store the chunks directly in
+                # the index, instead of taking another trip to the cache.
+                #
+                # Simplified diffs are stored the same way, regardless of
+                # size. They depend on how long the diff took to compute,
+                # so regenerating a missing segment could produce lines that
+                # don't match the rest of the index. Storing everything in
+                # one entry means they're always rebuilt together.
+                index['chunks'] = [
+                    dict(chunk,
+                         lines=serialize_lines(chunk['lines']))
+                    for chunk in chunks
+                ]
+            else:
+                # Store everything but the lines of each chunk in the index.
+                # The lines will be stored in segments.
+                index['chunk_infos'] = [
+                    {
+                        _key: _value
+                        for _key, _value in chunk.items()
+                        if _key != 'lines'
+                    }
+                    for chunk in chunks
+                ]
+
+                lines = self._get_all_lines_uncached()
+
+                for i, start in enumerate(range(0, num_lines,
+                                                segment_num_lines)):
+                    cache_memoize(
+                        self._make_segment_cache_key(cache_key, i),
+                        lambda: serialize_lines(
+                            lines[start:start + segment_num_lines]),
+                        force_overwrite=True,
+                        large_data=True)
+
+            index['lines_format'] = LINES_FORMAT_VERSION
+
+            return index
+
+        try:
+            return self._chunks_indexes[cache_key]
+        except KeyError:
+            pass
+
+        index_cache_key = '%s-index' % cache_key
+        index = cache_memoize(index_cache_key, _build_index,
+                              large_data=True)
+
+        if (index.get('lines_format') != LINES_FORMAT_VERSION or
+            (index['simplified'] and 'chunks' not in index)):
+            # The index was stored in an older format, or stores a
+            # simplified diff in segments. Rebuild it.
+            index = cache_memoize(index_cache_key, _build_index,
+                                  force_overwrite=True,
+                                  large_data=True)
+
+        if 'chunks' in index:
+            if hasattr(self, '_all_chunks'):
+                # The chunks were just generated, so there's no need to
+                # deserialize the stored copy.
+                chunks = self._all_chunks
+            else:
+                chunks = [
+                    dict(chunk,
+                         lines=deserialize_lines(chunk['lines']))
+                    for chunk in index['chunks']
+                ]
+
+            index = dict(index,
+                         chunks=chunks)
+
+        self._chunks_indexes[cache_key] = index
+
+        return index
+
+    def _build_chunks_index(self, chunks):
+        """Build an index for a list of chunks.
+
+        The index maps virtual line numbers to chunks, and chunks to the
+        offsets of their lines within the file. The lines are stored in
+        segments of :py:attr:`CACHE_SEGMENT_NUM_LINES` lines.
+
+        Version Added:
+            6.0
+
+        Args:
+            chunks (list of dict):
+                The list of chunks to index.
+
+        Returns:
+            dict:
+            The index for the chunks. This contains the keys documented in
+            :py:meth:`get_chunks_info`, along with:
+
+            ``chunk_first_lines`` (list of int):
+                The virtual line number of the first line of each chunk.
+
+            ``chunk_line_offsets`` (list of int):
+                The offset of the first line of each chunk, relative to the
+                first line in the file.
+
+            ``num_lines`` (int):
+                The total number of lines in all chunks.
+
+            ``segment_num_lines`` (int):
+                The number of lines stored in each segment.
+
+            ``chunk_infos`` (list of dict, optional):
+                The chunks, without their lines, if the lines are stored in
+                segments.
+
+            ``chunks`` (list of dict, optional):
+                All the chunks, if they fit in a single segment.
+        """
+        changed_chunk_indexes = []
+        chunk_first_lines = []
+        chunk_line_offsets = []
+        whitespace_only = len(chunks) > 0
+        simplified = False
+        next_line = 1
+        num_lines = 0
+
+        for i, chunk in enumerate(chunks):
+            lines = chunk['lines']
+
+            if lines:
+                next_line = lines[0][0]
+
+            chunk_first_lines.append(next_line)
+            chunk_line_offsets.append(num_lines)
+            next_line += len(lines)
+            num_lines += len(lines)
+
+            if chunk['change'] != 'equal':
+                changed_chunk_indexes.append(i)
+                meta = chunk.get('meta', {})
+
+                if not meta.get('whitespace_chunk', False):
+                    whitespace_only = False
+
+                if meta.get('simplified'):
+                    simplified = True
+
+        return {
+            'changed_chunk_indexes': changed_chunk_indexes,
+            'chunk_first_lines': chunk_first_lines,
+            'chunk_line_offsets': chunk_line_offsets,
+            'num_chunks': len(chunks),
+            'num_lines': num_lines,
+            'segment_num_lines': self.CACHE_SEGMENT_NUM_LINES,
+            'simplified': simplified,
+            'whitespace_only': whitespace_only,
+        }
+
+    def _iter_indexed_chunks(self, cache_key, index, start_index, end_index,
+                             first_line=None, last_line=None,
+                             lazy_lines=False):
+        """Yield a range of chunks using the index.
+
+        Only the segments containing the lines of the chunks (or the lines
+        within the provided line range) will be fetched. If a segment is
+        missing from the cache, the chunks will be generated again, and the
+        segment will be stored back in the cache.
+
+        Version Added:
+            6.0
+
+        Args:
+            cache_key (str):
+                The cache key for the chunks. This may be ``None`` if the
+                index contains all the chunks.
+
+            index (dict):
+                The index for the chunks.
+
+            start_index (int):
+                The index of the first chunk to return.
+
+            end_index (int):
+                The index after the last chunk to return.
+
+            first_line (int, optional):
+                The first virtual line number to include in the chunks.
+                If provided, ``last_line`` must also be provided, and
+                chunks without any lines in the range will be skipped.
+
+            last_line (int, optional):
+                The last virtual line number to include in the chunks.
+
+            lazy_lines (bool, optional):
+                Whether to load lines only when they're accessed. See
+                :py:meth:`get_chunk_range`.
+
+        Yields:
+            dict:
+            Each chunk in the range.
+        """
+        if start_index >= end_index:
+            return
+
+        chunk_first_lines = index['chunk_first_lines']
+        chunk_line_offsets = index['chunk_line_offsets']
+        num_chunks = index['num_chunks']
+        all_chunks = index.get('chunks')
+        line_ranges = []
+
+        # Work out which lines are needed from each chunk, as offsets
+        # relative to the first line in the file.
+        for i in range(start_index, end_index):
+            chunk_start = chunk_line_offsets[i]
+
+            if i + 1 < num_chunks:
+                chunk_end = chunk_line_offsets[i + 1]
+            else:
+                chunk_end = index['num_lines']
+
+            if first_line is None:
+                start = chunk_start
+                end = chunk_end
+            else:
+                start = max(chunk_start,
+                            chunk_start + first_line - chunk_first_lines[i])
+                end = min(chunk_end,
+                          chunk_start + last_line - chunk_first_lines[i] + 1)
+
+                if start >= end:
+                    continue
+
+            line_ranges.append((i, chunk_start, start, end))
+
+        if not line_ranges:
+            return
+
+        if all_chunks is None and not lazy_lines:
+            # Fetch all the lines at once, so that segments shared between
+            # chunks are only fetched once.
+            lines_start = line_ranges[0][2]
+            all_lines = self._get_cached_lines(cache_key=cache_key,
+                                               index=index,
+                                               start=lines_start,
+                                               end=line_ranges[-1][3])
+
+        for i, chunk_start, start, end in line_ranges:
+            if all_chunks is not None:
+                chunk = all_chunks[i]
+
+                if first_line is None:
+                    yield chunk
+                    continue
+
+                lines = chunk['lines'][start - chunk_start:end - chunk_start]
+            else:
+                chunk = index['chunk_infos'][i]
+
+                if lazy_lines:
+                    lines = CachedChunkLines(
+                        load_lines=partial(self._get_cached_lines,
+                                           cache_key=cache_key,
+                                           index=index),
+                        start=start,
+                        end=end)
+                else:
+                    lines = all_lines[start - lines_start:end - lines_start]
+
+            chunk = dict(chunk,
+                         lines=lines)
+
+            if first_line is not None:
+                chunk['numlines'] = len(lines)
+
+            yield chunk
+
+    def _get_cached_lines(self, cache_key, index, start, end):
+        """Return a range of lines from the cached segments.
+
+        Version Added:
+            6.0
+
+        Args:
+            cache_key (str):
+                The cache key for the chunks.
+
+            index (dict):
+                The index for the chunks.
+
+            start (int):
+                The offset of the first line to return, relative to the
+                first line in the file.
+
+            end (int):
+                The offset after the last line to return.
+
+        Returns:
+            list:
+            The lines in the range.
+        """
+        segment_num_lines = index['segment_num_lines']
+        lines = []
+
+        if start >= end:
+            return lines
+
+        for segment_index in range(start // segment_num_lines,
+                                   (end - 1) // segment_num_lines + 1):
+            segment_start = segment_index * segment_num_lines
+            segment_lines = self._get_cached_segment(
+                cache_key=cache_key,
+                index=index,
+                segment_index=segment_index)
+            lines += segment_lines[max(start - segment_start, 0):
+                                   end - segment_start]
+
+        return lines
+
+    def _get_cached_segment(self, cache_key, index, segment_index):
+        """Return the lines in a cached segment.
+
+        Segments are only fetched from the cache once for the lifetime of
+        the chunk generator. If a segment is missing from the cache, it will
+        be regenerated and stored.
+
+        Version Added:
+            6.0
+
+        Args:
+            cache_key (str):
+                The cache key for the chunks.
+
+            index (dict):
+                The index for the chunks.
+
+            segment_index (int):
+                The index of the segment.
+
+        Returns:
+            list:
+            The lines in the segment.
+        """
+        key = (cache_key, segment_index)
+
+        try:
+            return self._cached_segments[key]
+        except KeyError:
+            segment_cache_key = self._make_segment_cache_key(cache_key,
+                                                             segment_index)
+            lines = deserialize_lines(cache_memoize(
+                segment_cache_key,
+                lambda: serialize_lines(self._regenerate_segment(
+                    cache_key, index, segment_index)),
+                large_data=True))
+
+            if lines is None:
+                # The segment was stored in an older format. Regenerate it.
+                lines = self._regenerate_segment(cache_key, index,
+                                                 segment_index)
+                cache_memoize(segment_cache_key,
+                              lambda: serialize_lines(lines),
+                              force_overwrite=True,
+                              large_data=True)
+
+            self._cached_segments[key] = lines
+
+            return lines
+
+    def _regenerate_segment(self, cache_key, index, segment_index):
+        """Generate the lines for a segment missing from the cache.
+
+        Only indexes for diffs that weren't simplified store their lines in
+        segments, so the diff is generated again without a time budget.
+        Otherwise, a slower run could simplify the diff, and the lines
+        wouldn't match the index.
+
+        Version Added:
+            6.0
+
+        Args:
+            cache_key (str):
+                The cache key for the chunks.
+
+            index (dict):
+                The index for the chunks.
+
+            segment_index (int):
+                The index of the segment to generate.
+
+        Returns:
+            list:
+            The lines in the segment.
+        """
+        assert not index['simplified']
+
+        self._use_time_budget = False
+
+        try:
+            chunks = self._get_all_chunks_uncached()
+        finally:
+            self._use_time_budget = True
+
+        lines = self._get_all_lines_uncached()
+
+        if (len(chunks) != index['num_chunks'] or
+            len(lines) != index['num_lines']):
+            # This should never happen, since chunk generation should be
+            # deterministic for a given cache key. If it does, throw away
+            # the index, so it'll be rebuilt on the next request.
+            logger.warning('Generated %d chunks (%d lines) for cache key '
+                           '"%s", but the cached index expects %d (%d '
+                           'lines). Invalidating the index.',
+                           len(chunks), len(lines), cache_key,
+                           index['num_chunks'], index['num_lines'])
+            cache.delete(make_cache_key('%s-index' % cache_key))
+
+        segment_num_lines = index['segment_num_lines']
+        start = segment_index * segment_num_lines
+
+        return lines[start:start + segment_num_lines]
+
+    def _get_all_chunks_uncached(self):
+        """Return all chunks, bypassing the cache.
+
+        The chunks will only be generated once for the lifetime of the
+        chunk generator.
+
+        Version Added:
+            6.0
+
+        Returns:
+            list of dict:
+            The list of chunks.
+        """
+        try:
+            return self._all_chunks
+        except AttributeError:
+            self._all_chunks = list(self.get_chunks_uncached())
+
+            return self._all_chunks
+
+    def _get_all_lines_uncached(self):
+        """Return the lines of all chunks, bypassing the cache.
+
+        Version Added:
+            6.0
+
+        Returns:
+            list:
+            The lines of all chunks, in order.
+        """
+        try:
+            return self._all_lines
+        except AttributeError:
+            self._all_lines = [
+                line
+                for chunk in self._get_all_chunks_uncached()
+                for line in chunk['lines']
+            ]
+
+            return self._all_lines
+
+    def _make_segment_cache_key(self, cache_key, segment_index):
+        """Return the cache key for a segment of lines.
+
+        Version Added:
+            6.0
+
+        Args:
+            cache_key (str):
+                The cache key for the chunks.
+
+            segment_index (int):
+                The index of the segment.
+
+        Returns:
+            str:
+            The cache key for the segment.
+        """
+        return '%s-segment-%d' % (cache_key, segment_index)
+
     def generate_chunks(self, old, new, old_encoding_list=None,
                         new_encoding_list=None):
         """Generate chunks for the difference between two strings.
@@ -278,7 +1072,7 @@ class RawDiffChunkGenerator(object):
             ``index`` (int)
                 The 0-based index of the chunk.
 
-            ``lines`` (list of unicode):
+            ``lines`` (list of reviewboard.diffviewer.chunk_lines.DiffLine):
                 The rendered list of lines.
 
             ``numlines`` (int):
@@ -293,7 +1087,20 @@ class RawDiffChunkGenerator(object):
 
             ``meta`` (dict):
                 Metadata on the chunk.
+
+                If the diff took longer than
+                :py:attr:`DiffSettings.diff_time_budget
+                <reviewboard.diffviewer.settings.DiffSettings.
+                diff_time_budget>` to generate, changed chunks will contain
+                a ``simplified`` key, listing the simplifications made to
+                the diff so far (``coarse``, ``intraline``, and/or
+                ``moves``).
         """
+        if self._use_time_budget and self.diff_settings.diff_time_budget:
+            time_budget = DiffTimeBudget(self.diff_settings.diff_time_budget)
+        else:
+            time_budget = None
+
         is_lists = isinstance(old, list)
         assert is_lists == isinstance(new, list)
 
@@ -348,8 +1155,13 @@ class RawDiffChunkGenerator(object):
                 ignore_space = False
                 break
 
-        self.differ = get_differ(a, b, ignore_space=ignore_space,
-                                 compat_version=self.diff_compat)
+        self.differ = get_differ(
+            a, b,
+            ignore_space=ignore_space,
+            compat_version=self.diff_compat,
+            engine=siteconfig.get('diffviewer_differ_engine',
+                                  DifferEngine.DEFAULT),
+            time_budget=time_budget)
         self.differ.add_interesting_lines_for_headers(self.orig_filename)
 
         context_num_lines = siteconfig.get("diffviewer_context_num_lines")
@@ -365,7 +1177,19 @@ class RawDiffChunkGenerator(object):
             'delete': 0,
         }
 
+        simplifications = self._simplifications
+        simplifications.clear()
+
         for tag, i1, i2, j1, j2, meta in opcodes_generator:
+            if time_budget is not None and time_budget.expired:
+                # All opcodes have been computed by this point. Note how
+                # they were simplified, if they were.
+                if self.differ.simplified:
+                    simplifications.add('coarse')
+
+                if getattr(opcodes_generator, 'moves_skipped', False):
+                    simplifications.add('moves')
+
             old_lines = markup_a[i1:i2]
             new_lines = markup_b[j1:j2]
             num_lines = max(len(old_lines), len(new_lines))
@@ -384,6 +1208,9 @@ class RawDiffChunkGenerator(object):
 
             counts[tag] += num_lines
 
+            if tag != 'equal' and simplifications:
+                meta['simplified'] = sorted(simplifications)
+
             if tag == 'equal' and num_lines > collapse_threshold:
                 last_range_start = num_lines - context_num_lines
 
@@ -609,9 +1436,15 @@ class RawDiffChunkGenerator(object):
         should be highlighted.
 
         This defaults to simply wrapping get_line_changed_regions() from
-        diffutils. Subclasses can override to provide custom behavior.
+        diffutils, sharing results for long lines through the cache.
+        Subclasses can override to provide custom behavior.
+
+        Version Changed:
+            6.0:
+            Results for long lines are now shared through the cache.
         """
-        return get_line_changed_regions(old_line, new_line)
+        return get_line_changed_regions(old_line, new_line,
+                                        use_shared_cache=True)
 
     def _get_enable_syntax_highlighting(self, old, new, a, b):
         """Returns whether or not we'll be enabling syntax highlighting.
@@ -656,17 +1489,30 @@ class RawDiffChunkGenerator(object):
         side-by-side diff. It contains a row number, real line numbers,
         region information, syntax-highlighted HTML for the text,
         and other metadata.
+
+        Version Changed:
+            6.0:
+            This now returns a
+            :py:class:`~reviewboard.diffviewer.chunk_lines.DiffLine` instead
+            of a list.
         """
         if (tag == 'replace' and
             old_line and new_line and
             len(old_line) <= self.STYLED_MAX_LINE_LEN and
             len(new_line) <= self.STYLED_MAX_LINE_LEN and
             old_line != new_line):
-            # Generate information on the regions that changed between the
-            # two lines.
-            old_region, new_region = \
-                self.get_line_changed_regions(old_line_num, old_line,
-                                              new_line_num, new_line)
+            time_budget = self.differ.time_budget
+
+            if time_budget is not None and time_budget.expired:
+                # We're out of time, so skip computing the regions.
+                self._simplifications.add('intraline')
+                old_region = new_region = []
+            else:
+                # Generate information on the regions that changed between
+                # the two lines.
+                old_region, new_region = \
+                    self.get_line_changed_regions(old_line_num, old_line,
+                                                  new_line_num, new_line)
         else:
             old_region = new_region = []
 
@@ -694,12 +1540,12 @@ class RawDiffChunkGenerator(object):
                 old_markup, new_markup = self._highlight_indentation(
                     old_markup, new_markup, *indentation_change)
 
-        result = [
+        result = (
             v_line_num,
             old_line_num or '', old_markup, old_region,
             new_line_num or '', new_markup, new_region,
-            line_pair in meta['whitespace_lines']
-        ]
+            line_pair in meta['whitespace_lines'],
+        )
 
         # NOTE: Prior to Review Board 5, this only contained moved info
         #       ("to"/"from" keys), and was not used for general line-level
@@ -744,9 +1590,9 @@ class RawDiffChunkGenerator(object):
         # Only include the meta information for the line if it has content.
         # Otherwise, save the space in cache.
         if line_meta:
-            result.append(line_meta)
+            result += (line_meta,)
 
-        return result
+        return DiffLine(result)
 
     def _get_move_info(self, line_num, moved_meta):
         """Return information for a moved line.
@@ -1033,6 +1879,11 @@ class RawDiffChunkGenerator(object):
         This will only apply syntax highlighting if a lexer is available and
         the file extension is not blacklisted.
 
+        Version Changed:
+            6.0:
+            Highlighted lines are now shared with other diffs containing the
+            same file contents through a cache.
+
         Args:
             data (unicode):
                 The data to syntax highlight.
@@ -1076,6 +1927,28 @@ class RawDiffChunkGenerator(object):
 
         lexer.add_filter('codetagify')
 
+        return get_highlighted_lines(data, lexer, self._highlight)
+
+    def _highlight(self, data, lexer):
+        """Syntax-highlight a file's contents using a lexer.
+
+        This is called when the highlighted lines are not already in the
+        shared syntax highlighting cache.
+
+        Version Added:
+            6.0
+
+        Args:
+            data (unicode):
+                The data to syntax highlight.
+
+            lexer (pygments.lexer.Lexer):
+                The lexer to use.
+
+        Returns:
+            list of unicode:
+            A list of syntax-highlighted lines.
+        """
         return split_line_endings(
             highlight(data, lexer, NoWrapperHtmlFormatter()))
 
@@ -1224,7 +2097,8 @@ class DiffChunkGenerator(RawDiffChunkGenerator):
             interdiff = None
 
         return get_diff_opcode_generator(self.differ, diff, interdiff,
-                                         request=self.request)
+                                         request=self.request,
+                                         diff_settings=self.diff_settings)
 
     def get_chunks(self):
         """Return the chunks for the given diff information.
@@ -1237,14 +2111,7 @@ class DiffChunkGenerator(RawDiffChunkGenerator):
         yielded. Otherwise, new chunks will be generated, stored in cache,
         and yielded.
         """
-        counts = self.filediff.get_line_counts()
-
-        if (self.filediff.binary or
-            self.filediff.source_revision == '' or
-            ((self.filediff.is_new or self.filediff.deleted or
-              self.filediff.moved or self.filediff.copied) and
-             counts['raw_insert_count'] == 0 and
-             counts['raw_delete_count'] == 0)):
+        if not self._has_chunks():
             return
 
         cache_key = self.make_cache_key()
@@ -1252,6 +2119,110 @@ class DiffChunkGenerator(RawDiffChunkGenerator):
         for chunk in super(DiffChunkGenerator, self).get_chunks(cache_key):
             yield chunk
 
+    def get_chunks_info(self):
+        """Return information on the chunks for the diff.
+
+        This will only need to fetch a small index from the cache, rather
+        than all the chunks.
+
+        Version Added:
+            6.0
+
+        Returns:
+            dict:
+            Information on the chunks. See
+            :py:meth:`RawDiffChunkGenerator.get_chunks_info` for details.
+        """
+        if not self._has_chunks():
+            return {
+                'changed_chunk_indexes': [],
+                'num_chunks': 0,
+                'simplified': False,
+                'whitespace_only': False,
+            }
+
+        return super(DiffChunkGenerator, self).get_chunks_info(
+            self.make_cache_key())
+
+    def get_chunk_range(self, start_index, end_index, *, lazy_lines=False):
+        """Return a range of chunks for the diff.
+
+        Only the cached segments containing the chunks will be fetched from
+        the cache.
+
+        Version Added:
+            6.0
+
+        Args:
+            start_index (int):
+                The index of the first chunk to return.
+
+            end_index (int):
+                The index after the last chunk to return.
+
+            lazy_lines (bool, optional):
+                Whether to load the lines of each chunk only once they're
+                accessed. See
+                :py:meth:`RawDiffChunkGenerator.get_chunk_range`.
+
+        Yields:
+            dict:
+            Each chunk in the range.
+        """
+        if self._has_chunks():
+            yield from super(DiffChunkGenerator, self).get_chunk_range(
+                start_index, end_index, self.make_cache_key(),
+                lazy_lines=lazy_lines)
+
+    def get_chunks_in_line_range(self, first_line, num_lines):
+        """Return the chunks overlapping a range of lines in the diff.
+
+        Each chunk will only contain the lines within the range. Only the
+        cached segments containing the lines will be fetched from the cache.
+
+        Version Added:
+            6.0
+
+        Args:
+            first_line (int):
+                The first virtual line number in the range.
+
+            num_lines (int):
+                The number of lines in the range.
+
+        Yields:
+            dict:
+            Each chunk overlapping the range.
+        """
+        if self._has_chunks():
+            yield from super(DiffChunkGenerator,
+                             self).get_chunks_in_line_range(
+                first_line, num_lines, self.make_cache_key())
+
+    def _has_chunks(self):
+        """Return whether the diff may have any chunks.
+
+        A diff won't have chunks if the file is binary or is an added or
+        deleted 0-length file, or if the file has moved with no additional
+        changes.
+
+        Version Added:
+            6.0
+
+        Returns:
+            bool:
+            Whether the diff may have any chunks.
+        """
+        counts = self.filediff.get_line_counts()
+
+        return not (
+            self.filediff.binary or
+            self.filediff.source_revision == '' or
+            ((self.filediff.is_new or self.filediff.deleted or
+              self.filediff.moved or self.filediff.copied) and
+             counts['raw_insert_count'] == 0 and
+             counts['raw_delete_count'] == 0))
+
     def get_chunks_uncached(self):
         """Yield the list of chunks, bypassing the cache."""
         base_filediff = self.base_filediff
@@ -1259,11 +2230,12 @@ class DiffChunkGenerator(RawDiffChunkGenerator):
         interfilediff = self.interfilediff
         request = self.request
 
-        old = get_original_file(filediff=filediff,
-                                request=request)
-        new = get_patched_file(source_data=old,
+        orig = get_original_file(filediff=filediff,
+                                 request=request)
+        new = get_patched_file(source_data=orig,
                                filediff=filediff,
                                request=request)
+        old = orig
 
         old_encoding_list = get_filediff_encodings(filediff)
         new_encoding_list = old_encoding_list
@@ -1310,22 +2282,10 @@ class DiffChunkGenerator(RawDiffChunkGenerator):
                                         request=request)
                 old_encoding_list = get_filediff_encodings(ancestor_filediff)
 
-        # Check whether we have a SHA256 checksum first. They were introduced
-        # in Review Board 4.0, long after SHA1 checksums. If we already have
-        # a SHA256 checksum, then we'll also have a SHA1 checksum, but the
-        # inverse is not true.
-        if filediff.orig_sha256 is None:
-            if filediff.orig_sha1 is None:
-                filediff.extra_data.update({
-                    'orig_sha1': self._get_sha1(old),
-                    'patched_sha1': self._get_sha1(new),
-                })
-
-            filediff.extra_data.update({
-                'orig_sha256': self._get_sha256(old),
-                'patched_sha256': self._get_sha256(new),
-            })
-            filediff.save(update_fields=['extra_data'])
+        # Checksums are computed from this FileDiff's own original file,
+        # rather than any ancestor's file we're diffing against, so that
+        # they can be used to look up the file in the file content cache.
+        self._update_checksums(filediff, orig=orig, new=new)
 
         if interfilediff:
             old = new
@@ -1338,22 +2298,9 @@ class DiffChunkGenerator(RawDiffChunkGenerator):
                                    request=request)
             new_encoding_list = get_filediff_encodings(interfilediff)
 
-            # Check whether we have a SHA256 checksum first. They were
-            # introduced in Review Board 4.0, long after SHA1 checksums. If we
-            # already have a SHA256 checksum, then we'll also have a SHA1
-            # checksum, but the inverse is not true.
-            if interfilediff.orig_sha256 is None:
-                if interfilediff.orig_sha1 is None:
-                    interfilediff.extra_data.update({
-                        'orig_sha1': self._get_sha1(interdiff_orig),
-                        'patched_sha1': self._get_sha1(new),
-                    })
-
-                interfilediff.extra_data.update({
-                    'orig_sha256': self._get_sha256(interdiff_orig),
-                    'patched_sha256': self._get_sha256(new),
-                })
-                interfilediff.save(update_fields=['extra_data'])
+            self._update_checksums(interfilediff,
+                                   orig=interdiff_orig,
+                                   new=new)
         elif self.force_interdiff:
             # Basically, revert the change.
             old, new = new, old
@@ -1475,6 +2422,61 @@ class DiffChunkGenerator(RawDiffChunkGenerator):
         """
         return force_str(hashlib.sha1(content).hexdigest())
 
+    def _update_checksums(self, filediff, orig, new):
+        """Record any missing checksums for a FileDiff's files.
+
+        The public SHA1 and SHA256 checksums are stored along with the
+        server-computed SHA256 checksums used for file content cache lookups.
+        The FileDiff will only be saved if anything was missing.
+
+        Version Added:
+            6.0
+
+        Args:
+            filediff (reviewboard.diffviewer.models.filediff.FileDiff):
+                The FileDiff to update.
+
+            orig (bytes):
+                The FileDiff's own original file.
+
+            new (bytes):
+                The FileDiff's own patched file.
+        """
+        extra_data = filediff.extra_data
+        new_extra_data = {}
+
+        if filediff.file_cache_orig_sha256 is None:
+            orig_sha256 = self._get_sha256(orig)
+            patched_sha256 = self._get_sha256(new)
+
+            new_extra_data.update({
+                filediff._FILE_CACHE_ORIG_SHA256_KEY: orig_sha256,
+                filediff._FILE_CACHE_PATCHED_SHA256_KEY: patched_sha256,
+            })
+        else:
+            orig_sha256 = None
+            patched_sha256 = None
+
+        # Check whether we have a SHA256 checksum first. They were introduced
+        # in Review Board 4.0, long after SHA1 checksums. If we already have
+        # a SHA256 checksum, then we'll also have a SHA1 checksum, but the
+        # inverse is not true.
+        if filediff.orig_sha256 is None:
+            if filediff.orig_sha1 is None:
+                new_extra_data.update({
+                    'orig_sha1': self._get_sha1(orig),
+                    'patched_sha1': self._get_sha1(new),
+                })
+
+            new_extra_data.update({
+                'orig_sha256': orig_sha256 or self._get_sha256(orig),
+                'patched_sha256': patched_sha256 or self._get_sha256(new),
+            })
+
+        if new_extra_data:
+            extra_data.update(new_extra_data)
+            filediff.save(update_fields=['extra_data'])
+
     def _get_sha256(self, content):
         """Return a SHA256 hash for the provided content.
 
@@ -0,0 +1,401 @@
+"""Compact storage for the lines of diff chunks.
+
+Version Added:
+    6.0
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+
+#: The version of the serialized format for lines.
+#:
+#: This must be bumped whenever :py:func:`serialize_lines` changes the format
+#: of its result. Serialized lines with any other version are treated as
+#: missing from the cache, and regenerated.
+#:
+#: Version Added:
+#:     6.0
+LINES_FORMAT_VERSION = 1
+
+
+class DiffLine(tuple):
+    """A line in a diff chunk.
+
+    Lines were historically lists, and are still accessed by index in
+    templates, template tags and third-party code, and sent as arrays in the
+    API. This keeps that layout, while taking less memory than a list. Each
+    line contains:
+
+    ===== ====================================================================
+    Index Value
+    ===== ====================================================================
+    0     The virtual line number of the row in the diff viewer.
+    1     The line number in the original file, or ``''``.
+    2     The HTML for the line in the original file.
+    3     The changed regions within the line in the original file.
+    4     The line number in the modified file, or ``''``.
+    5     The HTML for the line in the modified file.
+    6     The changed regions within the line in the modified file.
+    7     Whether the line only contains whitespace changes.
+    8     Optional metadata for the line (see :py:attr:`meta`).
+    ===== ====================================================================
+
+    These are also available as attributes. To remain compatible with code
+    written for lists, lines compare equal to lists with the same values.
+
+    Version Added:
+        6.0
+    """
+
+    __slots__ = ()
+
+    @property
+    def row(self) -> int:
+        """The virtual line number of the row in the diff viewer.
+
+        Type:
+            int
+        """
+        return self[0]
+
+    @property
+    def orig_line_num(self) -> Any:
+        """The line number in the original file.
+
+        This will be ``''`` if the row has no original line.
+
+        Type:
+            int or str
+        """
+        return self[1]
+
+    @property
+    def orig_markup(self) -> str:
+        """The HTML for the line in the original file.
+
+        Type:
+            str
+        """
+        return self[2]
+
+    @property
+    def orig_regions(self) -> Optional[List[Tuple[int, int]]]:
+        """The changed regions within the line in the original file.
+
+        Type:
+            list of tuple
+        """
+        return self[3]
+
+    @property
+    def modified_line_num(self) -> Any:
+        """The line number in the modified file.
+
+        This will be ``''`` if the row has no modified line.
+
+        Type:
+            int or str
+        """
+        return self[4]
+
+    @property
+    def modified_markup(self) -> str:
+        """The HTML for the line in the modified file.
+
+        Type:
+            str
+        """
+        return self[5]
+
+    @property
+    def modified_regions(self) -> Optional[List[Tuple[int, int]]]:
+        """The changed regions within the line in the modified file.
+
+        Type:
+            list of tuple
+        """
+        return self[6]
+
+    @property
+    def is_whitespace(self) -> bool:
+        """Whether the line only contains whitespace changes.
+
+        Type:
+            bool
+        """
+        return self[7]
+
+    @property
+    def meta(self) -> Dict[str, Any]:
+        """Metadata for the line.
+
+        This may contain ``from`` and ``to`` keys for moved lines, and a
+        ``code_safety`` key for code safety results. This will be an empty
+        dictionary if the line has no metadata.
+
+        Type:
+            dict
+        """
+        if len(self) > 8:
+            return self[8]
+
+        return {}
+
+    def __eq__(
+        self,
+        other: object,
+    ) -> bool:
+        """Return whether the line is equal to another line.
+
+        Args:
+            other (object):
+                The line to compare to. This may be a list.
+
+        Returns:
+            bool:
+            Whether the lines are equal.
+        """
+        if isinstance(other, list):
+            other = tuple(other)
+
+        return tuple.__eq__(self, other)
+
+    def __ne__(
+        self,
+        other: object,
+    ) -> bool:
+        """Return whether the line is not equal to another line.
+
+        Args:
+            other (object):
+                The line to compare to. This may be a list.
+
+        Returns:
+            bool:
+            Whether the lines are not equal.
+        """
+        result = self.__eq__(other)
+
+        if result is NotImplemented:
+            return result
+
+        return not result
+
+    __hash__ = tuple.__hash__
+
+    def __repr__(self) -> str:
+        """Return a string representation of the line.
+
+        Returns:
+            str:
+            The string representation.
+        """
+        return 'DiffLine(%s)' % tuple.__repr__(self)
+
+
+def serialize_lines(
+    lines: Sequence[Sequence[Any]],
+) -> Tuple[Any, ...]:
+    """Serialize lines in a compact form for storage in the cache.
+
+    Rather than storing each line as its own list, the lines are split into
+    columns. Runs of consecutive line numbers are stored as a start and a
+    count, the modified HTML is omitted when it matches the original HTML
+    (as it does for unchanged lines), and regions, whitespace flags and
+    metadata are only stored for the lines that have them.
+
+    Lines that don't fit this layout (such as lines from third-party chunk
+    generators) are stored as-is.
+
+    Version Added:
+        6.0
+
+    Args:
+        lines (list):
+            The lines to serialize.
+
+    Returns:
+        tuple:
+        The serialized lines. This can be passed to
+        :py:func:`deserialize_lines`.
+    """
+    num_lines = len(lines)
+    orig_markups = []
+    modified_markups = []
+    regions = {}
+    whitespace = []
+    metas = {}
+
+    try:
+        rows = _encode_line_nums(line[0] for line in lines)
+        orig_line_nums = _encode_line_nums(line[1] for line in lines)
+        modified_line_nums = _encode_line_nums(line[4] for line in lines)
+
+        for i, line in enumerate(lines):
+            orig_markup = line[2]
+            modified_markup = line[5]
+            orig_markups.append(orig_markup)
+
+            if (modified_markup == orig_markup and
+                type(modified_markup) is type(orig_markup)):
+                modified_markups.append(None)
+            else:
+                modified_markups.append(modified_markup)
+
+            orig_region = line[3]
+            modified_region = line[6]
+
+            if orig_region != [] or modified_region != []:
+                regions[i] = (orig_region, modified_region)
+
+            is_whitespace = line[7]
+
+            if type(is_whitespace) is not bool:
+                raise ValueError('Unexpected whitespace flag %r'
+                                 % (is_whitespace,))
+
+            if is_whitespace:
+                whitespace.append(i)
+
+            if len(line) > 8:
+                metas[i] = line[8]
+    except (IndexError, TypeError, ValueError):
+        return (LINES_FORMAT_VERSION, None, [
+            tuple(line)
+            for line in lines
+        ])
+
+    return (LINES_FORMAT_VERSION, num_lines, rows, orig_line_nums,
+            orig_markups, modified_line_nums, modified_markups, regions,
+            whitespace, metas)
+
+
+def deserialize_lines(
+    data: Any,
+) -> Optional[List[DiffLine]]:
+    """Deserialize lines stored by :py:func:`serialize_lines`.
+
+    Version Added:
+        6.0
+
+    Args:
+        data (tuple):
+            The serialized lines.
+
+    Returns:
+        list of DiffLine:
+        The deserialized lines, or ``None`` if the data is not in the
+        current format (for instance, if it was stored by an older version).
+    """
+    if (not isinstance(data, tuple) or
+        not data or
+        data[0] != LINES_FORMAT_VERSION):
+        return None
+
+    if data[1] is None:
+        return [
+            DiffLine(line)
+            for line in data[2]
+        ]
+
+    (num_lines, rows, orig_line_nums, orig_markups, modified_line_nums,
+     modified_markups, regions, whitespace, metas) = data[1:]
+
+    whitespace = set(whitespace)
+    lines = []
+
+    for i, row, orig_line_num, orig_markup, modified_line_num, \
+            modified_markup in zip(range(num_lines),
+                                   _decode_line_nums(rows),
+                                   _decode_line_nums(orig_line_nums),
+                                   orig_markups,
+                                   _decode_line_nums(modified_line_nums),
+                                   modified_markups):
+        if modified_markup is None:
+            modified_markup = orig_markup
+
+        try:
+            orig_region, modified_region = regions[i]
+        except KeyError:
+            orig_region = []
+            modified_region = []
+
+        line = (row, orig_line_num, orig_markup, orig_region,
+                modified_line_num, modified_markup, modified_region,
+                i in whitespace)
+
+        if i in metas:
+            line += (metas[i],)
+
+        lines.append(DiffLine(line))
+
+    return lines
+
+
+def _encode_line_nums(line_nums):
+    """Encode a sequence of line numbers as runs.
+
+    Each run is stored as a pair of the first line number and the number of
+    lines. Line numbers within a run increase by 1. Runs of blank line
+    numbers (``''``) are stored with a first line number of 0.
+
+    Args:
+        line_nums (iterable):
+            The line numbers to encode.
+
+    Returns:
+        list of int:
+        The flattened list of runs.
+
+    Raises:
+        ValueError:
+            A line number could not be encoded.
+    """
+    runs = []
+    run_start = None
+    run_len = 0
+
+    for line_num in line_nums:
+        if line_num == '':
+            line_num = 0
+        elif type(line_num) is not int or line_num <= 0:
+            raise ValueError('Unexpected line number %r' % (line_num,))
+
+        if (run_start is not None and
+            ((line_num == 0 and run_start == 0) or
+             (run_start != 0 and line_num == run_start + run_len))):
+            run_len += 1
+        else:
+            if run_start is not None:
+                runs += (run_start, run_len)
+
+            run_start = line_num
+            run_len = 1
+
+    if run_start is not None:
+        runs += (run_start, run_len)
+
+    return runs
+
+
+def _decode_line_nums(runs):
+    """Decode line numbers encoded by :py:func:`_encode_line_nums`.
+
+    Args:
+        runs (list of int):
+            The flattened list of runs.
+
+    Yields:
+        int or str:
+        Each line number.
+    """
+    for i in range(0, len(runs), 2):
+        run_start = runs[i]
+        run_len = runs[i + 1]
+
+        if run_start == 0:
+            yield from ('',) * run_len
+        else:
+            yield from range(run_start, run_start + run_len)
@@ -0,0 +1,334 @@
+"""Pre-generation of diff chunks for newly-published diffs.
+
+Diff chunks are normally generated the first time a file is viewed in the
+diff viewer, which means the first reviewer of a new revision waits for the
+entire diff to be computed. This module generates and caches those chunks
+ahead of time, in the background, once a diff is published.
+
+Version Added:
+    6.0
+"""
+
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.db import connections, transaction
+from django.utils.translation import override
+from djblets.siteconfig.models import SiteConfiguration
+
+from reviewboard.diffviewer.diffutils import (
+    _get_diff_file_chunk_generator,
+    get_diff_files)
+from reviewboard.diffviewer.models import DiffSet
+from reviewboard.diffviewer.settings import DiffSettings
+
+
+logger = logging.getLogger(__name__)
+
+
+def get_diffsets_to_warm(diffset_history_id):
+    """Return the diffsets to pre-generate chunks for in a diffset history.
+
+    This will return the latest diffset on its own, and the interdiff
+    between the previous diffset and the latest diffset, if there's more
+    than one diffset.
+
+    Args:
+        diffset_history_id (int):
+            The ID of the diffset history.
+
+    Returns:
+        list of tuple:
+        A list of ``(diffset, interdiffset)`` tuples. ``interdiffset`` will
+        be ``None`` for the latest diffset on its own.
+    """
+    diffsets = list(
+        DiffSet.objects
+        .filter(history=diffset_history_id)
+        .order_by('-revision')[:2])
+
+    if not diffsets:
+        return []
+
+    result = [(diffsets[0], None)]
+
+    if len(diffsets) > 1:
+        result.append((diffsets[1], diffsets[0]))
+
+    return result
+
+
+def warm_diffset_chunks(diffset, *, interdiffset=None, diff_settings):
+    """Generate and cache the chunks for every file in a diffset.
+
+    Chunks are generated in the same way, and stored under the same cache
+    keys, as when viewing the diff with the provided settings. Any files
+    that are already cached won't be generated again.
+
+    An error generating chunks for one file (for instance, if the file
+    can't be fetched from the repository) will be logged, and the remaining
+    files will still be generated.
+
+    Args:
+        diffset (reviewboard.diffviewer.models.diffset.DiffSet):
+            The diffset to generate chunks for.
+
+        interdiffset (reviewboard.diffviewer.models.diffset.DiffSet,
+                      optional):
+            The diffset on the other end of an interdiff range, if
+            generating chunks for an interdiff.
+
+        diff_settings (reviewboard.diffviewer.settings.DiffSettings):
+            The settings used to control the display of diffs.
+
+    Returns:
+        int:
+        The number of files processed without errors.
+    """
+    files = get_diff_files(diffset=diffset, interdiffset=interdiffset)
+    num_processed = 0
+
+    for diff_file in files:
+        try:
+            chunk_generator = _get_diff_file_chunk_generator(
+                diff_file=diff_file,
+                request=None,
+                diff_settings=diff_settings)
+
+            # Fetching the chunk information will generate and cache the
+            # chunks, if they're not already cached.
+            chunk_generator.get_chunks_info()
+        except Exception as e:
+            logger.exception('Unable to pre-generate diff chunks for '
+                             'filediff ID %s: %s',
+                             diff_file['filediff'].pk, e)
+        else:
+            num_processed += 1
+
+    return num_processed
+
+
+def warm_diffset_history_chunks(diffset_history_id, *, diff_settings):
+    """Generate and cache the chunks for the latest diffsets in a history.
+
+    This will generate chunks for the diffsets returned by
+    :py:func:`get_diffsets_to_warm`, using the site's default language.
+
+    Args:
+        diffset_history_id (int):
+            The ID of the diffset history.
+
+        diff_settings (reviewboard.diffviewer.settings.DiffSettings):
+            The settings used to control the display of diffs.
+
+    Returns:
+        int:
+        The number of files processed without errors.
+    """
+    num_processed = 0
+
+    # Chunk cache keys depend on the active language, which isn't
+    # available outside of a request.
+    with override(settings.LANGUAGE_CODE):
+        for diffset, interdiffset in get_diffsets_to_warm(diffset_history_id):
+            num_processed += warm_diffset_chunks(diffset,
+                                                 interdiffset=interdiffset,
+                                                 diff_settings=diff_settings)
+
+    return num_processed
+
+
+class ChunkWarmupQueue(object):
+    """A queue for pre-generating diff chunks in background threads.
+
+    Diffset histories are queued up for processing by a pool of threads,
+    limited by the ``diffviewer_chunk_warmup_max_workers`` site configuration
+    setting. If ``diffviewer_chunk_warmup_max_pending`` histories are
+    already waiting to be processed, any new ones will be skipped, and
+    their chunks will be generated when they're first viewed instead.
+
+    Version Added:
+        6.0
+    """
+
+    def __init__(self):
+        """Initialize the queue."""
+        self._executor = None
+        self._max_workers = None
+        self._num_pending = 0
+        self._lock = threading.Lock()
+
+    @property
+    def num_pending(self):
+        """The number of queued diffset histories not yet processed.
+
+        Type:
+            int
+        """
+        return self._num_pending
+
+    def queue(self, diffset_history_id, *, local_site=None):
+        """Queue pre-generation of chunks for a diffset history.
+
+        If called within a database transaction, the work will be queued
+        once the transaction has been committed.
+
+        Args:
+            diffset_history_id (int):
+                The ID of the diffset history.
+
+            local_site (reviewboard.site.models.LocalSite, optional):
+                The Local Site that owns the diffset history.
+
+        Returns:
+            bool:
+            ``True`` if the work will be queued. ``False`` if pre-generation
+            is disabled.
+        """
+        siteconfig = SiteConfiguration.objects.get_current()
+        max_workers = siteconfig.get('diffviewer_chunk_warmup_max_workers')
+        max_pending = siteconfig.get('diffviewer_chunk_warmup_max_pending')
+
+        if not max_workers:
+            return False
+
+        diff_settings = DiffSettings.create(local_site=local_site)
+
+        transaction.on_commit(
+            lambda: self._submit(diffset_history_id,
+                                 diff_settings=diff_settings,
+                                 max_workers=max_workers,
+                                 max_pending=max_pending))
+
+        return True
+
+    def _submit(self, diffset_history_id, *, diff_settings, max_workers,
+                max_pending):
+        """Submit work to the thread pool.
+
+        Args:
+            diffset_history_id (int):
+                The ID of the diffset history.
+
+            diff_settings (reviewboard.diffviewer.settings.DiffSettings):
+                The settings used to control the display of diffs.
+
+            max_workers (int):
+                The maximum number of threads in the pool.
+
+            max_pending (int):
+                The maximum number of diffset histories waiting to be
+                processed.
+        """
+        with self._lock:
+            if max_pending and self._num_pending >= max_pending:
+                logger.warning('Skipping pre-generation of diff chunks for '
+                               'diffset history ID %s. There are already '
+                               '%d diffset histories waiting.',
+                               diffset_history_id, self._num_pending)
+                return
+
+            if self._executor is None or self._max_workers != max_workers:
+                if self._executor is not None:
+                    # Let any running work finish in the old pool.
+                    self._executor.shutdown(wait=False)
+
+                self._executor = self._create_executor(max_workers)
+                self._max_workers = max_workers
+
+            self._num_pending += 1
+            executor = self._executor
+
+        executor.submit(self._run, diffset_history_id,
+                        diff_settings=diff_settings)
+
+    def _run(self, diffset_history_id, *, diff_settings):
+        """Pre-generate chunks for a diffset history.
+
+        This is run in a worker thread. Any database connections opened by
+        the thread will be closed once finished.
+
+        Args:
+            diffset_history_id (int):
+                The ID of the diffset history.
+
+            diff_settings (reviewboard.diffviewer.settings.DiffSettings):
+                The settings used to control the display of diffs.
+        """
+        try:
+            num_processed = warm_diffset_history_chunks(
+                diffset_history_id,
+                diff_settings=diff_settings)
+
+            logger.debug('Pre-generated diff chunks for %d files in '
+                         'diffset history ID %s.',
+                         num_processed, diffset_history_id)
+        except Exception as e:
+            logger.exception('Unable to pre-generate diff chunks for '
+                             'diffset history ID %s: %s',
+                             diffset_history_id, e)
+        finally:
+            with self._lock:
+                self._num_pending -= 1
+
+            connections.close_all()
+
+    def _create_executor(self, max_workers):
+        """Return a new executor for running work.
+
+        Args:
+            max_workers (int):
+                The maximum number of threads to use.
+
+        Returns:
+            concurrent.futures.Executor:
+            The new executor.
+        """
+        return ThreadPoolExecutor(max_workers=max_workers,
+                                  thread_name_prefix='rb-chunk-warmup')
+
+
+#: The queue used to pre-generate chunks for published diffs.
+#:
+#: Version Added:
+#:     6.0
+chunk_warmup_queue = ChunkWarmupQueue()
+
+
+def _on_review_request_published(review_request, changedesc=None, **kwargs):
+    """Queue pre-generation of chunks when a new diff is published.
+
+    Args:
+        review_request (reviewboard.reviews.models.review_request.
+                        ReviewRequest):
+            The review request that was published.
+
+        changedesc (reviewboard.changedescs.models.ChangeDescription,
+                    optional):
+            The change description for the publish, if this isn't the first
+            publish.
+
+        **kwargs (dict, unused):
+            Additional keyword arguments from the signal.
+    """
+    if not review_request.repository_id:
+        return
+
+    if changedesc is not None and 'diff' not in changedesc.fields_changed:
+        return
+
+    chunk_warmup_queue.queue(review_request.diffset_history_id,
+                             local_site=review_request.local_site)
+
+
+def connect_signals():
+    """Connect signal handlers for pre-generating chunks."""
+    from reviewboard.reviews.models import ReviewRequest
+    from reviewboard.reviews.signals import review_request_published
+
+    review_request_published.connect(
+        _on_review_request_published,
+        sender=ReviewRequest,
+        dispatch_uid='diffviewer_chunk_warmup')
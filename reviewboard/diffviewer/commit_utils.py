@@ -2,6 +2,7 @@
 
 import base64
 import json
+from bisect import bisect_left
 from itertools import chain
 
 from django.utils.encoding import force_bytes
@@ -72,7 +73,7 @@ def get_file_exists_in_history(validation_info, repository, parent_id, path,
                                       **kwargs)
 
 
-def exclude_ancestor_filediffs(to_filter, all_filediffs=None):
+def exclude_ancestor_filediffs(to_filter, all_filediffs=None, ancestry=None):
     """Exclude all ancestor FileDiffs from the given list and return the rest.
 
     A :pyclass:`~reviewboard.diffviewer.models.filediff.FileDiff` is considered
@@ -82,6 +83,13 @@ def exclude_ancestor_filediffs(to_filter, all_filediffs=None):
     As a result, only the most recent (commit-wise) FileDiffs that modify a
     given file will be included in the result.
 
+    Version Changed:
+        6.0:
+        * Added the ``ancestry`` argument.
+        * Ancestors are now computed for all FileDiffs at once, instead of
+          through :py:meth:`FileDiff.get_ancestors()
+          <reviewboard.diffviewer.models.filediff.FileDiff.get_ancestors>`.
+
     Args:
         to_filter (list of reviewboard.diffviewer.models.filediff.FileDiff):
             The FileDiffs to filter.
@@ -95,24 +103,208 @@ def exclude_ancestor_filediffs(to_filter, all_filediffs=None):
             FileDiffs in the :py:class:`~reviewboard.diffviewer.models.
             diffset.DiffSet>`.
 
+        ancestry (FileDiffAncestry, optional):
+            A pre-computed ancestry for all FileDiffs in the DiffSet. If
+            provided, ``all_filediffs`` is ignored.
+
     Returns:
         list of reviewboard.diffviewer.models.filediff.FileDiff:
         The FileDiffs that are not ancestors of other FileDiffs.
     """
-    if all_filediffs is None:
-        all_filediffs = to_filter
-
-    ancestor_pks = {
-        ancestor.pk
-        for filediff in to_filter
-        for ancestor in filediff.get_ancestors(minimal=False,
-                                               filediffs=all_filediffs)
-    }
+    if ancestry is None:
+        if all_filediffs is None:
+            all_filediffs = to_filter
+
+        ancestry = FileDiffAncestry(all_filediffs)
+
+    return ancestry.exclude_ancestors(to_filter)
+
+
+def get_filediff_parent_ids(filediffs):
+    """Return the parent of each FileDiff in a commit series.
+
+    The parent of a :py:class:`~reviewboard.diffviewer.models.filediff.
+    FileDiff` is the FileDiff in the most recent preceding commit that
+    produced the version of the file it modifies. For a newly-created file,
+    this is the FileDiff in the most recent preceding commit that deleted a
+    file at the same path, if any.
+
+    This computes the same ancestry as :py:meth:`FileDiff.get_ancestors()
+    <reviewboard.diffviewer.models.filediff.FileDiff.get_ancestors>`, for
+    all FileDiffs in a single pass.
+
+    Version Added:
+        6.0
+
+    Args:
+        filediffs (list of reviewboard.diffviewer.models.filediff.FileDiff):
+            All the per-commit FileDiffs in the DiffSet.
+
+    Returns:
+        dict:
+        A mapping of each FileDiff's ID to the ID of its parent, or ``None``
+        if it has no parent in the commit series.
+    """
+    by_dest_file = {}
+
+    for filediff in filediffs:
+        by_detail = by_dest_file.setdefault(filediff.dest_file, {})
+        by_commit = by_detail.setdefault(filediff.dest_detail, {})
+        by_commit[filediff.commit_id] = filediff
+
+    # Index the candidate parents by the source file and revision they
+    # would be looked up by, sorted in commit order. Newly-created files
+    # look up deleted files by path.
+    candidates = {}
+    deleted_candidates = {}
+
+    for dest_file, by_detail in by_dest_file.items():
+        deleted_by_commit = {}
+
+        for dest_detail, by_commit in by_detail.items():
+            candidates[(dest_file, dest_detail)] = _sort_by_commit(by_commit)
+
+            for commit_id, filediff in by_commit.items():
+                if filediff.deleted:
+                    deleted_by_commit.setdefault(commit_id, filediff)
+
+        if deleted_by_commit:
+            deleted_candidates[dest_file] = _sort_by_commit(deleted_by_commit)
+
+    parent_ids = {}
+
+    for filediff in filediffs:
+        if filediff.is_new:
+            prev_set = deleted_candidates.get(filediff.source_file)
+        else:
+            prev_set = candidates.get((filediff.source_file,
+                                       filediff.source_revision))
+
+        parent_id = None
+
+        if prev_set:
+            # Find the last candidate from a commit preceding this one.
+            commit_ids, prev_filediffs = prev_set
+            i = bisect_left(commit_ids, filediff.commit_id)
+
+            if i > 0:
+                parent_id = prev_filediffs[i - 1].pk
+
+        parent_ids[filediff.pk] = parent_id
+
+    return parent_ids
+
+
+class FileDiffAncestry:
+    """The ancestry of all FileDiffs in a commit series.
+
+    This allows the ancestors of any FileDiff in a commit series to be looked
+    up without any queries or scans of the other FileDiffs.
+
+    Version Added:
+        6.0
+    """
+
+    def __init__(self, filediffs, parent_ids=None):
+        """Initialize the ancestry.
+
+        Args:
+            filediffs (list of reviewboard.diffviewer.models.filediff.
+                       FileDiff):
+                All the per-commit FileDiffs in the DiffSet.
+
+            parent_ids (dict, optional):
+                A pre-computed mapping of FileDiff IDs to parent FileDiff IDs,
+                as returned by :py:func:`get_filediff_parent_ids`. This will
+                be computed if not provided.
+        """
+        if parent_ids is None:
+            parent_ids = get_filediff_parent_ids(filediffs)
+
+        self.parent_ids = parent_ids
+        self._by_id = {
+            filediff.pk: filediff
+            for filediff in filediffs
+        }
+
+    def get_ancestors(self, filediff):
+        """Return the ancestors of a FileDiff.
+
+        This is equivalent to calling :py:meth:`FileDiff.get_ancestors()
+        <reviewboard.diffviewer.models.filediff.FileDiff.get_ancestors>`
+        with ``minimal=False``.
+
+        Args:
+            filediff (reviewboard.diffviewer.models.filediff.FileDiff):
+                The FileDiff to return ancestors for.
+
+        Returns:
+            list of reviewboard.diffviewer.models.filediff.FileDiff:
+            The ancestor FileDiffs, in application order.
+        """
+        by_id = self._by_id
+        parent_ids = self.parent_ids
+        ancestors = []
+        parent_id = parent_ids.get(filediff.pk)
+
+        while parent_id is not None:
+            ancestors.append(by_id[parent_id])
+            parent_id = parent_ids.get(parent_id)
+
+        ancestors.reverse()
+
+        return ancestors
+
+    def exclude_ancestors(self, filediffs):
+        """Exclude all ancestors of the given FileDiffs from the list.
+
+        Args:
+            filediffs (list of reviewboard.diffviewer.models.filediff.
+                       FileDiff):
+                The FileDiffs to filter.
+
+        Returns:
+            list of reviewboard.diffviewer.models.filediff.FileDiff:
+            The FileDiffs that are not ancestors of other FileDiffs in the
+            list.
+        """
+        parent_ids = self.parent_ids
+        ancestor_ids = set()
+
+        for filediff in filediffs:
+            parent_id = parent_ids.get(filediff.pk)
+
+            # Once we reach an ancestor we've already seen, the rest of its
+            # ancestors have been seen as well.
+            while parent_id is not None and parent_id not in ancestor_ids:
+                ancestor_ids.add(parent_id)
+                parent_id = parent_ids.get(parent_id)
+
+        return [
+            filediff
+            for filediff in filediffs
+            if filediff.pk not in ancestor_ids
+        ]
+
+
+def _sort_by_commit(by_commit):
+    """Return FileDiffs sorted by commit.
+
+    Args:
+        by_commit (dict):
+            A mapping of commit IDs to FileDiffs.
+
+    Returns:
+        tuple:
+        A 2-tuple containing the sorted list of commit IDs, and the list of
+        FileDiffs in the same order. The commit IDs are kept in their own
+        list so that they can be searched with :py:func:`bisect.bisect_left`.
+    """
+    commit_ids = sorted(by_commit)
 
-    return [
-        filediff
-        for filediff in to_filter
-        if filediff.pk not in ancestor_pks
+    return commit_ids, [
+        by_commit[commit_id]
+        for commit_id in commit_ids
     ]
 
 
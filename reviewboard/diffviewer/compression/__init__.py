@@ -0,0 +1,28 @@
+"""Compression codecs for stored diff data.
+
+Version Added:
+    6.0
+"""
+
+from __future__ import annotations
+
+from typing import cast
+
+from djblets.registries.importer import lazy_import_registry
+
+from reviewboard.diffviewer.compression.registry import \
+    DiffCompressionCodecRegistry
+
+
+#: The registry managing available diff compression codecs.
+#:
+#: Version Added:
+#:     6.0
+#:
+#: Type:
+#:     reviewboard.diffviewer.compression.registry.
+#:     DiffCompressionCodecRegistry
+diff_compression_codec_registry = cast(
+    DiffCompressionCodecRegistry,
+    lazy_import_registry('reviewboard.diffviewer.compression.registry',
+                         'DiffCompressionCodecRegistry'))
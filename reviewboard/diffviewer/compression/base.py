@@ -0,0 +1,158 @@
+"""Base support for diff compression codecs.
+
+Version Added:
+    6.0
+"""
+
+from __future__ import annotations
+
+from typing import Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from djblets.util.typing import StrOrPromise
+
+
+class BaseDiffCompressionCodec:
+    """Base class for a diff compression codec.
+
+    Compression codecs compress the diff data stored in
+    :py:class:`~reviewboard.diffviewer.models.raw_file_diff_data.
+    RawFileDiffData`. Each stored entry records the ID of the codec used to
+    compress it, so any registered codec can be used to read existing
+    entries, regardless of which codec is used for new entries.
+
+    Codecs offer different tradeoffs between the time needed to store diffs,
+    the time needed to read them back, and the space they take up. Most
+    codecs accept a compression level to fine-tune this.
+
+    Subclasses must implement the following attributes:
+
+    * :py:attr:`codec_id`
+    * :py:attr:`name`
+    * :py:attr:`default_level`
+    * :py:attr:`min_level`
+    * :py:attr:`max_level`
+
+    And the following methods:
+
+    * :py:meth:`compress_data`
+    * :py:meth:`decompress`
+
+    Version Added:
+        6.0
+    """
+
+    #: The ID of this codec.
+    #:
+    #: This is stored along with the compressed data. It must be provided by
+    #: subclasses, must be unique, and must be a single character.
+    #:
+    #: Type:
+    #:     str
+    codec_id: Optional[str] = None
+
+    #: The display name of the codec.
+    #:
+    #: This must be provided by subclasses.
+    #:
+    #: Type:
+    #:     str
+    name: Optional[StrOrPromise] = ''
+
+    #: The default compression level.
+    #:
+    #: Type:
+    #:     int
+    default_level: int = 0
+
+    #: The minimum supported compression level.
+    #:
+    #: Type:
+    #:     int
+    min_level: int = 0
+
+    #: The maximum supported compression level.
+    #:
+    #: Type:
+    #:     int
+    max_level: int = 0
+
+    def is_available(self) -> bool:
+        """Return whether the codec can be used.
+
+        Subclasses that depend on optional modules should override this.
+
+        Returns:
+            bool:
+            ``True`` if the codec can be used to compress and decompress data.
+        """
+        return True
+
+    def compress(
+        self,
+        data: bytes,
+        level: Optional[int] = None,
+    ) -> bytes:
+        """Compress data.
+
+        Args:
+            data (bytes):
+                The data to compress.
+
+            level (int, optional):
+                The compression level to use. This will be clamped to the
+                range supported by the codec. If not provided, the codec's
+                default level will be used.
+
+        Returns:
+            bytes:
+            The compressed data.
+        """
+        if level is None:
+            level = self.default_level
+        else:
+            level = max(self.min_level, min(level, self.max_level))
+
+        return self.compress_data(data, level)
+
+    def compress_data(
+        self,
+        data: bytes,
+        level: int,
+    ) -> bytes:
+        """Compress data at a given level.
+
+        This must be implemented by subclasses. Callers should use
+        :py:meth:`compress` instead.
+
+        Args:
+            data (bytes):
+                The data to compress.
+
+            level (int):
+                The compression level to use. This is guaranteed to be in
+                the range supported by the codec.
+
+        Returns:
+            bytes:
+            The compressed data.
+        """
+        raise NotImplementedError
+
+    def decompress(
+        self,
+        data: bytes,
+    ) -> bytes:
+        """Decompress data.
+
+        This must be implemented by subclasses.
+
+        Args:
+            data (bytes):
+                The data to decompress.
+
+        Returns:
+            bytes:
+            The decompressed data.
+        """
+        raise NotImplementedError
@@ -0,0 +1,194 @@
+"""Built-in diff compression codecs.
+
+Version Added:
+    6.0
+"""
+
+from __future__ import annotations
+
+import bz2
+import zlib
+
+from django.utils.translation import gettext_lazy as _
+
+from reviewboard.diffviewer.compression.base import BaseDiffCompressionCodec
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+
+class BZip2DiffCompressionCodec(BaseDiffCompressionCodec):
+    """A codec compressing diffs using bzip2.
+
+    This offers good compression, but is slow both to compress and to
+    decompress. This was the only codec prior to Review Board 6.0.
+
+    Version Added:
+        6.0
+    """
+
+    codec_id = 'B'
+    name = _('BZip2')
+    default_level = 9
+    min_level = 1
+    max_level = 9
+
+    def compress_data(
+        self,
+        data: bytes,
+        level: int,
+    ) -> bytes:
+        """Compress data at a given level.
+
+        Args:
+            data (bytes):
+                The data to compress.
+
+            level (int):
+                The compression level to use.
+
+        Returns:
+            bytes:
+            The compressed data.
+        """
+        return bz2.compress(data, level)
+
+    def decompress(
+        self,
+        data: bytes,
+    ) -> bytes:
+        """Decompress data.
+
+        Args:
+            data (bytes):
+                The data to decompress.
+
+        Returns:
+            bytes:
+            The decompressed data.
+        """
+        return bz2.decompress(data)
+
+
+class ZlibDiffCompressionCodec(BaseDiffCompressionCodec):
+    """A codec compressing diffs using zlib.
+
+    This is considerably faster than bzip2, particularly when decompressing,
+    at the cost of slightly larger stored diffs.
+
+    Version Added:
+        6.0
+    """
+
+    codec_id = 'Z'
+    name = _('zlib')
+    default_level = 6
+    min_level = 1
+    max_level = 9
+
+    def compress_data(
+        self,
+        data: bytes,
+        level: int,
+    ) -> bytes:
+        """Compress data at a given level.
+
+        Args:
+            data (bytes):
+                The data to compress.
+
+            level (int):
+                The compression level to use.
+
+        Returns:
+            bytes:
+            The compressed data.
+        """
+        return zlib.compress(data, level)
+
+    def decompress(
+        self,
+        data: bytes,
+    ) -> bytes:
+        """Decompress data.
+
+        Args:
+            data (bytes):
+                The data to decompress.
+
+        Returns:
+            bytes:
+            The decompressed data.
+        """
+        return zlib.decompress(data)
+
+
+class ZstandardDiffCompressionCodec(BaseDiffCompressionCodec):
+    """A codec compressing diffs using Zstandard.
+
+    This is very fast to compress and decompress at its lower levels, and
+    can approach bzip2's compression at its higher levels.
+
+    This requires the :pypi:`zstandard` module, which can be installed
+    through the ``ReviewBoard[zstd]`` package.
+
+    Version Added:
+        6.0
+    """
+
+    codec_id = 'S'
+    name = _('Zstandard')
+    default_level = 3
+    min_level = 1
+    max_level = 22
+
+    def is_available(self) -> bool:
+        """Return whether the codec can be used.
+
+        Returns:
+            bool:
+            ``True`` if the :pypi:`zstandard` module is installed.
+        """
+        return zstandard is not None
+
+    def compress_data(
+        self,
+        data: bytes,
+        level: int,
+    ) -> bytes:
+        """Compress data at a given level.
+
+        Args:
+            data (bytes):
+                The data to compress.
+
+            level (int):
+                The compression level to use.
+
+        Returns:
+            bytes:
+            The compressed data.
+        """
+        assert zstandard is not None
+
+        return zstandard.ZstdCompressor(level=level).compress(data)
+
+    def decompress(
+        self,
+        data: bytes,
+    ) -> bytes:
+        """Decompress data.
+
+        Args:
+            data (bytes):
+                The data to decompress.
+
+        Returns:
+            bytes:
+            The decompressed data.
+        """
+        assert zstandard is not None
+
+        return zstandard.ZstdDecompressor().decompress(data)
@@ -0,0 +1,119 @@
+"""Diff compression codec registry.
+
+Version Added:
+    6.0
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import Iterator, Optional
+
+from django.utils.translation import gettext_lazy as _
+from djblets.registries.registry import (ALREADY_REGISTERED,
+                                         NOT_REGISTERED)
+from djblets.siteconfig.models import SiteConfiguration
+
+from reviewboard.diffviewer.compression.base import BaseDiffCompressionCodec
+from reviewboard.registries.registry import Registry
+
+
+logger = logging.getLogger(__name__)
+
+
+class DiffCompressionCodecRegistry(Registry[BaseDiffCompressionCodec]):
+    """Registry for managing diff compression codecs.
+
+    By default, this includes codecs for bzip2, zlib, and Zstandard.
+    Extensions can register additional codecs, which can then be activated
+    through the ``diffviewer_compression_codec`` site configuration setting.
+
+    Version Added:
+        6.0
+    """
+
+    lookup_attrs = ('codec_id',)
+
+    errors = {
+        ALREADY_REGISTERED: _(
+            '"%(item)s" is already a registered diff compression codec.'
+        ),
+        NOT_REGISTERED: _(
+            '"%(attr_value)s" is not a registered diff compression codec.'
+        ),
+    }
+
+    #: The ID of the codec used if the configured codec is unavailable.
+    #:
+    #: Type:
+    #:     str
+    fallback_codec_id = 'B'
+
+    @property
+    def current_codec(self) -> BaseDiffCompressionCodec:
+        """The currently-configured codec for compressing new diffs.
+
+        If the configured codec is not registered or not available, this
+        will fall back to the bzip2 codec.
+
+        Type:
+            BaseDiffCompressionCodec
+        """
+        siteconfig = SiteConfiguration.objects.get_current()
+        codec_id = siteconfig.get('diffviewer_compression_codec')
+        codec = self.get_codec(codec_id)
+
+        if codec is None or not codec.is_available():
+            logger.warning('Diff compression codec "%s" is not available. '
+                           'Falling back to "%s".',
+                           codec_id, self.fallback_codec_id)
+
+            codec = self.get_codec(self.fallback_codec_id)
+            assert codec is not None
+
+        return codec
+
+    @property
+    def current_level(self) -> Optional[int]:
+        """The currently-configured compression level.
+
+        This will be ``None`` if the codec's default level should be used.
+
+        Type:
+            int
+        """
+        siteconfig = SiteConfiguration.objects.get_current()
+
+        return siteconfig.get('diffviewer_compression_level')
+
+    def get_codec(
+        self,
+        codec_id: str,
+    ) -> Optional[BaseDiffCompressionCodec]:
+        """Return a codec with the given ID.
+
+        Args:
+            codec_id (str):
+                The ID of the codec.
+
+        Returns:
+            BaseDiffCompressionCodec:
+            The codec, or ``None`` if not found.
+        """
+        return self.get('codec_id', codec_id)
+
+    def get_defaults(self) -> Iterator[BaseDiffCompressionCodec]:
+        """Return the default codecs.
+
+        Yields:
+            BaseDiffCompressionCodec:
+            Each default codec.
+        """
+        from reviewboard.diffviewer.compression.codecs import (
+            BZip2DiffCompressionCodec,
+            ZlibDiffCompressionCodec,
+            ZstandardDiffCompressionCodec)
+
+        yield BZip2DiffCompressionCodec()
+        yield ZlibDiffCompressionCodec()
+        yield ZstandardDiffCompressionCodec()
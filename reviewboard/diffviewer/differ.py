@@ -1,4 +1,5 @@
 import os
+import time
 
 from reviewboard.diffviewer.errors import DiffCompatError
 from reviewboard.diffviewer.filetypes import (HEADER_REGEXES,
@@ -18,14 +19,111 @@ class DiffCompatVersion(object):
     # (prevents very long diff times for certain files)
     MYERS_SMS_COST_BAIL = 2
 
+    # Histogram differ, based on Git's histogram diff algorithm. This must
+    # be opted into by administrators. See get_default_diff_compat_version().
+    HISTOGRAM = 3
+
     DEFAULT = MYERS_SMS_COST_BAIL
 
     MYERS_VERSIONS = (MYERS, MYERS_SMS_COST_BAIL)
+    HISTOGRAM_VERSIONS = (HISTOGRAM,)
+
+
+class DifferEngine(object):
+    """Engines available for computing Myers diffs.
+
+    Engines trade off implementation strategies, but all engines produce
+    identical opcodes for a given :py:class:`DiffCompatVersion`. This makes
+    it safe to switch engines without invalidating any cached diffs.
+
+    Version Added:
+        6.0
+    """
+
+    #: The original list-based pure-Python engine.
+    PYTHON = 'python'
+
+    #: An engine storing line codes in compact integer arrays.
+    #:
+    #: This is considerably faster on very large files.
+    ARRAY = 'array'
+
+    DEFAULT = PYTHON
+
+    ALL = (PYTHON, ARRAY)
+
+
+class DiffTimeBudget(object):
+    """A limit on the time spent computing a diff.
+
+    Differs and opcode generators check this while doing expensive work.
+    Once the budget has expired, they'll fall back on cheaper, simplified
+    results for the remainder of the diff.
+
+    Version Added:
+        6.0
+    """
+
+    def __init__(self, seconds):
+        """Initialize the budget.
+
+        The budget starts counting down immediately.
+
+        Args:
+            seconds (float):
+                The number of seconds in the budget.
+        """
+        self.seconds = seconds
+        self.deadline = time.monotonic() + seconds
+        self._expired = False
+
+    @property
+    def expired(self):
+        """Whether the budget has expired.
+
+        Once the budget has expired, this will always be ``True``.
+
+        Type:
+            bool
+        """
+        if not self._expired and time.monotonic() >= self.deadline:
+            self._expired = True
+
+        return self._expired
 
 
 class Differ(object):
     """Base class for differs."""
-    def __init__(self, a, b, ignore_space=False, compat_version=None):
+    def __init__(self, a, b, ignore_space=False, compat_version=None,
+                 time_budget=None):
+        """Initialize the differ.
+
+        Version Changed:
+            6.0:
+            Added the ``time_budget`` argument.
+
+        Args:
+            a (list of str):
+                The lines of the original file.
+
+            b (list of str):
+                The lines of the modified file.
+
+            ignore_space (bool, optional):
+                Whether to ignore leading whitespace when comparing lines.
+
+            compat_version (int, optional):
+                The diff compatibility version.
+
+            time_budget (DiffTimeBudget, optional):
+                The time budget for computing the diff. Differs supporting
+                this will simplify the remainder of the diff once it's
+                expired, and set :py:attr:`simplified`.
+
+        Raises:
+            TypeError:
+                ``a`` and ``b`` were of different types.
+        """
         if type(a) is not type(b):
             raise TypeError
 
@@ -33,9 +131,19 @@ class Differ(object):
         self.b = b
         self.ignore_space = ignore_space
         self.compat_version = compat_version
+        self.time_budget = time_budget
         self.interesting_line_regexes = []
         self.interesting_lines = [{}, {}]
 
+        #: Whether the diff was simplified due to an expired time budget.
+        #:
+        #: Version Added:
+        #:     6.0
+        #:
+        #: Type:
+        #:     bool
+        self.simplified = False
+
     def add_interesting_line_regex(self, name, regex):
         """Registers a regular expression used to look for interesting lines.
 
@@ -82,19 +190,65 @@ class Differ(object):
         raise NotImplementedError
 
 
+def get_default_diff_compat_version():
+    """Return the compatibility version to use for new diffs.
+
+    This will be :py:attr:`DiffCompatVersion.DEFAULT`, unless the
+    administrator has opted into the histogram differ through the
+    ``diffviewer_use_histogram_differ`` site configuration setting.
+
+    Version Added:
+        6.0
+
+    Returns:
+        int:
+        The diff compatibility version for new diffs.
+    """
+    from djblets.siteconfig.models import SiteConfiguration
+
+    siteconfig = SiteConfiguration.objects.get_current()
+
+    if siteconfig.get('diffviewer_use_histogram_differ'):
+        return DiffCompatVersion.HISTOGRAM
+
+    return DiffCompatVersion.DEFAULT
+
+
 def get_differ(a, b, ignore_space=False,
-               compat_version=DiffCompatVersion.DEFAULT):
+               compat_version=DiffCompatVersion.DEFAULT,
+               engine=DifferEngine.DEFAULT,
+               time_budget=None):
     """Returns a differ for with the given settings.
 
     By default, this will return the MyersDiffer. Older differs can be used
     by specifying a compat_version, but this is only for *really* ancient
     diffs, currently.
+
+    Version Changed:
+        6.0:
+        Added the ``engine`` argument, which can be set to
+        :py:attr:`DifferEngine.ARRAY` to use the array-backed Myers differ.
+        This has no effect on non-Myers compatibility versions.
+
+        Added the ``time_budget`` argument, which limits the time spent
+        computing Myers and histogram diffs. See :py:class:`DiffTimeBudget`.
     """
     cls = None
 
-    if compat_version in DiffCompatVersion.MYERS_VERSIONS:
-        from reviewboard.diffviewer.myersdiff import MyersDiffer
-        cls = MyersDiffer
+    if engine not in DifferEngine.ALL:
+        raise DiffCompatError(
+            'Invalid differ engine (%s) passed to Differ' % engine)
+
+    if compat_version in DiffCompatVersion.HISTOGRAM_VERSIONS:
+        from reviewboard.diffviewer.histogramdiff import HistogramDiffer
+        cls = HistogramDiffer
+    elif compat_version in DiffCompatVersion.MYERS_VERSIONS:
+        if engine == DifferEngine.ARRAY:
+            from reviewboard.diffviewer.myersdiff import ArrayMyersDiffer
+            cls = ArrayMyersDiffer
+        else:
+            from reviewboard.diffviewer.myersdiff import MyersDiffer
+            cls = MyersDiffer
     elif compat_version == DiffCompatVersion.SMDIFFER:
         from reviewboard.diffviewer.smdiff import SMDiffer
         cls = SMDiffer
@@ -103,4 +257,6 @@ def get_differ(a, b, ignore_space=False,
             'Invalid diff compatibility version (%s) passed to Differ' %
             compat_version)
 
-    return cls(a, b, ignore_space, compat_version=compat_version)
+    return cls(a, b, ignore_space,
+               compat_version=compat_version,
+               time_budget=time_budget)
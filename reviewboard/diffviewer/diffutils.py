@@ -1,16 +1,24 @@
 import fnmatch
+import hashlib
 import logging
 import os
 import re
 import shutil
 import subprocess
 import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from difflib import SequenceMatcher
-from functools import cmp_to_key
+from functools import cmp_to_key, lru_cache
+from itertools import accumulate
+from typing import Optional
 
 from django.core.exceptions import ObjectDoesNotExist
+from django.db import connections
 from django.utils.encoding import force_str
-from django.utils.translation import gettext as _
+from django.utils.translation import gettext as _, get_language, override
+from djblets.cache.backend import cache_memoize
 from djblets.log import log_timed
 from djblets.siteconfig.models import SiteConfiguration
 from djblets.util.compat.python.past import cmp
@@ -20,6 +28,8 @@ from housekeeping.functions import deprecate_non_keyword_only_args
 from reviewboard.deprecation import RemovedInReviewBoard70Warning
 from reviewboard.diffviewer.commit_utils import exclude_ancestor_filediffs
 from reviewboard.diffviewer.errors import DiffTooBigError, PatchError
+from reviewboard.diffviewer.filecache import \
+    file_content_cache_backend_registry
 from reviewboard.diffviewer.settings import DiffSettings
 from reviewboard.scmtools.core import FileLookupContext, PRE_CREATION, HEAD
 
@@ -44,6 +54,45 @@ NEWLINE_UNICODE_RE = re.compile(r'(?:\n|\r(?:\r?\n)?)')
 _PATCH_GARBAGE_INPUT = 'patch: **** Only garbage was found in the patch input.'
 
 
+#: The maximum number of line pairs to cache changed regions for.
+#:
+#: This applies to each process.
+#:
+#: Version Added:
+#:     6.0
+LINE_CHANGED_REGIONS_CACHE_SIZE = 10000
+
+
+#: The combined length of two lines at which they're compared by tokens.
+#:
+#: Lines shorter than this are compared character by character.
+#:
+#: Version Added:
+#:     6.0
+LINE_CHANGED_REGIONS_TOKEN_LEN = 300
+
+
+#: The combined length of two lines at which their regions can be shared.
+#:
+#: See the ``use_shared_cache`` argument for
+#: :py:func:`get_line_changed_regions`.
+#:
+#: Version Added:
+#:     6.0
+LINE_CHANGED_REGIONS_SHARED_CACHE_LEN = 1000
+
+
+#: The version of changed regions stored in the shared cache.
+#:
+#: This must be bumped whenever the results of computing changed regions
+#: change.
+_LINE_CHANGED_REGIONS_VERSION = 1
+
+
+#: A regex for splitting a line into words, whitespace, and other characters.
+_LINE_TOKENS_RE = re.compile(r'\w+|\s+|[^\w\s]')
+
+
 def convert_to_unicode(s, encoding_list):
     """Return the passed string as a unicode object.
 
@@ -209,12 +258,204 @@ def split_line_endings(data):
     return lines
 
 
+def _apply_patch_in_process(diff, orig_file):
+    """Apply a simple unified diff to a file in memory.
+
+    This handles the common case of a diff whose hunks all apply exactly at
+    the line numbers listed in the hunk headers, without needing to spawn
+    :command:`patch`.
+
+    Anything beyond that (diffs with no hunks, hunks that would need to be
+    applied at an offset or with fuzz, malformed hunks, or diffs containing
+    more than one file) is left for :command:`patch`, so that its behavior
+    and error reporting are preserved. In those cases, this will return
+    ``None``.
+
+    Both the diff and the file must already have had their line endings
+    normalized through :py:func:`convert_line_endings`.
+
+    Version Added:
+        6.0
+
+    Args:
+        diff (bytes):
+            The contents of the diff to apply.
+
+        orig_file (bytes):
+            The contents of the original file.
+
+    Returns:
+        bytes:
+        The contents of the patched file, or ``None`` if the diff must be
+        applied using :command:`patch`.
+    """
+    orig_lines = orig_file.splitlines(True)
+    num_orig_lines = len(orig_lines)
+    diff_lines = diff.split(b'\n')
+
+    if diff_lines and not diff_lines[-1]:
+        diff_lines.pop()
+
+    num_diff_lines = len(diff_lines)
+    result = []
+    orig_pos = 0
+    found_hunks = False
+    i = 0
+
+    # Skip past the file headers to the first hunk.
+    while i < num_diff_lines and not diff_lines[i].startswith(b'@@ '):
+        i += 1
+
+    while i < num_diff_lines:
+        line = diff_lines[i]
+
+        if not line.startswith(b'@@ '):
+            # This is trailing content after the last hunk. If there are any
+            # further hunks or file headers after this, let patch(1) sort it
+            # out.
+            for line in diff_lines[i:]:
+                if line.startswith((b'@@ ', b'--- ', b'+++ ', b'diff ')):
+                    return None
+
+            break
+
+        m = CHUNK_RANGE_RE.match(line)
+
+        if not m:
+            return None
+
+        old_start = int(m.group('orig_start'))
+        old_len = int(m.group('orig_len') or 1)
+        new_len = int(m.group('modified_len') or 1)
+        old_hunk_lines = []
+        new_hunk_lines = []
+        old_no_newline = False
+        new_no_newline = False
+        last_prefix = None
+        prefix_context = None
+        suffix_context = 0
+        i += 1
+
+        while i < num_diff_lines:
+            line = diff_lines[i]
+
+            if line.startswith(b'\\'):
+                # This is a "\ No newline at end of file" marker, which
+                # applies to the previous line.
+                if last_prefix == b' ':
+                    old_no_newline = True
+                    new_no_newline = True
+                elif last_prefix == b'-':
+                    old_no_newline = True
+                elif last_prefix == b'+':
+                    new_no_newline = True
+                else:
+                    return None
+
+                last_prefix = None
+                i += 1
+                continue
+
+            if (len(old_hunk_lines) == old_len and
+                len(new_hunk_lines) == new_len):
+                break
+
+            prefix = line[:1]
+
+            if prefix == b' ' or not line:
+                old_hunk_lines.append(line[1:])
+                new_hunk_lines.append(line[1:])
+                last_prefix = b' '
+                suffix_context += 1
+            elif prefix == b'-' or prefix == b'+':
+                if prefix == b'-':
+                    old_hunk_lines.append(line[1:])
+                else:
+                    new_hunk_lines.append(line[1:])
+
+                if prefix_context is None:
+                    prefix_context = suffix_context
+
+                last_prefix = prefix
+                suffix_context = 0
+            else:
+                return None
+
+            i += 1
+
+        if (len(old_hunk_lines) != old_len or
+            len(new_hunk_lines) != new_len):
+            # The hunk is malformed or truncated.
+            return None
+
+        if old_len == 0:
+            hunk_pos = old_start
+        else:
+            hunk_pos = old_start - 1
+
+        if hunk_pos < orig_pos or hunk_pos + old_len > num_orig_lines:
+            return None
+
+        # patch(1) treats hunks with less leading context than trailing
+        # context as anchored to the start of the file, and hunks with less
+        # trailing context as anchored to the end of the file. If that
+        # doesn't hold for where the hunk claims to apply, patch(1) will
+        # look elsewhere for it.
+        if prefix_context is not None:
+            if (prefix_context < suffix_context and
+                hunk_pos != 0):
+                return None
+            elif (suffix_context < prefix_context and
+                  hunk_pos + old_len != num_orig_lines):
+                return None
+
+        # The hunk must apply exactly where it claims to. Anything else
+        # requires patch(1)'s offset and fuzz handling.
+        for j, hunk_line in enumerate(old_hunk_lines):
+            if old_no_newline and j == old_len - 1:
+                if (hunk_pos + j != num_orig_lines - 1 or
+                    orig_lines[hunk_pos + j] != hunk_line):
+                    return None
+            elif orig_lines[hunk_pos + j] != hunk_line + b'\n':
+                return None
+
+        result += orig_lines[orig_pos:hunk_pos]
+        result += [
+            hunk_line + b'\n'
+            for hunk_line in new_hunk_lines
+        ]
+
+        if new_no_newline and result:
+            result[-1] = result[-1][:-1]
+
+        orig_pos = hunk_pos + old_len
+        found_hunks = True
+
+    if not found_hunks:
+        return None
+
+    if new_no_newline and orig_pos != num_orig_lines:
+        # The last line of the new file can't lack a newline if there's
+        # more content after it.
+        return None
+
+    result += orig_lines[orig_pos:]
+
+    return b''.join(result)
+
+
 def patch(diff, orig_file, filename, request=None):
     """Apply a diff to a file.
 
-    This delegates out to ``patch`` because no one except Larry Wall knows how
+    Simple diffs that apply cleanly are applied in-process. Anything else
+    delegates out to ``patch`` because no one except Larry Wall knows how
     to patch.
 
+    Version Changed:
+        6.0:
+        Diffs that apply cleanly are now applied without spawning
+        :command:`patch`.
+
     Args:
         diff (bytes):
             The contents of the diff to apply.
@@ -242,13 +483,21 @@ def patch(diff, orig_file, filename, request=None):
         # Someone uploaded an unchanged file. Return the one we're patching.
         return orig_file
 
+    orig_file = convert_line_endings(orig_file)
+    diff = convert_line_endings(diff)
+
+    new_file = _apply_patch_in_process(diff=diff,
+                                       orig_file=orig_file)
+
+    if new_file is not None:
+        log_timer.done()
+
+        return new_file
+
     # Prepare the temporary directory if none is available
     tempdir = tempfile.mkdtemp(prefix='reviewboard.')
 
     try:
-        orig_file = convert_line_endings(orig_file)
-        diff = convert_line_endings(diff)
-
         (fd, oldfile) = tempfile.mkstemp(dir=tempdir)
         f = os.fdopen(fd, 'w+b')
         f.write(orig_file)
@@ -430,6 +679,14 @@ def get_original_file_from_repo(filediff, request=None):
 def get_original_file(filediff, request=None):
     """Return the pre-patch file of a FileDiff.
 
+    If a file content cache backend is enabled, the file will be fetched
+    from the cache when possible, and stored in the cache after being
+    computed.
+
+    Version Changed:
+        6.0:
+        Added support for the file content cache.
+
     Version Changed:
         4.0:
         The ``encoding_list`` parameter should no longer be provided by
@@ -452,6 +709,58 @@ def get_original_file(filediff, request=None):
         bytes:
         The pre-patch file.
 
+    Raises:
+        UnicodeDecodeError:
+            The source file was not compatible with any of the available
+            encodings.
+
+        reviewboard.diffutils.errors.PatchError:
+            An error occurred when trying to apply the patch.
+
+        reviewboard.scmtools.errors.SCMError:
+            An error occurred while computing the pre-patch file.
+    """
+    file_cache = file_content_cache_backend_registry.current_backend
+
+    # Only the server-computed SHA256 is used for lookups. The public
+    # orig_sha256 can be set by clients, and prior to Review Board 6.0 could
+    # be of an ancestor's file for FileDiffs in a commit series.
+    orig_sha256 = filediff.file_cache_orig_sha256
+    use_cached = (file_cache is not None and
+                  orig_sha256 is not None)
+
+    if use_cached:
+        data = file_cache.get_file_content(orig_sha256)
+
+        if data is not None:
+            return data
+
+    data = _get_original_file_uncached(filediff=filediff,
+                                       request=request)
+
+    if file_cache is not None and data:
+        file_cache.set_file_content(hashlib.sha256(data).hexdigest(), data)
+
+    return data
+
+
+def _get_original_file_uncached(filediff, request=None):
+    """Return the pre-patch file of a FileDiff, bypassing the file cache.
+
+    Version Added:
+        6.0
+
+    Args:
+        filediff (reviewboard.diffviewer.models.filediff.FileDiff):
+            The FileDiff to retrieve the pre-patch file for.
+
+        request (django.http.HttpRequest, optional):
+            The HTTP request from the client.
+
+    Returns:
+        bytes:
+        The pre-patch file.
+
     Raises:
         UnicodeDecodeError:
             The source file was not compatible with any of the available
@@ -511,6 +820,14 @@ def get_patched_file(source_data, filediff, request=None):
     This will normalize the patch, applying any changes needed for the
     repository, and then patch the provided data with the patch contents.
 
+    If a file content cache backend is enabled and the provided data is the
+    FileDiff's original file, the patched file will be fetched from the cache
+    when possible, and stored in the cache after being computed.
+
+    Version Changed:
+        6.0:
+        Added support for the file content cache.
+
     Args:
         source_data (bytes):
             The file contents to patch.
@@ -525,16 +842,37 @@ def get_patched_file(source_data, filediff, request=None):
         bytes:
         The patched file contents.
     """
+    file_cache = file_content_cache_backend_registry.current_backend
+
+    # See get_original_file() for why only the server-computed SHA256s are
+    # used.
+    patched_sha256 = filediff.file_cache_patched_sha256
+    use_cached = (file_cache is not None and
+                  patched_sha256 is not None and
+                  filediff.file_cache_orig_sha256 ==
+                  hashlib.sha256(source_data).hexdigest())
+
+    if use_cached:
+        data = file_cache.get_file_content(patched_sha256)
+
+        if data is not None:
+            return data
+
     repository = filediff.get_repository()
     diff = repository.normalize_patch(patch=filediff.diff,
                                       filename=filediff.source_file,
                                       revision=filediff.source_revision)
 
-    return patch(diff=diff,
+    data = patch(diff=diff,
                  orig_file=source_data,
                  filename=filediff.dest_file,
                  request=request)
 
+    if file_cache is not None and data:
+        file_cache.set_file_content(hashlib.sha256(data).hexdigest(), data)
+
+    return data
+
 
 def get_revision_str(revision):
     if revision == HEAD:
@@ -622,6 +960,13 @@ def get_matched_interdiff_files(tool, filediffs, interfilediffs):
     ``filediffs`` that don't have entries in ``interfilediffs`` are considered
     reverted changes.
 
+    Version Changed:
+        6.0:
+        Matching is now performed through dictionary lookups, with the
+        rename and new/deleted state comparisons limited to files that
+        weren't matched directly. This keeps matching linear for diffs with
+        many thousands of files.
+
     Args:
         tool (reviewboard.scmtools.core.SCMTool)
             The tool used for all these diffs.
@@ -642,22 +987,16 @@ def get_matched_interdiff_files(tool, filediffs, interfilediffs):
     parser = tool.get_parser(b'')
     _normfile = parser.normalize_diff_filename
 
-    def _make_detail_key(filediff):
-        return (_normfile(filediff.source_file),
-                _normfile(filediff.dest_file),
-                filediff.is_new,
-                filediff.deleted)
-
     # In order to support interdiffs properly, we need to display diffs on
     # every file in the union of both diffsets. Iterating over one diffset
     # or the other doesn't suffice. We also need to be careful to handle
     # things like renamed/moved files, particularly when there are multiple
     # of them with the same source filename.
     #
-    # This is done in four stages:
+    # This is done in six stages:
     #
-    # 1. Build up maps and a set for keeping track of possible
-    #    interfilediff candidates for future stages.
+    # 1. Build up maps for keeping track of possible interfilediff
+    #    candidates for future stages.
     #
     # 2. Look for any files that are common between the two diff revisions
     #    that have the same source filename, same destination filename, and
@@ -667,31 +1006,49 @@ def get_matched_interdiff_files(tool, filediffs, interfilediffs):
     #    match here.
     #
     # 3. Look for any files that are common between the two diff revisions
+    #    that were moved/copied from the same source filename to the same
+    #    destination filename.
+    #
+    # 4. Look for any files that are common between the two diff revisions
     #    that have the same source filename and new/deleted state. These will
     #    ignore the destination filename, helping to match cases where diff 1
     #    modifies a file and diff 2 modifies + renames/moves it.
     #
-    # 4. Add any remaining files from diff 2 that weren't found in diff 1.
+    # 5. Look for any files with the same source filename and compatible
+    #    new/deleted states.
+    #
+    # 6. Add any remaining files from diff 2 that weren't found in diff 1.
+    #
+    # Each stage is driven by dictionaries keyed on the normalized filenames
+    # and file states, and stages 3 onward only consider files that weren't
+    # already matched, so the number of comparisons stays proportional to
+    # the number of files.
+    #
+    # Dictionaries with ``None`` values are used as insertion-ordered sets,
+    # so that results are stable.
     #
     # We don't have to worry about things like the order of matched diffs.
     # That will be taken care of at the end of the function.
     detail_interdiff_map = {}
     simple_interdiff_map = {}
-    remaining_interfilediffs = set()
+    remaining_interfilediffs = {}
 
-    # Stage 1: Build up the maps/set of interfilediffs.
+    # Stage 1: Build up the maps of interfilediffs.
     for interfilediff in interfilediffs:
         source_file = _normfile(interfilediff.source_file)
-        detail_key = _make_detail_key(interfilediff)
+        detail_key = (source_file,
+                      _normfile(interfilediff.dest_file),
+                      interfilediff.is_new,
+                      interfilediff.deleted)
 
         # We'll store this interfilediff in three spots: The set of
         # all interfilediffs, the detail map (for source + dest +
         # is_new file comparisons), and the simple map (for direct
         # source_file comparisons). These will be used for the
         # different matching stages.
-        remaining_interfilediffs.add(interfilediff)
+        remaining_interfilediffs[interfilediff] = None
         detail_interdiff_map[detail_key] = interfilediff
-        simple_interdiff_map.setdefault(source_file, set()).add(interfilediff)
+        simple_interdiff_map.setdefault(source_file, {})[interfilediff] = None
 
     # Stage 2: Look for common files with the same source/destination
     #          filenames and new/deleted states.
@@ -702,23 +1059,29 @@ def get_matched_interdiff_files(tool, filediffs, interfilediffs):
 
     for filediff in filediffs:
         source_file = _normfile(filediff.source_file)
+        detail_key = (source_file,
+                      _normfile(filediff.dest_file),
+                      filediff.is_new,
+                      filediff.deleted)
 
         try:
-            interfilediff = detail_interdiff_map.pop(
-                _make_detail_key(filediff))
+            interfilediff = detail_interdiff_map.pop(detail_key)
         except KeyError:
-            remaining_filediffs.append(filediff)
+            remaining_filediffs.append((filediff, source_file))
             continue
 
         yield filediff, interfilediff
 
-        if interfilediff:
-            remaining_interfilediffs.discard(interfilediff)
+        remaining_interfilediffs.pop(interfilediff, None)
+        simple_interdiff_map[source_file].pop(interfilediff, None)
 
-            try:
-                simple_interdiff_map.get(source_file, []).remove(interfilediff)
-            except ValueError:
-                pass
+    if not remaining_filediffs:
+        # Everything was matched directly, so there's nothing left to
+        # compare. Any remaining interfilediffs are new changes.
+        for interfilediff in remaining_interfilediffs:
+            yield None, interfilediff
+
+        return
 
     # Stage 3: Look for common files with the same source/destination
     #          filenames (when they differ).
@@ -727,25 +1090,40 @@ def get_matched_interdiff_files(tool, filediffs, interfilediffs):
     # processed here. We'll look for any filediffs from diff 2 that were
     # moved/copied from the same source to the same destination. This is one
     # half of the detailed file state we checked in stage 2.
+    #
+    # Only the remaining interfilediffs sharing a source filename with a
+    # remaining filediff are indexed for this.
+    remaining_source_files = {
+        source_file
+        for filediff, source_file in remaining_filediffs
+    }
+    rename_interdiff_map = {}
+
+    for source_file in remaining_source_files:
+        for interfilediff in simple_interdiff_map.get(source_file, {}):
+            rename_interdiff_map.setdefault(
+                (source_file, interfilediff.dest_file),
+                []).append(interfilediff)
+
     new_remaining_filediffs = []
 
-    for filediff in remaining_filediffs:
-        source_file = _normfile(filediff.source_file)
-        found_interfilediffs = [
-            temp_interfilediff
-            for temp_interfilediff in simple_interdiff_map.get(source_file, [])
-            if (temp_interfilediff.dest_file == filediff.dest_file and
-                filediff.source_file != filediff.dest_file)
-        ]
+    for filediff, source_file in remaining_filediffs:
+        found_interfilediffs = None
+
+        if filediff.source_file != filediff.dest_file:
+            found_interfilediffs = rename_interdiff_map.pop(
+                (source_file, filediff.dest_file),
+                None)
 
         if found_interfilediffs:
-            remaining_interfilediffs.difference_update(found_interfilediffs)
+            source_interdiff_map = simple_interdiff_map[source_file]
 
             for interfilediff in found_interfilediffs:
-                simple_interdiff_map[source_file].remove(interfilediff)
+                remaining_interfilediffs.pop(interfilediff, None)
+                del source_interdiff_map[interfilediff]
                 yield filediff, interfilediff
         else:
-            new_remaining_filediffs.append(filediff)
+            new_remaining_filediffs.append((filediff, source_file))
 
     remaining_filediffs = new_remaining_filediffs
 
@@ -758,23 +1136,28 @@ def get_matched_interdiff_files(tool, filediffs, interfilediffs):
     # be matched up.
     new_remaining_filediffs = []
 
-    for filediff in remaining_filediffs:
-        source_file = _normfile(filediff.source_file)
-        found_interfilediffs = [
-            temp_interfilediff
-            for temp_interfilediff in simple_interdiff_map.get(source_file, [])
-            if (temp_interfilediff.is_new == filediff.is_new and
-                temp_interfilediff.deleted == filediff.deleted)
-        ]
+    for filediff, source_file in remaining_filediffs:
+        source_interdiff_map = simple_interdiff_map.get(source_file)
+
+        if source_interdiff_map:
+            is_new = filediff.is_new
+            deleted = filediff.deleted
+            found_interfilediffs = [
+                temp_interfilediff
+                for temp_interfilediff in source_interdiff_map
+                if (temp_interfilediff.is_new == is_new and
+                    temp_interfilediff.deleted == deleted)
+            ]
+        else:
+            found_interfilediffs = None
 
         if found_interfilediffs:
-            remaining_interfilediffs.difference_update(found_interfilediffs)
-
             for interfilediff in found_interfilediffs:
-                simple_interdiff_map[source_file].remove(interfilediff)
+                remaining_interfilediffs.pop(interfilediff, None)
+                del source_interdiff_map[interfilediff]
                 yield filediff, interfilediff
         else:
-            new_remaining_filediffs.append(filediff)
+            new_remaining_filediffs.append((filediff, source_file))
 
     remaining_filediffs = new_remaining_filediffs
 
@@ -793,11 +1176,11 @@ def get_matched_interdiff_files(tool, filediffs, interfilediffs):
     #
     # Any files not found with a matching interdiff will simply be yielded.
     # This is the last stage dealing with the filediffs in the first revision.
-    for filediff in remaining_filediffs:
-        source_file = _normfile(filediff.source_file)
+    for filediff, source_file in remaining_filediffs:
         found_interfilediffs = [
             temp_interfilediff
-            for temp_interfilediff in simple_interdiff_map.get(source_file, [])
+            for temp_interfilediff in simple_interdiff_map.get(source_file,
+                                                               {})
             if (((filediff.is_new or not temp_interfilediff.is_new) or
                  (not filediff.is_new and temp_interfilediff.is_new and
                   filediff.dest_detail == temp_interfilediff.dest_detail)) and
@@ -805,12 +1188,11 @@ def get_matched_interdiff_files(tool, filediffs, interfilediffs):
         ]
 
         if found_interfilediffs:
-            remaining_interfilediffs.difference_update(found_interfilediffs)
-
             for interfilediff in found_interfilediffs:
                 # NOTE: If more stages are ever added that deal with
                 #       simple_interdiff_map, then we'll need to remove
                 #       interfilediff from that map here.
+                remaining_interfilediffs.pop(interfilediff, None)
                 yield filediff, interfilediff
         else:
             yield filediff, None
@@ -844,6 +1226,12 @@ def get_filediffs_match(filediff1, filediff2):
     hashes (introduced in Review Board 4.0), and fall back on SHA1 hashes if
     not present.
 
+    Version Changed:
+        6.0:
+        Diffs stored in :py:class:`~reviewboard.diffviewer.models.
+        raw_file_diff_data.RawFileDiffData` are now compared by their stored
+        hash, rather than by loading and comparing their contents.
+
     Args:
         filediff1 (reviewboard.diffviewer.models.filediff.FileDiff):
             The first FileDiff to compare.
@@ -867,15 +1255,26 @@ def get_filediffs_match(filediff1, filediff2):
     # 2.0+) or SHA256 (RB 4.0+) hashes, so we have to check for them. We want
     # to prioritize SHA256 hashes, but if the filediff or interfilediff lacks
     # a SHA256 hash, we want to fall back to SHA1.
-    return (filediff1 is not None and filediff2 is not None and
-            (filediff1.diff == filediff2.diff or
-             (filediff1.deleted and filediff2.deleted) or
-             (filediff1.patched_sha256 is not None and
-              filediff1.patched_sha256 == filediff2.patched_sha256) or
-             ((filediff1.patched_sha256 is None or
-               filediff2.patched_sha256 is None) and
-              filediff1.patched_sha1 is not None and
-              filediff1.patched_sha1 == filediff2.patched_sha1)))
+    if filediff1 is None or filediff2 is None:
+        return False
+
+    if ((filediff1.deleted and filediff2.deleted) or
+        (filediff1.patched_sha256 is not None and
+         filediff1.patched_sha256 == filediff2.patched_sha256) or
+        ((filediff1.patched_sha256 is None or
+          filediff2.patched_sha256 is None) and
+         filediff1.patched_sha1 is not None and
+         filediff1.patched_sha1 == filediff2.patched_sha1)):
+        return True
+
+    # Diff contents are stored by hash, so if both FileDiffs have been
+    # migrated to RawFileDiffData, we can compare the IDs without loading
+    # the contents.
+    if (filediff1.diff_hash_id is not None and
+        filediff2.diff_hash_id is not None):
+        return filediff1.diff_hash_id == filediff2.diff_hash_id
+
+    return filediff1.diff == filediff2.diff
 
 
 def get_diff_files(diffset, filediff=None, interdiffset=None,
@@ -964,6 +1363,7 @@ def get_diff_files(diffset, filediff=None, interdiffset=None,
         return []
 
     per_commit_filediffs = None
+    ancestry = None
     requested_base_filediff = base_filediff
 
     if filediff:
@@ -1010,8 +1410,9 @@ def get_diff_files(diffset, filediff=None, interdiffset=None,
                      f.commit_id <= tip_commit_id))
             ]
 
+            ancestry = diffset.get_filediff_ancestry(per_commit_filediffs)
             filediffs = exclude_ancestor_filediffs(filediffs,
-                                                   per_commit_filediffs)
+                                                   ancestry=ancestry)
         else:
             filediffs = diffset.cumulative_files
 
@@ -1140,13 +1541,16 @@ def get_diff_files(diffset, filediff=None, interdiffset=None,
         base_filediff = None
 
         if filediff.commit_id:
-            # If we pre-computed this above (or before) and we have all
-            # FileDiffs, this will cost no additional queries.
-            #
-            # Otherwise this will cost up to
-            # ``1 + len(diffset.per_commit_files.count())`` queries.
-            ancestors = filediff.get_ancestors(minimal=False,
-                                               filediffs=per_commit_filediffs)
+            if ancestry is not None:
+                # We're showing a commit range, and have the ancestry of
+                # all FileDiffs, so this won't cost any queries.
+                ancestors = ancestry.get_ancestors(filediff)
+            else:
+                # If we pre-computed this before, this will cost one query.
+                #
+                # Otherwise this will cost up to
+                # ``1 + len(diffset.per_commit_files.count())`` queries.
+                ancestors = filediff.get_ancestors(minimal=False)
 
             if ancestors:
                 if requested_base_filediff:
@@ -1222,17 +1626,32 @@ def populate_diff_chunks(
     files,
     *,
     request=None,
-    diff_settings: DiffSettings):
+    diff_settings: DiffSettings,
+    max_workers: Optional[int] = None,
+):
     """Populate a list of diff files with chunk data.
 
     This accepts a list of files (generated by :py:func:`get_diff_files`) and
     generates diff chunk data for each file in the list. The chunk data is
     stored in memory in the file state.
 
+    Chunks for several files can be generated at once by passing
+    ``max_workers``, or by setting the
+    ``diffviewer_chunk_generation_max_workers`` site configuration setting.
+    This overlaps fetching files from the repository with diffing and
+    syntax highlighting of other files. The files will be populated in the
+    same way, and in the same order, as when generated one at a time.
+
+    The time taken to generate the chunks for each file is stored in the
+    file's ``chunks_load_time`` key (in seconds), and logged at the debug
+    level.
+
     Version Changed:
         6.0:
         * Made all arguments other than ``files`` keyword-only.
         * Made the ``diff_settings`` argument mandatory.
+        * Added the ``max_workers`` argument.
+        * Added the ``chunks_load_time`` key to each file.
 
     Args:
         files (list of dict):
@@ -1246,29 +1665,56 @@ def populate_diff_chunks(
 
             Version Added:
                 5.0.2
+
+        max_workers (int, optional):
+            The maximum number of files to generate chunks for at once.
+
+            If not provided, this will use the
+            ``diffviewer_chunk_generation_max_workers`` site configuration
+            setting. A value of 1 generates chunks for one file at a time,
+            on the calling thread.
+
+            Version Added:
+                6.0
     """
-    from reviewboard.diffviewer.chunk_generator import get_diff_chunk_generator
+    if max_workers is None:
+        siteconfig = SiteConfiguration.objects.get_current()
+        max_workers = siteconfig.get('diffviewer_chunk_generation_max_workers')
+
+    max_workers = min(max_workers, len(files))
 
-    for diff_file in files:
-        chunk_generator = get_diff_chunk_generator(
+    if max_workers > 1:
+        results = _generate_diff_files_chunks_threaded(
+            files=files,
             request=request,
-            filediff=diff_file['filediff'],
-            interfilediff=diff_file['interfilediff'],
-            force_interdiff=diff_file['force_interdiff'],
-            base_filediff=diff_file.get('base_filediff'),
-            diff_settings=diff_settings)
-        chunks = list(chunk_generator.get_chunks())
+            diff_settings=diff_settings,
+            max_workers=max_workers)
+    else:
+        results = (
+            _generate_diff_file_chunks(diff_file=diff_file,
+                                       request=request,
+                                       diff_settings=diff_settings)
+            for diff_file in files
+        )
+
+    for diff_file, (chunks, code_safety_results, load_time) in zip(files,
+                                                                   results):
+        logger.debug('Generated %d diff chunks for filediff ID %s in '
+                     '%.3f seconds',
+                     len(chunks), diff_file['filediff'].pk, load_time,
+                     extra={'request': request})
 
         diff_file.update({
             'chunks': chunks,
+            'chunks_load_time': load_time,
             'num_chunks': len(chunks),
             'changed_chunk_indexes': [],
+            'simplified': False,
             'whitespace_only': len(chunks) > 0,
         })
 
-        if chunk_generator.all_code_safety_results:
-            diff_file['code_safety_results'] = \
-                chunk_generator.all_code_safety_results
+        if code_safety_results:
+            diff_file['code_safety_results'] = code_safety_results
 
         for j, chunk in enumerate(chunks):
             chunk['index'] = j
@@ -1280,12 +1726,217 @@ def populate_diff_chunks(
                 if not meta.get('whitespace_chunk', False):
                     diff_file['whitespace_only'] = False
 
+                if meta.get('simplified'):
+                    diff_file['simplified'] = True
+
         diff_file.update({
             'num_changes': len(diff_file['changed_chunk_indexes']),
             'chunks_loaded': True,
         })
 
 
+def _generate_diff_file_chunks(diff_file, *, request, diff_settings):
+    """Generate the chunks for a diff file.
+
+    Version Added:
+        6.0
+
+    Args:
+        diff_file (dict):
+            The diff file to generate chunks for.
+
+        request (django.http.HttpRequest):
+            The HTTP request from the client.
+
+        diff_settings (reviewboard.diffviewer.settings.DiffSettings):
+            The settings used to control the display of diffs.
+
+    Returns:
+        tuple:
+        A 3-tuple containing:
+
+        1. The list of chunks.
+        2. The code safety results for the file.
+        3. The time taken to generate the chunks, in seconds.
+    """
+    start_time = time.monotonic()
+
+    chunk_generator = _get_diff_file_chunk_generator(
+        diff_file=diff_file,
+        request=request,
+        diff_settings=diff_settings)
+    chunks = list(chunk_generator.get_chunks())
+
+    return (chunks,
+            chunk_generator.all_code_safety_results,
+            time.monotonic() - start_time)
+
+
+def _get_diff_file_chunk_generator(diff_file, *, request, diff_settings):
+    """Return a chunk generator for a diff file.
+
+    Version Added:
+        6.0
+
+    Args:
+        diff_file (dict):
+            The diff file to generate chunks for.
+
+        request (django.http.HttpRequest):
+            The HTTP request from the client.
+
+        diff_settings (reviewboard.diffviewer.settings.DiffSettings):
+            The settings used to control the display of diffs.
+
+    Returns:
+        reviewboard.diffviewer.chunk_generator.DiffChunkGenerator:
+        The chunk generator for the file.
+    """
+    from reviewboard.diffviewer.chunk_generator import get_diff_chunk_generator
+
+    return get_diff_chunk_generator(
+        request=request,
+        filediff=diff_file['filediff'],
+        interfilediff=diff_file['interfilediff'],
+        force_interdiff=diff_file['force_interdiff'],
+        base_filediff=diff_file.get('base_filediff'),
+        diff_settings=diff_settings)
+
+
+def _generate_diff_files_chunks_threaded(files, *, request, diff_settings,
+                                         max_workers):
+    """Generate the chunks for diff files using a pool of threads.
+
+    Each thread generates chunks for files until there are none left. Any
+    database connections opened by a thread are closed once it's finished.
+
+    Version Added:
+        6.0
+
+    Args:
+        files (list of dict):
+            The list of diff files to generate chunks for.
+
+        request (django.http.HttpRequest):
+            The HTTP request from the client.
+
+        diff_settings (reviewboard.diffviewer.settings.DiffSettings):
+            The settings used to control the display of diffs.
+
+        max_workers (int):
+            The number of threads to use.
+
+    Returns:
+        list of tuple:
+        The results from :py:func:`_generate_diff_file_chunks` for each file,
+        in the same order as ``files``.
+
+    Raises:
+        Exception:
+            An error occurred while generating chunks for a file. The first
+            error encountered will be raised once all threads have finished.
+    """
+    results = [None] * len(files)
+    pending = iter(enumerate(files))
+    pending_lock = threading.Lock()
+
+    # Chunk cache keys and rendered text depend on the active language,
+    # which is stored per-thread.
+    language = get_language()
+
+    def _worker():
+        try:
+            with override(language):
+                while True:
+                    with pending_lock:
+                        try:
+                            i, diff_file = next(pending)
+                        except StopIteration:
+                            break
+
+                    results[i] = _generate_diff_file_chunks(
+                        diff_file=diff_file,
+                        request=request,
+                        diff_settings=diff_settings)
+        finally:
+            connections.close_all()
+
+    with ThreadPoolExecutor(max_workers=max_workers,
+                            thread_name_prefix='rb-diff-chunks') as executor:
+        futures = [
+            executor.submit(_worker)
+            for i in range(max_workers)
+        ]
+
+    for future in futures:
+        # This will raise any exception from the worker.
+        future.result()
+
+    return results
+
+
+def populate_diff_chunk(diff_file, chunk_index, *, request=None,
+                        diff_settings, lazy_lines=False):
+    """Populate a diff file with a single chunk.
+
+    This is a lighter-weight version of :py:func:`populate_diff_chunks` for
+    when only one chunk in a file is needed. Only the cached segment
+    containing the chunk will be fetched from the cache, along with a small
+    index for the file.
+
+    The file's ``chunks`` key will contain only the requested chunk (or no
+    chunks, if the index is out of range). The ``num_chunks``,
+    ``changed_chunk_indexes``, ``num_changes``, ``simplified``, and
+    ``whitespace_only`` keys will describe all chunks in the file. The
+    ``chunks_loaded`` key will remain ``False``.
+
+    Version Added:
+        6.0
+
+    Args:
+        diff_file (dict):
+            The diff file to populate.
+
+        chunk_index (int):
+            The index of the chunk to load.
+
+        request (django.http.HttpRequest, optional):
+            The HTTP request from the client.
+
+        diff_settings (reviewboard.diffviewer.settings.DiffSettings):
+            The settings used to control the display of diffs.
+
+        lazy_lines (bool, optional):
+            Whether to load the lines of the chunk only once they're
+            accessed. This is useful when only a few lines of the chunk will
+            be rendered, such as when expanding context around a collapsed
+            chunk. See
+            :py:meth:`~reviewboard.diffviewer.chunk_generator.
+            RawDiffChunkGenerator.get_chunk_range`.
+    """
+    chunk_generator = _get_diff_file_chunk_generator(
+        diff_file=diff_file,
+        request=request,
+        diff_settings=diff_settings)
+    chunks_info = chunk_generator.get_chunks_info()
+    chunks = list(chunk_generator.get_chunk_range(chunk_index,
+                                                  chunk_index + 1,
+                                                  lazy_lines=lazy_lines))
+
+    diff_file.update({
+        'chunks': chunks,
+        'num_chunks': chunks_info['num_chunks'],
+        'changed_chunk_indexes': chunks_info['changed_chunk_indexes'],
+        'num_changes': len(chunks_info['changed_chunk_indexes']),
+        'simplified': chunks_info['simplified'],
+        'whitespace_only': chunks_info['whitespace_only'],
+    })
+
+    if chunk_generator.all_code_safety_results:
+        diff_file['code_safety_results'] = \
+            chunk_generator.all_code_safety_results
+
+
 def get_file_from_filediff(context,
                            filediff,
                            interfilediff,
@@ -1329,13 +1980,7 @@ def get_file_from_filediff(context,
         dict:
         The diff file information. If not found, this will return ``None``.
     """
-    interdiffset = None
-
-    key = "_diff_files_%s_%s" % (filediff.diffset.id, filediff.id)
-
-    if interfilediff:
-        key += "_%s" % (interfilediff.id)
-        interdiffset = interfilediff.diffset
+    key = _make_diff_file_context_key(filediff, interfilediff)
 
     if key in context:
         files = context[key]
@@ -1343,9 +1988,9 @@ def get_file_from_filediff(context,
         assert 'user' in context
 
         request = context.get('request', None)
-        files = get_diff_files(filediff.diffset, filediff, interdiffset,
-                               interfilediff=interfilediff,
-                               request=request)
+        files = _get_diff_files_for_filediff(filediff=filediff,
+                                             interfilediff=interfilediff,
+                                             request=request)
 
         populate_diff_chunks(files=files,
                              request=request,
@@ -1359,6 +2004,61 @@ def get_file_from_filediff(context,
     return None
 
 
+def _make_diff_file_context_key(filediff, interfilediff):
+    """Return the template context key used to store a diff file.
+
+    Version Added:
+        6.0
+
+    Args:
+        filediff (reviewboard.diffviewer.models.filediff.FileDiff):
+            The filediff being rendered.
+
+        interfilediff (reviewboard.diffviewer.models.filediff.FileDiff):
+            The optional filediff being used to render an interdiff.
+
+    Returns:
+        str:
+        The context key.
+    """
+    key = '_diff_files_%s_%s' % (filediff.diffset.id, filediff.id)
+
+    if interfilediff:
+        key += '_%s' % interfilediff.id
+
+    return key
+
+
+def _get_diff_files_for_filediff(filediff, interfilediff, request):
+    """Return the list of diff files for a filediff/interfilediff.
+
+    Version Added:
+        6.0
+
+    Args:
+        filediff (reviewboard.diffviewer.models.filediff.FileDiff):
+            The filediff being rendered.
+
+        interfilediff (reviewboard.diffviewer.models.filediff.FileDiff):
+            The optional filediff being used to render an interdiff.
+
+        request (django.http.HttpRequest):
+            The HTTP request from the client.
+
+    Returns:
+        list of dict:
+        The list of diff files. This will contain at most one file.
+    """
+    if interfilediff:
+        interdiffset = interfilediff.diffset
+    else:
+        interdiffset = None
+
+    return get_diff_files(filediff.diffset, filediff, interdiffset,
+                          interfilediff=interfilediff,
+                          request=request)
+
+
 def get_last_line_number_in_diff(context,
                                  filediff,
                                  interfilediff,
@@ -1559,6 +2259,15 @@ def get_file_chunks_in_range(context,
     See :py:func:`get_chunks_in_range` for information on the returned state
     of the chunks.
 
+    If the file's chunks haven't already been loaded into the context, only
+    the cached segments of chunks containing the lines will be fetched from
+    the cache.
+
+    Version Changed:
+        6.0:
+        * Only the needed chunks are fetched, if the file's chunks aren't
+          already loaded.
+
     Version Changed:
         5.0.2:
         * Added the optional ``diff_settings`` argument.
@@ -1589,15 +2298,35 @@ def get_file_chunks_in_range(context,
         DiffChunk:
         Each chunk in the range.
     """
-    diff_file = get_file_from_filediff(context=context,
-                                       filediff=filediff,
-                                       interfilediff=interfilediff,
-                                       diff_settings=diff_settings)
+    if _make_diff_file_context_key(filediff, interfilediff) in context:
+        diff_file = get_file_from_filediff(context=context,
+                                           filediff=filediff,
+                                           interfilediff=interfilediff,
+                                           diff_settings=diff_settings)
+
+        if diff_file:
+            yield from get_chunks_in_range(chunks=diff_file['chunks'],
+                                           first_line=first_line,
+                                           num_lines=num_lines)
+    else:
+        request = context.get('request', None)
+        files = _get_diff_files_for_filediff(filediff=filediff,
+                                             interfilediff=interfilediff,
+                                             request=request)
+
+        if files:
+            assert len(files) == 1
+
+            chunk_generator = _get_diff_file_chunk_generator(
+                diff_file=files[0],
+                request=request,
+                diff_settings=diff_settings)
+            chunks = chunk_generator.get_chunks_in_line_range(first_line,
+                                                              num_lines)
 
-    if diff_file:
-        yield from get_chunks_in_range(chunks=diff_file['chunks'],
-                                       first_line=first_line,
-                                       num_lines=num_lines)
+            yield from get_chunks_in_range(chunks=chunks,
+                                           first_line=first_line,
+                                           num_lines=num_lines)
 
 
 def get_chunks_in_range(chunks, first_line, num_lines):
@@ -1645,7 +2374,7 @@ def get_chunks_in_range(chunks, first_line, num_lines):
                 last_index = len(lines)
 
             new_chunk = {
-                'index': i,
+                'index': chunk.get('index', i),
                 'lines': chunk['lines'][start_index:last_index],
                 'numlines': last_index - start_index,
                 'change': chunk['change'],
@@ -1658,18 +2387,139 @@ def get_chunks_in_range(chunks, first_line, num_lines):
             num_lines -= new_chunk['numlines']
 
             assert num_lines >= 0
+
             if num_lines == 0:
                 break
 
 
-def get_line_changed_regions(oldline, newline):
-    """Returns regions of changes between two similar lines."""
+def get_line_changed_regions(oldline, newline, *, use_shared_cache=False):
+    """Return regions of changes between two similar lines.
+
+    Results are cached in each process for the most recently-compared pairs
+    of lines, since the same pairs of lines are compared across revisions and
+    interdiffs.
+
+    Lines with a combined length of at least
+    :py:data:`LINE_CHANGED_REGIONS_TOKEN_LEN` are compared token by token
+    instead of character by character, keeping comparisons of very long
+    lines fast.
+
+    Version Changed:
+        6.0:
+        * Added ``use_shared_cache``.
+        * Added caching of results.
+        * Long lines are now compared by tokens.
+
+    Args:
+        oldline (str):
+            The line in the original file.
+
+        newline (str):
+            The line in the modified file.
+
+        use_shared_cache (bool, optional):
+            Whether to also store results in the shared cache. This is only
+            used for pairs of lines with a combined length of at least
+            :py:data:`LINE_CHANGED_REGIONS_SHARED_CACHE_LEN`, for which
+            computing the regions costs more than a cache lookup.
+
+    Returns:
+        tuple:
+        A 2-tuple of lists of ``(start, end)`` tuples for the changed regions
+        in the original and modified lines, or ``(None, None)`` if the lines
+        are too different to highlight changes within them.
+    """
     if oldline is None or newline is None:
         return None, None
 
+    use_shared_cache = (
+        use_shared_cache and
+        (len(oldline) + len(newline) >=
+         LINE_CHANGED_REGIONS_SHARED_CACHE_LEN))
+
+    old_regions, new_regions = _get_cached_line_changed_regions(
+        oldline, newline, use_shared_cache)
+
+    if old_regions is None:
+        return None, None
+
+    # The cached results are shared, so return copies the caller can modify.
+    return list(old_regions), list(new_regions)
+
+
+@lru_cache(maxsize=LINE_CHANGED_REGIONS_CACHE_SIZE)
+def _get_cached_line_changed_regions(oldline, newline, use_shared_cache):
+    """Return cached regions of changes between two lines.
+
+    Version Added:
+        6.0
+
+    Args:
+        oldline (str):
+            The line in the original file.
+
+        newline (str):
+            The line in the modified file.
+
+        use_shared_cache (bool):
+            Whether to look up and store the results in the shared cache.
+
+    Returns:
+        tuple:
+        A 2-tuple of tuples of changed regions, or ``(None, None)``.
+    """
+    if not use_shared_cache:
+        return _compute_line_changed_regions(oldline, newline)
+
+    key_hash = hashlib.sha256()
+
+    for line in (oldline, newline):
+        line = line.encode('utf-8', 'surrogatepass')
+        key_hash.update(b'%d:' % len(line))
+        key_hash.update(line)
+
+    return cache_memoize(
+        'diff-line-regions-v%d-%s' % (_LINE_CHANGED_REGIONS_VERSION,
+                                      key_hash.hexdigest()),
+        lambda: _compute_line_changed_regions(oldline, newline))
+
+
+def _compute_line_changed_regions(oldline, newline):
+    """Compute regions of changes between two lines.
+
+    Version Added:
+        6.0
+
+    Args:
+        oldline (str):
+            The line in the original file.
+
+        newline (str):
+            The line in the modified file.
+
+    Returns:
+        tuple:
+        A 2-tuple of tuples of changed regions, or ``(None, None)``.
+    """
+    old_len = len(oldline)
+    new_len = len(newline)
+
+    if old_len + new_len >= LINE_CHANGED_REGIONS_TOKEN_LEN:
+        # Character-level comparisons of long lines get very slow, so compare
+        # tokens instead, and map the results back to character offsets.
+        old_seq = _LINE_TOKENS_RE.findall(oldline)
+        new_seq = _LINE_TOKENS_RE.findall(newline)
+        old_offsets = list(accumulate(map(len, old_seq), initial=0))
+        new_offsets = list(accumulate(map(len, new_seq), initial=0))
+    else:
+        old_seq = oldline
+        new_seq = newline
+        old_offsets = None
+        new_offsets = None
+
     # Use the SequenceMatcher directly. It seems to give us better results
     # for this. We should investigate steps to move to the new differ.
-    differ = SequenceMatcher(None, oldline, newline)
+    differ = SequenceMatcher(None, old_seq, new_seq)
 
     # This thresholds our results -- we don't want to show inter-line diffs
     # if most of the line has changed, unless those lines are very short.
@@ -1677,7 +2527,18 @@ def get_line_changed_regions(oldline, newline):
     # FIXME: just a plain, linear threshold is pretty crummy here.  Short
     # changes in a short line get lost.  I haven't yet thought of a fancy
     # nonlinear test.
-    if differ.ratio() < 0.6:
+    if old_offsets is None:
+        ratio = differ.ratio()
+    else:
+        # Weigh matching tokens by their length, so this is comparable to
+        # the ratio for characters.
+        matched = sum(
+            old_offsets[i + size] - old_offsets[i]
+            for i, j, size in differ.get_matching_blocks()
+        )
+        ratio = 2.0 * matched / (old_len + new_len)
+
+    if ratio < 0.6:
         return None, None
 
     oldchanges = []
@@ -1685,6 +2546,12 @@ def get_line_changed_regions(oldline, newline):
     back = (0, 0)
 
     for tag, i1, i2, j1, j2 in differ.get_opcodes():
+        if old_offsets is not None:
+            i1 = old_offsets[i1]
+            i2 = old_offsets[i2]
+            j1 = new_offsets[j1]
+            j2 = new_offsets[j2]
+
         if tag == 'equal':
             if (i2 - i1 < 3) or (j2 - j1 < 3):
                 back = (j2 - j1, i2 - i1)
@@ -1706,7 +2573,7 @@ def get_line_changed_regions(oldline, newline):
 
         back = (0, 0)
 
-    return oldchanges, newchanges
+    return tuple(oldchanges), tuple(newchanges)
 
 
 def get_sorted_filediffs(filediffs, key=None):
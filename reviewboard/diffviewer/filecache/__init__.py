@@ -0,0 +1,28 @@
+"""Content-addressed caching of original and patched file contents.
+
+Version Added:
+    6.0
+"""
+
+from __future__ import annotations
+
+from typing import cast
+
+from djblets.registries.importer import lazy_import_registry
+
+from reviewboard.diffviewer.filecache.registry import \
+    FileContentCacheBackendRegistry
+
+
+#: The registry managing available file content cache backends.
+#:
+#: Version Added:
+#:     6.0
+#:
+#: Type:
+#:     reviewboard.diffviewer.filecache.registry.
+#:     FileContentCacheBackendRegistry
+file_content_cache_backend_registry = cast(
+    FileContentCacheBackendRegistry,
+    lazy_import_registry('reviewboard.diffviewer.filecache.registry',
+                         'FileContentCacheBackendRegistry'))
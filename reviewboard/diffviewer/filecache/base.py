@@ -0,0 +1,114 @@
+"""Base support for file content cache backends.
+
+Version Added:
+    6.0
+"""
+
+from __future__ import annotations
+
+import re
+from typing import Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from djblets.util.typing import StrOrPromise
+
+
+_SHA256_RE = re.compile(r'^[0-9a-f]{64}$')
+
+
+def is_valid_sha256(
+    sha256: object,
+) -> bool:
+    """Return whether a value is a valid hex-encoded SHA256.
+
+    Backends must check this before using a SHA256 to address any content,
+    since it may be used to build paths or cache keys.
+
+    Version Added:
+        6.0
+
+    Args:
+        sha256 (object):
+            The value to check.
+
+    Returns:
+        bool:
+        ``True`` if this is a lowercase, hex-encoded SHA256.
+    """
+    return isinstance(sha256, str) and _SHA256_RE.match(sha256) is not None
+
+
+class BaseFileContentCacheBackend:
+    """Base class for a file content cache backend.
+
+    File content cache backends store the normalized contents of original
+    and patched files, keyed by the SHA256 of the contents. Since the
+    contents are addressed by their checksum, any number of FileDiffs,
+    interdiffs, and review requests that reference the same file contents
+    can share a single entry.
+
+    Backends are free to decline to store any contents (for instance, if
+    they're too large), and to evict contents at any time. They must ignore
+    any SHA256 that fails :py:func:`is_valid_sha256`.
+
+    Subclasses must implement the following attributes:
+
+    * :py:attr:`backend_id`
+    * :py:attr:`name`
+
+    And the following methods:
+
+    * :py:meth:`get_file_content`
+    * :py:meth:`set_file_content`
+
+    Version Added:
+        6.0
+    """
+
+    #: The ID of this cache backend.
+    #:
+    #: This must be provided by subclasses, and must be unique.
+    #:
+    #: Type:
+    #:     str
+    backend_id: Optional[str] = None
+
+    #: The display name of the cache backend.
+    #:
+    #: This must be provided by subclasses.
+    #:
+    #: Type:
+    #:     str
+    name: Optional[StrOrPromise] = ''
+
+    def get_file_content(
+        self,
+        sha256: str,
+    ) -> Optional[bytes]:
+        """Return the file contents with the given SHA256.
+
+        Args:
+            sha256 (str):
+                The hex-encoded SHA256 of the file contents.
+
+        Returns:
+            bytes:
+            The file contents, or ``None`` if they were not in the cache.
+        """
+        raise NotImplementedError
+
+    def set_file_content(
+        self,
+        sha256: str,
+        content: bytes,
+    ) -> None:
+        """Store file contents in the cache.
+
+        Args:
+            sha256 (str):
+                The hex-encoded SHA256 of the file contents.
+
+            content (bytes):
+                The file contents to store.
+        """
+        raise NotImplementedError
@@ -0,0 +1,92 @@
+"""A file content cache backend using the Django cache.
+
+Version Added:
+    6.0
+"""
+
+from __future__ import annotations
+
+from typing import Optional
+
+from django.core.cache import cache
+from django.utils.translation import gettext_lazy as _
+from djblets.cache.backend import CACHE_CHUNK_SIZE, make_cache_key
+
+from reviewboard.diffviewer.filecache.base import (
+    BaseFileContentCacheBackend,
+    is_valid_sha256)
+
+
+class CacheFileContentCacheBackend(BaseFileContentCacheBackend):
+    """A file content cache backend storing contents in the Django cache.
+
+    Memcached won't store items larger than its slab size, so files larger
+    than :py:attr:`max_content_size` are not cached by this backend. The
+    local disk backend can be used to cache larger files.
+
+    Version Added:
+        6.0
+    """
+
+    backend_id = 'cache'
+    name = _('Cache server')
+
+    #: The maximum size of file contents to store.
+    #:
+    #: Type:
+    #:     int
+    max_content_size = CACHE_CHUNK_SIZE
+
+    def get_file_content(
+        self,
+        sha256: str,
+    ) -> Optional[bytes]:
+        """Return the file contents with the given SHA256.
+
+        Args:
+            sha256 (str):
+                The hex-encoded SHA256 of the file contents.
+
+        Returns:
+            bytes:
+            The file contents, or ``None`` if they were not in the cache.
+        """
+        if not is_valid_sha256(sha256):
+            return None
+
+        return cache.get(self._make_cache_key(sha256))
+
+    def set_file_content(
+        self,
+        sha256: str,
+        content: bytes,
+    ) -> None:
+        """Store file contents in the cache.
+
+        Contents larger than :py:attr:`max_content_size` will be skipped.
+
+        Args:
+            sha256 (str):
+                The hex-encoded SHA256 of the file contents.
+
+            content (bytes):
+                The file contents to store.
+        """
+        if is_valid_sha256(sha256) and len(content) <= self.max_content_size:
+            cache.set(self._make_cache_key(sha256), content)
+
+    def _make_cache_key(
+        self,
+        sha256: str,
+    ) -> str:
+        """Return the cache key for file contents.
+
+        Args:
+            sha256 (str):
+                The hex-encoded SHA256 of the file contents.
+
+        Returns:
+            str:
+            The cache key.
+        """
+        return make_cache_key('diff-file-content-%s' % sha256)
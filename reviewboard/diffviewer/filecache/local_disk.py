@@ -0,0 +1,343 @@
+"""A file content cache backend storing contents on the local disk.
+
+Version Added:
+    6.0
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import tempfile
+import threading
+from typing import Dict, List, Optional, Tuple
+
+from django.conf import settings
+from django.utils.translation import gettext_lazy as _
+from djblets.siteconfig.models import SiteConfiguration
+
+from reviewboard.diffviewer.filecache.base import (
+    BaseFileContentCacheBackend,
+    is_valid_sha256)
+
+
+logger = logging.getLogger(__name__)
+
+
+class LocalDiskFileContentCacheBackend(BaseFileContentCacheBackend):
+    """A file content cache backend storing contents on the local disk.
+
+    Contents are stored as files in the directory set in the
+    ``diffviewer_file_cache_path`` site configuration setting (defaulting to
+    a directory in the site's data directory), grouped into subdirectories
+    by the first two characters of the SHA256.
+
+    The total size of the cache is bounded by the
+    ``diffviewer_file_cache_max_size`` setting. When this is exceeded, the
+    least-recently used files are evicted. File modification times are
+    updated on each read in order to track usage.
+
+    This has no limit on the size of individual files (aside from the total
+    size of the cache), making it a good choice for installs with large
+    files.
+
+    Version Added:
+        6.0
+    """
+
+    backend_id = 'local-disk'
+    name = _('Local disk')
+
+    #: The fraction of the maximum size to evict down to.
+    #:
+    #: Evicting below the maximum size prevents every new entry from
+    #: triggering another eviction pass.
+    #:
+    #: Type:
+    #:     float
+    EVICT_TO_RATIO = 0.9
+
+    def __init__(self) -> None:
+        """Initialize the backend."""
+        self._lock = threading.Lock()
+
+        # A mapping of cache directories to the total size of their
+        # contents. This is populated on first write, and re-synced with
+        # the filesystem on each eviction pass, since other processes may
+        # be writing to the same directory.
+        self._total_sizes: Dict[str, int] = {}
+
+    def get_cache_dir(self) -> str:
+        """Return the directory used to store file contents.
+
+        Returns:
+            str:
+            The absolute path to the cache directory.
+        """
+        siteconfig = SiteConfiguration.objects.get_current()
+
+        return (siteconfig.get('diffviewer_file_cache_path') or
+                os.path.join(settings.SITE_DATA_DIR, 'diff-file-cache'))
+
+    def get_max_size(self) -> int:
+        """Return the maximum total size of the cache.
+
+        Returns:
+            int:
+            The maximum size in bytes.
+        """
+        siteconfig = SiteConfiguration.objects.get_current()
+
+        return siteconfig.get('diffviewer_file_cache_max_size')
+
+    def get_file_content(
+        self,
+        sha256: str,
+    ) -> Optional[bytes]:
+        """Return the file contents with the given SHA256.
+
+        The contents will be verified against the checksum, in order to
+        guard against partially-written or corrupted files.
+
+        Args:
+            sha256 (str):
+                The hex-encoded SHA256 of the file contents.
+
+        Returns:
+            bytes:
+            The file contents, or ``None`` if they were not in the cache.
+        """
+        path = self._get_content_path(self.get_cache_dir(), sha256)
+
+        if path is None:
+            return None
+
+        try:
+            with open(path, 'rb') as fp:
+                content = fp.read()
+
+            # Mark this as recently used.
+            os.utime(path)
+        except OSError:
+            return None
+
+        if hashlib.sha256(content).hexdigest() != sha256:
+            logger.warning('Removing corrupt cached file contents at %s',
+                           path)
+
+            try:
+                os.unlink(path)
+            except OSError:
+                pass
+
+            return None
+
+        return content
+
+    def set_file_content(
+        self,
+        sha256: str,
+        content: bytes,
+    ) -> None:
+        """Store file contents in the cache.
+
+        Contents larger than the maximum size of the cache will be skipped.
+        If storing the contents exceeds the maximum size, the least-recently
+        used files will be evicted.
+
+        Args:
+            sha256 (str):
+                The hex-encoded SHA256 of the file contents.
+
+            content (bytes):
+                The file contents to store.
+        """
+        cache_dir = self.get_cache_dir()
+        max_size = self.get_max_size()
+        size = len(content)
+
+        if size > max_size:
+            return
+
+        path = self._get_content_path(cache_dir, sha256)
+
+        if path is None or os.path.exists(path):
+            return
+
+        content_dir = os.path.dirname(path)
+
+        try:
+            os.makedirs(content_dir, exist_ok=True)
+
+            # Write to a temporary file first and then move it into place,
+            # so that readers never see a partial file.
+            fd, temp_path = tempfile.mkstemp(dir=content_dir,
+                                             prefix='.tmp-')
+
+            try:
+                with os.fdopen(fd, 'wb') as fp:
+                    fp.write(content)
+
+                os.replace(temp_path, path)
+            except Exception:
+                os.unlink(temp_path)
+                raise
+        except OSError as e:
+            logger.error('Unable to write cached file contents to %s: %s',
+                         path, e)
+            return
+
+        with self._lock:
+            try:
+                total_size = self._total_sizes[cache_dir] + size
+            except KeyError:
+                total_size = self._get_entries_size(cache_dir)
+
+            if total_size > max_size:
+                total_size = self._evict(cache_dir,
+                                         int(max_size * self.EVICT_TO_RATIO))
+
+            self._total_sizes[cache_dir] = total_size
+
+    def _get_content_path(
+        self,
+        cache_dir: str,
+        sha256: str,
+    ) -> Optional[str]:
+        """Return the path to the file storing contents.
+
+        The SHA256 is validated before building the path, and the resulting
+        path is checked to be within the cache directory, so that contents
+        are never read, written, or removed elsewhere on the filesystem.
+
+        Args:
+            cache_dir (str):
+                The cache directory.
+
+            sha256 (str):
+                The hex-encoded SHA256 of the file contents.
+
+        Returns:
+            str:
+            The path to the file, or ``None`` if the SHA256 is invalid.
+        """
+        if not is_valid_sha256(sha256):
+            logger.warning('Ignoring invalid SHA256 %r for the file content '
+                           'cache',
+                           sha256)
+            return None
+
+        cache_dir = os.path.realpath(cache_dir)
+        path = os.path.join(cache_dir, sha256[:2], sha256)
+
+        real_path = os.path.realpath(path)
+
+        if os.path.commonpath([cache_dir, real_path]) != cache_dir:
+            logger.warning('Ignoring file content cache path %s outside of '
+                           '%s',
+                           path, cache_dir)
+            return None
+
+        return path
+
+    def _get_entries(
+        self,
+        cache_dir: str,
+    ) -> List[Tuple[float, int, str]]:
+        """Return all entries in the cache.
+
+        Args:
+            cache_dir (str):
+                The cache directory.
+
+        Returns:
+            list of tuple:
+            A list of ``(mtime, size, path)`` tuples for each stored file.
+        """
+        entries: List[Tuple[float, int, str]] = []
+
+        try:
+            subdirs = list(os.scandir(cache_dir))
+        except OSError:
+            return entries
+
+        for subdir in subdirs:
+            if not subdir.is_dir():
+                continue
+
+            try:
+                for entry in os.scandir(subdir.path):
+                    if entry.name.startswith('.'):
+                        continue
+
+                    try:
+                        stat = entry.stat()
+                    except OSError:
+                        # It was likely evicted by another process.
+                        continue
+
+                    entries.append((stat.st_mtime, stat.st_size,
+                                    entry.path))
+            except OSError:
+                continue
+
+        return entries
+
+    def _get_entries_size(
+        self,
+        cache_dir: str,
+    ) -> int:
+        """Return the total size of all entries in the cache.
+
+        Args:
+            cache_dir (str):
+                The cache directory.
+
+        Returns:
+            int:
+            The total size in bytes.
+        """
+        return sum(
+            size
+            for mtime, size, path in self._get_entries(cache_dir)
+        )
+
+    def _evict(
+        self,
+        cache_dir: str,
+        target_size: int,
+    ) -> int:
+        """Evict the least-recently used entries from the cache.
+
+        Args:
+            cache_dir (str):
+                The cache directory.
+
+            target_size (int):
+                The total size to evict down to.
+
+        Returns:
+            int:
+            The new total size of the cache.
+        """
+        entries = self._get_entries(cache_dir)
+        entries.sort()
+        total_size = sum(
+            size
+            for mtime, size, path in entries
+        )
+
+        for mtime, size, path in entries:
+            if total_size <= target_size:
+                break
+
+            try:
+                os.unlink(path)
+            except OSError:
+                # It was likely evicted by another process.
+                pass
+
+            total_size -= size
+
+        return total_size
@@ -0,0 +1,92 @@
+"""File content cache backend registry.
+
+Version Added:
+    6.0
+"""
+
+from __future__ import annotations
+
+from typing import Iterator, Optional
+
+from django.utils.translation import gettext_lazy as _
+from djblets.registries.registry import (ALREADY_REGISTERED,
+                                         NOT_REGISTERED)
+from djblets.siteconfig.models import SiteConfiguration
+
+from reviewboard.diffviewer.filecache.base import BaseFileContentCacheBackend
+from reviewboard.registries.registry import Registry
+
+
+class FileContentCacheBackendRegistry(
+    Registry[BaseFileContentCacheBackend]
+):
+    """Registry for managing file content cache backends.
+
+    By default, this includes backends for the Django cache and the local
+    disk. Extensions can register additional backends, which can then be
+    activated through the ``diffviewer_file_cache_backend`` site
+    configuration setting.
+
+    Version Added:
+        6.0
+    """
+
+    lookup_attrs = ('backend_id',)
+
+    errors = {
+        ALREADY_REGISTERED: _(
+            '"%(item)s" is already a registered file content cache backend.'
+        ),
+        NOT_REGISTERED: _(
+            '"%(attr_value)s" is not a registered file content cache '
+            'backend.'
+        ),
+    }
+
+    @property
+    def current_backend(self) -> Optional[BaseFileContentCacheBackend]:
+        """The currently-configured file content cache backend.
+
+        This will be ``None`` if caching of file contents is disabled.
+
+        Type:
+            BaseFileContentCacheBackend
+        """
+        siteconfig = SiteConfiguration.objects.get_current()
+        backend_id = siteconfig.get('diffviewer_file_cache_backend')
+
+        if not backend_id:
+            return None
+
+        return self.get_backend(backend_id)
+
+    def get_backend(
+        self,
+        backend_id: str,
+    ) -> Optional[BaseFileContentCacheBackend]:
+        """Return a cache backend with the given ID.
+
+        Args:
+            backend_id (str):
+                The ID of the cache backend.
+
+        Returns:
+            BaseFileContentCacheBackend:
+            The cache backend, or ``None`` if not found.
+        """
+        return self.get('backend_id', backend_id)
+
+    def get_defaults(self) -> Iterator[BaseFileContentCacheBackend]:
+        """Return the default cache backends.
+
+        Yields:
+            BaseFileContentCacheBackend:
+            Each default cache backend.
+        """
+        from reviewboard.diffviewer.filecache.cache_backend import \
+            CacheFileContentCacheBackend
+        from reviewboard.diffviewer.filecache.local_disk import \
+            LocalDiskFileContentCacheBackend
+
+        yield CacheFileContentCacheBackend()
+        yield LocalDiskFileContentCacheBackend()
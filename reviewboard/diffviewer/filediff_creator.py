@@ -1,11 +1,15 @@
 """Utilities for creating FileDiffs."""
 
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from copy import deepcopy
 from functools import cmp_to_key
 
+from django.db import connections
 from django.utils.encoding import force_bytes, force_str
 from django.utils.translation import gettext as _
+from djblets.siteconfig.models import SiteConfiguration
 from djblets.util.compat.python.past import cmp
 
 from reviewboard.diffviewer.errors import EmptyDiffError
@@ -83,9 +87,19 @@ def create_filediffs(diff_file_contents, parent_diff_file_contents,
         The created FileDiffs.
 
         If ``validate_only`` is ``True``, the returned list will be empty.
+
+    Version Changed:
+        6.0:
+        * The diff data for all files is now stored in bulk, through
+          :py:meth:`RawFileDiffDataManager.get_or_create_many_from_data()
+          <reviewboard.diffviewer.managers.RawFileDiffDataManager.
+          get_or_create_many_from_data>`, rather than one file at a time.
+        * ``get_file_exists`` may now be called for several files at once,
+          from other threads, based on the
+          ``diffviewer_file_exists_max_workers`` site configuration setting.
     """
     from reviewboard.diffviewer.diffutils import convert_to_unicode
-    from reviewboard.diffviewer.models import FileDiff
+    from reviewboard.diffviewer.models import FileDiff, RawFileDiffData
 
     diff_info = _prepare_diff_info(
         diff_file_contents=diff_file_contents,
@@ -141,6 +155,7 @@ def create_filediffs(diff_file_contents, parent_diff_file_contents,
 
     # Convert the list of parsed files into FileDiffs.
     filediffs = []
+    parent_diffs = []
 
     for f in diff_info['files']:
         parent_file = None
@@ -256,18 +271,42 @@ def create_filediffs(diff_file_contents, parent_diff_file_contents,
         filediff.old_unix_mode = f.old_unix_mode
         filediff.new_unix_mode = f.new_unix_mode
 
-        if not validate_only:
-            # This state all requires making modifications to the database.
-            # We only want to do this if we're saving.
-            filediff.diff = f.data
-            filediff.parent_diff = parent_content
-
-            filediff.set_line_counts(raw_insert_count=f.insert_count,
-                                     raw_delete_count=f.delete_count)
-
         filediffs.append(filediff)
+        parent_diffs.append(parent_content)
 
     if not validate_only:
+        # Store the diff data for all files (and their parent diffs) at
+        # once. Line counts are stored only for the main diffs.
+        files = diff_info['files']
+        parent_diff_indexes = [
+            i
+            for i, parent_diff in enumerate(parent_diffs)
+            if parent_diff
+        ]
+
+        raw_fdds = RawFileDiffData.objects.get_or_create_many_from_data(
+            [f.data for f in files] + [
+                parent_diffs[i]
+                for i in parent_diff_indexes
+            ],
+            line_counts=[
+                (f.insert_count, f.delete_count)
+                for f in files
+            ] + [None] * len(parent_diff_indexes))
+
+        for f, filediff, raw_fdd in zip(files, filediffs, raw_fdds):
+            filediff.diff_hash = raw_fdd
+            filediff.diff64 = b''
+            filediff.extra_data.update({
+                'raw_insert_count': f.insert_count,
+                'raw_delete_count': f.delete_count,
+            })
+
+        for i, raw_fdd in zip(parent_diff_indexes, raw_fdds[len(files):]):
+            filediff = filediffs[i]
+            filediff.parent_diff_hash = raw_fdd
+            filediff.parent_diff64 = b''
+
         FileDiff.objects.bulk_create(filediffs)
 
         if diffset.extra_data:
@@ -436,6 +475,14 @@ def _process_files(parsed_diff, basedir, repository, base_commit_id,
                    limit_to=None):
     """Collect metadata about files in the parser.
 
+    All existence checks are made before any files are yielded, and may be
+    made concurrently (see :py:func:`_check_files_exist`). If any files do
+    not exist, the error for the first of those files is raised.
+
+    Version Changed:
+        6.0:
+        Existence checks are now made for all files up-front.
+
     Args:
         parsed_diff (reviewboard.diffviewer.parser.ParsedDiff):
             The parsed diff to process.
@@ -486,6 +533,8 @@ def _process_files(parsed_diff, basedir, repository, base_commit_id,
     basedir = force_bytes(basedir)
 
     parsed_change = parsed_diff.changes[0]
+    files = []
+    lookups = []
 
     for f in parsed_change.files:
         # This will either be a Revision or bytes. Either way, convert it
@@ -521,28 +570,169 @@ def _process_files(parsed_diff, basedir, repository, base_commit_id,
             not f.deleted and
             not f.moved and
             not f.copied):
-            context = FileLookupContext(
-                request=request,
-                base_commit_id=base_commit_id,
-                diff_extra_data=parsed_diff.extra_data,
-                commit_extra_data=parsed_change.extra_data,
-                file_extra_data=f.extra_data)
-
-            if not get_file_exists(path=force_str(source_filename),
-                                   revision=force_str(source_revision),
-                                   context=context):
-                raise FileNotFoundError(path=force_str(source_filename),
-                                        revision=force_str(source_revision),
-                                        base_commit_id=base_commit_id,
-                                        context=context)
+            lookups.append({
+                'path': force_str(source_filename),
+                'revision': force_str(source_revision),
+                'context': FileLookupContext(
+                    request=request,
+                    base_commit_id=base_commit_id,
+                    diff_extra_data=parsed_diff.extra_data,
+                    commit_extra_data=parsed_change.extra_data,
+                    file_extra_data=f.extra_data),
+            })
+            lookup_index = len(lookups) - 1
+        else:
+            lookup_index = None
 
         f.orig_filename = source_filename
         f.orig_file_details = source_revision
         f.modified_filename = dest_filename
 
+        files.append((f, lookup_index))
+
+    if lookups:
+        exists_results = _check_files_exist(lookups, get_file_exists)
+    else:
+        exists_results = []
+
+    for f, lookup_index in files:
+        if lookup_index is not None:
+            exists = exists_results[lookup_index]
+
+            if isinstance(exists, Exception):
+                raise exists
+            elif not exists:
+                lookup = lookups[lookup_index]
+
+                raise FileNotFoundError(path=lookup['path'],
+                                        revision=lookup['revision'],
+                                        base_commit_id=base_commit_id,
+                                        context=lookup['context'])
+
         yield f
 
 
+def _check_files_exist(lookups, get_file_exists, max_workers=None):
+    """Check whether files exist in the repository.
+
+    Checks for several files can be made at once by passing
+    ``max_workers``, or by setting the
+    ``diffviewer_file_exists_max_workers`` site configuration setting.
+    This is useful for repositories backed by hosting services, where each
+    check is a separate HTTP request. The results of each check are cached
+    by :py:meth:`Repository.get_file_exists
+    <reviewboard.scmtools.models.Repository.get_file_exists>` as normal.
+
+    Once a file is found to be missing (or fails to be checked), files
+    later in the list are no longer checked. Files earlier in the list are
+    always checked, so the first failure in the list is always reported,
+    regardless of the order in which the checks finish.
+
+    Version Added:
+        6.0
+
+    Args:
+        lookups (list of dict):
+            The lookups to perform. Each is a dictionary of keyword arguments
+            for ``get_file_exists``.
+
+        get_file_exists (callable):
+            The callable used to determine if a file exists in the
+            repository.
+
+        max_workers (int, optional):
+            The maximum number of files to check at once.
+
+            If not provided, this will use the
+            ``diffviewer_file_exists_max_workers`` site configuration
+            setting. A value of 1 checks one file at a time, on the calling
+            thread.
+
+    Returns:
+        list:
+        The result for each lookup, in the same order as ``lookups``. Each
+        is a boolean indicating whether the file exists, or the exception
+        raised while checking the file. Results for files after the first
+        failure may be ``None``.
+    """
+    if max_workers is None:
+        siteconfig = SiteConfiguration.objects.get_current()
+        max_workers = siteconfig.get('diffviewer_file_exists_max_workers')
+
+    max_workers = min(max_workers, len(lookups))
+    results = [None] * len(lookups)
+
+    if max_workers <= 1:
+        for i, lookup in enumerate(lookups):
+            try:
+                results[i] = get_file_exists(**lookup)
+            except Exception as e:
+                results[i] = e
+
+            if not _is_file_exists_success(results[i]):
+                break
+
+        return results
+
+    pending = iter(enumerate(lookups))
+    lock = threading.Lock()
+    first_failure = len(lookups)
+
+    def _worker():
+        nonlocal first_failure
+
+        try:
+            while True:
+                with lock:
+                    try:
+                        i, lookup = next(pending)
+                    except StopIteration:
+                        break
+
+                    if i > first_failure:
+                        # An earlier file has already failed. Nothing
+                        # after it needs to be checked.
+                        break
+
+                try:
+                    result = get_file_exists(**lookup)
+                except Exception as e:
+                    result = e
+
+                results[i] = result
+
+                if not _is_file_exists_success(result):
+                    with lock:
+                        first_failure = min(first_failure, i)
+        finally:
+            connections.close_all()
+
+    with ThreadPoolExecutor(max_workers=max_workers,
+                            thread_name_prefix='rb-file-exists') as executor:
+        for i in range(max_workers):
+            executor.submit(_worker)
+
+    return results
+
+
+def _is_file_exists_success(result):
+    """Return whether a file existence check succeeded.
+
+    Version Added:
+        6.0
+
+    Args:
+        result (object):
+            The result from the check. This is either the value returned
+            from the check or the exception raised.
+
+    Returns:
+        bool:
+        ``True`` if the file was found to exist.
+    """
+    return bool(result) and not isinstance(result, Exception)
+
+
 def _compare_files(file1, file2):
     """Compare two files to determine a relative sort order.
 
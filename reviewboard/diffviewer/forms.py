@@ -10,7 +10,7 @@ from django.utils.translation import gettext, gettext_lazy as _
 
 from reviewboard.diffviewer.commit_utils import (deserialize_validation_info,
                                                  get_file_exists_in_history)
-from reviewboard.diffviewer.differ import DiffCompatVersion
+from reviewboard.diffviewer.differ import get_default_diff_compat_version
 from reviewboard.diffviewer.diffutils import check_diff_size
 from reviewboard.diffviewer.filediff_creator import create_filediffs
 from reviewboard.diffviewer.models import DiffCommit, DiffSet
@@ -467,7 +467,7 @@ class ValidateCommitForm(BaseCommitValidationForm):
                           revision=0,
                           basedir='',
                           repository=self.repository,
-                          diffcompat=DiffCompatVersion.DEFAULT,
+                          diffcompat=get_default_diff_compat_version(),
                           base_commit_id=base_commit_id)
 
         get_file_exists = partial(get_file_exists_in_history,
@@ -0,0 +1,331 @@
+"""A histogram diff algorithm, based on the one used by Git.
+
+Version Added:
+    6.0
+"""
+
+from bisect import bisect_left
+from collections import Counter
+
+from reviewboard.diffviewer.myersdiff import (ArrayMyersDiffer,
+                                              _get_common_prefix_len,
+                                              _get_common_suffix_len)
+
+
+class HistogramDiffer(ArrayMyersDiffer):
+    """An implementation of the histogram diff algorithm.
+
+    This is an extension of the patience diff algorithm, modeled after the
+    one used by Git. For each range being compared, it looks for the longest
+    common region of lines anchored on the lines that appear the fewest
+    number of times in the original file, and then recurses into the ranges
+    before and after that region.
+
+    When a range contains lines that appear exactly once in both files,
+    all of those lines are used as anchors at once (taking the longest
+    increasing sequence of them, as in patience diff), which lets large files
+    with many unique lines be split up in roughly linear time.
+
+    Anchoring on rare lines means that common lines (blank lines, closing
+    braces, and so on) won't cause spurious matches when code is reordered.
+
+    If a range only has lines that appear too many times to be used as
+    anchors, the Myers algorithm will be used for that range.
+
+    Once the changed lines have been found, the same post-processing used by
+    :py:class:`~reviewboard.diffviewer.myersdiff.MyersDiffer` is used to
+    shift and join chunks, and opcodes are generated in the same form.
+
+    This is used for
+    :py:attr:`~reviewboard.diffviewer.differ.DiffCompatVersion.HISTOGRAM`.
+
+    Version Added:
+        6.0
+    """
+
+    #: The maximum number of occurrences of a line for use as an anchor.
+    #:
+    #: Ranges containing only lines that appear more often than this will
+    #: be diffed using the Myers algorithm.
+    MAX_CHAIN_LENGTH = 64
+
+    def _gen_diff_data(self):
+        """Generate all the diff data needed to return opcodes.
+
+        This is only called once during the lifetime of the differ.
+        """
+        if self.a_data and self.b_data:
+            return
+
+        a_data = self.DiffData(self._gen_diff_codes(self.a, False))
+        b_data = self.DiffData(self._gen_diff_codes(self.b, True))
+        self.a_data = a_data
+        self.b_data = b_data
+
+        # Set up the state needed for the Myers fallback. No lines are
+        # discarded, so the undiscarded lines map directly to real indexes.
+        for data in (a_data, b_data):
+            data.undiscarded = data.data.tolist()
+            data.real_indexes = list(range(data.length))
+            data.undiscarded_lines = data.length
+
+        self.max_lines = a_data.length + b_data.length + 3
+        self.fdiag = [0] * self.max_lines
+        self.bdiag = [0] * self.max_lines
+        self.downoff = self.upoff = b_data.length + 1
+
+        self._histogram_diff()
+        self._shift_chunks(a_data, b_data)
+        self._shift_chunks(b_data, a_data)
+
+    def _histogram_diff(self):
+        """Mark all modified lines using the histogram algorithm.
+
+        This processes ranges using an explicit stack, in order to avoid
+        hitting recursion limits on large files.
+        """
+        a = self.a_data.undiscarded
+        b = self.b_data.undiscarded
+        a_modified = self.a_data.modified
+        b_modified = self.b_data.modified
+        time_budget = self.time_budget
+        ranges = [(0, self.a_data.length, 0, self.b_data.length)]
+
+        while ranges:
+            a_lower, a_upper, b_lower, b_upper = ranges.pop()
+
+            # Skip past any equal lines at the start and end of the range.
+            n = _get_common_prefix_len(a, a_lower, a_upper,
+                                       b, b_lower, b_upper)
+            a_lower += n
+            b_lower += n
+
+            n = _get_common_suffix_len(a, a_lower, a_upper,
+                                       b, b_lower, b_upper)
+            a_upper -= n
+            b_upper -= n
+
+            if a_lower == a_upper or b_lower == b_upper:
+                # Only inserted or deleted lines remain.
+                for i in range(a_lower, a_upper):
+                    a_modified[i] = True
+
+                for i in range(b_lower, b_upper):
+                    b_modified[i] = True
+
+                continue
+
+            if time_budget is not None and time_budget.expired:
+                # We've run out of time. Treat the rest of this range as
+                # changed.
+                self._simplify_range(a_lower, a_upper, b_lower, b_upper)
+                continue
+
+            anchors = self._find_unique_anchors(a_lower, a_upper,
+                                                b_lower, b_upper)
+
+            if anchors:
+                # Diff the ranges between each of the anchors. These are
+                # pushed in reverse order so they're processed in order.
+                a_end = a_upper
+                b_end = b_upper
+
+                for i, j in reversed(anchors):
+                    ranges.append((i + 1, a_end, j + 1, b_end))
+                    a_end = i
+                    b_end = j
+
+                ranges.append((a_lower, a_end, b_lower, b_end))
+                continue
+
+            region = self._find_lcs_region(a_lower, a_upper,
+                                           b_lower, b_upper)
+
+            if region is None:
+                # There were no usable anchors, since every common line
+                # appeared too many times. Fall back on Myers.
+                self._lcs(a_lower, a_upper, b_lower, b_upper, False)
+            elif region is False:
+                # There are no lines in common.
+                for i in range(a_lower, a_upper):
+                    a_modified[i] = True
+
+                for i in range(b_lower, b_upper):
+                    b_modified[i] = True
+            else:
+                a_start, a_end, b_start, b_end = region
+
+                # Process the range before the region first, by pushing it
+                # last.
+                ranges.append((a_end, a_upper, b_end, b_upper))
+                ranges.append((a_lower, a_start, b_lower, b_start))
+
+    def _find_unique_anchors(self, a_lower, a_upper, b_lower, b_upper):
+        """Return anchors for lines that are unique in both ranges.
+
+        This finds all lines that appear exactly once in each range, and
+        returns the longest sequence of them that appear in the same order in
+        both ranges.
+
+        Args:
+            a_lower (int):
+                The lower bound of the range in the original file.
+
+            a_upper (int):
+                The upper bound of the range in the original file.
+
+            b_lower (int):
+                The lower bound of the range in the modified file.
+
+            b_upper (int):
+                The upper bound of the range in the modified file.
+
+        Returns:
+            list of tuple:
+            A list of ``(a_index, b_index)`` tuples for each anchor, in order.
+            This will be empty if there are no unique lines in common.
+        """
+        a = self.a_data.undiscarded
+        b = self.b_data.undiscarded
+        a_counts = Counter(a[a_lower:a_upper])
+        b_counts = Counter(b[b_lower:b_upper])
+
+        a_unique = {
+            code: i
+            for i, code in enumerate(a[a_lower:a_upper], a_lower)
+            if a_counts[code] == 1 and b_counts[code] == 1
+        }
+
+        if not a_unique:
+            return []
+
+        # Pair up the unique lines in the order they appear in the modified
+        # range.
+        pairs = [
+            (a_unique[code], j)
+            for j, code in enumerate(b[b_lower:b_upper], b_lower)
+            if code in a_unique
+        ]
+
+        # Find the longest increasing sequence of original line indexes,
+        # using patience sorting.
+        tails = []
+        tail_indexes = []
+        prev_indexes = [-1] * len(pairs)
+
+        for index, (i, j) in enumerate(pairs):
+            pos = bisect_left(tails, i)
+
+            if pos > 0:
+                prev_indexes[index] = tail_indexes[pos - 1]
+
+            if pos == len(tails):
+                tails.append(i)
+                tail_indexes.append(index)
+            else:
+                tails[pos] = i
+                tail_indexes[pos] = index
+
+        anchors = []
+        index = tail_indexes[-1]
+
+        while index != -1:
+            anchors.append(pairs[index])
+            index = prev_indexes[index]
+
+        anchors.reverse()
+
+        return anchors
+
+    def _find_lcs_region(self, a_lower, a_upper, b_lower, b_upper):
+        """Return the best common region to split a range on.
+
+        The best region is the longest region of equal lines anchored on
+        the lines with the fewest occurrences in the original range.
+
+        Args:
+            a_lower (int):
+                The lower bound of the range in the original file.
+
+            a_upper (int):
+                The upper bound of the range in the original file.
+
+            b_lower (int):
+                The lower bound of the range in the modified file.
+
+            b_upper (int):
+                The upper bound of the range in the modified file.
+
+        Returns:
+            object:
+            A 4-tuple of ``(a_start, a_end, b_start, b_end)`` for the best
+            region, ``False`` if there are no lines in common, or ``None`` if
+            all common lines appeared too many times to be used as anchors.
+        """
+        a = self.a_data.undiscarded
+        b = self.b_data.undiscarded
+        max_chain_length = self.MAX_CHAIN_LENGTH
+
+        # Build the histogram of lines in the original range.
+        positions = {}
+
+        for i in range(a_lower, a_upper):
+            code = a[i]
+
+            try:
+                positions[code].append(i)
+            except KeyError:
+                positions[code] = [i]
+
+        counts = {
+            code: len(code_positions)
+            for code, code_positions in positions.items()
+        }
+        best_region = None
+        best_len = 0
+        best_count = max_chain_length
+        has_common = False
+        j = b_lower
+
+        while j < b_upper:
+            code_positions = positions.get(b[j])
+            next_j = j + 1
+
+            if code_positions is not None:
+                has_common = True
+
+                if len(code_positions) <= best_count:
+                    for i in code_positions:
+                        # Extend the region backward and forward as long as
+                        # the lines match.
+                        n = _get_common_suffix_len(a, a_lower, i,
+                                                   b, b_lower, j)
+                        a_start = i - n
+                        b_start = j - n
+
+                        n = _get_common_prefix_len(a, i, a_upper,
+                                                   b, j, b_upper)
+                        a_end = i + n
+                        b_end = j + n
+
+                        # Find the lowest number of occurrences of any line
+                        # in the region.
+                        count = min(map(counts.__getitem__,
+                                        a[a_start:a_end]))
+                        region_len = a_end - a_start
+
+                        if region_len > best_len or count < best_count:
+                            best_region = (a_start, a_end, b_start, b_end)
+                            best_len = region_len
+                            best_count = count
+
+                        next_j = max(next_j, b_end)
+
+            j = next_j
+
+        if best_region is not None:
+            return best_region
+        elif has_common:
+            return None
+        else:
+            return False
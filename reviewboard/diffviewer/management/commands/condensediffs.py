@@ -5,10 +5,13 @@ from datetime import datetime, timedelta
 
 from django.conf import settings
 from django.contrib.humanize.templatetags.humanize import intcomma
-from django.core.management.base import BaseCommand
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
 from django.utils.translation import gettext as _, ngettext_lazy as N_
 
-from reviewboard.diffviewer.models import FileDiff
+from reviewboard.diffviewer.compression import \
+    diff_compression_codec_registry
+from reviewboard.diffviewer.models import FileDiff, RawFileDiffData
 
 
 class Command(BaseCommand):
@@ -65,6 +68,58 @@ class Command(BaseCommand):
             help=_("The maximum number of migrations to perform. This is "
                    "useful if you have a lot of diffs to migrate and want "
                    "to do it over several sessions."))
+        parser.add_argument(
+            '--workers',
+            action='store',
+            dest='workers',
+            type=int,
+            default=1,
+            help=_("The number of processes to migrate diffs with. Diffs "
+                   "will be split up by ID, and each process will migrate "
+                   "one range of diffs at a time."))
+        parser.add_argument(
+            '--checkpoint',
+            action='store',
+            dest='checkpoint_path',
+            default=None,
+            help=_("The path to a file used to record progress after "
+                   "each batch of diffs is migrated when using --workers. "
+                   "If stopped, running this again with the same file will "
+                   "pick up where it left off."))
+        parser.add_argument(
+            '--recompress',
+            action='store_true',
+            dest='recompress',
+            default=False,
+            help=_("Recompress stored diffs using the configured diff "
+                   "compression codec and level, rather than migrating "
+                   "diffs. This can be stopped and run again to continue "
+                   "where it left off."))
+        parser.add_argument(
+            '--codec',
+            action='store',
+            dest='codec',
+            default=None,
+            help=_("The ID of the codec to use with --recompress, instead "
+                   "of the configured codec (for example, \"B\" for "
+                   "BZip2, \"Z\" for zlib, or \"S\" for Zstandard)."))
+        parser.add_argument(
+            '--level',
+            action='store',
+            dest='level',
+            type=int,
+            default=None,
+            help=_("The compression level to use with --recompress, "
+                   "instead of the configured level."))
+        parser.add_argument(
+            '--start-id',
+            action='store',
+            dest='start_id',
+            type=int,
+            default=None,
+            help=_("The ID of the first stored diff to recompress. This "
+                   "can be used to skip past diffs processed in a previous "
+                   "run with --recompress."))
 
     def handle(self, **options):
         """Handle the command.
@@ -79,6 +134,22 @@ class Command(BaseCommand):
         """
         self.show_progress = options['show_progress']
         max_diffs = options['max_diffs']
+        workers = options['workers']
+
+        if workers < 1:
+            raise CommandError(_('--workers must be at least 1.'))
+        elif workers > 1 and connection.vendor == 'sqlite':
+            # SQLite only allows one process to write at a time.
+            raise CommandError(_('--workers cannot be used with SQLite '
+                                 'databases.'))
+
+        if options['recompress']:
+            self._recompress(codec_id=options['codec'],
+                             level=options['level'],
+                             max_diffs=max_diffs,
+                             start_pk=options['start_id'],
+                             show_counts=options['show_counts'])
+            return
 
         if options['show_counts']:
             counts = FileDiff.objects.get_migration_counts()
@@ -131,9 +202,12 @@ class Command(BaseCommand):
         self.prev_time_remaining_s = ''
         self.show_remaining = False
 
-        info = FileDiff.objects.migrate_all(batch_done_cb=self._on_batch_done,
-                                            counts=counts,
-                                            max_diffs=max_diffs)
+        info = FileDiff.objects.migrate_all(
+            batch_done_cb=self._on_batch_done,
+            counts=counts,
+            max_diffs=max_diffs,
+            workers=workers,
+            checkpoint_path=options['checkpoint_path'])
 
         if info['diffs_migrated'] == 0:
             self.stdout.write(_('All diffs have already been migrated.\n'))
@@ -153,7 +227,143 @@ class Command(BaseCommand):
                                     float(old_diff_size) * 100),
                 })
 
-    def _on_batch_done(self, total_diffs_migrated, total_count=None, **kwargs):
+    def _recompress(self, codec_id, level, max_diffs, start_pk,
+                    show_counts):
+        """Recompress stored diffs.
+
+        Version Added:
+            6.0
+
+        Args:
+            codec_id (str):
+                The ID of the codec to recompress with, or ``None`` to use
+                the configured codec.
+
+            level (int):
+                The compression level, or ``None`` to use the configured
+                level (or the codec's default level, if ``codec_id`` is
+                provided).
+
+            max_diffs (int):
+                The maximum number of diffs to recompress, or ``None``.
+
+            start_pk (int):
+                The ID of the first diff to recompress, or ``None``.
+
+            show_counts (bool):
+                Whether to only show the number of diffs to recompress.
+
+        Raises:
+            django.core.management.CommandError:
+                The codec was not found or is not available.
+        """
+        if codec_id is None:
+            codec = diff_compression_codec_registry.current_codec
+
+            if level is None:
+                level = diff_compression_codec_registry.current_level
+        else:
+            codec = diff_compression_codec_registry.get_codec(codec_id)
+
+            if codec is None or not codec.is_available():
+                raise CommandError(
+                    _('The diff compression codec "%s" is not available.')
+                    % codec_id)
+
+        if show_counts or self.show_progress:
+            total_count = RawFileDiffData.objects.get_recompression_count(
+                codec=codec,
+                start_pk=start_pk)
+        else:
+            total_count = None
+
+        if show_counts:
+            self.stdout.write(
+                _('%(count)d diffs to recompress using %(codec)s\n')
+                % {
+                    'count': total_count,
+                    'codec': codec.name,
+                })
+            return
+        elif total_count == 0:
+            self.stdout.write(_('All diffs have already been '
+                                'recompressed.\n'))
+            return
+
+        if total_count is None:
+            self.stdout.write(_('Recompressing all diffs using '
+                                '%(codec)s...\n')
+                              % {'codec': codec.name})
+        else:
+            if max_diffs is not None:
+                total_count = min(total_count, max_diffs)
+
+            self.stdout.write(
+                _('Recompressing %(count)d diffs using %(codec)s...\n')
+                % {
+                    'count': total_count,
+                    'codec': codec.name,
+                })
+
+        self.stdout.write(_(
+          '\n'
+          'This may take a while. It is safe to continue using '
+          'Review Board while this is\n'
+          'processing. If stopped, this can be run again to continue where '
+          'it left off.\n'
+          '\n'))
+
+        # Don't allow queries to be stored.
+        settings.DEBUG = False
+
+        self.start_time = datetime.now()
+        self.prev_prefix_len = 0
+        self.prev_time_remaining_s = ''
+        self.show_remaining = False
+        self.last_pk = None
+
+        try:
+            info = RawFileDiffData.objects.recompress_all(
+                codec=codec,
+                level=level,
+                batch_done_cb=self._on_batch_done,
+                total_count=total_count,
+                max_diffs=max_diffs,
+                start_pk=start_pk)
+        except KeyboardInterrupt:
+            if self.last_pk is not None:
+                self.stdout.write(
+                    _('\n'
+                      '\n'
+                      'Stopped. Run this again with --start-id=%s to '
+                      'continue.\n')
+                    % (self.last_pk + 1))
+
+            raise
+
+        if info['diffs_migrated'] == 0:
+            self.stdout.write(_('All diffs have already been '
+                                'recompressed.\n'))
+        else:
+            old_diff_size = info['old_diff_size']
+            new_diff_size = info['new_diff_size']
+
+            self.stdout.write(
+                _('\n'
+                  '\n'
+                  'Recompressed %(count)d stored diffs from %(old_size)s '
+                  'bytes to %(new_size)s bytes (%(savings_pct)0.2f%% '
+                  'savings)\n')
+                % {
+                    'count': info['diffs_migrated'],
+                    'old_size': intcomma(old_diff_size),
+                    'new_size': intcomma(new_diff_size),
+                    'savings_pct': (float(old_diff_size - new_diff_size) /
+                                    float(old_diff_size or 1) * 100),
+                })
+
+    def _on_batch_done(self, total_diffs_migrated, total_count=None,
+                       last_pk=None, **kwargs):
         """Handler for when a batch of diffs are processed.
 
         This will report the progress of the operation, showing the estimated
@@ -169,9 +379,17 @@ class Command(BaseCommand):
                 may be ``None``, in which case the output won't contain
                 progress and time estimation.
 
+            last_pk (int, optional):
+                The ID of the last diff processed, when recompressing.
+
+                Version Added:
+                    6.0
+
             **kwargs (dict, unused):
                 Unused keyword arguments.
         """
+        self.last_pk = last_pk
+
         # NOTE: We use sys.stdout when writing instead of self.stderr in order
         #       to control newlines. Command.stderr will force a \n for each
         #       write.
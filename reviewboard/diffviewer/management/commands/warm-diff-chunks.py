@@ -0,0 +1,169 @@
+"""Management command to pre-generate diff chunks for open review requests.
+
+Version Added:
+    6.0
+"""
+
+from __future__ import annotations
+
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from typing import Optional
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+from django.utils import timezone
+from django.utils.translation import gettext as _
+
+from reviewboard.diffviewer.chunk_warmup import warm_diffset_history_chunks
+from reviewboard.diffviewer.settings import DiffSettings
+from reviewboard.reviews.models import ReviewRequest
+from reviewboard.site.models import LocalSite
+
+
+class Command(BaseCommand):
+    """Management command to pre-generate diff chunks.
+
+    This generates and caches the chunks for the latest diff (and the
+    interdiff from the previous diff) on open review requests, so they
+    display quickly for the next reviewer. This can be used to fill the
+    cache after clearing it or upgrading.
+
+    Version Added:
+        6.0
+    """
+
+    help = _(
+        'Pre-generate and cache diffs for open review requests, so they '
+        'display quickly for reviewers.'
+    )
+
+    def add_arguments(
+        self,
+        parser: argparse.ArgumentParser,
+    ) -> None:
+        """Add arguments to the command.
+
+        Args:
+            parser (argparse.ArgumentParser):
+                The argument parser for the command.
+        """
+        parser.add_argument(
+            '--num-days',
+            type=int,
+            help=_(
+                'Only generate diffs for review requests updated in this '
+                'many days. Defaults to all open review requests.'
+            ))
+        parser.add_argument(
+            '--review-request-id',
+            type=int,
+            action='append',
+            dest='review_request_ids',
+            metavar='ID',
+            help=_(
+                'The ID of a review request to generate diffs for. This can '
+                'be specified multiple times. Defaults to all open review '
+                'requests.'
+            ))
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=1,
+            help=_(
+                'The number of review requests to generate diffs for at '
+                'once. Defaults to 1.'
+            ))
+
+    def handle(
+        self,
+        **options,
+    ) -> None:
+        """Handle the command.
+
+        Args:
+            **options (dict):
+                Options parsed on the command line.
+
+        Raises:
+            django.core.management.CommandError:
+                There was an error with the provided options.
+        """
+        num_days: Optional[int] = options['num_days']
+        review_request_ids: Optional[list[int]] = \
+            options['review_request_ids']
+        workers: int = options['workers']
+
+        if workers < 1:
+            raise CommandError(_('--workers must be 1 or higher.'))
+
+        queryset = (
+            ReviewRequest.objects
+            .filter(public=True,
+                    status=ReviewRequest.PENDING_REVIEW,
+                    repository__isnull=False,
+                    diffset_history__isnull=False)
+            .order_by('-last_updated')
+        )
+
+        if review_request_ids:
+            queryset = queryset.filter(pk__in=review_request_ids)
+
+        if num_days is not None:
+            queryset = queryset.filter(
+                last_updated__gte=timezone.now() - timedelta(days=num_days))
+
+        review_requests = list(
+            queryset.values_list('pk', 'diffset_history', 'local_site'))
+
+        self.stdout.write(
+            _('Generating diffs for %d review requests...')
+            % len(review_requests))
+
+        local_sites = {
+            local_site.pk: local_site
+            for local_site in LocalSite.objects.filter(
+                pk__in={
+                    local_site_id
+                    for _id, _history_id, local_site_id in review_requests
+                    if local_site_id is not None
+                })
+        }
+
+        def _warm(review_request_id, diffset_history_id, local_site_id):
+            try:
+                return warm_diffset_history_chunks(
+                    diffset_history_id,
+                    diff_settings=DiffSettings.create(
+                        local_site=local_sites.get(local_site_id)))
+            finally:
+                if workers > 1:
+                    # Close any database connections opened by the worker
+                    # thread.
+                    connections.close_all()
+
+        total_processed = 0
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            if workers > 1:
+                results = executor.map(lambda args: _warm(*args),
+                                       review_requests)
+            else:
+                results = (
+                    _warm(*args)
+                    for args in review_requests
+                )
+
+            for (review_request_id, *args), num_processed in \
+                    zip(review_requests, results):
+                self.stdout.write(
+                    _('Review request #%(id)s: generated %(count)d files')
+                    % {
+                        'count': num_processed,
+                        'id': review_request_id,
+                    })
+                total_processed += num_processed
+
+        self.stdout.write(
+            _('Generated diffs for %d files.') % total_processed)
@@ -1,19 +1,30 @@
 """Managers for reviewboard.diffviewer.models."""
 
-import bz2
 import gc
 import hashlib
+import json
 import logging
+import multiprocessing
+import os
+import queue
+import tempfile
+import time
+from concurrent.futures import (FIRST_COMPLETED, ProcessPoolExecutor,
+                                wait as wait_futures)
 from functools import partial
 
+import django
 from django.conf import settings
-from django.db import models, reset_queries, connection, connections
-from django.db.models import Count, Q
-from django.db.utils import IntegrityError
+from django.db import (models, reset_queries, connection, connections,
+                       transaction)
+from django.db.models import Count, Max, Min, Q
+from django.db.utils import IntegrityError, OperationalError
 from django.utils.translation import gettext as _
 
 from reviewboard.diffviewer.commit_utils import get_file_exists_in_history
-from reviewboard.diffviewer.differ import DiffCompatVersion
+from reviewboard.diffviewer.compression import \
+    diff_compression_codec_registry
+from reviewboard.diffviewer.differ import get_default_diff_compat_version
 from reviewboard.diffviewer.diffutils import check_diff_size
 from reviewboard.diffviewer.filediff_creator import create_filediffs
 
@@ -21,6 +32,30 @@ from reviewboard.diffviewer.filediff_creator import create_filediffs
 logger = logging.getLogger(__name__)
 
 
+def _migrate_filediff_partition(**kwargs):
+    """Migrate diff content in one partition of a migration.
+
+    This is run in worker processes by
+    :py:meth:`FileDiffManager.migrate_all`, and must be a module-level
+    function in order to be sent to those processes.
+
+    Version Added:
+        6.0
+
+    Args:
+        **kwargs (dict):
+            Keyword arguments for
+            :py:meth:`FileDiffManager._migrate_partition`.
+
+    Returns:
+        tuple:
+        The result from :py:meth:`FileDiffManager._migrate_partition`.
+    """
+    from reviewboard.diffviewer.models import FileDiff
+
+    return FileDiff.objects._migrate_partition(**kwargs)
+
+
 class FileDiffManager(models.Manager):
     """A manager for FileDiff objects.
 
@@ -30,6 +65,53 @@ class FileDiffManager(models.Manager):
 
     MIGRATE_OBJECT_LIMIT = 200
 
+    #: The default number of FileDiff IDs in each partition of a migration.
+    #:
+    #: This is used when migrating with multiple worker processes.
+    #:
+    #: Version Added:
+    #:     6.0
+    #:
+    #: Type:
+    #:     int
+    MIGRATE_PARTITION_SIZE = 10_000
+
+    #: The boundaries of each partition of LegacyFileDiffData to migrate.
+    #:
+    #: LegacyFileDiffData are keyed by SHA1, so these split the entries
+    #: into partitions by the first character of the hash.
+    #:
+    #: Version Added:
+    #:     6.0
+    #:
+    #: Type:
+    #:     list of str
+    MIGRATE_LEGACY_PARTITION_BOUNDARIES = list('123456789abcdef')
+
+    #: The number of times to retry a batch of a migration.
+    #:
+    #: Each batch is migrated in its own transaction. If it fails due to a
+    #: database error (such as a deadlock or a conflicting write from another
+    #: worker), it will be rolled back and retried up to this many times.
+    #:
+    #: Version Added:
+    #:     6.0
+    #:
+    #: Type:
+    #:     int
+    MIGRATE_BATCH_RETRIES = 3
+
+    #: The number of seconds to wait before the first retry of a batch.
+    #:
+    #: This is multiplied by the attempt number for each further retry.
+    #:
+    #: Version Added:
+    #:     6.0
+    #:
+    #: Type:
+    #:     float
+    MIGRATE_BATCH_RETRY_DELAY = 0.5
+
     def unmigrated(self):
         """Query FileDiffs that store their own diff content.
 
@@ -146,15 +228,37 @@ class FileDiffManager(models.Manager):
         }
 
     def migrate_all(self, batch_done_cb=None, counts=None, batch_size=40,
-                    max_diffs=None):
+                    max_diffs=None, workers=1, partition_size=None,
+                    checkpoint_path=None):
         """Migrate diff content in FileDiffs to use RawFileDiffData.
 
         This will run through all unmigrated FileDiffs and migrate them,
         condensing their storage needs and removing the content from
         FileDiffs.
 
+        Each batch of objects is migrated in its own transaction, and is
+        retried (up to :py:attr:`MIGRATE_BATCH_RETRIES` times) if it fails
+        due to a database error.
+
+        If ``workers`` is greater than 1, the objects to migrate will be
+        split into partitions (by ranges of IDs), and each partition will be
+        migrated by a pool of worker processes. ``batch_done_cb`` will be
+        called with the combined totals from all workers each time a batch
+        finishes.
+
+        Progress can be recorded in a checkpoint file by passing
+        ``checkpoint_path``. This is updated after each batch. If the
+        migration is stopped, running it again with the same checkpoint file
+        will skip over completed partitions, and resume partially-migrated
+        partitions after their last migrated batch.
+
         This will return a dictionary with the result of the process.
 
+        Version Changed:
+            6.0:
+            Added the ``workers``, ``partition_size``, and
+            ``checkpoint_path`` arguments.
+
         Args:
             batch_done_cb (callable, optional):
                 A function to call after each batch of objects has been
@@ -185,6 +289,44 @@ class FileDiffManager(models.Manager):
 
             max_diffs (int, optional):
                 The maximum number of diffs to migrate.
+
+            workers (int, optional):
+                The number of worker processes to migrate with. A value of
+                1 migrates all objects in this process, one batch at a time.
+
+                Version Added:
+                    6.0
+
+            partition_size (int, optional):
+                The number of FileDiff IDs in each partition, when migrating
+                with multiple workers. This defaults to
+                :py:attr:`MIGRATE_PARTITION_SIZE`.
+
+                Version Added:
+                    6.0
+
+            checkpoint_path (str, optional):
+                The path to a file used to record progress, when migrating
+                with multiple workers.
+
+                Version Added:
+                    6.0
+
+        Returns:
+            dict:
+            A dictionary containing the following keys:
+
+            ``diffs_migrated`` (:py:class:`int`):
+                The number of diffs migrated.
+
+            ``old_diff_size`` (:py:class:`int`):
+                The size of the migrated diff data, before migration.
+
+            ``new_diff_size`` (:py:class:`int`):
+                The size of the migrated diff data, after migration.
+
+            ``bytes_saved`` (:py:class:`int`):
+                The number of bytes saved by the migration.
         """
         from reviewboard.diffviewer.models import LegacyFileDiffData
 
@@ -200,7 +342,7 @@ class FileDiffManager(models.Manager):
         if counts is not None:
             total_count = counts.get('total_count')
         else:
-            total_count = self.get_migration_counts()
+            total_count = self.get_migration_counts()['total_count']
 
         if max_diffs is not None:
             if total_count is None:
@@ -208,28 +350,41 @@ class FileDiffManager(models.Manager):
             else:
                 total_count = min(total_count, max_diffs)
 
-        migration_tasks = (
-            (self._migrate_filediffs, unmigrated_filediffs),
-            (self._migrate_legacy_fdd, legacy_data_items),
-        )
+        if workers > 1:
+            total_diffs_migrated, total_diff_size, total_bytes_saved = \
+                self._migrate_all_parallel(
+                    batch_done_cb=batch_done_cb,
+                    total_count=total_count,
+                    batch_size=batch_size,
+                    max_diffs=max_diffs,
+                    workers=workers,
+                    partition_size=(partition_size or
+                                    self.MIGRATE_PARTITION_SIZE),
+                    checkpoint_path=checkpoint_path)
+        else:
+            migration_tasks = (
+                (self._migrate_filediffs, unmigrated_filediffs),
+                (self._migrate_legacy_fdd, legacy_data_items),
+            )
 
-        for migrate_func, queryset in migration_tasks:
-            for batch_info in migrate_func(queryset=queryset,
-                                           batch_size=batch_size,
-                                           max_diffs=max_diffs):
-                total_diffs_migrated += batch_info[0]
-                total_diff_size += batch_info[1]
-                total_bytes_saved += batch_info[2]
+            for migrate_func, queryset in migration_tasks:
+                for batch_info in migrate_func(queryset=queryset,
+                                               batch_size=batch_size,
+                                               max_diffs=max_diffs):
+                    total_diffs_migrated += batch_info[0]
+                    total_diff_size += batch_info[1]
+                    total_bytes_saved += batch_info[2]
 
-                if batch_done_cb is not None:
-                    batch_done_cb(total_diffs_migrated=total_diffs_migrated,
-                                  total_count=total_count)
+                    if batch_done_cb is not None:
+                        batch_done_cb(
+                            total_diffs_migrated=total_diffs_migrated,
+                            total_count=total_count)
 
-                if max_diffs is not None:
-                    max_diffs -= batch_info[0]
+                    if max_diffs is not None:
+                        max_diffs -= batch_info[0]
 
-            if max_diffs is not None and max_diffs <= 0:
-                break
+                if max_diffs is not None and max_diffs <= 0:
+                    break
 
         # Call batch_done_cb one more time, using the finalized total count
         # which may differ from the original count due to a bad total row
@@ -245,6 +400,410 @@ class FileDiffManager(models.Manager):
             'bytes_saved': total_bytes_saved,
         }
 
+    def _migrate_all_parallel(self, batch_done_cb, total_count, batch_size,
+                              max_diffs, workers, partition_size,
+                              checkpoint_path):
+        """Migrate diff content using a pool of worker processes.
+
+        This is called by :py:meth:`migrate_all` when migrating with more
+        than one worker. Partitions are handed out to the workers as they
+        become free.
+
+        Workers report each batch once it's committed. The batch will then
+        be recorded in the checkpoint file (if any) and ``batch_done_cb``
+        will be called with the combined totals so far.
+
+        If any partition fails, no further partitions will be started. The
+        first error will be raised once the running partitions finish.
+
+        Version Added:
+            6.0
+
+        Args:
+            batch_done_cb (callable):
+                The function to call after each batch has been migrated.
+                This may be ``None``.
+
+            total_count (int):
+                The total number of objects being processed, for
+                ``batch_done_cb``. This may be ``None``.
+
+            batch_size (int):
+                The number of objects to process in each batch.
+
+            max_diffs (int):
+                The maximum number of diffs to migrate. This may be ``None``.
+
+            workers (int):
+                The number of worker processes to migrate with.
+
+            partition_size (int):
+                The number of FileDiff IDs in each partition.
+
+            checkpoint_path (str):
+                The path to the checkpoint file. This may be ``None``.
+
+        Returns:
+            tuple:
+            A 3-tuple containing the number of diffs migrated, the size of
+            the diff data before migration, and the number of bytes saved.
+
+        Raises:
+            Exception:
+                An error occurred while migrating a partition.
+        """
+        completed, last_pks = self._load_migration_checkpoint(checkpoint_path)
+        partitions = self._get_migration_partitions(partition_size)
+        pending = iter([
+            partition
+            for partition in partitions
+            if partition not in completed
+        ])
+
+        # Partitions that no longer have anything to migrate won't be
+        # listed, so there's no need to keep track of their progress.
+        last_pks = {
+            partition: last_pk
+            for partition, last_pk in last_pks.items()
+            if partition in partitions
+        }
+        running = {}
+        error = None
+        total_diffs_migrated = 0
+        total_diff_size = 0
+        total_bytes_saved = 0
+
+        def _start_partitions():
+            while len(running) < workers:
+                if max_diffs is None:
+                    remaining = None
+                else:
+                    # Each running partition may go on to migrate the rest
+                    # of the diffs it was given, so only hand out what's
+                    # left after those.
+                    remaining = max_diffs - total_diffs_migrated - sum(
+                        (partition_max_diffs -
+                         migrated_by_partition.get(partition, 0))
+                        for partition, partition_max_diffs in running.values()
+                    )
+
+                    if remaining <= 0:
+                        break
+
+                try:
+                    partition = next(pending)
+                except StopIteration:
+                    break
+
+                future = executor.submit(_migrate_filediff_partition,
+                                         partition=partition,
+                                         batch_size=batch_size,
+                                         max_diffs=remaining,
+                                         after_pk=last_pks.get(partition),
+                                         progress_queue=progress_queue)
+                running[future] = (partition, remaining)
+
+        def _process_progress():
+            nonlocal total_diffs_migrated, total_diff_size, total_bytes_saved
+
+            while True:
+                try:
+                    partition, last_pk, batch_info = \
+                        progress_queue.get_nowait()
+                except queue.Empty:
+                    break
+
+                total_diffs_migrated += batch_info[0]
+                total_diff_size += batch_info[1]
+                total_bytes_saved += batch_info[2]
+
+                migrated_by_partition[partition] = (
+                    migrated_by_partition.get(partition, 0) + batch_info[0])
+                last_pks[partition] = last_pk
+                self._save_migration_checkpoint(checkpoint_path, completed,
+                                                last_pks)
+
+                if batch_done_cb is not None:
+                    batch_done_cb(
+                        total_diffs_migrated=total_diffs_migrated,
+                        total_count=total_count)
+
+        migrated_by_partition = {}
+
+        # Workers report batches through a queue managed by a separate
+        # process, so that it can be sent to them along with each partition.
+        # This is started after the executor is created, so that it doesn't
+        # inherit any database connections.
+        with self._create_migration_executor(workers) as executor, \
+                multiprocessing.Manager() as manager:
+            progress_queue = manager.Queue()
+            _start_partitions()
+
+            while running:
+                done = wait_futures(running,
+                                    timeout=1,
+                                    return_when=FIRST_COMPLETED)[0]
+
+                # Batches are reported before a partition's future finishes,
+                # so these will always include the finished partitions.
+                _process_progress()
+
+                for future in done:
+                    partition, remaining = running.pop(future)
+
+                    try:
+                        num_diffs = future.result()[0]
+                    except Exception as e:
+                        logger.exception('Error migrating diffs in partition '
+                                         '%r: %s',
+                                         partition, e)
+
+                        if error is None:
+                            error = e
+
+                        continue
+
+                    if remaining is None or num_diffs < remaining:
+                        # Everything in this partition has been migrated.
+                        # (Otherwise, it was cut short by max_diffs.)
+                        completed.add(partition)
+                        last_pks.pop(partition, None)
+                        self._save_migration_checkpoint(checkpoint_path,
+                                                        completed, last_pks)
+
+                if done and error is None:
+                    _start_partitions()
+
+        if error is not None:
+            raise error
+
+        return total_diffs_migrated, total_diff_size, total_bytes_saved
+
+    def _migrate_partition(self, partition, batch_size, max_diffs=None,
+                           after_pk=None, progress_queue=None):
+        """Migrate diff content in one partition of a migration.
+
+        Objects are migrated in order of their IDs, with each batch in its
+        own transaction. Once a batch is committed, it will be reported to
+        ``progress_queue``.
+
+        Version Added:
+            6.0
+
+        Args:
+            partition (tuple):
+                The partition to migrate, from
+                :py:meth:`_get_migration_partitions`.
+
+            batch_size (int):
+                The number of objects to process in each batch.
+
+            max_diffs (int, optional):
+                The maximum number of diffs to migrate.
+
+            after_pk (object, optional):
+                The ID of the last object migrated in a previous run. Only
+                objects after this will be migrated.
+
+            progress_queue (queue.Queue, optional):
+                The queue to report each migrated batch to. Each item is a
+                3-tuple of the partition, the ID of the last object in the
+                batch, and a 3-tuple of the number of diffs migrated, the
+                size of the diff data before migration, and the number of
+                bytes saved.
+
+        Returns:
+            tuple:
+            A 3-tuple containing the number of diffs migrated, the size of
+            the diff data before migration, and the number of bytes saved.
+        """
+        from reviewboard.diffviewer.models import LegacyFileDiffData
+
+        partition_type, start, end = partition
+
+        if partition_type == 'filediffs':
+            migrate_func = self._migrate_filediffs
+            queryset = self.unmigrated()
+            pks_index = 3
+        else:
+            assert partition_type == 'legacy_file_diff_data'
+
+            migrate_func = self._migrate_legacy_fdd
+            queryset = LegacyFileDiffData.objects.all()
+            pks_index = 5
+
+        queryset = queryset.filter(pk__gte=start)
+
+        if end is not None:
+            queryset = queryset.filter(pk__lt=end)
+
+        if after_pk is not None:
+            queryset = queryset.filter(pk__gt=after_pk)
+
+        num_diffs = 0
+        diff_size = 0
+        bytes_saved = 0
+
+        for batch_info in migrate_func(queryset=queryset.order_by('pk'),
+                                       batch_size=batch_size,
+                                       max_diffs=max_diffs):
+            num_diffs += batch_info[0]
+            diff_size += batch_info[1]
+            bytes_saved += batch_info[2]
+
+            if progress_queue is not None and batch_info[pks_index]:
+                progress_queue.put((partition, max(batch_info[pks_index]),
+                                    batch_info[:3]))
+
+        return num_diffs, diff_size, bytes_saved
+
+    def _get_migration_partitions(self, partition_size):
+        """Return the partitions of objects to migrate.
+
+        FileDiffs are partitioned into ranges of ``partition_size`` IDs
+        (starting at multiples of ``partition_size``), and LegacyFileDiffData
+        into ranges of hashes.
+
+        Version Added:
+            6.0
+
+        Args:
+            partition_size (int):
+                The number of FileDiff IDs in each partition.
+
+        Returns:
+            list of tuple:
+            The partitions to migrate. Each is a 3-tuple of the type of
+            object (``filediffs`` or ``legacy_file_diff_data``), the first
+            ID in the partition, and the ID after the end of the partition
+            (or ``None``, for the last partition of LegacyFileDiffData).
+        """
+        from reviewboard.diffviewer.models import LegacyFileDiffData
+
+        partitions = []
+        id_range = self.unmigrated().aggregate(min_id=Min('pk'),
+                                               max_id=Max('pk'))
+
+        if id_range['min_id'] is not None:
+            # Partitions are aligned to multiples of the partition size, so
+            # that they stay the same as FileDiffs are migrated. This keeps
+            # any checkpoints valid across runs.
+            min_id = id_range['min_id']
+
+            partitions += [
+                ('filediffs', start, start + partition_size)
+                for start in range(min_id - min_id % partition_size,
+                                   id_range['max_id'] + 1,
+                                   partition_size)
+            ]
+
+        if LegacyFileDiffData.objects.exists():
+            boundaries = self.MIGRATE_LEGACY_PARTITION_BOUNDARIES
+
+            partitions += [
+                ('legacy_file_diff_data', start, end)
+                for start, end in zip([''] + boundaries, boundaries + [None])
+            ]
+
+        return partitions
+
+    def _create_migration_executor(self, workers):
+        """Return the executor used to migrate partitions.
+
+        Version Added:
+            6.0
+
+        Args:
+            workers (int):
+                The number of worker processes.
+
+        Returns:
+            concurrent.futures.Executor:
+            The executor.
+        """
+        # Database connections can't be shared with the worker processes.
+        # Close them so that each process opens its own.
+        connections.close_all()
+
+        return ProcessPoolExecutor(max_workers=workers,
+                                   initializer=django.setup)
+
+    def _load_migration_checkpoint(self, checkpoint_path):
+        """Return the progress recorded in a checkpoint file.
+
+        Version Added:
+            6.0
+
+        Args:
+            checkpoint_path (str):
+                The path to the checkpoint file. This may be ``None``.
+
+        Returns:
+            tuple:
+            A 2-tuple containing the set of completed partitions and a
+            dictionary mapping partially-migrated partitions to the ID of the
+            last object migrated in them. These will be empty if there's no
+            checkpoint file.
+        """
+        if not checkpoint_path or not os.path.exists(checkpoint_path):
+            return set(), {}
+
+        with open(checkpoint_path, 'r') as fp:
+            data = json.load(fp)
+
+        completed = {
+            tuple(partition)
+            for partition in data['completed']
+        }
+        last_pks = {
+            tuple(partition): last_pk
+            for partition, last_pk in data.get('last_pks', [])
+        }
+
+        return completed, last_pks
+
+    def _save_migration_checkpoint(self, checkpoint_path, completed,
+                                   last_pks):
+        """Record progress in a checkpoint file.
+
+        Version Added:
+            6.0
+
+        Args:
+            checkpoint_path (str):
+                The path to the checkpoint file. If ``None``, nothing will
+                be recorded.
+
+            completed (set of tuple):
+                The completed partitions.
+
+            last_pks (dict):
+                A dictionary mapping partially-migrated partitions to the ID
+                of the last object migrated in them.
+        """
+        if not checkpoint_path:
+            return
+
+        # Write to a temporary file first and then move it into place, so
+        # that the checkpoint is never left partially written.
+        fd, temp_path = tempfile.mkstemp(
+            dir=os.path.dirname(os.path.abspath(checkpoint_path)),
+            prefix='.tmp-')
+
+        try:
+            with os.fdopen(fd, 'w') as fp:
+                json.dump(
+                    {
+                        'completed': sorted(completed, key=repr),
+                        'last_pks': sorted(last_pks.items(), key=repr),
+                    },
+                    fp)
+
+            os.replace(temp_path, checkpoint_path)
+        except Exception:
+            os.unlink(temp_path)
+            raise
+
     def _migrate_legacy_fdd(self, queryset, batch_size,
                             max_diffs=None):
         """Migrate data from LegacyFileDiffData to RawFileDiffData.
@@ -257,6 +816,11 @@ class FileDiffManager(models.Manager):
         point to the new RawFileDiffData entry instead of the old
         LegacyFileDiffData.
 
+        Version Changed:
+            6.0:
+            Each batch is now migrated in its own transaction, and retried
+            on database errors.
+
         Args:
             queryset (django.db.models.query.QuerySet):
                 The queryset for retrieving
@@ -283,81 +847,114 @@ class FileDiffManager(models.Manager):
             6. A list of all legacy hashes that were migrated for diffs and
                parent diffs.
         """
-        from reviewboard.diffviewer.models import RawFileDiffData
-
-        cursor = connection.cursor()
-
         queryset = queryset.annotate(
             num_filediffs=Count('filediffs'),
             num_parent_filediffs=Count('parent_filediffs'))
 
-        for batch in self._iter_batches(queryset=queryset,
-                                        batch_size=batch_size,
-                                        max_diffs=max_diffs):
-            batch_total_diff_size = 0
-            batch_total_bytes_saved = 0
-            raw_fdds = []
-            all_diff_hashes = []
-            filediff_hashes = []
-            parent_filediff_hashes = []
+        yield from self._migrate_batches(
+            queryset=queryset,
+            batch_size=batch_size,
+            max_diffs=max_diffs,
+            migrate_batch_func=partial(self._migrate_legacy_fdd_batch,
+                                       queryset=queryset,
+                                       cursor=connection.cursor()))
 
-            for legacy_fdd in batch:
-                raw_fdd = RawFileDiffData.objects.create_from_legacy(
-                    legacy_fdd, save=False)
+    def _migrate_legacy_fdd_batch(self, batch, queryset, cursor):
+        """Migrate a batch of LegacyFileDiffData to RawFileDiffData.
 
-                raw_fdds.append(raw_fdd)
+        Version Added:
+            6.0
 
-                binary_hash = legacy_fdd.binary_hash
+        Args:
+            batch (list of reviewboard.diffviewer.models.LegacyFileDiffData):
+                The batch of objects to migrate.
+
+            queryset (django.db.models.query.QuerySet):
+                The queryset the batch was retrieved from.
 
-                old_diff_size = len(legacy_fdd.get_binary_base64())
-                batch_total_diff_size += old_diff_size
-                batch_total_bytes_saved += old_diff_size - len(raw_fdd.binary)
+            cursor (django.db.backends.utils.CursorWrapper):
+                The database cursor used to update FileDiffs.
 
-                # Update all associated FileDiffs to use the new objects
-                # instead of the old ones.
-                if legacy_fdd.num_filediffs > 0:
-                    filediff_hashes.append(binary_hash)
+        Returns:
+            tuple:
+            The information on the batch, as yielded by
+            :py:meth:`_migrate_legacy_fdd`.
+        """
+        from reviewboard.diffviewer.models import RawFileDiffData
 
-                if legacy_fdd.num_parent_filediffs > 0:
-                    parent_filediff_hashes.append(binary_hash)
+        batch_total_diff_size = 0
+        batch_total_bytes_saved = 0
+        raw_fdds = []
+        all_diff_hashes = []
+        filediff_hashes = []
+        parent_filediff_hashes = []
 
-                all_diff_hashes.append(binary_hash)
+        for legacy_fdd in batch:
+            raw_fdd = RawFileDiffData.objects.create_from_legacy(
+                legacy_fdd, save=False)
 
-            try:
-                # Attempt to create all the entries we want in one go.
+            raw_fdds.append(raw_fdd)
+
+            binary_hash = legacy_fdd.binary_hash
+
+            old_diff_size = len(legacy_fdd.get_binary_base64())
+            batch_total_diff_size += old_diff_size
+            batch_total_bytes_saved += old_diff_size - len(raw_fdd.binary)
+
+            # Update all associated FileDiffs to use the new objects
+            # instead of the old ones.
+            if legacy_fdd.num_filediffs > 0:
+                filediff_hashes.append(binary_hash)
+
+            if legacy_fdd.num_parent_filediffs > 0:
+                parent_filediff_hashes.append(binary_hash)
+
+            all_diff_hashes.append(binary_hash)
+
+        # These use savepoints, so that a conflict doesn't break the batch's
+        # transaction.
+        try:
+            # Attempt to create all the entries we want in one go.
+            with transaction.atomic():
                 RawFileDiffData.objects.bulk_create(raw_fdds)
-            except IntegrityError:
-                # One or more entries in the batch conflicted with an existing
-                # entry, meaning it was already created. We'll just need to
-                # operate on the contents of this batch one-by-one.
-                for raw_fdd in raw_fdds:
-                    try:
+        except IntegrityError:
+            # One or more entries in the batch conflicted with an existing
+            # entry, meaning it was already created. We'll just need to
+            # operate on the contents of this batch one-by-one.
+            for raw_fdd in raw_fdds:
+                try:
+                    with transaction.atomic():
                         raw_fdd.save()
-                    except IntegrityError:
-                        raw_fdd = RawFileDiffData.objects.get(
-                            binary_hash=raw_fdd.binary_hash)
+                except IntegrityError:
+                    raw_fdd = RawFileDiffData.objects.get(
+                        binary_hash=raw_fdd.binary_hash)
 
-                        # This was already in the database, so we didn't have
-                        # to write new data. That means we get to reclaim
-                        # its size in the amount of bytes saved.
-                        batch_total_bytes_saved += len(raw_fdd.binary)
+                    # This was already in the database, so we didn't have
+                    # to write new data. That means we get to reclaim
+                    # its size in the amount of bytes saved.
+                    batch_total_bytes_saved += len(raw_fdd.binary)
 
-            if filediff_hashes:
-                self._transition_hashes(cursor, 'diff_hash', filediff_hashes)
+        if filediff_hashes:
+            self._transition_hashes(cursor, 'diff_hash', filediff_hashes)
 
-            if parent_filediff_hashes:
-                self._transition_hashes(cursor, 'parent_diff_hash',
-                                        parent_filediff_hashes)
+        if parent_filediff_hashes:
+            self._transition_hashes(cursor, 'parent_diff_hash',
+                                    parent_filediff_hashes)
 
-            queryset.filter(pk__in=all_diff_hashes).delete()
+        queryset.filter(pk__in=all_diff_hashes).delete()
 
-            yield (len(batch), batch_total_diff_size,
-                   batch_total_bytes_saved, filediff_hashes,
-                   parent_filediff_hashes, all_diff_hashes)
+        return (len(batch), batch_total_diff_size, batch_total_bytes_saved,
+                filediff_hashes, parent_filediff_hashes, all_diff_hashes)
 
     def _migrate_filediffs(self, queryset, batch_size, max_diffs=None):
         """Migrate old diff data from a FileDiff into a RawFileDiffData.
 
+        Version Changed:
+            6.0:
+            Each batch is now migrated in its own transaction, and retried
+            on database errors. The IDs of the migrated FileDiffs are now
+            included in the yielded information.
+
         Args:
             queryset (django.db.models.query.QuerySet):
                 The queryset for retrieving
@@ -378,43 +975,135 @@ class FileDiffManager(models.Manager):
             2. The total number of bytes of diff data from the old legacy
                entries in this batch.
             3. The total number of bytes saved during this migration.
+            4. A list of the IDs of the FileDiffs that were migrated.
+        """
+        yield from self._migrate_batches(
+            queryset=queryset,
+            batch_size=batch_size,
+            max_diffs=max_diffs,
+            migrate_batch_func=self._migrate_filediff_batch)
+
+    def _migrate_filediff_batch(self, batch):
+        """Migrate old diff data from a batch of FileDiffs.
+
+        Version Added:
+            6.0
+
+        Args:
+            batch (list of reviewboard.diffviewer.models.FileDiff):
+                The batch of FileDiffs to migrate.
+
+        Returns:
+            tuple:
+            The information on the batch, as yielded by
+            :py:meth:`_migrate_filediffs`.
+        """
+        batch_total_diff_size = 0
+        batch_total_bytes_saved = 0
+
+        for filediff in batch:
+            diff_size = len(filediff.get_diff64_base64())
+            parent_diff_size = len(filediff.get_parent_diff64_base64())
+
+            batch_total_diff_size += diff_size + parent_diff_size
+
+            diff_hash_is_new, parent_diff_hash_is_new = \
+                filediff._migrate_diff_data(recalculate_counts=False)
+
+            if diff_size > 0:
+                batch_total_bytes_saved += diff_size
+
+                if diff_hash_is_new:
+                    # This is a new entry, so we have to subtract the
+                    # new storage size. This *could* be larger than the
+                    # original diff, but will usually be smaller.
+                    batch_total_bytes_saved -= \
+                        len(filediff.diff_hash.binary)
+
+            if parent_diff_size > 0:
+                batch_total_bytes_saved += parent_diff_size
+
+                if diff_hash_is_new:
+                    # This is a new entry, so we have to subtract the
+                    # new storage size. This *could* be larger than the
+                    # original diff, but will usually be smaller.
+                    batch_total_bytes_saved -= \
+                        len(filediff.parent_diff_hash.binary)
+
+        return (len(batch), batch_total_diff_size, batch_total_bytes_saved,
+                [filediff.pk for filediff in batch])
+
+    def _migrate_batches(self, queryset, batch_size, max_diffs,
+                         migrate_batch_func):
+        """Migrate batches of objects, each in its own transaction.
+
+        Committing each batch keeps locks short-lived, so that concurrent
+        workers and other users of the database aren't blocked for the
+        length of a migration.
+
+        If a batch fails due to a database error, its transaction will be
+        rolled back and the batch will be retried with freshly-fetched
+        objects, up to :py:attr:`MIGRATE_BATCH_RETRIES` times.
+
+        Version Added:
+            6.0
+
+        Args:
+            queryset (django.db.models.query.QuerySet):
+                The queryset for retrieving objects to migrate.
+
+            batch_size (int):
+                The number of objects to process in each batch.
+
+            max_diffs (int):
+                The maximum number of diffs to migrate. This may be ``None``,
+                in which case all diffs will be migrated.
+
+            migrate_batch_func (callable):
+                The function used to migrate a batch. This takes the list of
+                objects in the batch, and returns information on the batch.
+
+        Yields:
+            tuple:
+            The information on each batch returned by ``migrate_batch_func``.
+
+        Raises:
+            django.db.utils.DatabaseError:
+                A batch could not be migrated after all retries.
         """
         for batch in self._iter_batches(queryset=queryset,
                                         batch_size=batch_size,
                                         max_diffs=max_diffs):
-            batch_total_diff_size = 0
-            batch_total_bytes_saved = 0
-
-            for filediff in batch:
-                diff_size = len(filediff.get_diff64_base64())
-                parent_diff_size = len(filediff.get_parent_diff64_base64())
+            attempt = 0
 
-                batch_total_diff_size += diff_size + parent_diff_size
+            while True:
+                try:
+                    with transaction.atomic():
+                        batch_info = migrate_batch_func(batch)
 
-                diff_hash_is_new, parent_diff_hash_is_new = \
-                    filediff._migrate_diff_data(recalculate_counts=False)
+                    break
+                except (IntegrityError, OperationalError) as e:
+                    attempt += 1
 
-                if diff_size > 0:
-                    batch_total_bytes_saved += diff_size
+                    if attempt > self.MIGRATE_BATCH_RETRIES:
+                        raise
 
-                    if diff_hash_is_new:
-                        # This is a new entry, so we have to subtract the
-                        # new storage size. This *could* be larger than the
-                        # original diff, but will usually be smaller.
-                        batch_total_bytes_saved -= \
-                            len(filediff.diff_hash.binary)
+                    logger.warning('Error migrating a batch of %d diffs '
+                                   '(attempt %d of %d). Retrying: %s',
+                                   len(batch), attempt,
+                                   self.MIGRATE_BATCH_RETRIES + 1, e)
 
-                if parent_diff_size > 0:
-                    batch_total_bytes_saved += parent_diff_size
+                    time.sleep(self.MIGRATE_BATCH_RETRY_DELAY * attempt)
 
-                    if diff_hash_is_new:
-                        # This is a new entry, so we have to subtract the
-                        # new storage size. This *could* be larger than the
-                        # original diff, but will usually be smaller.
-                        batch_total_bytes_saved -= \
-                            len(filediff.parent_diff_hash.binary)
+                    # The objects may have been modified while migrating
+                    # them, or by whatever we conflicted with. Fetch them
+                    # again, skipping any that were migrated elsewhere.
+                    batch = list(queryset.filter(pk__in=[
+                        obj.pk
+                        for obj in batch
+                    ]))
 
-            yield len(batch), batch_total_diff_size, batch_total_bytes_saved
+            yield batch_info
 
     def _iter_batches(self, queryset, batch_size, max_diffs=None,
                       object_limit=MIGRATE_OBJECT_LIMIT):
@@ -591,17 +1280,67 @@ class RawFileDiffDataManager(models.Manager):
     This provides conveniences for creating an entry based on a
     LegacyFileDiffData object.
     """
-    def process_diff_data(self, data):
+
+    #: The number of entries to look up or create in each query.
+    #:
+    #: Version Added:
+    #:     6.0
+    #:
+    #: Type:
+    #:     int
+    BULK_BATCH_SIZE = 500
+
+    def process_diff_data(self, data, codec=None, level=None):
         """Processes a diff, returning the resulting content and compression.
 
         If the content would benefit from being compressed, this will
         return the compressed content and the value for the compression
         flag. Otherwise, it will return the raw content.
+
+        Version Changed:
+            6.0:
+            Added the ``codec`` and ``level`` arguments. By default, the
+            codec and level configured in the site configuration are now
+            used, rather than always using bzip2.
+
+        Args:
+            data (bytes):
+                The diff data to process.
+
+            codec (reviewboard.diffviewer.compression.base.
+                   BaseDiffCompressionCodec, optional):
+                The codec used to compress the data. This defaults to the
+                configured codec.
+
+                Version Added:
+                    6.0
+
+            level (int, optional):
+                The compression level. If ``codec`` is not provided, this
+                defaults to the configured level. Otherwise, it defaults to
+                the codec's default level.
+
+                Version Added:
+                    6.0
+
+        Returns:
+            tuple:
+            A 2-tuple containing:
+
+            1. The data to store (:py:class:`bytes`).
+            2. The value for the compression flag (:py:class:`str`), or
+               ``None`` if the data is not compressed.
         """
-        compressed_data = bz2.compress(data, 9)
+        if codec is None:
+            codec = diff_compression_codec_registry.current_codec
+
+            if level is None:
+                level = diff_compression_codec_registry.current_level
+
+        compressed_data = codec.compress(data, level)
 
         if len(compressed_data) < len(data):
-            return compressed_data, self.model.COMPRESSION_BZIP2
+            return compressed_data, codec.codec_id
         else:
             return data, None
 
@@ -636,6 +1375,118 @@ class RawFileDiffDataManager(models.Manager):
                 'compression': compression,
             })
 
+    def get_or_create_many_from_data(self, diffs, line_counts=None):
+        """Return or create stored entries for several diffs at once.
+
+        This performs the same work as :py:meth:`get_or_create_from_data`
+        for each diff, but in a fixed number of queries per batch rather
+        than per diff. All diffs are hashed up-front, existing entries are
+        loaded in bulk, and any missing entries are created in bulk.
+
+        If line counts are provided for a diff, they'll be stored on the
+        entry, updating any existing entries with differing counts.
+
+        Version Added:
+            6.0
+
+        Args:
+            diffs (list of bytes):
+                The diff data to store or return entries for.
+
+            line_counts (list of tuple, optional):
+                A list of ``(insert_count, delete_count)`` tuples for each
+                diff in ``diffs``. An item may be ``None`` if there are no
+                line counts for that diff.
+
+        Returns:
+            list of reviewboard.diffviewer.models.raw_file_diff_data.
+            RawFileDiffData:
+            The entries for each diff, in the same order as ``diffs``.
+
+        Raises:
+            TypeError:
+                The data passed in was not a bytes string.
+        """
+        if line_counts is None:
+            line_counts = [None] * len(diffs)
+
+        assert len(line_counts) == len(diffs)
+
+        # Hash all the diffs first, collapsing duplicates, so we only
+        # process each distinct diff once.
+        binary_hashes = []
+        diffs_by_hash = {}
+        line_counts_by_hash = {}
+
+        for data, data_line_counts in zip(diffs, line_counts):
+            if not isinstance(data, bytes):
+                raise TypeError(
+                    'RawFileDiffData.objects.get_or_create_many_from_data '
+                    'expects bytes values, not %s'
+                    % type(data))
+
+            binary_hash = self._hash_hexdigest(data)
+            binary_hashes.append(binary_hash)
+            diffs_by_hash[binary_hash] = data
+
+            if data_line_counts is not None:
+                line_counts_by_hash[binary_hash] = data_line_counts
+
+        all_hashes = list(diffs_by_hash.keys())
+        raw_fdds_by_hash = self._get_many_by_hash(all_hashes)
+
+        # Build any entries that don't yet exist. Another upload may be
+        # creating some of the same entries, so conflicts are ignored, and
+        # the new entries are then loaded in order to get their IDs on all
+        # databases.
+        new_raw_fdds = []
+
+        for binary_hash in all_hashes:
+            if binary_hash not in raw_fdds_by_hash:
+                processed_data, compression = \
+                    self.process_diff_data(diffs_by_hash[binary_hash])
+                raw_fdd = self.model(binary_hash=binary_hash,
+                                     binary=processed_data,
+                                     compression=compression,
+                                     extra_data={})
+
+                try:
+                    raw_fdd.insert_count, raw_fdd.delete_count = \
+                        line_counts_by_hash[binary_hash]
+                except KeyError:
+                    pass
+
+                new_raw_fdds.append(raw_fdd)
+
+        if new_raw_fdds:
+            self.bulk_create(new_raw_fdds,
+                             batch_size=self.BULK_BATCH_SIZE,
+                             ignore_conflicts=True)
+            raw_fdds_by_hash.update(self._get_many_by_hash([
+                raw_fdd.binary_hash
+                for raw_fdd in new_raw_fdds
+            ]))
+
+        # Update the line counts on any entries that are missing them or
+        # have differing counts.
+        for binary_hash, (insert_count, delete_count) in \
+                line_counts_by_hash.items():
+            raw_fdd = raw_fdds_by_hash[binary_hash]
+
+            if raw_fdd.extra_data is None:
+                raw_fdd.extra_data = {}
+
+            if (raw_fdd.insert_count != insert_count or
+                raw_fdd.delete_count != delete_count):
+                raw_fdd.insert_count = insert_count
+                raw_fdd.delete_count = delete_count
+                raw_fdd.save(update_fields=('extra_data',))
+
+        return [
+            raw_fdds_by_hash[binary_hash]
+            for binary_hash in binary_hashes
+        ]
+
     def create_from_legacy(self, legacy, save=True):
         processed_data, compression = self.process_diff_data(legacy.binary)
 
@@ -649,6 +1500,223 @@ class RawFileDiffDataManager(models.Manager):
 
         return raw_file_diff_data
 
+    def get_recompression_count(self, codec, start_pk=None):
+        """Return the number of entries needing to be recompressed.
+
+        Version Added:
+            6.0
+
+        Args:
+            codec (reviewboard.diffviewer.compression.base.
+                   BaseDiffCompressionCodec):
+                The codec that entries will be recompressed with.
+
+            start_pk (int, optional):
+                The ID of the first entry to consider.
+
+        Returns:
+            int:
+            The number of entries not yet compressed with the codec.
+        """
+        return self._get_recompression_queryset(codec, start_pk).count()
+
+    def recompress_all(self, codec=None, level=None, batch_done_cb=None,
+                       total_count=None, batch_size=100, max_diffs=None,
+                       start_pk=None):
+        """Recompress stored diff data using a codec.
+
+        This will go through every entry not already compressed with the
+        codec, in order of ID, decompressing and recompressing the data in
+        batches. Entries that don't benefit from compression will be stored
+        uncompressed.
+
+        Since entries already compressed with the codec are skipped, this
+        can be interrupted and run again to pick up where it left off.
+        ``start_pk`` can be used to skip entries already processed that are
+        stored uncompressed.
+
+        Version Added:
+            6.0
+
+        Args:
+            codec (reviewboard.diffviewer.compression.base.
+                   BaseDiffCompressionCodec, optional):
+                The codec to recompress with. This defaults to the
+                configured codec.
+
+            level (int, optional):
+                The compression level. If ``codec`` is not provided, this
+                defaults to the configured level. Otherwise, it defaults to
+                the codec's default level.
+
+            batch_done_cb (callable, optional):
+                A function to call after each batch of entries has been
+                processed. This can be used for progress notification.
+
+                This should be in the form of:
+
+                .. code-block:: python
+
+                   def on_batch_done(total_diffs_migrated=None,
+                                     total_count=None, last_pk=None,
+                                     **kwargs):
+                       ...
+
+                Note that ``total_count`` may be ``None``.
+
+            total_count (int, optional):
+                The total number of entries being processed, for reporting
+                to ``batch_done_cb``.
+
+            batch_size (int, optional):
+                The number of entries to process in each batch.
+
+            max_diffs (int, optional):
+                The maximum number of entries to process.
+
+            start_pk (int, optional):
+                The ID of the first entry to process.
+
+        Returns:
+            dict:
+            A dictionary containing the following keys:
+
+            ``diffs_migrated`` (:py:class:`int`):
+                The number of entries processed.
+
+            ``old_diff_size`` (:py:class:`int`):
+                The total stored size of the entries before processing.
+
+            ``new_diff_size`` (:py:class:`int`):
+                The total stored size of the entries after processing.
+
+            ``last_pk`` (:py:class:`int`):
+                The ID of the last entry processed, or ``None`` if no entries
+                were processed.
+        """
+        assert batch_done_cb is None or callable(batch_done_cb)
+
+        if codec is None:
+            codec = diff_compression_codec_registry.current_codec
+
+            if level is None:
+                level = diff_compression_codec_registry.current_level
+
+        queryset = self._get_recompression_queryset(codec)
+        total_diffs_migrated = 0
+        old_diff_size = 0
+        new_diff_size = 0
+        last_pk = None
+
+        if start_pk is not None:
+            # Entries are processed in order of ID, so continuing after the
+            # previous ID is the same as starting at the given ID.
+            last_pk = start_pk - 1
+
+        if max_diffs is not None and total_count is not None:
+            total_count = min(total_count, max_diffs)
+
+        while max_diffs is None or total_diffs_migrated < max_diffs:
+            if max_diffs is not None:
+                batch_size = min(batch_size, max_diffs - total_diffs_migrated)
+
+            batch_queryset = queryset
+
+            if last_pk is not None:
+                batch_queryset = batch_queryset.filter(pk__gt=last_pk)
+
+            raw_fdds = list(batch_queryset[:batch_size])
+
+            if not raw_fdds:
+                break
+
+            with transaction.atomic():
+                for raw_fdd in raw_fdds:
+                    old_data = bytes(raw_fdd.binary)
+                    new_data, compression = self.process_diff_data(
+                        raw_fdd.content,
+                        codec=codec,
+                        level=level)
+
+                    self.filter(pk=raw_fdd.pk).update(binary=new_data,
+                                                      compression=compression)
+
+                    old_diff_size += len(old_data)
+                    new_diff_size += len(new_data)
+
+            total_diffs_migrated += len(raw_fdds)
+            last_pk = raw_fdds[-1].pk
+
+            if batch_done_cb is not None:
+                batch_done_cb(total_diffs_migrated=total_diffs_migrated,
+                              total_count=total_count,
+                              last_pk=last_pk)
+
+        return {
+            'diffs_migrated': total_diffs_migrated,
+            'old_diff_size': old_diff_size,
+            'new_diff_size': new_diff_size,
+            'last_pk': last_pk,
+        }
+
+    def _get_recompression_queryset(self, codec, start_pk=None):
+        """Return a queryset for entries needing to be recompressed.
+
+        Version Added:
+            6.0
+
+        Args:
+            codec (reviewboard.diffviewer.compression.base.
+                   BaseDiffCompressionCodec):
+                The codec that entries will be recompressed with.
+
+            start_pk (int, optional):
+                The ID of the first entry to include.
+
+        Returns:
+            django.db.models.query.QuerySet:
+            The queryset of entries, ordered by ID.
+        """
+        queryset = (
+            self.exclude(compression=codec.codec_id)
+            .only('pk', 'binary', 'compression')
+            .order_by('pk')
+        )
+
+        if start_pk is not None:
+            queryset = queryset.filter(pk__gte=start_pk)
+
+        return queryset
+
+    def _get_many_by_hash(self, binary_hashes):
+        """Return entries matching a list of hashes.
+
+        The lookups are split into batches, in order to stay within query
+        parameter limits on all databases.
+
+        Version Added:
+            6.0
+
+        Args:
+            binary_hashes (list of str):
+                The hashes of the entries to return.
+
+        Returns:
+            dict:
+            A dictionary mapping hashes to entries. Hashes without an entry
+            will not be included.
+        """
+        batch_size = self.BULK_BATCH_SIZE
+        result = {}
+
+        for i in range(0, len(binary_hashes), batch_size):
+            batch_hashes = binary_hashes[i:i + batch_size]
+
+            for raw_fdd in self.filter(binary_hash__in=batch_hashes):
+                result[raw_fdd.binary_hash] = raw_fdd
+
+        return result
+
     def _hash_hexdigest(self, diff):
         hasher = hashlib.sha1()
         hasher.update(diff)
@@ -1048,7 +2116,7 @@ class DiffSetManager(BaseDiffManager):
             basedir=basedir,
             history=diffset_history,
             repository=repository,
-            diffcompat=DiffCompatVersion.DEFAULT,
+            diffcompat=get_default_diff_compat_version(),
             base_commit_id=base_commit_id)
 
         if not validate_only:
@@ -1101,5 +2169,5 @@ class DiffSetManager(BaseDiffManager):
             name='diff',
             history=diffset_history,
             repository=repository,
-            diffcompat=DiffCompatVersion.DEFAULT,
+            diffcompat=get_default_diff_compat_version(),
             **kwargs)
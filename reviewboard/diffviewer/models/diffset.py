@@ -6,6 +6,8 @@ from django.utils import timezone
 from django.utils.translation import gettext, gettext_lazy as _
 from djblets.db.fields import JSONField, RelationCounterField
 
+from reviewboard.diffviewer.commit_utils import (FileDiffAncestry,
+                                                 get_filediff_parent_ids)
 from reviewboard.diffviewer.filediff_creator import create_filediffs
 from reviewboard.diffviewer.diffutils import get_total_line_counts
 from reviewboard.diffviewer.managers import DiffSetManager
@@ -16,6 +18,7 @@ class DiffSet(models.Model):
     """A revisioned collection of FileDiffs."""
 
     _FINALIZED_COMMIT_SERIES_KEY = '__finalized_commit_series'
+    _FILEDIFF_PARENTS_KEY = '__filediff_parents'
 
     name = models.CharField(_('name'), max_length=256)
     revision = models.IntegerField(_('revision'))
@@ -63,6 +66,11 @@ class DiffSet(models.Model):
                                save=False):
         """Finalize the commit series represented by this DiffSet.
 
+        Version Changed:
+            6.0:
+            This now stores an index of the ancestry of the commit series'
+            FileDiffs. See :py:meth:`get_filediff_ancestry`.
+
         Args:
             cumulative_diff (bytes):
                 The cumulative diff of the entire commit series.
@@ -155,12 +163,72 @@ class DiffSet(models.Model):
             self.extra_data = {}
 
         self.extra_data[self._FINALIZED_COMMIT_SERIES_KEY] = True
+        self._store_filediff_parent_ids(get_filediff_parent_ids(
+            self.files.filter(commit_id__isnull=False)))
 
         if save:
             self.save(update_fields=('extra_data',))
 
         return filediffs
 
+    def get_filediff_ancestry(self, filediffs=None):
+        """Return the ancestry of the FileDiffs in the commit series.
+
+        For finalized commit series, the ancestry is indexed when the series
+        is finalized, and any commit range can then be looked up without
+        scanning all the FileDiffs. Older finalized commit series will have
+        the index stored the first time this is called.
+
+        Version Added:
+            6.0
+
+        Args:
+            filediffs (list of reviewboard.diffviewer.models.filediff.FileDiff,
+                       optional):
+                All the per-commit FileDiffs in this DiffSet. This defaults
+                to :py:attr:`per_commit_files`.
+
+        Returns:
+            reviewboard.diffviewer.commit_utils.FileDiffAncestry:
+            The ancestry of the FileDiffs.
+        """
+        if filediffs is None:
+            filediffs = self.per_commit_files
+
+        parent_ids = None
+
+        if self.is_commit_series_finalized:
+            stored_parent_ids = self.extra_data.get(self._FILEDIFF_PARENTS_KEY)
+
+            if stored_parent_ids is None:
+                parent_ids = get_filediff_parent_ids(filediffs)
+
+                if self.pk:
+                    self._store_filediff_parent_ids(parent_ids)
+                    self.save(update_fields=('extra_data',))
+            else:
+                parent_ids = {
+                    int(filediff_id): parent_id
+                    for filediff_id, parent_id in stored_parent_ids.items()
+                }
+
+        return FileDiffAncestry(filediffs, parent_ids)
+
+    def _store_filediff_parent_ids(self, parent_ids):
+        """Store the parents of each FileDiff in extra_data.
+
+        Only FileDiffs that have parents are stored.
+
+        Args:
+            parent_ids (dict):
+                A mapping of FileDiff IDs to parent FileDiff IDs.
+        """
+        self.extra_data[self._FILEDIFF_PARENTS_KEY] = {
+            str(filediff_id): parent_id
+            for filediff_id, parent_id in parent_ids.items()
+            if parent_id is not None
+        }
+
     def get_total_line_counts(self):
         """Return the total line counts of all child FileDiffs.
 
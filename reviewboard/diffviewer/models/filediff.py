@@ -42,6 +42,12 @@ class FileDiff(models.Model):
 
     _IS_PARENT_EMPTY_KEY = '__parent_diff_empty'
 
+    # These are only ever set by the server, from the FileDiff's own files,
+    # so they're safe to use for file content cache lookups. Unlike the
+    # public checksums, they can't be set through the API.
+    _FILE_CACHE_ORIG_SHA256_KEY = '__file_cache_orig_sha256'
+    _FILE_CACHE_PATCHED_SHA256_KEY = '__file_cache_patched_sha256'
+
     diffset = models.ForeignKey('DiffSet',
                                 on_delete=models.CASCADE,
                                 related_name='files',
@@ -461,6 +467,32 @@ class FileDiff(models.Model):
         """
         return self.extra_data.get('patched_sha256')
 
+    @property
+    def file_cache_orig_sha256(self):
+        """The SHA256 of the original file, for the file content cache.
+
+        This is computed by the server from this FileDiff's own original
+        file, and can't be set by clients. It may be ``None``, in which case
+        it will be populated when the diff is next viewed.
+
+        Version Added:
+            6.0
+        """
+        return self.extra_data.get(self._FILE_CACHE_ORIG_SHA256_KEY)
+
+    @property
+    def file_cache_patched_sha256(self):
+        """The SHA256 of the patched file, for the file content cache.
+
+        This is computed by the server from this FileDiff's own patched
+        file, and can't be set by clients. It may be ``None``, in which case
+        it will be populated when the diff is next viewed.
+
+        Version Added:
+            6.0
+        """
+        return self.extra_data.get(self._FILE_CACHE_PATCHED_SHA256_KEY)
+
     @property
     def encoding(self):
         """The encoding of the source and patched file.
@@ -1,12 +1,13 @@
 """RawFileDiffData model definition."""
 
-import bz2
 import logging
 
 from django.db import models
 from django.utils.translation import gettext_lazy as _
 from djblets.db.fields import JSONField
 
+from reviewboard.diffviewer.compression import \
+    diff_compression_codec_registry
 from reviewboard.diffviewer.errors import DiffParserError
 from reviewboard.diffviewer.managers import RawFileDiffDataManager
 
@@ -19,14 +20,35 @@ class RawFileDiffData(models.Model):
 
     This is the class used in Review Board 2.5+ to store diff content.
     Unlike in previous versions, the content is not base64-encoded. Instead,
-    it is stored either as bzip2-compressed data (if the resulting
-    compressed data is smaller than the raw data), or as the raw data itself.
+    it is stored either as compressed data (if the resulting compressed data
+    is smaller than the raw data), or as the raw data itself.
+
+    Version Changed:
+        6.0:
+        Data can now be compressed with any codec registered in
+        :py:data:`~reviewboard.diffviewer.compression.
+        diff_compression_codec_registry`, with the codec's ID stored in
+        :py:attr:`compression`. Previously, only bzip2 was supported.
     """
 
     COMPRESSION_BZIP2 = 'B'
 
+    #: Compression using zlib.
+    #:
+    #: Version Added:
+    #:     6.0
+    COMPRESSION_ZLIB = 'Z'
+
+    #: Compression using Zstandard.
+    #:
+    #: Version Added:
+    #:     6.0
+    COMPRESSION_ZSTANDARD = 'S'
+
     COMPRESSION_CHOICES = (
         (COMPRESSION_BZIP2, _('BZip2-compressed')),
+        (COMPRESSION_ZLIB, _('zlib-compressed')),
+        (COMPRESSION_ZSTANDARD, _('Zstandard-compressed')),
     )
 
     binary_hash = models.CharField(_("hash"), max_length=40, unique=True)
@@ -43,16 +65,29 @@ class RawFileDiffData(models.Model):
 
         The content will be uncompressed (if necessary) and returned as the
         raw set of bytes originally uploaded.
+
+        Version Changed:
+            6.0:
+            The content is now decompressed using the registered codec
+            matching :py:attr:`compression`.
+
+        Raises:
+            NotImplementedError:
+                The content was compressed with a codec that is not
+                registered or not available.
         """
-        if self.compression == self.COMPRESSION_BZIP2:
-            return bz2.decompress(self.binary)
-        elif self.compression is None:
+        if self.compression is None:
             return bytes(self.binary)
-        else:
+
+        codec = diff_compression_codec_registry.get_codec(self.compression)
+
+        if codec is None or not codec.is_available():
             raise NotImplementedError(
                 'Unsupported compression method %s for RawFileDiffData %s'
                 % (self.compression, self.pk))
 
+        return codec.decompress(self.binary)
+
     @property
     def insert_count(self):
         return self.extra_data.get('insert_count')
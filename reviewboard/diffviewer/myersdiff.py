@@ -1,3 +1,7 @@
+from array import array
+from collections import Counter
+from functools import lru_cache
+
 from reviewboard.diffviewer.differ import Differ, DiffCompatVersion
 
 
@@ -240,8 +244,12 @@ class MyersDiffer(Differ):
 
         cost = 0
         max_cost = max(256, self._very_approx_sqrt(self.max_lines * 4))
+        time_budget = self.time_budget
 
         while True:
+            if time_budget is not None and time_budget.expired:
+                return None
+
             cost += 1
             big_snake = False
 
@@ -408,6 +416,39 @@ class MyersDiffer(Differ):
 
         raise Exception("The function should not have reached here.")
 
+    def _simplify_range(self, a_lower, a_upper, b_lower, b_upper):
+        """Mark all lines in a range as modified.
+
+        This is used once the time budget has expired, in place of searching
+        for lines in common. The range will show up as a single coarse
+        change, and :py:attr:`simplified` will be set.
+
+        Version Added:
+            6.0
+
+        Args:
+            a_lower (int):
+                The lower bound of the range in the original file.
+
+            a_upper (int):
+                The upper bound of the range in the original file.
+
+            b_lower (int):
+                The lower bound of the range in the modified file.
+
+            b_upper (int):
+                The upper bound of the range in the modified file.
+        """
+        for data, lower, upper in ((self.a_data, a_lower, a_upper),
+                                   (self.b_data, b_lower, b_upper)):
+            modified = data.modified
+            real_indexes = data.real_indexes
+
+            for i in range(lower, upper):
+                modified[real_indexes[i]] = True
+
+        self.simplified = True
+
     def _find_diagonal(self, minimum, maximum, k, best, diagoff, vector,
                        vdiff_func, check_x_range, check_y_range,
                        discard_index, k_offset, cost):
@@ -463,12 +504,18 @@ class MyersDiffer(Differ):
                 a_lower += 1
         else:
             # Find the middle snake and length of an optimal path for A and B
-            x, y, low_minimal, high_minimal = \
-                self._find_sms(a_lower, a_upper, b_lower, b_upper,
-                               find_minimal)
+            sms = self._find_sms(a_lower, a_upper, b_lower, b_upper,
+                                 find_minimal)
 
-            self._lcs(a_lower, x, b_lower, y, low_minimal)
-            self._lcs(x, a_upper, y, b_upper, high_minimal)
+            if sms is None:
+                # The time budget has expired. Treat the rest of this range
+                # as changed.
+                self._simplify_range(a_lower, a_upper, b_lower, b_upper)
+            else:
+                x, y, low_minimal, high_minimal = sms
+
+                self._lcs(a_lower, x, b_lower, y, low_minimal)
+                self._lcs(x, a_upper, y, b_upper, high_minimal)
 
     def _shift_chunks(self, data, other_data):
         """
@@ -706,3 +753,844 @@ class MyersDiffer(Differ):
             result *= 2
 
         return result
+
+
+@lru_cache(maxsize=256)
+def _very_approx_sqrt(i):
+    """Return a cached result for MyersDiffer._very_approx_sqrt.
+
+    This is an exact copy of the algorithm used by :py:class:`MyersDiffer`,
+    which needs to be preserved in order to produce identical results, but
+    is expensive enough to be worth caching across calls.
+
+    Args:
+        i (int or float):
+            The value to compute the result for.
+
+    Returns:
+        int:
+        The resulting value.
+    """
+    result = 1
+    i /= 4
+    while i > 0:
+        i /= 4
+        result *= 2
+
+    return result
+
+
+def _get_common_prefix_len(a, a_start, a_end, b, b_start, b_end):
+    """Return the number of equal items at the start of two ranges.
+
+    This compares progressively larger slices of the sequences, letting the
+    comparisons happen in C instead of item-by-item in Python.
+
+    Args:
+        a (list of int):
+            The first sequence.
+
+        a_start (int):
+            The start of the range in the first array.
+
+        a_end (int):
+            The end of the range in the first array.
+
+        b (list of int):
+            The second sequence.
+
+        b_start (int):
+            The start of the range in the second array.
+
+        b_end (int):
+            The end of the range in the second array.
+
+    Returns:
+        int:
+        The number of equal items.
+    """
+    max_len = min(a_end - a_start, b_end - b_start)
+    length = 0
+    step = 1
+
+    while length < max_len:
+        n = min(step, max_len - length)
+        i = a_start + length
+        j = b_start + length
+
+        if a[i:i + n] == b[j:j + n]:
+            length += n
+            step <<= 1
+        elif n == 1:
+            break
+        else:
+            step = n >> 1
+
+    return length
+
+
+def _get_common_suffix_len(a, a_start, a_end, b, b_start, b_end):
+    """Return the number of equal items at the end of two ranges.
+
+    This is the reverse equivalent of :py:func:`_get_common_prefix_len`.
+
+    Args:
+        a (list of int):
+            The first sequence.
+
+        a_start (int):
+            The start of the range in the first array.
+
+        a_end (int):
+            The end of the range in the first array.
+
+        b (list of int):
+            The second sequence.
+
+        b_start (int):
+            The start of the range in the second array.
+
+        b_end (int):
+            The end of the range in the second array.
+
+    Returns:
+        int:
+        The number of equal items.
+    """
+    max_len = min(a_end - a_start, b_end - b_start)
+    length = 0
+    step = 1
+
+    while length < max_len:
+        n = min(step, max_len - length)
+        i = a_end - length
+        j = b_end - length
+
+        if a[i - n:i] == b[j - n:j]:
+            length += n
+            step <<= 1
+        elif n == 1:
+            break
+        else:
+            step = n >> 1
+
+    return length
+
+
+class ArrayMyersDiffer(MyersDiffer):
+    """A Myers differ storing line codes in compact integer arrays.
+
+    This produces the exact same opcodes as :py:class:`MyersDiffer`, but
+    interns lines into compact :py:class:`array.array` storage, tracks
+    discard and modification states in byte arrays, and replaces the
+    per-line Python loops used for discarding lines, walking common ranges
+    and generating opcodes with operations that run in C. This makes a large
+    difference for files with tens of thousands of lines.
+
+    This can be selected by passing
+    :py:attr:`~reviewboard.diffviewer.differ.DifferEngine.ARRAY` to
+    :py:func:`~reviewboard.diffviewer.differ.get_differ`.
+
+    Version Added:
+        6.0
+    """
+
+    #: The array typecode used for line codes and indexes.
+    ARRAY_TYPECODE = 'l'
+
+    def get_opcodes(self):
+        """Yield opcodes representing the contents of the diff.
+
+        The resulting opcodes are in the format of
+        ``(tag, i1, i2, j1, j2)``, and are identical to those generated by
+        :py:meth:`MyersDiffer.get_opcodes`.
+
+        Yields:
+            tuple:
+            Each opcode in the diff.
+        """
+        self._gen_diff_data()
+
+        a_length = self.a_data.length
+        b_length = self.b_data.length
+
+        if a_length == 0 and b_length == 0:
+            # There's nothing to process or yield. Bail.
+            return
+
+        a_modified = self._get_modified_flags(self.a_data)
+        b_modified = self._get_modified_flags(self.b_data)
+
+        a_line = b_line = 0
+        last_group = None
+
+        while a_line < a_length or b_line < b_length:
+            a_start = a_line
+            b_start = b_line
+
+            if (a_line < a_length and
+                not a_modified[a_line] and
+                b_line < b_length and
+                not b_modified[b_line]):
+                # Equal. Consume the entire run of unmodified lines at once.
+                a_next = a_modified.find(1, a_line)
+                b_next = b_modified.find(1, b_line)
+
+                if a_next == -1:
+                    a_next = a_length
+
+                if b_next == -1:
+                    b_next = b_length
+
+                a_changed = b_changed = min(a_next - a_line,
+                                            b_next - b_line)
+                tag = 'equal'
+                a_line += a_changed
+                b_line += b_changed
+            else:
+                # Deleted, inserted or replaced.
+                if a_line < a_length:
+                    if b_line >= b_length:
+                        a_line = a_length
+                    else:
+                        a_line = a_modified.find(0, a_line)
+
+                        if a_line == -1:
+                            a_line = a_length
+
+                if b_line < b_length:
+                    if a_line >= a_length:
+                        b_line = b_length
+                    else:
+                        b_line = b_modified.find(0, b_line)
+
+                        if b_line == -1:
+                            b_line = b_length
+
+                a_changed = a_line - a_start
+                b_changed = b_line - b_start
+
+                assert a_start < a_line or b_start < b_line
+                assert a_changed != 0 or b_changed != 0
+
+                if a_changed == 0 and b_changed > 0:
+                    tag = 'insert'
+                elif a_changed > 0 and b_changed == 0:
+                    tag = 'delete'
+                elif a_changed > 0 and b_changed > 0:
+                    tag = 'replace'
+
+                    if a_changed != b_changed:
+                        if a_changed > b_changed:
+                            a_line -= a_changed - b_changed
+                        elif a_changed < b_changed:
+                            b_line -= b_changed - a_changed
+
+                        a_changed = b_changed = min(a_changed, b_changed)
+
+            if last_group and last_group[0] == tag:
+                last_group = (tag,
+                              last_group[1], last_group[2] + a_changed,
+                              last_group[3], last_group[4] + b_changed)
+            else:
+                if last_group:
+                    yield last_group
+
+                last_group = (tag, a_start, a_start + a_changed,
+                              b_start, b_start + b_changed)
+
+        if not last_group:
+            last_group = ('equal', 0, a_length, 0, b_length)
+
+        yield last_group
+
+    def _get_modified_flags(self, data):
+        """Return a compact array of modified flags for the lines.
+
+        Args:
+            data (MyersDiffer.DiffData):
+                The diff data to return flags for.
+
+        Returns:
+            bytearray:
+            An array containing ``1`` for each modified line and ``0`` for
+            each unmodified line.
+        """
+        length = data.length
+        flags = bytearray(length)
+
+        for i, modified in data.modified.items():
+            if modified and 0 <= i < length:
+                flags[i] = 1
+
+        return flags
+
+    def _gen_diff_codes(self, lines, is_modified_file):
+        """Convert all lines of text into integer codes.
+
+        Args:
+            lines (list of str):
+                The lines to convert.
+
+            is_modified_file (bool):
+                Whether these are lines from the modified file.
+
+        Returns:
+            array.array:
+            The array of line codes.
+        """
+        code_table = self.code_table
+        interesting_line_table = self.interesting_line_table
+        interesting_line_regexes = self.interesting_line_regexes
+        ignore_space = self.ignore_space
+        last_code = self.last_code
+
+        if is_modified_file:
+            interesting_lines = self.interesting_lines[1]
+        else:
+            interesting_lines = self.interesting_lines[0]
+
+        codes = array(self.ARRAY_TYPECODE)
+        append = codes.append
+
+        for linenum, raw_line in enumerate(lines):
+            line = raw_line
+
+            if ignore_space:
+                # We still want to show lines that contain only whitespace.
+                stripped_line = raw_line.lstrip()
+
+                if stripped_line:
+                    line = stripped_line
+
+            code = code_table.get(line)
+
+            if code is None:
+                # This is a new, unrecorded line, so mark it and store it.
+                last_code += 1
+                code = last_code
+                code_table[line] = code
+
+                # Check to see if this is an interesting line that the caller
+                # wants recorded.
+                if interesting_line_regexes and raw_line.lstrip():
+                    for name, regex in interesting_line_regexes:
+                        if regex.match(raw_line):
+                            interesting_line_table[code] = name
+                            interesting_lines[name].append((linenum,
+                                                            raw_line))
+                            break
+            elif interesting_line_table:
+                interesting_line_name = interesting_line_table.get(code)
+
+                if interesting_line_name:
+                    interesting_lines[interesting_line_name].append(
+                        (linenum, raw_line))
+
+            append(code)
+
+        self.last_code = last_code
+
+        return codes
+
+    def _lcs(self, a_lower, a_upper, b_lower, b_upper, find_minimal):
+        """Compute the Longest Common Subsequence of two ranges.
+
+        This walks the common lines at the start and end of the ranges in
+        bulk before continuing with the standard divide-and-conquer
+        algorithm.
+
+        Args:
+            a_lower (int):
+                The lower bound of the range in the original file.
+
+            a_upper (int):
+                The upper bound of the range in the original file.
+
+            b_lower (int):
+                The lower bound of the range in the modified file.
+
+            b_upper (int):
+                The upper bound of the range in the modified file.
+
+            find_minimal (bool):
+                Whether to find a minimal diff.
+        """
+        a_undiscarded = self.a_data.undiscarded
+        b_undiscarded = self.b_data.undiscarded
+
+        n = _get_common_prefix_len(a_undiscarded, a_lower, a_upper,
+                                   b_undiscarded, b_lower, b_upper)
+        a_lower += n
+        b_lower += n
+
+        n = _get_common_suffix_len(a_undiscarded, a_lower, a_upper,
+                                   b_undiscarded, b_lower, b_upper)
+        a_upper -= n
+        b_upper -= n
+
+        if a_lower == a_upper:
+            # Inserted lines.
+            modified = self.b_data.modified
+            real_indexes = self.b_data.real_indexes
+
+            for i in range(b_lower, b_upper):
+                modified[real_indexes[i]] = True
+        elif b_lower == b_upper:
+            # Deleted lines.
+            modified = self.a_data.modified
+            real_indexes = self.a_data.real_indexes
+
+            for i in range(a_lower, a_upper):
+                modified[real_indexes[i]] = True
+        else:
+            # Find the middle snake and length of an optimal path for A and B
+            sms = self._find_sms(a_lower, a_upper, b_lower, b_upper,
+                                 find_minimal)
+
+            if sms is None:
+                # The time budget has expired. Treat the rest of this range
+                # as changed.
+                self._simplify_range(a_lower, a_upper, b_lower, b_upper)
+            else:
+                x, y, low_minimal, high_minimal = sms
+
+                self._lcs(a_lower, x, b_lower, y, low_minimal)
+                self._lcs(x, a_upper, y, b_upper, high_minimal)
+
+    def _find_sms(self, a_lower, a_upper, b_lower, b_upper, find_minimal):
+        """Find the Shortest Middle Snake.
+
+        This is equivalent to :py:meth:`MyersDiffer._find_sms`, but keeps
+        all state in local variables in the hot loops.
+
+        Args:
+            a_lower (int):
+                The lower bound of the range in the original file.
+
+            a_upper (int):
+                The upper bound of the range in the original file.
+
+            b_lower (int):
+                The lower bound of the range in the modified file.
+
+            b_upper (int):
+                The upper bound of the range in the modified file.
+
+            find_minimal (bool):
+                Whether to find a minimal diff.
+
+        Returns:
+            tuple:
+            A 4-tuple of ``(x, y, low_minimal, high_minimal)``, or ``None``
+            if the time budget expired.
+        """
+        a_undiscarded = self.a_data.undiscarded
+        b_undiscarded = self.b_data.undiscarded
+        down_vector = self.fdiag  # The vector for the (0, 0) to (x, y) search
+        up_vector = self.bdiag    # The vector for the (u, v) to (N, M) search
+        downoff = self.downoff
+        upoff = self.upoff
+        max_lines = self.max_lines
+        snake_limit = self.SNAKE_LIMIT
+
+        down_k = a_lower - b_lower  # The k-line to start the forward search
+        up_k = a_upper - b_upper    # The k-line to start the reverse search
+        odd_delta = (down_k - up_k) % 2 != 0
+
+        down_vector[downoff + down_k] = a_lower
+        up_vector[upoff + up_k] = a_upper
+
+        dmin = a_lower - b_upper
+        dmax = a_upper - b_lower
+
+        down_min = down_max = down_k
+        up_min = up_max = up_k
+
+        cost = 0
+        max_cost = max(256, self._very_approx_sqrt(max_lines * 4))
+        time_budget = self.time_budget
+
+        while True:
+            if time_budget is not None and time_budget.expired:
+                return None
+
+            cost += 1
+            big_snake = False
+
+            if down_min > dmin:
+                down_min -= 1
+                down_vector[downoff + down_min - 1] = -1
+            else:
+                down_min += 1
+
+            if down_max < dmax:
+                down_max += 1
+                down_vector[downoff + down_max + 1] = -1
+            else:
+                down_max -= 1
+
+            # Extend the forward path
+            for k in range(down_max, down_min - 1, -2):
+                tlo = down_vector[downoff + k - 1]
+                thi = down_vector[downoff + k + 1]
+
+                if tlo >= thi:
+                    x = tlo + 1
+                else:
+                    x = thi
+
+                y = x - k
+                old_x = x
+
+                # Find the end of the furthest reaching forward D-path in
+                # diagonal k
+                while (x < a_upper and y < b_upper and
+                       a_undiscarded[x] == b_undiscarded[y]):
+                    x += 1
+                    y += 1
+
+                if (odd_delta and up_min <= k <= up_max and
+                    up_vector[upoff + k] <= x):
+                    return x, y, True, True
+
+                if x - old_x > snake_limit:
+                    big_snake = True
+
+                down_vector[downoff + k] = x
+
+            # Extend the reverse path
+            if up_min > dmin:
+                up_min -= 1
+                up_vector[upoff + up_min - 1] = max_lines
+            else:
+                up_min += 1
+
+            if up_max < dmax:
+                up_max += 1
+                up_vector[upoff + up_max + 1] = max_lines
+            else:
+                up_max -= 1
+
+            for k in range(up_max, up_min - 1, -2):
+                tlo = up_vector[upoff + k - 1]
+                thi = up_vector[upoff + k + 1]
+
+                if tlo < thi:
+                    x = tlo
+                else:
+                    x = thi - 1
+
+                y = x - k
+                old_x = x
+
+                while (x > a_lower and y > b_lower and
+                       a_undiscarded[x - 1] == b_undiscarded[y - 1]):
+                    x -= 1
+                    y -= 1
+
+                if (not odd_delta and down_min <= k <= down_max and
+                    x <= down_vector[downoff + k]):
+                    return x, y, True, True
+
+                if old_x - x > snake_limit:
+                    big_snake = True
+
+                up_vector[upoff + k] = x
+
+            if find_minimal:
+                continue
+
+            # Heuristics courtesy of GNU diff. See MyersDiffer._find_sms.
+            if cost > 200 and big_snake:
+                ret_x, ret_y, best = self._find_diagonal(
+                    down_min, down_max, down_k, 0,
+                    downoff, down_vector,
+                    lambda x: x - a_lower,
+                    lambda x: a_lower + snake_limit <= x < a_upper,
+                    lambda y: b_lower + snake_limit <= y < b_upper,
+                    lambda i, k: i - k,
+                    1, cost)
+
+                if best > 0:
+                    return ret_x, ret_y, True, False
+
+                ret_x, ret_y, best = self._find_diagonal(
+                    up_min, up_max, up_k, best, upoff,
+                    up_vector,
+                    lambda x: a_upper - x,
+                    lambda x: a_lower < x <= a_upper - snake_limit,
+                    lambda y: b_lower < y <= b_upper - snake_limit,
+                    lambda i, k: i + k,
+                    0, cost)
+
+                if best > 0:
+                    return ret_x, ret_y, False, True
+
+            if (cost >= max_cost and
+                self.compat_version >= DiffCompatVersion.MYERS_SMS_COST_BAIL):
+                # We've reached or gone past the max cost. Just give up now
+                # and report the halfway point between our best results.
+                fx_best = bx_best = 0
+
+                # Find the forward diagonal that maximized x + y
+                fxy_best = -1
+
+                for d in range(down_max, down_min - 1, -2):
+                    x = min(down_vector[downoff + d], a_upper)
+                    y = x - d
+
+                    if b_upper < y:
+                        x = b_upper + d
+                        y = b_upper
+
+                    if fxy_best < x + y:
+                        fxy_best = x + y
+                        fx_best = x
+
+                # Find the backward diagonal that minimizes x + y
+                bxy_best = max_lines
+
+                for d in range(up_max, up_min - 1, -2):
+                    x = max(a_lower, up_vector[upoff + d])
+                    y = x - d
+
+                    if y < b_lower:
+                        x = b_lower + d
+                        y = b_lower
+
+                    if x + y < bxy_best:
+                        bxy_best = x + y
+                        bx_best = x
+
+                # Use the better of the two diagonals
+                if (a_upper + b_upper - bxy_best <
+                    fxy_best - (a_lower + b_lower)):
+                    return fx_best, fxy_best - fx_best, True, False
+                else:
+                    return bx_best, bxy_best - bx_best, False, True
+
+    def _discard_confusing_lines(self):
+        """Discard lines that have no matches or too many matches.
+
+        This is equivalent to
+        :py:meth:`MyersDiffer._discard_confusing_lines`, but stores discard
+        states in byte arrays and skips over ranges of lines in bulk.
+        """
+        a_data = self.a_data
+        b_data = self.b_data
+
+        a_discards = self._build_discards(a_data, Counter(b_data.data))
+        b_discards = self._build_discards(b_data, Counter(a_data.data))
+
+        self._check_discard_runs(a_data, a_discards)
+        self._check_discard_runs(b_data, b_discards)
+
+        self._discard_lines(a_data, a_discards)
+        self._discard_lines(b_data, b_discards)
+
+    def _build_discards(self, data, counts):
+        """Build the list of provisional discards for a file.
+
+        Args:
+            data (MyersDiffer.DiffData):
+                The diff data for the file.
+
+            counts (collections.Counter):
+                The number of times each line code appears in the other file.
+
+        Returns:
+            bytearray:
+            The discard state for each line.
+        """
+        many = 5 * self._very_approx_sqrt(data.length / 64)
+        discard_states = {}
+
+        for code in set(data.data):
+            num_matches = counts[code]
+
+            if code == 0:
+                discard_states[code] = self.DISCARD_NONE
+            elif num_matches == 0:
+                discard_states[code] = self.DISCARD_FOUND
+            elif num_matches > many:
+                discard_states[code] = self.DISCARD_CANCEL
+            else:
+                discard_states[code] = self.DISCARD_NONE
+
+        return bytearray(map(discard_states.__getitem__, data.data))
+
+    def _check_discard_runs(self, data, discards):
+        """Cancel provisional discards that aren't within a run of discards.
+
+        Args:
+            data (MyersDiffer.DiffData):
+                The diff data for the file.
+
+            discards (bytearray):
+                The discard states to update.
+        """
+        DISCARD_NONE = self.DISCARD_NONE
+        DISCARD_FOUND = self.DISCARD_FOUND
+        DISCARD_CANCEL = self.DISCARD_CANCEL
+        cancel_byte = bytes([DISCARD_CANCEL])
+        none_byte = bytes([DISCARD_NONE])
+        data_length = data.length
+        i = 0
+
+        while i < data_length:
+            # Cancel all provisional discards up until the next run of
+            # discardable lines.
+            run_start = discards.find(DISCARD_FOUND, i)
+
+            if run_start == -1:
+                run_start = data_length
+
+            if i < run_start:
+                discards[i:run_start] = \
+                    discards[i:run_start].replace(cancel_byte, none_byte)
+                i = run_start
+
+                if i == data_length:
+                    break
+
+            # Find the end of this run of discardable lines and count
+            # how many are provisionally discardable.
+            j = discards.find(DISCARD_NONE, i)
+
+            if j == -1:
+                j = data_length
+
+            provisional = discards.count(DISCARD_CANCEL, i, j)
+
+            # Cancel the provisional discards at the end and shrink the run.
+            while j > i and discards[j - 1] == DISCARD_CANCEL:
+                j -= 1
+                discards[j] = DISCARD_NONE
+                provisional -= 1
+
+            length = j - i
+
+            # If 1/4 of the lines are provisional, cancel discarding all the
+            # provisional lines in the run.
+            if provisional * 4 > length:
+                discards[i:j] = discards[i:j].replace(cancel_byte, none_byte)
+            else:
+                minimum = 1 + self._very_approx_sqrt(length / 4)
+                j = 0
+                consec = 0
+
+                while j < length:
+                    if discards[i + j] != DISCARD_CANCEL:
+                        consec = 0
+                    else:
+                        consec += 1
+
+                        if minimum == consec:
+                            j -= consec
+                        elif minimum < consec:
+                            discards[i + j] = DISCARD_NONE
+
+                    j += 1
+
+                # Scan forward from the start of the run.
+                consec = 0
+
+                for j in range(length):
+                    index = i + j
+                    discard = discards[index]
+
+                    if j >= 8 and discard == DISCARD_FOUND:
+                        break
+
+                    if discard == DISCARD_FOUND:
+                        consec += 1
+                    else:
+                        consec = 0
+
+                        if discard == DISCARD_CANCEL:
+                            discards[index] = DISCARD_NONE
+
+                    if consec == 3:
+                        break
+
+                i += length - 1
+
+                # Scan backward from the end of the run.
+                consec = 0
+
+                for j in range(length):
+                    index = i - j
+                    discard = discards[index]
+
+                    if j >= 8 and discard == DISCARD_FOUND:
+                        break
+
+                    if discard == DISCARD_FOUND:
+                        consec += 1
+                    else:
+                        consec = 0
+
+                        if discard == DISCARD_CANCEL:
+                            discards[index] = DISCARD_NONE
+
+                    if consec == 3:
+                        break
+
+            i += 1
+
+    def _discard_lines(self, data, discards):
+        """Store the undiscarded lines and mark discarded lines as modified.
+
+        Args:
+            data (MyersDiffer.DiffData):
+                The diff data for the file.
+
+            discards (bytearray):
+                The final discard states for each line.
+        """
+        length = data.length
+
+        if self.minimal_diff:
+            kept_indexes = range(length)
+        else:
+            DISCARD_NONE = self.DISCARD_NONE
+            kept_indexes = [
+                i
+                for i, discard in enumerate(discards)
+                if discard == DISCARD_NONE
+            ]
+
+            data.modified.update(
+                (i, True)
+                for i, discard in enumerate(discards)
+                if discard != DISCARD_NONE
+            )
+
+        codes = data.data
+        num_kept = len(kept_indexes)
+        padding = [0] * (length - num_kept)
+
+        # The undiscarded codes are indexed heavily while searching for
+        # snakes. Lists are faster to index than arrays (which must box each
+        # item on access), so these are stored as lists.
+        data.undiscarded = [codes[i] for i in kept_indexes]
+        data.undiscarded.extend(padding)
+        data.real_indexes = list(kept_indexes)
+        data.real_indexes.extend(padding)
+        data.undiscarded_lines = num_kept
+
+    def _very_approx_sqrt(self, i):
+        """Return a very approximate square root of a value.
+
+        This caches the results of :py:meth:`MyersDiffer._very_approx_sqrt`.
+
+        Args:
+            i (int or float):
+                The value to compute the result for.
+
+        Returns:
+            int:
+            The resulting value.
+        """
+        return _very_approx_sqrt(i)
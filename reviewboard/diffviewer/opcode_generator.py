@@ -1,3 +1,4 @@
+import logging
 import os
 import re
 
@@ -5,6 +6,9 @@ from reviewboard.diffviewer.processors import (filter_interdiff_opcodes,
                                                post_process_filtered_equals)
 
 
+logger = logging.getLogger(__name__)
+
+
 class MoveRange(object):
     """Stores information on a move range.
 
@@ -21,13 +25,86 @@ class MoveRange(object):
         return self.groups[-1]
 
     def add_group(self, group, group_index):
-        if self.groups[-1] != group:
+        if self.groups[-1][1] != group_index:
             self.groups.append((group, group_index))
 
     def __repr__(self):
         return '<MoveRange(%d, %d, %r)>' % (self.start, self.end, self.groups)
 
 
+class MoveCandidates(object):
+    """Positions of removed lines in a group that may be part of a move.
+
+    This stores the positions of all removed lines in a group with the same
+    normalized content, in ascending order. It tracks the first position
+    that hasn't yet been used in a move, so that used positions are only
+    skipped once.
+
+    Version Added:
+        6.0
+    """
+
+    __slots__ = ('group_index', 'positions', '_offset')
+
+    def __init__(self, group_index):
+        """Initialize the candidates.
+
+        Args:
+            group_index (int):
+                The index of the group containing the removed lines.
+        """
+        self.group_index = group_index
+        self.positions = []
+        self._offset = 0
+
+    def get_first_unused(self, used):
+        """Return the first position that hasn't been used in a move.
+
+        Args:
+            used (set of int):
+                All positions that have already been used in a move.
+
+        Returns:
+            int:
+            The first unused position, or ``None`` if all positions have
+            been used.
+        """
+        positions = self.positions
+        num_positions = len(positions)
+        offset = self._offset
+
+        while offset < num_positions and positions[offset] in used:
+            offset += 1
+
+        self._offset = offset
+
+        if offset < num_positions:
+            return positions[offset]
+
+        return None
+
+    def get_next_unused(self, position, used):
+        """Return the next position after another that hasn't been used.
+
+        Args:
+            position (int):
+                The position to start after.
+
+            used (set of int):
+                All positions that have already been used in a move.
+
+        Returns:
+            int:
+            The next unused position, or ``None`` if there are no more
+            unused positions.
+        """
+        for next_position in self.positions[self._offset:]:
+            if next_position > position and next_position not in used:
+                return next_position
+
+        return None
+
+
 class DiffOpcodeGenerator(object):
     ALPHANUM_RE = re.compile(r'\w')
     WHITESPACE_RE = re.compile(r'\s')
@@ -35,12 +112,28 @@ class DiffOpcodeGenerator(object):
     MOVE_PREFERRED_MIN_LINES = 2
     MOVE_MIN_LINE_LENGTH = 20
 
+    #: The default maximum number of changed lines for move detection.
+    #:
+    #: This is used if diff settings aren't provided. ``0`` disables the
+    #: limit.
+    #:
+    #: Version Added:
+    #:     6.0
+    #:
+    #: Type:
+    #:     int
+    DEFAULT_MOVE_DETECTION_MAX_LINES = 0
+
     TAB_SIZE = 8
 
     def __init__(self, differ, diff=None, interdiff=None, request=None,
-                 **kwargs):
+                 diff_settings=None, **kwargs):
         """Initialize the opcode generator.
 
+        Version Changed:
+            6.0:
+            Added the ``diff_settings`` parameter.
+
         Version Changed:
             3.0.18:
             Added the ``request`` and ``**kwargs`` parameters.
@@ -59,6 +152,10 @@ class DiffOpcodeGenerator(object):
             request (django.http.HttpRequest):
                 The HTTP request from the client.
 
+            diff_settings (reviewboard.diffviewer.settings.DiffSettings,
+                           optional):
+                The settings used to control the generation of opcodes.
+
             **kwargs (dict):
                 Additional keyword arguments, for future expansion.
         """
@@ -66,6 +163,16 @@ class DiffOpcodeGenerator(object):
         self.diff = diff
         self.interdiff = interdiff
         self.request = request
+        self.diff_settings = diff_settings
+
+        #: Whether move detection was skipped due to an expired time budget.
+        #:
+        #: Version Added:
+        #:     6.0
+        #:
+        #: Type:
+        #:     bool
+        self.moves_skipped = False
 
     def __iter__(self):
         """Returns opcodes from the differ with extra metadata.
@@ -80,6 +187,8 @@ class DiffOpcodeGenerator(object):
         self.groups = []
         self.removes = {}
         self.inserts = []
+        self._num_removed_lines = 0
+        self._num_inserted_lines = 0
 
         # Run the opcodes through the chain.
         opcodes = self.differ.get_opcodes()
@@ -179,27 +288,37 @@ class DiffOpcodeGenerator(object):
         for group_index, group in enumerate(opcodes):
             self.groups.append(group)
 
-            # Store delete/insert ranges for later lookup. We will be building
-            # keys that in most cases will be unique for the particular block
-            # of text being inserted/deleted. There is a chance of collision,
-            # so we store a list of matching groups under that key.
+            # Store delete/insert ranges for later lookup. We index removed
+            # lines by their normalized content, and then by the group
+            # containing them, so that we can look up the removed lines
+            # matching an inserted line without scanning every removed line.
             #
-            # Later, we will loop through the keys and attempt to find insert
-            # keys/groups that match remove keys/groups.
+            # Later, we will loop through the inserted groups and attempt to
+            # find removed lines that match the inserted lines.
             tag = group[0]
 
             if tag in ('delete', 'replace'):
                 i1 = group[1]
                 i2 = group[2]
 
+                self._num_removed_lines += i2 - i1
+
                 for i in range(i1, i2):
                     line = self.differ.a[i].strip()
 
                     if line:
-                        self.removes.setdefault(line, []).append(
-                            (i, group, group_index))
+                        line_removes = self.removes.setdefault(line, {})
+
+                        try:
+                            candidates = line_removes[group_index]
+                        except KeyError:
+                            candidates = MoveCandidates(group_index)
+                            line_removes[group_index] = candidates
+
+                        candidates.positions.append(i)
 
             if tag in ('insert', 'replace'):
+                self._num_inserted_lines += group[4] - group[3]
                 self.inserts.append(group)
 
     def _compute_chunk_indentation(self, i1, i2, j1, j2):
@@ -408,10 +527,39 @@ class DiffOpcodeGenerator(object):
         #
         # The algorithm will be documented as we go in the code.
         #
+        # Very large diffs can take a long time to process, so we skip move
+        # detection if there are too many changed lines.
+        if self.diff_settings is None:
+            max_lines = self.DEFAULT_MOVE_DETECTION_MAX_LINES
+        else:
+            max_lines = self.diff_settings.move_detection_max_lines
+
+        num_lines = self._num_removed_lines + self._num_inserted_lines
+
+        if max_lines and num_lines > max_lines:
+            logger.debug('Skipping move detection for %d changed lines, '
+                         'which exceeds the limit of %d.',
+                         num_lines, max_lines,
+                         extra={'request': self.request})
+            return
+
         # We start by looping through all the inserted groups.
+        #
+        # If the differ's time budget expires, we'll stop looking for any
+        # further moves.
         r_move_indexes_used = set()
+        time_budget = self.differ.time_budget
 
         for insert in self.inserts:
+            if time_budget is not None and time_budget.expired:
+                logger.debug('Skipping the remainder of move detection, '
+                             'which exceeded the time budget of %s '
+                             'seconds.',
+                             time_budget.seconds,
+                             extra={'request': self.request})
+                self.moves_skipped = True
+                break
+
             self._compute_move_for_insert(r_move_indexes_used, *insert)
 
     def _compute_move_for_insert(self, r_move_indexes_used, itag, ii1, ii2,
@@ -452,12 +600,11 @@ class DiffOpcodeGenerator(object):
         # Each line in this range has a corresponding consecutive delete line.
         i_move_range = MoveRange(i_move_cur, i_move_cur)
 
-        # The deleted move ranges. The key is a string in the form of
-        # "{i1}-{i2}-{j1}-{j2}", with those positions taken from the remove
-        # group for the line. The value is an instance of MoveRange. The values
+        # The deleted move ranges. The key is the index of the remove group
+        # for the line. The value is an instance of MoveRange. The values
         # in MoveRange are used to quickly locate deleted lines we've found
         # that match the inserted lines, so we can assemble ranges later.
-        r_move_ranges = {}  # key -> (start, end, group)
+        r_move_ranges = {}  # group index -> (start, end, group)
 
         move_key = None
         is_replace = (itag == 'replace')
@@ -480,56 +627,46 @@ class DiffOpcodeGenerator(object):
                 # for this particular move block we're processing then we'll
                 # update the range.
                 #
-                # The way we do that is to find each removed line that matches
-                # this inserted line, and for each of those find out if there's
-                # an existing move range that the found removed line
-                # immediately follows. If there is, we update the existing
-                # range.
+                # The way we do that is to find a removed line that matches
+                # this inserted line and immediately follows an existing move
+                # range. If there is one, we update the existing range.
                 #
-                # If there isn't any move information for this line, we'll
-                # simply add it to the move ranges.
-                for ri, rgroup, rgroup_index in self.removes[iline]:
-                    # Ignore any lines that have already been processed as
-                    # part of a move, so we don't end up with incorrect blocks
-                    # of lines being matched.
-                    if ri in r_move_indexes_used:
-                        continue
-
+                # If there isn't any move information for the removed line's
+                # group, we'll simply add it to the move ranges.
+                #
+                # Check that this isn't a replace line that's just
+                # "replacing" itself (which would happen if it's just
+                # changing whitespace).
+                if is_replace:
+                    self_ri = ii1 + i_move_cur - ij1
+                else:
+                    self_ri = None
+
+                match = self._find_move_candidate(
+                    iline=iline,
+                    move_key=move_key,
+                    r_move_ranges=r_move_ranges,
+                    r_move_indexes_used=r_move_indexes_used,
+                    self_ri=self_ri)
+
+                if match is not None:
+                    ri, rgroup_index, move_key = match
+                    rgroup = self.groups[rgroup_index]
                     r_move_range = r_move_ranges.get(move_key)
 
-                    if not r_move_range or ri != r_move_range.end + 1:
-                        # We either didn't have a previous range, or this
-                        # group didn't immediately follow it, so we need
-                        # to start a new one.
-                        move_key = '%s-%s-%s-%s' % rgroup[1:5]
-                        r_move_range = r_move_ranges.get(move_key)
-
                     if r_move_range:
-                        # If the remove information for the line is next in
-                        # the sequence for this calculated move range...
-                        if ri == r_move_range.end + 1:
-                            # This is part of the current range, so update
-                            # the end of the range to include it.
-                            r_move_range.end = ri
-                            r_move_range.add_group(rgroup, rgroup_index)
-                            updated_range = True
+                        # This is part of the current range, so update
+                        # the end of the range to include it.
+                        r_move_range.end = ri
+                        r_move_range.add_group(rgroup, rgroup_index)
                     else:
-                        # Check that this isn't a replace line that's just
-                        # "replacing" itself (which would happen if it's just
-                        # changing whitespace).
-                        if not is_replace or i_move_cur - ij1 != ri - ii1:
-                            # We don't have any move ranges yet, or we're done
-                            # with the existing range, so it's time to build
-                            # one based on any removed lines we find that
-                            # match the inserted line.
-                            r_move_ranges[move_key] = \
-                                MoveRange(ri, ri, [(rgroup, rgroup_index)])
-                            updated_range = True
-
-                    if updated_range:
-                        # We found a range we were able to update. Don't
-                        # attempt any more matches for removed lines.
-                        break
+                        # We don't have any move ranges yet, or we're done
+                        # with the existing range, so it's time to build
+                        # one based on the removed line we found.
+                        r_move_ranges[move_key] = \
+                            MoveRange(ri, ri, [(rgroup, rgroup_index)])
+
+                    updated_range = True
 
                 if not updated_range and r_move_ranges:
                     # We didn't find a move range that this line is a part
@@ -545,7 +682,7 @@ class DiffOpcodeGenerator(object):
                     # the increment below.
                     i_move_cur -= 1
                     move_key = None
-            elif iline == '' and move_key:
+            elif iline == '' and move_key is not None:
                 # This is a blank or whitespace-only line, which would not
                 # be in the list of removed lines above. We also have been
                 # working on a move range.
@@ -646,6 +783,98 @@ class DiffOpcodeGenerator(object):
                 i_move_range = MoveRange(i_move_cur, i_move_cur)
                 r_move_ranges = {}
 
+    def _find_move_candidate(self, iline, move_key, r_move_ranges,
+                             r_move_indexes_used, self_ri):
+        """Find a removed line that can be used in a move for an inserted line.
+
+        Removed lines are considered in order. A removed line is chosen if it
+        immediately follows the current move range, immediately follows the
+        move range for its own group, or starts a new move range for a group
+        that doesn't have one yet.
+
+        Rather than checking every removed line matching the inserted line,
+        this checks only the first unused removed line in each group, along
+        with the line following the group's move range. This keeps move
+        detection linear for lines that are repeated many times in a file.
+
+        Version Added:
+            6.0
+
+        Args:
+            iline (unicode):
+                The normalized inserted line.
+
+            move_key (int):
+                The key of the move range currently being built, or ``None``.
+
+            r_move_ranges (dict):
+                The move ranges being built, keyed by group index.
+
+            r_move_indexes_used (set):
+                All remove indexes that have already been included in a move
+                range.
+
+            self_ri (int):
+                The remove index that a replaced line would be replacing
+                itself with, or ``None``. This won't start a new move range.
+
+        Returns:
+            tuple:
+            A 3-tuple of ``(remove_index, group_index, move_key)``, where
+            ``move_key`` is the key of the move range to update or create.
+            This will be ``None`` if there are no suitable removed lines.
+        """
+        line_removes = self.removes[iline]
+        exhausted_group_indexes = []
+        match = None
+
+        for group_index, candidates in line_removes.items():
+            # Ignore any lines that have already been processed as part of a
+            # move, so we don't end up with incorrect blocks of lines being
+            # matched.
+            ri = candidates.get_first_unused(r_move_indexes_used)
+
+            if ri is None:
+                exhausted_group_indexes.append(group_index)
+                continue
+
+            r_move_range = r_move_ranges.get(move_key)
+
+            if r_move_range and ri == r_move_range.end + 1:
+                # This removed line is next in the sequence for the current
+                # move range.
+                match = (ri, group_index, move_key)
+                break
+
+            # This line didn't immediately follow the current range, so
+            # anything else in this group has to continue or start this
+            # group's range.
+            move_key = group_index
+            r_move_range = r_move_ranges.get(group_index)
+
+            if r_move_range:
+                next_ri = r_move_range.end + 1
+
+                if (ri == next_ri or
+                    (candidates.positions[0] <= next_ri and
+                     next_ri < self.groups[group_index][2] and
+                     next_ri not in r_move_indexes_used and
+                     self.differ.a[next_ri].strip() == iline)):
+                    match = (next_ri, group_index, group_index)
+                    break
+            else:
+                if ri == self_ri:
+                    ri = candidates.get_next_unused(ri, r_move_indexes_used)
+
+                if ri is not None:
+                    match = (ri, group_index, group_index)
+                    break
+
+        for group_index in exhausted_group_indexes:
+            del line_removes[group_index]
+
+        return match
+
     def _find_longest_move_range(self, r_move_ranges):
         # Go through every range of lines we've found and find the longest.
         #
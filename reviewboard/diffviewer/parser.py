@@ -6,13 +6,18 @@ import io
 import logging
 import re
 import weakref
+from array import array
+from collections.abc import Sequence
 from copy import deepcopy
+from itertools import accumulate
 from typing import Optional, Union
 
 from django.utils.translation import gettext as _
 from djblets.util.properties import TypedProperty
-from pydiffx import DiffType, DiffX
+from pydiffx import DiffType, DiffX, DiffXWriter
+from pydiffx.dom.writer import DiffXDOMWriter
 from pydiffx.errors import DiffXParseError
+from pydiffx.sections import CONTENT_SECTIONS, Section
 from typing_extensions import TypeAlias
 
 from reviewboard.diffviewer.errors import DiffParserError
@@ -44,6 +49,178 @@ _RevisionProperty: TypeAlias = TypedProperty[
 _StrProperty: TypeAlias = TypedProperty[Optional[str], Optional[str]]
 
 
+class DiffLines(Sequence):
+    """The lines in a diff, stored as offsets into a single buffer.
+
+    This provides the same sequence of lines as
+    :py:func:`~reviewboard.diffviewer.diffutils.split_line_endings`, without
+    storing a separate :py:class:`bytes` object for every line. Only the
+    start and end offsets of each line are stored, and lines are sliced out
+    of the buffer when accessed.
+
+    This allows :py:class:`ParsedDiffFile` to store contiguous ranges of
+    lines as views into the buffer (see
+    :py:meth:`ParsedDiffFile.append_lines`), rather than copying each line,
+    keeping memory usage close to the size of the diff when parsing large
+    uploads.
+
+    Version Added:
+        6.0
+
+    Attributes:
+        data (bytes):
+            The buffer containing the lines. This may be any bytes-like
+            object, such as a :py:class:`mmap.mmap`.
+    """
+
+    #: The size of the blocks of data used to compute line offsets.
+    #:
+    #: Type:
+    #:     int
+    OFFSETS_BLOCK_SIZE = 1024 * 1024
+
+    def __init__(self, data):
+        """Initialize the lines.
+
+        Args:
+            data (bytes):
+                The buffer containing the lines.
+        """
+        from reviewboard.diffviewer.diffutils import NEWLINE_BYTES_RE
+
+        self.data = data
+        self._view = memoryview(data)
+
+        # Offsets are computed a block at a time. Each block is split with
+        # the line endings captured, and the lengths of the resulting parts
+        # give the offsets of alternating line starts and ends. This keeps
+        # the work in C, while only holding one block's lines in memory.
+        split_re = re.compile(b'(%s)' % NEWLINE_BYTES_RE.pattern)
+        block_size = self.OFFSETS_BLOCK_SIZE
+        data_len = len(data)
+        starts = array('Q')
+        ends = array('Q')
+        pos = 0
+
+        while pos < data_len:
+            # Blocks always end after a newline, so that line endings are
+            # never split across blocks.
+            block_end = data.find(b'\n', pos + block_size)
+
+            if block_end == -1:
+                block_end = data_len
+            else:
+                block_end += 1
+
+            parts = split_re.split(data[pos:block_end])
+            offsets = array('Q', accumulate(map(len, parts), initial=pos))
+
+            # The last part follows the final line ending in the block. If
+            # it's empty, it's not a line (matching split_line_endings()).
+            num_lines = (len(parts) + 1) // 2 - (not parts[-1])
+
+            starts.extend(offsets[0:num_lines * 2:2])
+            ends.extend(offsets[1:num_lines * 2:2])
+            pos = block_end
+
+        self._starts = starts
+        self._ends = ends
+        self._last_index = None
+        self._last_line = None
+
+    def __len__(self):
+        """Return the number of lines.
+
+        Returns:
+            int:
+            The number of lines.
+        """
+        return len(self._starts)
+
+    def __getitem__(self, index):
+        """Return a line or a list of lines.
+
+        Args:
+            index (int or slice):
+                The index of the line, or a slice of lines.
+
+        Returns:
+            bytes or list of bytes:
+            The line, without its line ending, or a list of lines for a
+            slice.
+
+        Raises:
+            IndexError:
+                The index was out of range.
+        """
+        if index == self._last_index:
+            # Parsers tend to check the same line several times in a row.
+            return self._last_line
+
+        try:
+            line = self.data[self._starts[index]:self._ends[index]]
+        except TypeError:
+            if isinstance(index, slice):
+                return [
+                    self[i]
+                    for i in range(*index.indices(len(self._starts)))
+                ]
+
+            raise
+
+        self._last_index = index
+        self._last_line = line
+
+        return line
+
+    def __iter__(self):
+        """Iterate through the lines.
+
+        Yields:
+            bytes:
+            Each line, without its line ending.
+        """
+        data = self.data
+
+        for start, end in zip(self._starts, self._ends):
+            yield data[start:end]
+
+    def get_line_range(self, index):
+        """Return the offsets of a line in the buffer.
+
+        Args:
+            index (int):
+                The index of the line.
+
+        Returns:
+            tuple:
+            A 3-tuple of ``(start, end, ends_with_lf)``, where ``end`` is the
+            offset of the line ending, and ``ends_with_lf`` indicates whether
+            the line ending is a single ``\\n``.
+        """
+        end = self._ends[index]
+
+        return (self._starts[index],
+                end,
+                self.data[end:end + 1] == b'\n')
+
+    def get_view(self, start, end):
+        """Return a view of a range of the buffer.
+
+        Args:
+            start (int):
+                The starting offset.
+
+            end (int):
+                The ending offset.
+
+        Returns:
+            memoryview:
+            The view of the buffer. This does not copy the data.
+        """
+        return self._view[start:end]
+
+
 class ParsedDiff(object):
     """Parsed information from a diff.
 
@@ -348,7 +525,14 @@ class ParsedDiffFile(object):
         self.skip = False
         self.extra_data = {}
 
-        self._data_io = io.BytesIO()
+        # The data is stored as a list of chunks, which may be views into
+        # the diff's buffer, and joined once in finalize(). A contiguous
+        # range of the buffer is kept pending so that consecutive lines
+        # can be coalesced into a single view.
+        self._data_chunks = []
+        self._pending_view_lines = None
+        self._pending_view_start = 0
+        self._pending_view_end = 0
         self._data = None
 
     @property
@@ -397,9 +581,15 @@ class ParsedDiffFile(object):
 
         This makes the diff data available to consumers and closes the buffer
         for writing.
+
+        Version Changed:
+            6.0:
+            Data is now joined from the stored chunks and views at this point,
+            rather than being copied into a buffer as it's appended.
         """
-        self._data = self._data_io.getvalue()
-        self._data_io.close()
+        self._flush_pending_lines()
+        self._data = b''.join(self._data_chunks)
+        self._data_chunks = []
 
     def prepend_data(self, data):
         """Prepend data to the buffer.
@@ -409,12 +599,7 @@ class ParsedDiffFile(object):
                 The data to prepend.
         """
         if data:
-            new_data_io = io.BytesIO()
-            new_data_io.write(data)
-            new_data_io.write(self._data_io.getvalue())
-
-            self._data_io.close()
-            self._data_io = new_data_io
+            self._data_chunks.insert(0, data)
 
     def append_data(self, data):
         """Append data to the buffer.
@@ -424,7 +609,73 @@ class ParsedDiffFile(object):
                 The data to append.
         """
         if data:
-            self._data_io.write(data)
+            self._flush_pending_lines()
+            self._data_chunks.append(data)
+
+    def append_lines(self, lines, start, end):
+        """Append a range of lines from the diff to the buffer.
+
+        Each line will be appended with a trailing ``\\n``, just as if
+        calling :py:meth:`append_data` for each line followed by a newline.
+
+        If ``lines`` is a :py:class:`DiffLines`, any lines already ending
+        in a ``\\n`` in the diff will be stored as views into the diff's
+        buffer, with consecutive lines (including those appended in later
+        calls) sharing a single view. This avoids copying the contents of
+        large diffs.
+
+        Version Added:
+            6.0
+
+        Args:
+            lines (DiffLines or list of bytes):
+                The lines in the diff.
+
+            start (int):
+                The index of the first line to append.
+
+            end (int):
+                The index after the last line to append.
+        """
+        if not isinstance(lines, DiffLines):
+            self._flush_pending_lines()
+            chunks = self._data_chunks
+
+            for line in lines[start:end]:
+                chunks.append(line)
+                chunks.append(b'\n')
+
+            return
+
+        for i in range(start, end):
+            line_start, line_end, ends_with_lf = lines.get_line_range(i)
+
+            if not ends_with_lf:
+                # This line ending must be normalized, or this is the last
+                # line of the diff, so the line has to be copied.
+                self.append_data(lines[i] + b'\n')
+            elif (self._pending_view_lines is lines and
+                  self._pending_view_end == line_start):
+                self._pending_view_end = line_end + 1
+            else:
+                self._flush_pending_lines()
+                self._pending_view_lines = lines
+                self._pending_view_start = line_start
+                self._pending_view_end = line_end + 1
+
+    def _flush_pending_lines(self):
+        """Store any pending range of lines as a chunk.
+
+        Version Added:
+            6.0
+        """
+        lines = self._pending_view_lines
+
+        if lines is not None:
+            self._data_chunks.append(
+                lines.get_view(self._pending_view_start,
+                               self._pending_view_end))
+            self._pending_view_lines = None
 
 
 class BaseDiffParser(object):
@@ -531,6 +782,96 @@ class BaseDiffParser(object):
         """
         raise NotImplementedError
 
+    def iter_raw_diff(self, diffset_or_commit):
+        """Yield the contents of a raw diff in pieces.
+
+        This generates the same diff as :py:meth:`raw_diff`, but allows it to
+        be streamed to a client (or elsewhere) without building the entire
+        diff in memory first.
+
+        By default, this yields the result of :py:meth:`raw_diff`. Subclasses
+        can override this to generate the diff incrementally.
+
+        Version Added:
+            6.0
+
+        Args:
+            diffset_or_commit (reviewboard.diffviewer.models.diffset.DiffSet or
+                               reviewboard.diffviewer.models.diffcommit
+                               .DiffCommit):
+                The DiffSet or DiffCommit to render. See :py:meth:`raw_diff`
+                for details.
+
+        Yields:
+            bytes:
+            Each piece of the diff.
+
+        Raises:
+            TypeError:
+                The provided ``diffset_or_commit`` wasn't of a supported type.
+        """
+        yield self.raw_diff(diffset_or_commit)
+
+    def _load_raw_diff_content(self, filediff):
+        """Load the diff content for a FileDiff in a raw diff.
+
+        The loaded diff data is released from the FileDiff afterward, so that
+        generating a raw diff only keeps one file's diff in memory at a time.
+
+        Version Added:
+            6.0
+
+        Args:
+            filediff (reviewboard.diffviewer.models.filediff.FileDiff):
+                The FileDiff to load the diff for.
+
+        Returns:
+            bytes:
+            The diff content.
+        """
+        diff = filediff.diff
+
+        # FileDiff.diff is loaded from the related RawFileDiffData, which
+        # would otherwise stay cached on the FileDiff (and the DiffSet's
+        # cumulative_files) for as long as the FileDiff is around.
+        filediff._state.fields_cache.pop('diff_hash', None)
+
+        return diff
+
+    def _get_raw_diff_filediffs(self, diffset_or_commit):
+        """Return the FileDiffs to include in a raw diff.
+
+        Version Added:
+            6.0
+
+        Args:
+            diffset_or_commit (reviewboard.diffviewer.models.diffset.DiffSet or
+                               reviewboard.diffviewer.models.diffcommit
+                               .DiffCommit):
+                The DiffSet or DiffCommit to render.
+
+                If passing in a DiffSet, only the cumulative diff's files
+                will be returned.
+
+        Returns:
+            list of reviewboard.diffviewer.models.filediff.FileDiff:
+            The FileDiffs to include.
+
+        Raises:
+            TypeError:
+                The provided ``diffset_or_commit`` wasn't of a supported type.
+        """
+        if hasattr(diffset_or_commit, 'cumulative_files'):
+            # This will be a DiffSet.
+            return diffset_or_commit.cumulative_files
+        elif hasattr(diffset_or_commit, 'files'):
+            # This will be a DiffCommit.
+            return diffset_or_commit.files.all()
+        else:
+            raise TypeError('%r is not a valid value. Please pass a DiffSet '
+                            'or DiffCommit.'
+                            % diffset_or_commit)
+
     def normalize_diff_filename(self, filename):
         """Normalize filenames in diffs.
 
@@ -578,8 +919,33 @@ class DiffParser(BaseDiffParser):
     * :py:meth:`parse_filename_header`
     * :py:meth:`parse_after_headers`
     * :py:meth:`normalize_diff_filename`
+
+    Version Changed:
+        6.0:
+        Diffs of at least :py:attr:`LINE_OFFSETS_MIN_DIFF_SIZE` bytes are
+        now parsed with :py:attr:`lines` as a :py:class:`DiffLines`, rather
+        than a list.
+
+    Attributes:
+        lines (list of bytes or DiffLines):
+            The lines in the diff, without line endings.
     """
 
+    #: The minimum size of a diff to parse using line offsets.
+    #:
+    #: Diffs of at least this size will store :py:attr:`lines` as a
+    #: :py:class:`DiffLines`, and parsed files will reference ranges of the
+    #: diff rather than copies of each line. This keeps memory usage close to
+    #: the size of the diff, at the cost of slower access to lines. Smaller
+    #: diffs are split into a list of lines.
+    #:
+    #: Version Added:
+    #:     6.0
+    #:
+    #: Type:
+    #:     int
+    LINE_OFFSETS_MIN_DIFF_SIZE = 10 * 1024 * 1024
+
     #: A separator string below an Index header.
     #:
     #: This is commonly found immediately below an ``Index:`` header, meant
@@ -615,7 +981,11 @@ class DiffParser(BaseDiffParser):
 
         self.base_commit_id = None
         self.new_commit_id = None
-        self.lines = split_line_endings(data)
+
+        if len(data) >= self.LINE_OFFSETS_MIN_DIFF_SIZE:
+            self.lines = DiffLines(data)
+        else:
+            self.lines = split_line_endings(data)
 
         self.parsed_diff = ParsedDiff(
             parser=self,
@@ -755,8 +1125,7 @@ class DiffParser(BaseDiffParser):
             elif line.startswith(b'+'):
                 parsed_file.insert_count += 1
 
-        parsed_file.append_data(line)
-        parsed_file.append_data(b'\n')
+        parsed_file.append_lines(self.lines, linenum, linenum + 1)
 
         return linenum + 1
 
@@ -828,9 +1197,7 @@ class DiffParser(BaseDiffParser):
         else:
             # The header is part of the diff, so make sure it gets in the
             # diff content.
-            for line in self.lines[start:linenum]:
-                parsed_file.append_data(line)
-                parsed_file.append_data(b'\n')
+            parsed_file.append_lines(self.lines, start, linenum)
 
         return linenum, parsed_file
 
@@ -1108,21 +1475,155 @@ class DiffParser(BaseDiffParser):
             TypeError:
                 The provided ``diffset_or_commit`` wasn't of a supported type.
         """
-        if hasattr(diffset_or_commit, 'cumulative_files'):
-            # This will be a DiffSet.
-            filediffs = diffset_or_commit.cumulative_files
-        elif hasattr(diffset_or_commit, 'files'):
-            # This will be a DiffCommit.
-            filediffs = diffset_or_commit.files.all()
+        return b''.join(self._iter_raw_diff(diffset_or_commit))
+
+    def iter_raw_diff(self, diffset_or_commit):
+        """Yield the contents of a raw diff in pieces.
+
+        This yields the diff for each FileDiff in turn, loading only one
+        file's diff data at a time.
+
+        If a subclass has overridden :py:meth:`raw_diff`, this will instead
+        yield its result.
+
+        Version Added:
+            6.0
+
+        Args:
+            diffset_or_commit (reviewboard.diffviewer.models.diffset.DiffSet or
+                               reviewboard.diffviewer.models.diffcommit
+                               .DiffCommit):
+                The DiffSet or DiffCommit to render. See :py:meth:`raw_diff`
+                for details.
+
+        Yields:
+            bytes:
+            Each piece of the diff.
+
+        Raises:
+            TypeError:
+                The provided ``diffset_or_commit`` wasn't of a supported type.
+        """
+        if type(self).raw_diff is DiffParser.raw_diff:
+            yield from self._iter_raw_diff(diffset_or_commit)
         else:
-            raise TypeError('%r is not a valid value. Please pass a DiffSet '
-                            'or DiffCommit.'
-                            % diffset_or_commit)
+            yield from super().iter_raw_diff(diffset_or_commit)
 
-        return b''.join(
-            filediff.diff
-            for filediff in filediffs
-        )
+    def _iter_raw_diff(self, diffset_or_commit):
+        """Yield the diff for each FileDiff in a raw diff.
+
+        Version Added:
+            6.0
+
+        Args:
+            diffset_or_commit (reviewboard.diffviewer.models.diffset.DiffSet or
+                               reviewboard.diffviewer.models.diffcommit
+                               .DiffCommit):
+                The DiffSet or DiffCommit to render.
+
+        Yields:
+            bytes:
+            The diff for each FileDiff.
+
+        Raises:
+            TypeError:
+                The provided ``diffset_or_commit`` wasn't of a supported type.
+        """
+        for filediff in self._get_raw_diff_filediffs(diffset_or_commit):
+            yield self._load_raw_diff_content(filediff)
+
+
+class _StreamingDiffXDOMWriter(DiffXDOMWriter):
+    """A DiffX DOM writer that generates the file one section at a time.
+
+    This writes a DiffX object tree in pieces, loading each file's diff
+    content only when its section is written and discarding it afterward.
+
+    Version Added:
+        6.0
+    """
+
+    def iter_stream(self, diffx, load_file_diff):
+        """Yield the contents of a DiffX file in pieces.
+
+        Args:
+            diffx (pydiffx.dom.objects.DiffX):
+                The DiffX object to write.
+
+            load_file_diff (callable):
+                A function to call with each
+                :py:class:`~pydiffx.dom.objects.DiffXFileSection` before it
+                is written, in order to load its diff content.
+
+        Yields:
+            bytes:
+            The headers of the DiffX file, followed by each file section.
+
+        Raises:
+            pydiffx.errors.BaseDiffXError:
+                The DiffX contents could not be written. Details will be in
+                the error message.
+        """
+        stream = io.BytesIO()
+        main_options = diffx.options.copy()
+
+        writer = self.writer_cls(
+            stream,
+            version=main_options.pop('version', DiffXWriter.VERSION),
+            encoding=main_options.pop('encoding', None),
+            **main_options)
+
+        for section in diffx:
+            yield from self._iter_section(section, writer, stream,
+                                          load_file_diff)
+
+        data = stream.getvalue()
+
+        if data:
+            yield data
+
+    def _iter_section(self, section, writer, stream, load_file_diff):
+        """Write a section, yielding the stream after each file section.
+
+        Args:
+            section (pydiffx.dom.objects.BaseDiffXSection):
+                The section to write.
+
+            writer (pydiffx.writer.DiffXWriter):
+                The streaming writer to write with.
+
+            stream (io.BytesIO):
+                The stream being written to. This will be emptied after
+                each file section.
+
+            load_file_diff (callable):
+                The function used to load the diff for a file section.
+
+        Yields:
+            bytes:
+            The contents of the stream after each file section has been
+            written, including any headers written before it.
+        """
+        if section.section_id == Section.FILE:
+            load_file_diff(section)
+
+            try:
+                self._write_section(section, writer)
+            finally:
+                section.diff = b''
+
+            yield stream.getvalue()
+            stream.seek(0)
+            stream.truncate()
+        elif section.section_id in CONTENT_SECTIONS:
+            self._write_section(section, writer)
+        else:
+            write_func = getattr(writer, 'new_%s' % section.section_name)
+            write_func(**self._get_options(section))
+
+            for subsection in section:
+                yield from self._iter_section(subsection, writer, stream,
+                                              load_file_diff)
 
 
 class DiffXParser(BaseDiffParser):
@@ -1430,6 +1931,66 @@ class DiffXParser(BaseDiffParser):
             bytes:
             The resulting DiffX file contents.
 
+        Raises:
+            TypeError:
+                The provided ``diffset_or_commit`` value wasn't of a
+                supported type.
+        """
+        return b''.join(self._iter_raw_diff(diffset_or_commit))
+
+    def iter_raw_diff(self, diffset_or_commit):
+        """Yield the contents of a raw diff in pieces.
+
+        This generates the same DiffX file as :py:meth:`raw_diff`, yielding
+        the headers and then each file section in turn. Only one file's diff
+        data is loaded at a time.
+
+        If a subclass has overridden :py:meth:`raw_diff`, this will instead
+        yield its result.
+
+        Version Added:
+            6.0
+
+        Args:
+            diffset_or_commit (reviewboard.diffviewer.models.diffset.DiffSet or
+                               reviewboard.diffviewer.models.diffcommit
+                               .DiffCommit):
+                The DiffSet or DiffCommit to render. See :py:meth:`raw_diff`
+                for details.
+
+        Yields:
+            bytes:
+            Each piece of the DiffX file.
+
+        Raises:
+            TypeError:
+                The provided ``diffset_or_commit`` value wasn't of a
+                supported type.
+        """
+        if type(self).raw_diff is DiffXParser.raw_diff:
+            yield from self._iter_raw_diff(diffset_or_commit)
+        else:
+            yield from super().iter_raw_diff(diffset_or_commit)
+
+    def _iter_raw_diff(self, diffset_or_commit):
+        """Return a generator for the pieces of a raw DiffX file.
+
+        The structure of the DiffX file is built up front, without any diff
+        content. Each file's diff is loaded only when its section is written.
+
+        Version Added:
+            6.0
+
+        Args:
+            diffset_or_commit (reviewboard.diffviewer.models.diffset.DiffSet or
+                               reviewboard.diffviewer.models.diffcommit
+                               .DiffCommit):
+                The DiffSet or DiffCommit to render.
+
+        Returns:
+            iterator of bytes:
+            The generator for the pieces of the DiffX file.
+
         Raises:
             TypeError:
                 The provided ``diffset_or_commit`` value wasn't of a
@@ -1501,6 +2062,10 @@ class DiffXParser(BaseDiffParser):
         self._load_preamble(diffx, diffx_main_info)
         self._load_meta(diffx, diffx_main_info)
 
+        # File sections are compared by value, so they're mapped to their
+        # FileDiffs by ID.
+        file_sections = {}
+
         for change in changes:
             diffx_change_info = change['extra_data'].get('diffx', {})
 
@@ -1516,13 +2081,21 @@ class DiffXParser(BaseDiffParser):
                 self._load_options(diffx_file, diffx_file_info)
                 self._load_meta(diffx_file, diffx_file_info)
 
-                if filediff.diff:
-                    diffx_file.diff = filediff.diff
-                    self._load_options(diffx_file.diff_section,
-                                       diffx_file_info,
-                                       key='diff_options')
+                file_sections[id(diffx_file)] = (filediff, diffx_file_info)
+
+        def _load_file_diff(diffx_file):
+            filediff, diffx_file_info = file_sections[id(diffx_file)]
+            diff = self._load_raw_diff_content(filediff)
+
+            if diff:
+                diffx_file.diff = diff
+                self._load_options(diffx_file.diff_section,
+                                   diffx_file_info,
+                                   key='diff_options')
 
-        return diffx.to_bytes()
+        return _StreamingDiffXDOMWriter().iter_stream(
+            diffx,
+            load_file_diff=_load_file_diff)
 
     def _store_options(self, extra_data, diffx_section, key='options'):
         """Store options for a section in extra_data.
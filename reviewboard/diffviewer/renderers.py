@@ -7,7 +7,8 @@ from housekeeping.functions import deprecate_non_keyword_only_args
 
 from reviewboard.deprecation import RemovedInReviewBoard70Warning
 from reviewboard.diffviewer.chunk_generator import compute_chunk_last_header
-from reviewboard.diffviewer.diffutils import populate_diff_chunks
+from reviewboard.diffviewer.diffutils import (populate_diff_chunk,
+                                              populate_diff_chunks)
 from reviewboard.diffviewer.errors import UserVisibleError
 from reviewboard.diffviewer.settings import DiffSettings
 
@@ -33,6 +34,24 @@ class DiffRenderer(object):
 
     default_template_name = 'diffviewer/diff_file_fragment.html'
 
+    #: Whether to render chunks in Python instead of in the template.
+    #:
+    #: When enabled, the default template renders all chunks through the
+    #: :py:func:`~reviewboard.diffviewer.templatetags.difftags.diff_chunks`
+    #: template tag, which produces the same HTML as the template's own loop
+    #: over chunks, but much faster for files with many chunks.
+    #:
+    #: If ``None``, this is only enabled for :py:class:`DiffRenderer`
+    #: itself. Subclasses (such as those provided by extensions) will render
+    #: chunks through the template, unless they set this to ``True``.
+    #:
+    #: Version Added:
+    #:     6.0
+    #:
+    #: Type:
+    #:     bool
+    use_chunks_renderer = None
+
     ######################
     # Instance variables #
     ######################
@@ -124,6 +143,7 @@ class DiffRenderer(object):
         self.allow_caching = allow_caching
         self.template_name = template_name
         self.num_chunks = 0
+        self._all_chunks_loaded = True
         self.show_deleted = show_deleted
 
         if self.lines_of_context and len(self.lines_of_context) == 1:
@@ -162,15 +182,32 @@ class DiffRenderer(object):
         only as often as necessary. render_to_string will call this if it's
         not already in the cache.
         """
-        if not self.diff_file.get('chunks_loaded', False):
+        if self.diff_file.get('chunks_loaded', False):
+            self._all_chunks_loaded = True
+        elif self.chunk_index is not None:
+            # Only load the chunk being rendered.
+            #
+            # When expanding context, only a few lines of the chunk will be
+            # rendered, so only load those lines.
+            populate_diff_chunk(diff_file=self.diff_file,
+                                chunk_index=self.chunk_index,
+                                request=request,
+                                diff_settings=self.diff_settings,
+                                lazy_lines=bool(self.lines_of_context))
+            self._all_chunks_loaded = False
+        else:
             populate_diff_chunks(files=[self.diff_file],
                                  request=request,
                                  diff_settings=self.diff_settings)
+            self._all_chunks_loaded = True
 
         if self.chunk_index is not None:
             assert not self.lines_of_context or self.collapse_all
 
-            self.num_chunks = len(self.diff_file['chunks'])
+            if self._all_chunks_loaded:
+                self.num_chunks = len(self.diff_file['chunks'])
+            else:
+                self.num_chunks = self.diff_file['num_chunks']
 
             if self.chunk_index < 0 or self.chunk_index >= self.num_chunks:
                 raise UserVisibleError(
@@ -231,9 +268,11 @@ class DiffRenderer(object):
 
         if self.chunk_index is not None:
             # We're rendering a specific chunk within a file's diff, rather
-            # than the whole diff.
-            self.diff_file['chunks'] = \
-                [self.diff_file['chunks'][self.chunk_index]]
+            # than the whole diff. If only that chunk was loaded, it's
+            # already the only chunk in the list.
+            if self._all_chunks_loaded:
+                self.diff_file['chunks'] = \
+                    [self.diff_file['chunks'][self.chunk_index]]
 
             if self.lines_of_context:
                 # We're rendering a specific range of lines within this chunk,
@@ -241,7 +280,6 @@ class DiffRenderer(object):
                 chunk = self.diff_file['chunks'][0]
                 lines = chunk['lines']
                 num_lines = len(lines)
-                new_lines = []
 
                 total_lines_of_context = (self.lines_of_context[0] +
                                           self.lines_of_context[1])
@@ -280,8 +318,9 @@ class DiffRenderer(object):
                             'numlines': collapse_i,
                         })
 
-                    # The header contents
-                    new_lines += lines[collapse_i:chunk2_i]
+                    # The header contents. These won't be rendered, so if the
+                    # lines are being loaded on demand, they won't be loaded.
+                    new_lines = lines[collapse_i:chunk2_i]
 
                     if (self.chunk_index < self.num_chunks - 1 and
                             chunk2_i + self.lines_of_context[1] <= num_lines):
@@ -325,6 +364,11 @@ class DiffRenderer(object):
             if chunk['change'] == 'equal':
                 equal_lines += chunk['numlines']
 
+        use_chunks_renderer = self.use_chunks_renderer
+
+        if use_chunks_renderer is None:
+            use_chunks_renderer = (type(self) is DiffRenderer)
+
         context.update({
             'collapseall': self.collapse_all,
             'file': self.diff_file,
@@ -332,6 +376,7 @@ class DiffRenderer(object):
             'equal_lines': equal_lines,
             'standalone': self.chunk_index is not None,
             'show_deleted': self.show_deleted,
+            'use_chunks_renderer': use_chunks_renderer,
         })
 
         return context
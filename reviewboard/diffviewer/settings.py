@@ -94,6 +94,38 @@ class DiffSettings:
     #:     int
     syntax_highlighting_threshold: int
 
+    # The following settings were added after the class was introduced, and
+    # have defaults matching the site configuration so that existing callers
+    # constructing DiffSettings directly continue to work. Dataclass fields
+    # with defaults must follow those without, so these are sorted
+    # separately.
+
+    #: The maximum number of seconds to spend computing the diff of a file.
+    #:
+    #: If diffing a file takes longer than this, the rest of the diff will
+    #: be simplified, skipping move detection and highlighting of changes
+    #: within lines, and falling back to a coarse line-level diff for any
+    #: remaining changes. ``0`` disables the limit.
+    #:
+    #: Version Added:
+    #:     6.0
+    #:
+    #: Type:
+    #:     int
+    diff_time_budget: int = 20
+
+    #: The maximum number of changed lines in a file for move detection.
+    #:
+    #: If a file has more inserted and deleted lines than this, moved lines
+    #: will not be detected. ``0`` disables the limit.
+    #:
+    #: Version Added:
+    #:     6.0
+    #:
+    #: Type:
+    #:     int
+    move_detection_max_lines: int = 50_000
+
     @classmethod
     def create(
         cls,
@@ -177,9 +209,15 @@ class DiffSettings:
             custom_pygments_lexers=cast(
                 Dict[str, str],
                 siteconfig.get('diffviewer_custom_pygments_lexers')),
+            diff_time_budget=cast(
+                int,
+                siteconfig.get('diffviewer_diff_time_budget')),
             include_space_patterns=cast(
                 List[str],
                 siteconfig.get('diffviewer_include_space_patterns')),
+            move_detection_max_lines=cast(
+                int,
+                siteconfig.get('diffviewer_move_detection_max_lines')),
             paginate_by=cast(
                 int,
                 siteconfig.get('diffviewer_paginate_by')),
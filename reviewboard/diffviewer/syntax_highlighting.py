@@ -0,0 +1,127 @@
+"""Shared caching of syntax-highlighted file contents.
+
+Version Added:
+    6.0
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+from typing import Callable, Dict, List
+
+import pygments
+from django.core.cache import cache
+from djblets.cache.backend import cache_memoize, make_cache_key
+from pygments.lexer import Lexer
+
+
+logger = logging.getLogger(__name__)
+
+
+#: The cache key storing the number of highlighting cache hits.
+#:
+#: Type:
+#:     str
+CACHE_HITS_KEY = 'diff-syntax-highlighting-cache-hits'
+
+
+#: The cache key storing the number of highlighting cache misses.
+#:
+#: Type:
+#:     str
+CACHE_MISSES_KEY = 'diff-syntax-highlighting-cache-misses'
+
+
+def get_highlighted_lines(
+    data: str,
+    lexer: Lexer,
+    highlight_func: Callable[[str, Lexer], List[str]],
+) -> List[str]:
+    """Return syntax-highlighted lines for file contents, using a cache.
+
+    Highlighted lines are cached under the SHA256 of the contents, the
+    lexer, and the Pygments version. This allows highlighted contents to be
+    shared across all diffs containing the same version of a file,
+    regardless of the FileDiff, interdiff, or diff settings being rendered.
+
+    Hits and misses are counted in the cache, and can be retrieved through
+    :py:func:`get_cache_access_counts`.
+
+    Args:
+        data (str):
+            The file contents to highlight.
+
+        lexer (pygments.lexer.Lexer):
+            The lexer used to highlight the contents.
+
+        highlight_func (callable):
+            The function used to highlight the contents on a cache miss.
+            This takes the contents and lexer and returns a list of lines.
+
+    Returns:
+        list of str:
+        The syntax-highlighted lines.
+    """
+    sha256 = hashlib.sha256(data.encode('utf-8')).hexdigest()
+    lexer_class = type(lexer)
+    key = 'diff-syntax-highlighting-%s.%s-%s-%s' % (
+        lexer_class.__module__,
+        lexer_class.__name__,
+        pygments.__version__,
+        sha256)
+    missed = False
+
+    def _highlight():
+        nonlocal missed
+
+        missed = True
+
+        return highlight_func(data, lexer)
+
+    lines = cache_memoize(key, _highlight, large_data=True)
+    _increment_counter(CACHE_MISSES_KEY if missed else CACHE_HITS_KEY)
+
+    return lines
+
+
+def get_cache_access_counts() -> Dict[str, int]:
+    """Return the number of hits and misses for highlighted contents.
+
+    Returns:
+        dict:
+        A dictionary with ``hits`` and ``misses`` keys.
+    """
+    hits_key = make_cache_key(CACHE_HITS_KEY)
+    misses_key = make_cache_key(CACHE_MISSES_KEY)
+    counts = cache.get_many([hits_key, misses_key])
+
+    return {
+        'hits': counts.get(hits_key, 0),
+        'misses': counts.get(misses_key, 0),
+    }
+
+
+def _increment_counter(
+    key: str,
+) -> None:
+    """Increment a counter in the cache.
+
+    Args:
+        key (str):
+            The cache key for the counter.
+    """
+    key = make_cache_key(key)
+
+    try:
+        try:
+            cache.incr(key)
+        except ValueError:
+            # The counter hasn't been stored yet (or was evicted).
+            if not cache.add(key, 1, timeout=None):
+                cache.incr(key)
+    except Exception as e:
+        # Statistics should never interfere with rendering diffs.
+        logger.warning('Unable to update syntax highlighting cache '
+                       'counter %s: %s',
+                       key, e)
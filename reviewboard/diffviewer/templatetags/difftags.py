@@ -3,9 +3,10 @@ import re
 
 from django import template
 from django.template.loader import render_to_string
-from django.utils.html import escape, format_html
+from django.utils.formats import localize
+from django.utils.html import conditional_escape, escape, format_html
 from django.utils.safestring import mark_safe
-from django.utils.translation import gettext as _
+from django.utils.translation import gettext as _, ngettext
 
 from reviewboard.codesafety import code_safety_checker_registry
 from reviewboard.diffviewer.chunk_generator import DiffChunkGenerator
@@ -105,8 +106,19 @@ def showextrawhitespace(value):
     Any trailing whitespace or tabs following one or more spaces are
     marked up by inserted ``<span class="ew">...</span>`` tags.
     """
-    value = extraWhitespace.sub(r'<span class="ew">\1</span>', value)
-    return mark_safe(value.replace('\t', '<span class="tb">\t</span>'))
+    has_tabs = '\t' in value
+
+    # Most lines have no extra whitespace. Only run the regex if the line
+    # could match it.
+    if (has_tabs or
+        value[-1:].isspace() or
+        (value.endswith('</span>') and value[-8:-7].isspace())):
+        value = extraWhitespace.sub(r'<span class="ew">\1</span>', value)
+
+        if has_tabs:
+            value = value.replace('\t', '<span class="tb">\t</span>')
+
+    return mark_safe(value)
 
 
 def _diff_expand_link(context, expandable, text, tooltip,
@@ -243,48 +255,45 @@ def diff_lines(index, chunk, standalone, line_fmt, anchor_fmt='',
     num_lines = len(lines)
     chunk_index = chunk['index']
     change = chunk['change']
-    is_equal = False
-    is_replace = False
-    is_insert = False
-    is_delete = False
-
-    if change == 'equal':
-        is_equal = True
-    elif change == 'replace':
-        is_replace = True
-    elif change == 'insert':
-        is_insert = True
-    elif change == 'delete':
-        is_delete = True
+    is_equal = (change == 'equal')
+    is_replace = (change == 'replace')
+
+    # Conditionally update any content on either side of the displayed
+    # line. Only do this for sides that would contain changes (inserted,
+    # deleted, replaced, or equal lines). Each entry is the index of the
+    # side and the index of its changed regions within the line.
+    sides = []
+
+    if change != 'insert':
+        sides.append((0, 3))
+
+    if change != 'delete':
+        sides.append((1, 6))
 
     result = []
     last_line_num = num_lines - 1
 
     for i, line in enumerate(lines):
         row_classes = []
-        header_1_classes = []
-        header_2_classes = []
-        cell_1_classes = ['l']
-        cell_2_classes = ['r']
-        row_class_attr = ''
         header_1_class_attr = ''
         header_2_class_attr = ''
-        cell_1_class_attr = ''
-        cell_2_class_attr = ''
+        cell_1_class_attr = ' class="l"'
+        cell_2_class_attr = ' class="r"'
         line_html_sides = [line[2], line[5]]
         linenum1 = line[1]
         linenum2 = line[4]
-        show_collapse = False
-        anchor = None
-        warning_labels = set()
+        anchor_html = ''
+        moved_from = {}
+        moved_to = {}
+        moved_from_html = ''
+        moved_to_html = ''
+        warnings_html = ''
 
         try:
             line_meta = line[8]
         except IndexError:
             line_meta = {}
 
-        code_safety_results = line_meta.get('code_safety', [])
-
         if i == 0:
             row_classes.append('first')
 
@@ -293,21 +302,21 @@ def diff_lines(index, chunk, standalone, line_fmt, anchor_fmt='',
 
         if not is_equal:
             if i == 0:
-                anchor = '%s.%s' % (index, chunk_index)
+                anchor_html = anchor_fmt % {
+                    'anchor': '%s.%s' % (index, chunk_index),
+                }
 
             if line[7]:
                 row_classes.append('whitespace-line')
+
+        if line_meta:
+            code_safety_results = line_meta.get('code_safety', [])
         else:
-            show_collapse = (i == 0 and standalone)
+            code_safety_results = []
 
-        # Conditionally update any content on either side of the displayed
-        # line. Only do this for lines that would contain changes (inserted,
-        # deleted, replaced, or equal lines).
-        for side_i, process, line_range in ((0, not is_insert, line[3]),
-                                            (1, not is_delete, line[6])):
-            if not process:
-                continue
+        warning_labels = set()
 
+        for side_i, line_range_i in sides:
             line_html = line_html_sides[side_i]
 
             if line_html and len(line_html) <= STYLED_MAX_LINE_LEN:
@@ -315,6 +324,8 @@ def diff_lines(index, chunk, standalone, line_fmt, anchor_fmt='',
                 #       code that may modify the length of any text content
                 #       within tags, or the highlighting regions will be
                 #       incorrect.
+                line_range = line[line_range_i]
+
                 if is_replace and line_range:
                     line_html = highlightregion(line_html, line_range)
 
@@ -348,15 +359,15 @@ def diff_lines(index, chunk, standalone, line_fmt, anchor_fmt='',
 
         # Check for any move information. If found, prepare CSS classes and
         # HTML to show on the line.
-        moved_from = {}
-        moved_to = {}
-        is_moved_row = False
-        is_first_moved_row = False
+        if line_meta and ('from' in line_meta or 'to' in line_meta):
+            header_1_classes = []
+            header_2_classes = []
+            cell_1_classes = ['l']
+            cell_2_classes = ['r']
+            is_first_moved_row = False
 
-        if line_meta:
             if 'from' in line_meta:
                 moved_from_linenum, moved_from_first = line_meta['from']
-                is_moved_row = True
 
                 header_2_classes.append('moved-from')
                 cell_2_classes.append('moved-from')
@@ -373,10 +384,10 @@ def diff_lines(index, chunk, standalone, line_fmt, anchor_fmt='',
                         'target': mark_safe('moved-to-%s' % linenum2),
                         'text': _('Moved from line %s') % moved_from_linenum,
                     }
+                    moved_from_html = moved_fmt % moved_from
 
             if 'to' in line_meta:
                 moved_to_linenum, moved_to_first = line_meta['to']
-                is_moved_row = True
 
                 header_1_classes.append('moved-to')
                 cell_1_classes.append('moved-to')
@@ -392,40 +403,37 @@ def diff_lines(index, chunk, standalone, line_fmt, anchor_fmt='',
                         'target': mark_safe('moved-from-%s' % linenum1),
                         'text': _('Moved to line %s') % moved_to_linenum,
                     }
+                    moved_to_html = moved_fmt % moved_to
 
-        # Build all the attributes that will be used for the elements.
-        if is_moved_row:
             row_classes.append('moved-row')
 
-        if is_first_moved_row:
-            row_classes.append('moved-row-start')
+            if is_first_moved_row:
+                row_classes.append('moved-row-start')
 
-        if row_classes:
-            row_class_attr = ' class="%s"' % ' '.join(row_classes)
-
-        if cell_1_classes:
             cell_1_class_attr = ' class="%s"' % ' '.join(cell_1_classes)
-
-        if cell_2_classes:
             cell_2_class_attr = ' class="%s"' % ' '.join(cell_2_classes)
 
-        if header_1_classes:
-            header_1_class_attr = ' class="%s"' % ' '.join(header_1_classes)
+            if header_1_classes:
+                header_1_class_attr = \
+                    ' class="%s"' % ' '.join(header_1_classes)
 
-        if header_2_classes:
-            header_2_class_attr = ' class="%s"' % ' '.join(header_2_classes)
+            if header_2_classes:
+                header_2_class_attr = \
+                    ' class="%s"' % ' '.join(header_2_classes)
 
-        # Build all the HTML used for the line.
-        anchor_html = ''
-        begin_collapse_html = ''
-        end_collapse_html = ''
-        moved_from_html = ''
-        moved_to_html = ''
-        warnings_html = ''
+        if warning_labels:
+            warnings_html = line_warnings_fmt % {
+                'warning_labels': ', '.join(
+                    escape(_label)
+                    for _label in warning_labels
+                ),
+            }
 
+        # Build the HTML for the line.
         context = {
             'chunk_index': chunk_index,
-            'row_class_attr': row_class_attr,
+            'row_class_attr': (' class="%s"' % ' '.join(row_classes)
+                               if row_classes else ''),
             'header_1_class_attr': header_1_class_attr,
             'header_2_class_attr': header_2_class_attr,
             'cell_1_class_attr': cell_1_class_attr,
@@ -437,41 +445,197 @@ def diff_lines(index, chunk, standalone, line_fmt, anchor_fmt='',
             'line2': line_html_sides[1],
             'moved_from': moved_from,
             'moved_to': moved_to,
+            'anchor_html': anchor_html,
+            'begin_collapse_html': '',
+            'end_collapse_html': '',
+            'moved_from_html': moved_from_html,
+            'moved_to_html': moved_to_html,
+            'warnings_html': warnings_html,
         }
 
-        if anchor:
-            anchor_html = anchor_fmt % {
-                'anchor': anchor,
-            }
+        if is_equal and i == 0 and standalone:
+            context.update({
+                'begin_collapse_html': begin_collapse_fmt % context,
+                'end_collapse_html': end_collapse_fmt % context,
+            })
 
-        if show_collapse:
-            begin_collapse_html = begin_collapse_fmt % context
-            end_collapse_html = end_collapse_fmt % context
+        result.append(line_fmt % context)
 
-        if moved_from:
-            moved_from_html = moved_fmt % moved_from
+    return mark_safe(''.join(result))
 
-        if moved_to:
-            moved_to_html = moved_fmt % moved_to
 
-        if warning_labels:
-            warnings_html = line_warnings_fmt % {
-                'warning_labels': ', '.join(
-                    escape(_label)
-                    for _label in warning_labels
-                ),
+@register.simple_tag(takes_context=True)
+def diff_chunks(context, line_fmt, anchor_fmt='', begin_collapse_fmt='',
+                end_collapse_fmt='', moved_fmt='', line_warnings_fmt=''):
+    """Render all the chunks of a file in the diff viewer.
+
+    This renders the ``<tbody>`` for each chunk in a file, including the
+    headers for collapsed chunks, producing the same HTML as looping over
+    the chunks in :file:`diffviewer/diff_file_fragment.html`.
+
+    Looping over chunks in a Django template is slow for files with many
+    chunks, so the markup is built in Python instead. The lines of each
+    chunk are rendered by :py:func:`diff_lines`.
+
+    Version Added:
+        6.0
+
+    Args:
+        context (django.template.Context):
+            The template context. This must contain ``file``,
+            ``collapseall``, ``lines_of_context`` and ``standalone``.
+
+        line_fmt (str):
+            The ``%``-formatted template for a side-by-side line.
+
+        anchor_fmt (str, optional):
+            The Python ``%``-formatted template for an anchor to a line.
+
+        begin_collapse_fmt (str, optional):
+            The Python ``%``-formatted template for the beginning of a
+            collapsed section.
+
+        end_collapse_fmt (str, optional):
+            The Python ``%``-formatted template for the end of a collapsed
+            section.
+
+        moved_fmt (str, optional):
+            The Python ``%``-formatted template for a move flag.
+
+        line_warnings_fmt (str, optional):
+            The Python ``%``-formatted template for a line warnings indicator.
+
+    Returns:
+        django.utils.safestring.SafeString:
+        The rendered HTML.
+    """
+    diff_file = context['file']
+    file_index = diff_file['index']
+    num_chunks = diff_file.get('num_chunks')
+    collapse_all = context['collapseall']
+    standalone = context['standalone']
+    header_context = {
+        'file': diff_file,
+        'lines_of_context': context['lines_of_context'],
+    }
+    result = []
+
+    for chunk in diff_file['chunks']:
+        chunk_index = chunk['index']
+        meta = chunk.get('meta') or {}
+        result.append('\n')
+
+        if not chunk.get('collapsable') or not collapse_all:
+            classes = [chunk['change']]
+
+            if chunk['change'] != 'equal':
+                if meta.get('whitespace_chunk'):
+                    classes.append('whitespace-chunk')
+            elif chunk.get('collapsable'):
+                classes.append('collapsable')
+
+            if standalone:
+                classes.append('loaded')
+
+            result += [
+                format_html('\n <tbody id="chunk{0}.{1}" class="{2}">\n',
+                            file_index, chunk_index, ' '.join(classes)),
+                diff_lines(index=file_index,
+                           chunk=chunk,
+                           standalone=standalone,
+                           line_fmt=line_fmt,
+                           anchor_fmt=anchor_fmt,
+                           begin_collapse_fmt=begin_collapse_fmt,
+                           end_collapse_fmt=end_collapse_fmt,
+                           moved_fmt=moved_fmt,
+                           line_warnings_fmt=line_warnings_fmt),
+                '\n </tbody>\n',
+            ]
+        else:
+            header_context['chunk'] = chunk
+            numlines = chunk['numlines']
+
+            result.append(format_html(
+                '\n <tbody class="diff-header" id="collapsed-chunk{0}.{1}">\n'
+                '  <tr>\n'
+                '   <th>\n',
+                file_index, chunk_index))
+
+            if chunk_index != 0:
+                result += [
+                    '\n    ',
+                    diff_expand_link(header_context, 'above',
+                                     _('Show 20 more lines above'), 20, 0),
+                    '\n',
+                ]
+
+            expand_text = ngettext('%(lines)s line', '%(lines)s lines',
+                                   numlines) % {
+                'lines': conditional_escape(localize(numlines)),
             }
 
-        context.update({
-            'anchor_html': anchor_html,
-            'begin_collapse_html': begin_collapse_html,
-            'end_collapse_html': end_collapse_html,
-            'moved_from_html': moved_from_html,
-            'moved_to_html': moved_to_html,
-            'warnings_html': warnings_html,
-        })
+            result += [
+                '\n'
+                '   </th>\n'
+                '   <td colspan="3">\n'
+                '    \n'
+                '    ',
+                diff_expand_link(header_context, 'all', _('Show all lines'),
+                                 0, 0, mark_safe(expand_text)),
+                '\n'
+                '   </td>\n'
+                '  </tr>\n',
+            ]
+
+            if chunk_index + 1 != num_chunks:
+                result += [
+                    '\n'
+                    '  <tr>\n'
+                    '   <th>',
+                    diff_expand_link(header_context, 'below',
+                                     _('Show 20 more lines below'), 0, 20),
+                    '</th>\n',
+                ]
+
+                headers = meta.get('headers')
+
+                if headers and headers[0]:
+                    header_1 = headers[1]
+                    result.append('\n')
+
+                    if (header_1 and
+                        headers[0].get('text') == header_1.get('text')):
+                        result += [
+                            '\n   <td colspan="3">',
+                            diff_chunk_header(header_context, headers[0]),
+                            '</td>\n',
+                        ]
+                    else:
+                        result += [
+                            '\n   <td>',
+                            diff_chunk_header(header_context, headers[0]),
+                            '</td>\n'
+                            '   <td colspan="2">\n',
+                        ]
 
-        result.append(line_fmt % context)
+                        if header_1:
+                            result += [
+                                '\n',
+                                diff_chunk_header(header_context, header_1),
+                                '\n',
+                            ]
+
+                        result.append('\n   </td>\n')
+
+                    result.append('\n')
+                else:
+                    result.append('\n   <td colspan="3"></td>\n')
+
+                result.append('\n  </tr>\n')
+
+            result.append('\n </tbody>\n')
+
+        result.append('\n')
 
     return mark_safe(''.join(result))
 
@@ -0,0 +1,130 @@
+"""Unit tests for reviewboard.diffviewer.chunk_lines."""
+
+import pickle
+
+from reviewboard.diffviewer.chunk_lines import (LINES_FORMAT_VERSION,
+                                                DiffLine,
+                                                deserialize_lines,
+                                                serialize_lines)
+from reviewboard.testing import TestCase
+
+
+class DiffLineTests(TestCase):
+    """Unit tests for DiffLine."""
+
+    def test_attributes(self):
+        """Testing DiffLine attributes"""
+        line = DiffLine((10, 4, 'foo', [(0, 1)], 5, 'bar', [(1, 2)], True,
+                         {'to': (20, True)}))
+
+        self.assertEqual(line.row, 10)
+        self.assertEqual(line.orig_line_num, 4)
+        self.assertEqual(line.orig_markup, 'foo')
+        self.assertEqual(line.orig_regions, [(0, 1)])
+        self.assertEqual(line.modified_line_num, 5)
+        self.assertEqual(line.modified_markup, 'bar')
+        self.assertEqual(line.modified_regions, [(1, 2)])
+        self.assertTrue(line.is_whitespace)
+        self.assertEqual(line.meta, {'to': (20, True)})
+
+    def test_meta_without_meta(self):
+        """Testing DiffLine.meta without metadata"""
+        line = DiffLine((1, 1, 'foo', [], 1, 'foo', [], False))
+
+        self.assertEqual(line.meta, {})
+
+        with self.assertRaises(IndexError):
+            line[8]
+
+    def test_eq_with_list(self):
+        """Testing DiffLine.__eq__ with a list"""
+        line = DiffLine((1, 1, 'foo', [], 1, 'foo', [], False))
+
+        self.assertEqual(line, [1, 1, 'foo', [], 1, 'foo', [], False])
+        self.assertEqual([1, 1, 'foo', [], 1, 'foo', [], False], line)
+        self.assertEqual([line], [[1, 1, 'foo', [], 1, 'foo', [], False]])
+        self.assertNotEqual(line, [1, 1, 'foo', [], 1, 'bar', [], False])
+        self.assertNotEqual([1, 1, 'foo', [], 1, 'bar', [], False], line)
+
+    def test_pickle(self):
+        """Testing DiffLine with pickling"""
+        line = DiffLine((1, 1, 'foo', [], 1, 'foo', [], False))
+        result = pickle.loads(pickle.dumps(line, protocol=0))
+
+        self.assertIsInstance(result, DiffLine)
+        self.assertEqual(result, line)
+
+
+class SerializeLinesTests(TestCase):
+    """Unit tests for serialize_lines and deserialize_lines."""
+
+    def test_round_trip(self):
+        """Testing serialize_lines and deserialize_lines"""
+        lines = [
+            [1, 1, 'a', [], 1, 'a', [], False],
+            [2, 2, 'b', [], 2, 'b', [], False],
+            [3, 3, 'c &lt;', [(0, 1)], 3, 'd', [(0, 1)], False,
+             {'to': (10, True)}],
+            [4, 4, 'e', None, 4, 'e ', None, True],
+            [5, '', '', [], 5, 'f', [], False,
+             {
+                 'code_safety': [
+                     ('trojan_source', {
+                         'warnings': {'zws'},
+                     }),
+                 ],
+                 'from': (20, False),
+             }],
+            [6, 5, 'g', [], '', '', [], False],
+            [7, 9, 'h', [], 6, 'h', [], False],
+        ]
+
+        result = deserialize_lines(serialize_lines(lines))
+
+        self.assertEqual(result, lines)
+        self.assertIsInstance(result[0], DiffLine)
+        self.assertIsNone(result[3][3])
+
+    def test_serialize_compacts_lines(self):
+        """Testing serialize_lines stores runs of line numbers and omits
+        unchanged HTML
+        """
+        lines = [
+            [i, i, 'line %d' % i, [], i, 'line %d' % i, [], False]
+            for i in range(1, 101)
+        ]
+
+        data = serialize_lines(lines)
+
+        self.assertEqual(
+            data,
+            (LINES_FORMAT_VERSION, 100, [1, 100], [1, 100],
+             ['line %d' % i for i in range(1, 101)],
+             [1, 100], [None] * 100, {}, [], {}))
+        self.assertEqual(deserialize_lines(data), lines)
+
+    def test_serialize_with_empty(self):
+        """Testing serialize_lines with no lines"""
+        self.assertEqual(deserialize_lines(serialize_lines([])), [])
+
+    def test_serialize_with_unexpected_lines(self):
+        """Testing serialize_lines with lines that don't fit the compact
+        layout
+        """
+        lines = [
+            [1, 1, 'a', [], 1, 'a', [], False],
+            [2, '2', 'b', [], 2, 'b', [], 0],
+        ]
+
+        data = serialize_lines(lines)
+
+        self.assertIsNone(data[1])
+        self.assertEqual(deserialize_lines(data), lines)
+
+    def test_deserialize_with_old_format(self):
+        """Testing deserialize_lines with lines stored in an older format"""
+        self.assertIsNone(deserialize_lines([
+            [1, 1, 'a', [], 1, 'a', [], False],
+        ]))
+        self.assertIsNone(deserialize_lines(
+            (LINES_FORMAT_VERSION + 1, None, [])))
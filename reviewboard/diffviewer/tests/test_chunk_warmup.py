@@ -0,0 +1,305 @@
+"""Unit tests for reviewboard.diffviewer.chunk_warmup."""
+
+import kgb
+from django.db import connections
+
+from reviewboard.changedescs.models import ChangeDescription
+from reviewboard.diffviewer import chunk_warmup
+from reviewboard.diffviewer.chunk_generator import RawDiffChunkGenerator
+from reviewboard.diffviewer.chunk_warmup import (ChunkWarmupQueue,
+                                                 connect_signals,
+                                                 get_diffsets_to_warm,
+                                                 warm_diffset_chunks,
+                                                 warm_diffset_history_chunks)
+from reviewboard.diffviewer.diffutils import _get_diff_file_chunk_generator
+from reviewboard.diffviewer.settings import DiffSettings
+from reviewboard.diffviewer.tests.test_filediff_manager import InlineExecutor
+from reviewboard.testing import TestCase
+
+
+class ChunkWarmupTests(kgb.SpyAgency, TestCase):
+    """Unit tests for pre-generating diff chunks."""
+
+    fixtures = ['test_users', 'test_scmtools']
+
+    def setUp(self):
+        super(ChunkWarmupTests, self).setUp()
+
+        self.review_request = self.create_review_request(
+            create_repository=True)
+        self.diffset_history_id = self.review_request.diffset_history_id
+        self.diff_settings = DiffSettings.create()
+
+    def test_get_diffsets_to_warm_with_no_diffsets(self):
+        """Testing get_diffsets_to_warm with no diffsets"""
+        self.assertEqual(get_diffsets_to_warm(self.diffset_history_id), [])
+
+    def test_get_diffsets_to_warm_with_one_diffset(self):
+        """Testing get_diffsets_to_warm with one diffset"""
+        diffset = self.create_diffset(self.review_request)
+
+        self.assertEqual(get_diffsets_to_warm(self.diffset_history_id),
+                         [(diffset, None)])
+
+    def test_get_diffsets_to_warm_with_multiple_diffsets(self):
+        """Testing get_diffsets_to_warm with multiple diffsets"""
+        self.create_diffset(self.review_request, revision=1)
+        diffset2 = self.create_diffset(self.review_request, revision=2)
+        diffset3 = self.create_diffset(self.review_request, revision=3)
+
+        self.assertEqual(get_diffsets_to_warm(self.diffset_history_id),
+                         [(diffset3, None), (diffset2, diffset3)])
+
+    def test_warm_diffset_chunks(self):
+        """Testing warm_diffset_chunks"""
+        diffset = self.create_diffset(self.review_request)
+        self.create_filediff(diffset, source_file='/file1',
+                             dest_file='/file1')
+        self.create_filediff(diffset, source_file='/file2',
+                             dest_file='/file2')
+
+        chunk_generator = RawDiffChunkGenerator(
+            old=b'a\nb\n',
+            new=b'a\nc\n',
+            orig_filename='file',
+            modified_filename='file',
+            diff_settings=self.diff_settings)
+
+        self.spy_on(_get_diff_file_chunk_generator,
+                    op=kgb.SpyOpReturn(chunk_generator))
+        self.spy_on(chunk_generator.get_chunks_info)
+
+        num_processed = warm_diffset_chunks(
+            diffset,
+            diff_settings=self.diff_settings)
+
+        self.assertEqual(num_processed, 2)
+        self.assertSpyCallCount(_get_diff_file_chunk_generator, 2)
+        self.assertSpyCalledWith(_get_diff_file_chunk_generator,
+                                 request=None,
+                                 diff_settings=self.diff_settings)
+        self.assertSpyCallCount(chunk_generator.get_chunks_info, 2)
+
+    def test_warm_diffset_chunks_with_error(self):
+        """Testing warm_diffset_chunks with an error generating a file"""
+        diffset = self.create_diffset(self.review_request)
+        self.create_filediff(diffset, source_file='/file1',
+                             dest_file='/file1')
+        self.create_filediff(diffset, source_file='/file2',
+                             dest_file='/file2')
+
+        chunk_generator = RawDiffChunkGenerator(
+            old=b'a\nb\n',
+            new=b'a\nc\n',
+            orig_filename='file',
+            modified_filename='file',
+            diff_settings=self.diff_settings)
+
+        self.spy_on(
+            _get_diff_file_chunk_generator,
+            op=kgb.SpyOpMatchInOrder([
+                {
+                    'op': kgb.SpyOpRaise(IOError('Oh no')),
+                },
+                {
+                    'op': kgb.SpyOpReturn(chunk_generator),
+                },
+            ]))
+
+        num_processed = warm_diffset_chunks(
+            diffset,
+            diff_settings=self.diff_settings)
+
+        self.assertEqual(num_processed, 1)
+        self.assertSpyCallCount(_get_diff_file_chunk_generator, 2)
+
+    def test_warm_diffset_history_chunks(self):
+        """Testing warm_diffset_history_chunks generates the latest diff and
+        interdiff
+        """
+        diffset1 = self.create_diffset(self.review_request, revision=1)
+        diffset2 = self.create_diffset(self.review_request, revision=2)
+
+        self.spy_on(warm_diffset_chunks, op=kgb.SpyOpReturn(3))
+
+        num_processed = warm_diffset_history_chunks(
+            self.diffset_history_id,
+            diff_settings=self.diff_settings)
+
+        self.assertEqual(num_processed, 6)
+        self.assertSpyCallCount(warm_diffset_chunks, 2)
+        self.assertSpyCalledWith(warm_diffset_chunks.calls[0],
+                                 diffset2,
+                                 interdiffset=None,
+                                 diff_settings=self.diff_settings)
+        self.assertSpyCalledWith(warm_diffset_chunks.calls[1],
+                                 diffset1,
+                                 interdiffset=diffset2,
+                                 diff_settings=self.diff_settings)
+
+
+class ChunkWarmupQueueTests(kgb.SpyAgency, TestCase):
+    """Unit tests for ChunkWarmupQueue."""
+
+    fixtures = ['test_users', 'test_scmtools']
+
+    def setUp(self):
+        super(ChunkWarmupQueueTests, self).setUp()
+
+        self.queue = ChunkWarmupQueue()
+
+        self.spy_on(self.queue._create_executor,
+                    op=kgb.SpyOpReturn(InlineExecutor()))
+        self.spy_on(connections.close_all,
+                    owner=connections,
+                    call_original=False)
+        self.spy_on(warm_diffset_history_chunks,
+                    op=kgb.SpyOpReturn(2))
+
+    def test_queue(self):
+        """Testing ChunkWarmupQueue.queue"""
+        with self.captureOnCommitCallbacks(execute=True):
+            self.assertTrue(self.queue.queue(123))
+
+            # Nothing should run until the transaction is committed.
+            self.assertSpyNotCalled(warm_diffset_history_chunks)
+
+        self.assertSpyCalledOnce(warm_diffset_history_chunks)
+        self.assertSpyCalledWith(warm_diffset_history_chunks, 123)
+        self.assertSpyCalledOnceWith(self.queue._create_executor, 1)
+        self.assertSpyCalled(connections.close_all)
+        self.assertEqual(self.queue.num_pending, 0)
+
+    def test_queue_with_max_workers_0(self):
+        """Testing ChunkWarmupQueue.queue with
+        diffviewer_chunk_warmup_max_workers=0
+        """
+        with self.siteconfig_settings({
+            'diffviewer_chunk_warmup_max_workers': 0,
+        }):
+            with self.captureOnCommitCallbacks(execute=True) as callbacks:
+                self.assertFalse(self.queue.queue(123))
+
+        self.assertEqual(callbacks, [])
+        self.assertSpyNotCalled(warm_diffset_history_chunks)
+
+    def test_queue_with_max_pending(self):
+        """Testing ChunkWarmupQueue.queue with
+        diffviewer_chunk_warmup_max_pending reached
+        """
+        self.queue._num_pending = 2
+
+        with self.siteconfig_settings({
+            'diffviewer_chunk_warmup_max_pending': 2,
+        }):
+            with self.captureOnCommitCallbacks(execute=True):
+                self.assertTrue(self.queue.queue(123))
+
+        self.assertSpyNotCalled(warm_diffset_history_chunks)
+        self.assertEqual(self.queue.num_pending, 2)
+
+    def test_queue_with_error(self):
+        """Testing ChunkWarmupQueue.queue with an error generating chunks"""
+        warm_diffset_history_chunks.unspy()
+        self.spy_on(warm_diffset_history_chunks,
+                    op=kgb.SpyOpRaise(Exception('Oh no')))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.queue.queue(123)
+
+        self.assertSpyCalledOnce(warm_diffset_history_chunks)
+        self.assertEqual(self.queue.num_pending, 0)
+
+    def test_queue_with_max_workers_changed(self):
+        """Testing ChunkWarmupQueue.queue recreates the executor when
+        diffviewer_chunk_warmup_max_workers changes
+        """
+        with self.captureOnCommitCallbacks(execute=True):
+            self.queue.queue(123)
+
+        with self.siteconfig_settings({
+            'diffviewer_chunk_warmup_max_workers': 3,
+        }):
+            with self.captureOnCommitCallbacks(execute=True):
+                self.queue.queue(456)
+
+        self.assertSpyCallCount(warm_diffset_history_chunks, 2)
+        self.assertSpyCallCount(self.queue._create_executor, 2)
+        self.assertSpyLastCalledWith(self.queue._create_executor, 3)
+
+
+class ReviewRequestPublishedTests(kgb.SpyAgency, TestCase):
+    """Unit tests for pre-generating chunks when publishing diffs."""
+
+    fixtures = ['test_users', 'test_scmtools']
+
+    def setUp(self):
+        super(ReviewRequestPublishedTests, self).setUp()
+
+        connect_signals()
+
+        self.spy_on(chunk_warmup.chunk_warmup_queue.queue,
+                    call_original=False)
+
+    def test_first_publish(self):
+        """Testing pre-generating chunks on first publish of a review
+        request with a diff
+        """
+        review_request = self.create_review_request(create_repository=True)
+        self.create_diffset(review_request, draft=True)
+        review_request.get_draft().target_people.add(review_request.submitter)
+
+        review_request.publish(review_request.submitter)
+
+        self.assertSpyCalledOnceWith(
+            chunk_warmup.chunk_warmup_queue.queue,
+            review_request.diffset_history_id,
+            local_site=None)
+
+    def test_publish_with_new_diff(self):
+        """Testing pre-generating chunks when publishing a new diff"""
+        review_request = self.create_review_request(create_repository=True,
+                                                    publish=True)
+        self.create_diffset(review_request)
+        chunk_warmup.chunk_warmup_queue.queue.reset_calls()
+        self.create_diffset(review_request, revision=2, draft=True)
+        review_request.get_draft().target_people.add(review_request.submitter)
+
+        review_request.publish(review_request.submitter)
+
+        self.assertSpyCalledOnceWith(
+            chunk_warmup.chunk_warmup_queue.queue,
+            review_request.diffset_history_id,
+            local_site=None)
+
+    def test_publish_without_diff_change(self):
+        """Testing pre-generating chunks is skipped when publishing without
+        a diff change
+        """
+        review_request = self.create_review_request(create_repository=True,
+                                                    publish=True)
+        self.create_diffset(review_request)
+        chunk_warmup.chunk_warmup_queue.queue.reset_calls()
+
+        draft = self.create_review_request_draft(review_request)
+        draft.summary = 'New summary'
+        draft.save()
+        draft.target_people.add(review_request.submitter)
+
+        review_request.publish(review_request.submitter)
+
+        self.assertSpyNotCalled(chunk_warmup.chunk_warmup_queue.queue)
+
+    def test_publish_without_repository(self):
+        """Testing pre-generating chunks is skipped for review requests
+        without a repository
+        """
+        review_request = self.create_review_request()
+        changedesc = ChangeDescription()
+        changedesc.fields_changed['diff'] = {}
+
+        chunk_warmup._on_review_request_published(
+            review_request=review_request,
+            changedesc=changedesc)
+
+        self.assertSpyNotCalled(chunk_warmup.chunk_warmup_queue.queue)
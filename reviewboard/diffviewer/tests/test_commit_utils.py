@@ -3,14 +3,16 @@
 from kgb import SpyAgency
 
 from reviewboard.diffviewer.commit_utils import (CommitHistoryDiffEntry,
+                                                 FileDiffAncestry,
                                                  diff_histories,
                                                  exclude_ancestor_filediffs,
                                                  get_base_and_tip_commits,
-                                                 get_file_exists_in_history)
-from reviewboard.diffviewer.models import DiffCommit
+                                                 get_file_exists_in_history,
+                                                 get_filediff_parent_ids)
+from reviewboard.diffviewer.models import DiffCommit, FileDiff
 from reviewboard.diffviewer.tests.test_diffutils import \
     BaseFileDiffAncestorTests
-from reviewboard.scmtools.core import UNKNOWN
+from reviewboard.scmtools.core import PRE_CREATION, UNKNOWN
 from reviewboard.testing.testcase import TestCase
 
 
@@ -403,9 +405,7 @@ class ExcludeAncestorFileDiffsTests(BaseFileDiffAncestorTests):
 
     def test_exclude_query_count(self):
         """Testing exclude_ancestor_filediffs query count"""
-        num_queries = len(self.filediffs)
-
-        with self.assertNumQueries(num_queries):
+        with self.assertNumQueries(0):
             result = exclude_ancestor_filediffs(self.filediffs)
 
         self._test_excluded(result)
@@ -458,6 +458,156 @@ class ExcludeAncestorFileDiffsTests(BaseFileDiffAncestorTests):
         self.assertEqual(expected, set(result))
 
 
+class GetFileDiffParentIdsTests(TestCase):
+    """Unit tests for commit_utils.get_filediff_parent_ids."""
+
+    def test_with_file_modified_in_many_commits(self):
+        """Testing get_filediff_parent_ids with a file modified in many
+        commits
+        """
+        filediffs = [
+            self._make_filediff(1, 1, 'foo', 'a', 'b'),
+            self._make_filediff(2, 2, 'foo', 'b', 'c'),
+            self._make_filediff(3, 3, 'foo', 'c', 'd'),
+            self._make_filediff(4, 3, 'bar', 'x', 'y'),
+
+            # This modifies the version of foo produced by commit 1.
+            self._make_filediff(5, 4, 'foo', 'b', 'e'),
+            self._make_filediff(6, 4, 'bar', 'y', 'z',
+                                status=FileDiff.DELETED),
+            self._make_filediff(7, 5, 'bar', PRE_CREATION, 'w'),
+        ]
+
+        self.assertEqual(
+            get_filediff_parent_ids(filediffs),
+            {
+                1: None,
+                2: 1,
+                3: 2,
+                4: None,
+                5: 1,
+                6: 4,
+                7: 6,
+            })
+
+    def test_with_later_commits_only(self):
+        """Testing get_filediff_parent_ids ignores FileDiffs in later
+        commits
+        """
+        filediffs = [
+            self._make_filediff(1, 2, 'foo', 'a', 'b'),
+            self._make_filediff(2, 1, 'foo', 'b', 'a'),
+        ]
+
+        self.assertEqual(
+            get_filediff_parent_ids(filediffs),
+            {
+                1: 2,
+                2: None,
+            })
+
+    def _make_filediff(self, pk, commit_id, filename, source_revision,
+                       dest_detail, status=FileDiff.MODIFIED):
+        """Return a new, unsaved FileDiff.
+
+        Args:
+            pk (int):
+                The ID of the FileDiff.
+
+            commit_id (int):
+                The ID of the FileDiff's commit.
+
+            filename (str):
+                The source and destination filename.
+
+            source_revision (str):
+                The source revision.
+
+            dest_detail (str):
+                The destination revision.
+
+            status (str, optional):
+                The status of the FileDiff.
+
+        Returns:
+            reviewboard.diffviewer.models.filediff.FileDiff:
+            The new FileDiff.
+        """
+        return FileDiff(pk=pk,
+                        commit_id=commit_id,
+                        source_file=filename,
+                        dest_file=filename,
+                        source_revision=source_revision,
+                        dest_detail=dest_detail,
+                        status=status)
+
+
+class FileDiffAncestryTests(BaseFileDiffAncestorTests):
+    """Unit tests for commit_utils.FileDiffAncestry."""
+
+    def setUp(self):
+        super().setUp()
+
+        self.set_up_filediffs()
+
+    def test_get_ancestors(self):
+        """Testing FileDiffAncestry.get_ancestors matches
+        FileDiff.get_ancestors
+        """
+        with self.assertNumQueries(0):
+            ancestry = FileDiffAncestry(self.filediffs)
+
+            ancestors = {
+                filediff: ancestry.get_ancestors(filediff)
+                for filediff in self.filediffs
+            }
+
+        for filediff in self.filediffs:
+            self.assertEqual(
+                ancestors[filediff],
+                filediff.get_ancestors(minimal=False,
+                                       filediffs=self.filediffs,
+                                       update=False))
+
+    def test_get_ancestors_with_parent_ids(self):
+        """Testing FileDiffAncestry.get_ancestors with pre-computed parent
+        IDs
+        """
+        parent_ids = get_filediff_parent_ids(self.filediffs)
+        ancestry = FileDiffAncestry(self.filediffs, parent_ids)
+
+        for filediff in self.filediffs:
+            self.assertEqual(
+                ancestry.get_ancestors(filediff),
+                filediff.get_ancestors(minimal=False,
+                                       filediffs=self.filediffs,
+                                       update=False))
+
+    def test_exclude_ancestors_with_range(self):
+        """Testing FileDiffAncestry.exclude_ancestors with a range of
+        commits
+        """
+        ancestry = FileDiffAncestry(self.filediffs)
+        filediffs = [
+            filediff
+            for filediff in self.filediffs
+            if filediff.commit_id <= 2
+        ]
+
+        self.assertEqual(
+            ancestry.exclude_ancestors(filediffs),
+            [
+                filediff
+                for filediff in filediffs
+                if not any(
+                    filediff in other.get_ancestors(minimal=False,
+                                                    filediffs=self.filediffs,
+                                                    update=False)
+                    for other in filediffs
+                )
+            ])
+
+
 class DiffHistoriesTests(TestCase):
     """Unit tests for reviewboard.diffviewer.commit_utils.diff_histories."""
 
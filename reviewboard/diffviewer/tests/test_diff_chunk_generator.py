@@ -1,3 +1,5 @@
+import hashlib
+
 from kgb import SpyAgency
 
 from reviewboard.diffviewer.chunk_generator import DiffChunkGenerator
@@ -129,6 +131,33 @@ class DiffChunkGeneratorTests(SpyAgency, TestCase):
         self.assertTrue(self.repository.get_file.last_returned(
             'Hello, world!\n'.encode('utf-16')))
 
+    def test_get_chunks_records_file_cache_sha256s(self):
+        """Testing DiffChunkGenerator.get_chunks records server-computed
+        SHA256s for the file content cache
+        """
+        self.filediff.diff = (
+            b'--- README\n'
+            b'+++ README\n'
+            b'@@ -1,1 +1,1 @@\n'
+            b'-Hello, world!\n'
+            b'+Hi, world!\n'
+        )
+        self.filediff.source_file = '/test-file'
+        self.filediff.extra_data.update({
+            'orig_sha256': '../../etc/passwd',
+            'patched_sha256': '../../etc/passwd',
+        })
+
+        list(self.generator.get_chunks())
+
+        self.assertEqual(
+            self.filediff.file_cache_orig_sha256,
+            hashlib.sha256(b'Hello, world!\n').hexdigest())
+        self.assertEqual(
+            self.filediff.file_cache_patched_sha256,
+            hashlib.sha256(b'Hi, world!\n').hexdigest())
+        self.assertEqual(self.filediff.orig_sha256, '../../etc/passwd')
+
     def test_get_chunks_with_replace_in_added_file_with_parent_diff(self):
         """Testing DiffChunkGenerator.get_chunks with replace chunks in
         added file with parent diff
@@ -0,0 +1,111 @@
+"""Unit tests for reviewboard.diffviewer.compression.
+
+Version Added:
+    6.0
+"""
+
+import bz2
+import zlib
+from unittest import SkipTest
+
+from reviewboard.diffviewer.compression import \
+    diff_compression_codec_registry
+from reviewboard.diffviewer.compression.codecs import (
+    BZip2DiffCompressionCodec,
+    ZlibDiffCompressionCodec,
+    ZstandardDiffCompressionCodec)
+from reviewboard.diffviewer.models import RawFileDiffData
+from reviewboard.testing import TestCase
+
+
+class DiffCompressionCodecTests(TestCase):
+    """Unit tests for the built-in diff compression codecs."""
+
+    data = b'+blah blah blah\n' * 100
+
+    def test_bzip2(self):
+        """Testing BZip2DiffCompressionCodec"""
+        codec = BZip2DiffCompressionCodec()
+        compressed = codec.compress(self.data)
+
+        self.assertEqual(compressed, bz2.compress(self.data, 9))
+        self.assertEqual(codec.decompress(compressed), self.data)
+
+    def test_zlib(self):
+        """Testing ZlibDiffCompressionCodec"""
+        codec = ZlibDiffCompressionCodec()
+        compressed = codec.compress(self.data, 1)
+
+        self.assertEqual(compressed, zlib.compress(self.data, 1))
+        self.assertEqual(codec.decompress(compressed), self.data)
+
+    def test_zstandard(self):
+        """Testing ZstandardDiffCompressionCodec"""
+        codec = ZstandardDiffCompressionCodec()
+
+        if not codec.is_available():
+            raise SkipTest('zstandard is not installed')
+
+        compressed = codec.compress(self.data, 19)
+
+        self.assertLess(len(compressed), len(self.data))
+        self.assertEqual(codec.decompress(compressed), self.data)
+
+    def test_compress_clamps_level(self):
+        """Testing BaseDiffCompressionCodec.compress with an out-of-range
+        level
+        """
+        codec = ZlibDiffCompressionCodec()
+
+        self.assertEqual(codec.compress(self.data, 100),
+                         zlib.compress(self.data, 9))
+        self.assertEqual(codec.compress(self.data, -5),
+                         zlib.compress(self.data, 1))
+
+
+class DiffCompressionCodecRegistryTests(TestCase):
+    """Unit tests for DiffCompressionCodecRegistry."""
+
+    def test_current_codec(self):
+        """Testing DiffCompressionCodecRegistry.current_codec"""
+        self.assertIsInstance(diff_compression_codec_registry.current_codec,
+                              BZip2DiffCompressionCodec)
+
+        with self.siteconfig_settings({
+            'diffviewer_compression_codec': 'Z',
+        }):
+            self.assertIsInstance(
+                diff_compression_codec_registry.current_codec,
+                ZlibDiffCompressionCodec)
+
+    def test_current_codec_unavailable(self):
+        """Testing DiffCompressionCodecRegistry.current_codec with an
+        unregistered codec
+        """
+        with self.siteconfig_settings({
+            'diffviewer_compression_codec': 'X',
+        }):
+            self.assertIsInstance(
+                diff_compression_codec_registry.current_codec,
+                BZip2DiffCompressionCodec)
+
+
+class RawFileDiffDataCompressionTests(TestCase):
+    """Unit tests for RawFileDiffData compression."""
+
+    data = b'+blah blah blah\n' * 100
+
+    def test_content_with_zlib(self):
+        """Testing RawFileDiffData.content with zlib compression"""
+        raw_fdd = RawFileDiffData(binary=zlib.compress(self.data),
+                                  compression='Z')
+
+        self.assertEqual(raw_fdd.content, self.data)
+
+    def test_content_with_unknown_codec(self):
+        """Testing RawFileDiffData.content with an unknown codec"""
+        raw_fdd = RawFileDiffData(binary=self.data,
+                                  compression='X')
+
+        with self.assertRaises(NotImplementedError):
+            raw_fdd.content
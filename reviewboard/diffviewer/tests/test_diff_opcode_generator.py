@@ -1,7 +1,9 @@
 import os
 
+from reviewboard.diffviewer.differ import DiffTimeBudget
 from reviewboard.diffviewer.myersdiff import MyersDiffer
 from reviewboard.diffviewer.opcode_generator import get_diff_opcode_generator
+from reviewboard.diffviewer.settings import DiffSettings
 from reviewboard.testing import TestCase
 
 
@@ -713,10 +715,149 @@ class MoveDetectionTests(TestCase):
             ]
         )
 
-    def _test_move_detection(self, a, b, expected_i_moves, expected_r_moves):
-        differ = MyersDiffer(a, b)
+    def test_move_detection_with_repeated_lines(self):
+        """Testing DiffOpcodeGenerator move detection with a large moved
+        block containing many repeated lines
+        """
+        moved = []
+
+        for i in range(100):
+            moved += [
+                'value_%d = compute(%d)' % (i, i),
+                '}',
+            ]
+
+        unchanged = [
+            'unchanged line %d' % i
+            for i in range(300)
+        ]
+
+        # The trailing "}" is too short to be included in the move.
+        self._test_move_detection(
+            moved + unchanged,
+            unchanged + moved,
+            [{
+                i + 301: i + 1
+                for i in range(199)
+            }],
+            [{
+                i + 1: i + 301
+                for i in range(199)
+            }])
+
+    def test_move_detection_with_max_lines(self):
+        """Testing DiffOpcodeGenerator move detection with more changed
+        lines than DiffSettings.move_detection_max_lines
+        """
+        diff_settings = DiffSettings.create()
+        diff_settings.move_detection_max_lines = 5
+
+        self._test_move_detection(
+            [
+                'def foo(self):',
+                '    return 1',
+                '',
+                'def bar(self):',
+                '    return 2',
+                '',
+                'def baz(self):',
+                '    return 3',
+            ],
+            [
+                'def bar(self):',
+                '    return 2',
+                '',
+                'def baz(self):',
+                '    return 3',
+                '',
+                'def foo(self):',
+                '    return 1',
+            ],
+            [],
+            [],
+            diff_settings=diff_settings)
+
+    def test_move_detection_within_max_lines(self):
+        """Testing DiffOpcodeGenerator move detection with fewer changed
+        lines than DiffSettings.move_detection_max_lines
+        """
+        diff_settings = DiffSettings.create()
+        diff_settings.move_detection_max_lines = 6
+
+        self._test_move_detection(
+            [
+                'def foo(self):',
+                '    return 1',
+                '',
+                'def bar(self):',
+                '    return 2',
+                '',
+                'def baz(self):',
+                '    return 3',
+            ],
+            [
+                'def bar(self):',
+                '    return 2',
+                '',
+                'def baz(self):',
+                '    return 3',
+                '',
+                'def foo(self):',
+                '    return 1',
+            ],
+            [{
+                7: 1,
+                8: 2,
+            }],
+            [{
+                1: 7,
+                2: 8,
+            }],
+            diff_settings=diff_settings)
+
+    def test_move_detection_with_expired_time_budget(self):
+        """Testing DiffOpcodeGenerator move detection with an expired time
+        budget
+        """
+        differ = MyersDiffer(
+            [
+                'def foo(self):',
+                '    return 1',
+                '',
+                'def bar(self):',
+                '    return 2',
+            ],
+            [
+                'def bar(self):',
+                '    return 2',
+                '',
+                'def foo(self):',
+                '    return 1',
+            ])
+
+        # Compute the diff first, and let the budget expire before moves
+        # are computed.
+        differ._gen_diff_data()
+        differ.time_budget = DiffTimeBudget(0)
+
         opcode_generator = get_diff_opcode_generator(differ)
 
+        for opcodes in opcode_generator:
+            meta = opcodes[-1]
+
+            self.assertNotIn('moved-from', meta)
+            self.assertNotIn('moved-to', meta)
+
+        self.assertTrue(opcode_generator.moves_skipped)
+        self.assertFalse(differ.simplified)
+
+    def _test_move_detection(self, a, b, expected_i_moves, expected_r_moves,
+                             diff_settings=None):
+        differ = MyersDiffer(a, b)
+        opcode_generator = get_diff_opcode_generator(
+            differ,
+            diff_settings=diff_settings)
+
         r_moves = []
         i_moves = []
 
@@ -2,8 +2,10 @@
 
 from djblets.testing.decorators import add_fixtures
 
+from reviewboard.diffviewer.diffutils import split_line_endings
 from reviewboard.diffviewer.testing.mixins import DiffParserTestingMixin
 from reviewboard.diffviewer.parser import (BaseDiffParser,
+                                           DiffLines,
                                            DiffParser,
                                            ParsedDiff,
                                            ParsedDiffChange,
@@ -11,6 +13,49 @@ from reviewboard.diffviewer.parser import (BaseDiffParser,
 from reviewboard.testing import TestCase
 
 
+class DiffLinesTests(TestCase):
+    """Unit tests for reviewboard.diffviewer.parser.DiffLines."""
+
+    def test_matches_split_line_endings(self):
+        """Testing DiffLines matches split_line_endings"""
+        for data in (b'',
+                     b'\n',
+                     b'\n\n',
+                     b'line',
+                     b'line 1\nline 2\n',
+                     b'line 1\nline 2',
+                     b'line 1\r\nline 2\rline 3\r\r\nline 4\n\r',
+                     b'line 1\n\x0cline 2\n\n'):
+            lines = DiffLines(data)
+            expected = split_line_endings(data)
+
+            self.assertEqual(len(lines), len(expected))
+            self.assertEqual(list(lines), expected)
+            self.assertEqual(
+                [
+                    lines[i]
+                    for i in range(len(lines))
+                ],
+                expected)
+
+    def test_getitem_with_slice(self):
+        """Testing DiffLines.__getitem__ with slice"""
+        lines = DiffLines(b'line 1\nline 2\r\nline 3\nline 4\n')
+
+        self.assertEqual(lines[1:3], [b'line 2', b'line 3'])
+        self.assertEqual(lines[-2:], [b'line 3', b'line 4'])
+        self.assertEqual(lines[3:10], [b'line 4'])
+
+    def test_getitem_with_negative_index(self):
+        """Testing DiffLines.__getitem__ with negative index"""
+        lines = DiffLines(b'line 1\nline 2\n')
+
+        self.assertEqual(lines[-1], b'line 2')
+
+        with self.assertRaises(IndexError):
+            lines[2]
+
+
 class ParsedDiffTests(TestCase):
     """Unit tests for reviewboard.diffviewer.parser.ParsedDiff."""
 
@@ -51,6 +96,49 @@ class ParsedDiffFileTests(TestCase):
         self.assertEqual(parsed_diff_file.parent_parsed_diff_change,
                          parsed_diff_change)
 
+    def test_append_lines(self):
+        """Testing ParsedDiffFile.append_lines"""
+        lines = DiffLines(b'line 1\nline 2\nline 3\nline 4\nline 5\n')
+        parsed_diff_file = ParsedDiffFile()
+        parsed_diff_file.append_lines(lines, 0, 2)
+        parsed_diff_file.append_lines(lines, 2, 3)
+        parsed_diff_file.append_data(b'data\n')
+        parsed_diff_file.append_lines(lines, 4, 5)
+        parsed_diff_file.prepend_data(b'preamble\n')
+
+        # Consecutive lines should share a single view into the buffer.
+        self.assertEqual(len(parsed_diff_file._data_chunks), 3)
+
+        parsed_diff_file.finalize()
+
+        self.assertEqual(
+            parsed_diff_file.data,
+            b'preamble\n'
+            b'line 1\n'
+            b'line 2\n'
+            b'line 3\n'
+            b'data\n'
+            b'line 5\n')
+
+    def test_append_lines_normalizes_newlines(self):
+        """Testing ParsedDiffFile.append_lines normalizes newlines"""
+        lines = DiffLines(b'line 1\r\nline 2\rline 3\nline 4')
+        parsed_diff_file = ParsedDiffFile()
+        parsed_diff_file.append_lines(lines, 0, 4)
+        parsed_diff_file.finalize()
+
+        self.assertEqual(parsed_diff_file.data,
+                         b'line 1\nline 2\nline 3\nline 4\n')
+
+    def test_append_lines_with_list(self):
+        """Testing ParsedDiffFile.append_lines with a list of lines"""
+        parsed_diff_file = ParsedDiffFile()
+        parsed_diff_file.append_lines([b'line 1', b'line 2', b'line 3'],
+                                      1, 3)
+        parsed_diff_file.finalize()
+
+        self.assertEqual(parsed_diff_file.data, b'line 2\nline 3\n')
+
 
 class DiffParserTest(DiffParserTestingMixin, TestCase):
     """Unit tests for reviewboard.diffviewer.parser.DiffParser."""
@@ -81,6 +169,44 @@ class DiffParserTest(DiffParserTestingMixin, TestCase):
             insert_count=2,
             data=diff)
 
+    def test_with_line_offsets(self):
+        """Testing DiffParser with diffs at least LINE_OFFSETS_MIN_DIFF_SIZE
+        """
+        diff = (
+            b'Index: foo\r\n'
+            b'--- README  123\r\n'
+            b'+++ README  (new)\r\n'
+            b'@@ -1,4 +1,5 @@\n'
+            b' Line 1\n'
+            b'-Line 2\n'
+            b'+Line 2!\r'
+            b'+Inserted line\n'
+            b' Line 3\n'
+            b' Line 4'
+        )
+
+        class OffsetsDiffParser(DiffParser):
+            LINE_OFFSETS_MIN_DIFF_SIZE = len(diff)
+
+        parser = DiffParser(diff)
+        offsets_parser = OffsetsDiffParser(diff)
+
+        self.assertIsInstance(parser.lines, list)
+        self.assertIsInstance(offsets_parser.lines, DiffLines)
+
+        parsed_files = offsets_parser.parse()
+        self.assertEqual(len(parsed_files), 1)
+
+        self.assert_parsed_diff_file(
+            parsed_files[0],
+            orig_filename=b'README',
+            orig_file_details=b'123',
+            modified_filename=b'README',
+            modified_file_details=b'(new)',
+            insert_count=2,
+            delete_count=1,
+            data=parser.parse()[0].data)
+
     def test_line_counts(self):
         """Testing DiffParser with insert/delete line counts"""
         diff = (
@@ -269,6 +395,68 @@ class DiffParserTest(DiffParserTestingMixin, TestCase):
         parser = DiffParser(b'')
         self.assertEqual(parser.raw_diff(commit1), commit1_diff)
 
+    @add_fixtures(['test_scmtools'])
+    def test_iter_raw_diff(self):
+        """Testing DiffParser.iter_raw_diff"""
+        repository = self.create_repository(tool_name='Test')
+        diffset = self.create_diffset(repository=repository)
+
+        abc_diff = (
+            b'diff --git a/ABC b/ABC\n'
+            b'index 94bdd3e..197009f 100644\n'
+            b'--- ABC\n'
+            b'+++ ABC\n'
+            b'@@ -1,1 +1,1 @@\n'
+            b'-line!\n'
+            b'+line..\n'
+        )
+        readme_diff = (
+            b'diff --git a/README b/README\n'
+            b'index 94bdd3e..87abad9 100644\n'
+            b'--- README\n'
+            b'+++ README\n'
+            b'@@ -1,1 +1,1 @@\n'
+            b'-Hello, world!\n'
+            b'+Yo, world.\n'
+        )
+
+        self.create_filediff(diffset=diffset,
+                             source_file='ABC',
+                             dest_file='ABC',
+                             diff=abc_diff)
+        self.create_filediff(diffset=diffset,
+                             source_file='README',
+                             dest_file='README',
+                             diff=readme_diff)
+
+        # Make sure diff data isn't kept around on the FileDiffs.
+        diffset = type(diffset).objects.get(pk=diffset.pk)
+        parser = DiffParser(b'')
+
+        self.assertEqual(list(parser.iter_raw_diff(diffset)),
+                         [abc_diff, readme_diff])
+        self.assertEqual(parser.raw_diff(diffset), abc_diff + readme_diff)
+
+        for filediff in diffset.cumulative_files:
+            self.assertNotIn('diff_hash', filediff._state.fields_cache)
+
+    @add_fixtures(['test_scmtools'])
+    def test_iter_raw_diff_with_custom_raw_diff(self):
+        """Testing DiffParser.iter_raw_diff with subclass overriding
+        raw_diff
+        """
+        class CustomParser(DiffParser):
+            def raw_diff(self, diffset_or_commit):
+                return b'custom diff'
+
+        repository = self.create_repository(tool_name='Test')
+        diffset = self.create_diffset(repository=repository)
+        self.create_filediff(diffset=diffset)
+
+        parser = CustomParser(b'')
+        self.assertEqual(list(parser.iter_raw_diff(diffset)),
+                         [b'custom diff'])
+
     def test_parsed_diff_extra_data(self):
         """Testing custom DiffParser populating a ParsedDiff's extra_data"""
         class CustomParser(DiffParser):
@@ -3,6 +3,7 @@ from django.test import RequestFactory
 from djblets.cache.backend import cache_memoize
 from kgb import SpyAgency
 
+from reviewboard.diffviewer.chunk_generator import CachedChunkLines
 from reviewboard.diffviewer.errors import UserVisibleError
 from reviewboard.diffviewer.models import FileDiff
 from reviewboard.diffviewer.renderers import DiffRenderer
@@ -184,3 +185,269 @@ class DiffRendererTests(SpyAgency, TestCase):
 
         chunk = diff_file['chunks'][0]
         self.assertEqual(chunk['change'], 'replace')
+
+    def test_make_context_with_lines_of_context_and_lazy_lines(self):
+        """Testing DiffRenderer.make_context with lines_of_context only loads
+        the lines being shown from lazily-loaded lines
+        """
+        all_lines = [
+            [i + 1, i + 1, 'line %d' % i, [], i + 1, 'line %d' % i, [],
+             False]
+            for i in range(100)
+        ]
+        loaded = []
+
+        def _load_lines(start, end):
+            loaded.append((start, end))
+
+            return all_lines[start:end]
+
+        chunk = {
+            'change': 'equal',
+            'collapsable': True,
+            'index': 1,
+            'lines': CachedChunkLines(load_lines=_load_lines,
+                                      start=0,
+                                      end=100),
+            'meta': {
+                'left_headers': [],
+                'right_headers': [],
+            },
+            'numlines': 100,
+        }
+        diff_file = {
+            'newfile': False,
+            'interfilediff': None,
+            'filediff': FileDiff(),
+            'chunks': [chunk],
+        }
+
+        renderer = DiffRenderer(diff_file,
+                                chunk_index=1,
+                                collapse_all=True,
+                                lines_of_context=[3, 4],
+                                diff_settings=DiffSettings.create())
+        renderer._all_chunks_loaded = False
+        renderer.num_chunks = 3
+        renderer.make_context()
+
+        chunks = diff_file['chunks']
+        self.assertEqual(len(chunks), 3)
+        self.assertEqual(list(chunks[0]['lines']), all_lines[:3])
+        self.assertEqual(chunks[1]['numlines'], 93)
+        self.assertTrue(chunks[1]['collapsable'])
+        self.assertEqual(list(chunks[2]['lines']), all_lines[96:])
+
+        # Only the lines shown, and the first line of the collapsed region
+        # (used for computing headers), should have been loaded.
+        self.assertEqual(loaded, [(3, 4), (0, 3), (96, 100)])
+
+    def test_make_context_with_use_chunks_renderer_default(self):
+        """Testing DiffRenderer.make_context with use_chunks_renderer=None
+        enables rendering chunks in Python only for DiffRenderer
+        """
+        class MyDiffRenderer(DiffRenderer):
+            pass
+
+        class MyChunksDiffRenderer(DiffRenderer):
+            use_chunks_renderer = True
+
+        diff_settings = DiffSettings.create()
+
+        for renderer_cls, expected in ((DiffRenderer, True),
+                                       (MyDiffRenderer, False),
+                                       (MyChunksDiffRenderer, True)):
+            renderer = renderer_cls({'chunks': []},
+                                    diff_settings=diff_settings)
+            context = renderer.make_context()
+
+            self.assertEqual(context['use_chunks_renderer'], expected)
+
+    def test_render_with_use_chunks_renderer(self):
+        """Testing DiffRenderer.render_to_string_uncached with
+        use_chunks_renderer=True matches rendering chunks in the template
+        """
+        self._test_use_chunks_renderer()
+
+    def test_render_with_use_chunks_renderer_and_collapse_all(self):
+        """Testing DiffRenderer.render_to_string_uncached with
+        use_chunks_renderer=True and collapse_all=True matches rendering
+        chunks in the template
+        """
+        self._test_use_chunks_renderer(collapse_all=True)
+
+    def test_render_with_use_chunks_renderer_and_chunk_index(self):
+        """Testing DiffRenderer.render_to_string_uncached with
+        use_chunks_renderer=True and chunk_index matches rendering chunks in
+        the template
+        """
+        for chunk_index in range(5):
+            self._test_use_chunks_renderer(chunk_index=chunk_index)
+
+    def test_render_with_use_chunks_renderer_and_lines_of_context(self):
+        """Testing DiffRenderer.render_to_string_uncached with
+        use_chunks_renderer=True and lines_of_context matches rendering
+        chunks in the template
+        """
+        self._test_use_chunks_renderer(chunk_index=2,
+                                       collapse_all=True,
+                                       lines_of_context=[2, 3])
+
+    def _make_chunks_diff_file(self):
+        """Return a diff file with a variety of chunks for rendering.
+
+        Returns:
+            dict:
+            The diff file information.
+        """
+        def _make_equal_lines(start, num_lines):
+            return [
+                [start + i, start + i, 'line %d' % (start + i), [],
+                 start + i, 'line %d' % (start + i), [], False]
+                for i in range(num_lines)
+            ]
+
+        return {
+            'binary': False,
+            'chunks': [
+                {
+                    'change': 'equal',
+                    'collapsable': True,
+                    'index': 0,
+                    'lines': _make_equal_lines(1, 10),
+                    'meta': {
+                        'headers': [None, None],
+                        'left_headers': [],
+                        'right_headers': [],
+                    },
+                    'numlines': 10,
+                },
+                {
+                    'change': 'replace',
+                    'collapsable': False,
+                    'index': 1,
+                    'lines': [
+                        [11, 11, 'foo &amp; bar\t', [(0, 3)],
+                         11, 'foo &amp; baz  ', [(0, 3)], True],
+                        [12, 12, 'moved <b>up</b>', [],
+                         12, 'is\u200bAdmin', [], False,
+                         {
+                             'code_safety': [
+                                 ('trojan_source', {
+                                     'warnings': {'zws'},
+                                 }),
+                             ],
+                             'to': (30, True),
+                         }],
+                        [13, 13, 'moved down', [],
+                         13, 'moved from below', [], False,
+                         {
+                             'from': (25, True),
+                             'to': (31, False),
+                         }],
+                    ],
+                    'meta': {
+                        'whitespace_chunk': False,
+                        'whitespace_lines': [(0, 0)],
+                    },
+                    'numlines': 3,
+                },
+                {
+                    'change': 'equal',
+                    'collapsable': True,
+                    'index': 2,
+                    'lines': _make_equal_lines(14, 10),
+                    'meta': {
+                        'headers': [
+                            {'line': 14, 'text': 'def foo():'},
+                            {'line': 14, 'text': 'def foo():'},
+                        ],
+                        'left_headers': [(14, 'def foo():')],
+                        'right_headers': [(14, 'def foo():')],
+                    },
+                    'numlines': 10,
+                },
+                {
+                    'change': 'insert',
+                    'collapsable': False,
+                    'index': 3,
+                    'lines': [
+                        [24, '', '', [], 24, 'new <line>', [], False],
+                        [25, '', '', [], 25, 'moved from above', [], False,
+                         {
+                             'from': (12, True),
+                         }],
+                    ],
+                    'meta': {
+                        'whitespace_chunk': True,
+                        'whitespace_lines': [],
+                    },
+                    'numlines': 2,
+                },
+                {
+                    'change': 'equal',
+                    'collapsable': True,
+                    'index': 4,
+                    'lines': _make_equal_lines(26, 10),
+                    'meta': {
+                        'headers': [
+                            {'line': 4, 'text': 'class <Foo>:'},
+                            {'line': 26, 'text': 'class Bar:'},
+                        ],
+                        'left_headers': [(4, 'class <Foo>:')],
+                        'right_headers': [(26, 'class Bar:')],
+                    },
+                    'numlines': 10,
+                },
+                {
+                    'change': 'delete',
+                    'collapsable': False,
+                    'index': 5,
+                    'lines': [
+                        [36, 36, 'deleted', [], '', '', [], False],
+                    ],
+                    'meta': {
+                        'whitespace_chunk': False,
+                        'whitespace_lines': [],
+                    },
+                    'numlines': 1,
+                },
+            ],
+            'chunks_loaded': True,
+            'deleted': False,
+            'filediff': FileDiff(),
+            'index': 3,
+            'interfilediff': None,
+            'is_new_file': False,
+            'moved_or_copied': False,
+            'newfile': False,
+            'num_changes': 3,
+            'num_chunks': 6,
+            'whitespace_only': False,
+        }
+
+    def _test_use_chunks_renderer(self, **kwargs):
+        """Test that rendering chunks in Python matches the template.
+
+        Args:
+            **kwargs (dict):
+                Keyword arguments to pass to the renderers.
+        """
+        class TemplateDiffRenderer(DiffRenderer):
+            use_chunks_renderer = False
+
+        diff_settings = DiffSettings.create()
+        request = RequestFactory().get('/')
+        rendered = []
+
+        for renderer_cls in (DiffRenderer, TemplateDiffRenderer):
+            renderer = renderer_cls(
+                self._make_chunks_diff_file(),
+                diff_settings=diff_settings,
+                **dict(kwargs,
+                       lines_of_context=list(kwargs.get('lines_of_context',
+                                                        []))))
+            rendered.append(renderer.render_to_string_uncached(request))
+
+        self.assertIn('<tbody', rendered[0])
+        self.assertEqual(rendered[0], rendered[1])
@@ -4,6 +4,7 @@ Version Added:
     5.0.2
 """
 
+from reviewboard.admin.siteconfig import defaults as siteconfig_defaults
 from reviewboard.diffviewer.settings import DiffSettings
 from reviewboard.testing import TestCase
 
@@ -23,7 +24,9 @@ class DiffSettingsTests(TestCase):
             'diffviewer_custom_pygments_lexers': {
                 '.foo': 'SomeLexer',
             },
+            'diffviewer_diff_time_budget': 30,
             'diffviewer_include_space_patterns': ['*.a', '*.b'],
+            'diffviewer_move_detection_max_lines': 1_000,
             'diffviewer_paginate_by': 20,
             'diffviewer_paginate_orphans': 5,
             'diffviewer_syntax_highlighting': True,
@@ -42,14 +45,36 @@ class DiffSettingsTests(TestCase):
         self.assertEqual(diff_settings.custom_pygments_lexers, {
             '.foo': 'SomeLexer',
         })
+        self.assertEqual(diff_settings.diff_time_budget, 30)
         self.assertEqual(diff_settings.include_space_patterns,
                          ['*.a', '*.b'])
+        self.assertEqual(diff_settings.move_detection_max_lines, 1_000)
         self.assertEqual(diff_settings.paginate_by, 20)
         self.assertEqual(diff_settings.paginate_orphans, 5)
         self.assertTrue(diff_settings.syntax_highlighting)
         self.assertEqual(diff_settings.syntax_highlighting_threshold,
                          10_000)
 
+    def test_init_defaults(self):
+        """Testing DiffSettings.__init__ defaults match the site
+        configuration defaults
+        """
+        diff_settings = DiffSettings(
+            code_safety_configs={},
+            context_num_lines=5,
+            custom_pygments_lexers={},
+            include_space_patterns=[],
+            paginate_by=20,
+            paginate_orphans=10,
+            syntax_highlighting=True,
+            syntax_highlighting_threshold=20_000)
+
+        self.assertEqual(diff_settings.diff_time_budget,
+                         siteconfig_defaults['diffviewer_diff_time_budget'])
+        self.assertEqual(
+            diff_settings.move_detection_max_lines,
+            siteconfig_defaults['diffviewer_move_detection_max_lines'])
+
     def test_create_with_siteconfig_syntax_highlighting_true(self):
         """Testing DiffSettings.create with
         siteconfig.diffviewer_syntax_highlighting=True
@@ -124,7 +149,9 @@ class DiffSettingsTests(TestCase):
             'diffviewer_custom_pygments_lexers': {
                 '.foo': 'SomeLexer',
             },
+            'diffviewer_diff_time_budget': 30,
             'diffviewer_include_space_patterns': ['*.a', '*.b'],
+            'diffviewer_move_detection_max_lines': 1_000,
             'diffviewer_paginate_by': 20,
             'diffviewer_paginate_orphans': 5,
             'diffviewer_syntax_highlighting': True,
@@ -136,4 +163,4 @@ class DiffSettingsTests(TestCase):
 
         self.assertEqual(
             diff_settings.state_hash,
-            '178099a49bf920fd46866042e9013d90d8ad31edf986325cdd641d2e1de4e01f')
+            'e71c2934f6433d649ca00c7ad59ceaa986eded6162fd584c293a762c3739e9fd')
@@ -1,4 +1,6 @@
 from reviewboard.diffviewer.models import DiffSet, DiffSetHistory
+from reviewboard.diffviewer.tests.test_diffutils import \
+    BaseFileDiffAncestorTests
 from reviewboard.testing import TestCase
 
 
@@ -114,3 +116,82 @@ class DiffSetTests(TestCase):
             result = diffset.cumulative_files
 
         self.assertEqual(result, expected)
+
+
+class DiffSetFileDiffAncestryTests(BaseFileDiffAncestorTests):
+    """Unit tests for DiffSet.get_filediff_ancestry."""
+
+    def setUp(self):
+        super().setUp()
+
+        self.set_up_filediffs()
+
+    def test_finalize_commit_series_stores_ancestry(self):
+        """Testing DiffSet.finalize_commit_series stores the FileDiff
+        ancestry
+        """
+        diffset = DiffSet.objects.get(pk=self.diffset.pk)
+
+        self.assertIn(DiffSet._FILEDIFF_PARENTS_KEY, diffset.extra_data)
+
+        # Expecting 1 query:
+        #
+        # 1. Select all FileDiffs for a DiffSet.
+        with self.assertNumQueries(1):
+            ancestry = diffset.get_filediff_ancestry()
+
+        self._check_ancestry(ancestry)
+
+    def test_get_filediff_ancestry_without_stored_ancestry(self):
+        """Testing DiffSet.get_filediff_ancestry with a finalized commit
+        series without stored ancestry
+        """
+        parent_ids = self.diffset.extra_data.pop(DiffSet._FILEDIFF_PARENTS_KEY)
+        self.diffset.save(update_fields=('extra_data',))
+
+        diffset = DiffSet.objects.get(pk=self.diffset.pk)
+
+        # Expecting 2 queries:
+        #
+        # 1. Select all FileDiffs for a DiffSet.
+        # 2. Update extra_data on the DiffSet.
+        with self.assertNumQueries(2):
+            ancestry = diffset.get_filediff_ancestry()
+
+        self._check_ancestry(ancestry)
+
+        diffset = DiffSet.objects.get(pk=self.diffset.pk)
+        self.assertEqual(diffset.extra_data[DiffSet._FILEDIFF_PARENTS_KEY],
+                         parent_ids)
+
+    def test_get_filediff_ancestry_not_finalized(self):
+        """Testing DiffSet.get_filediff_ancestry with a commit series that
+        is not finalized
+        """
+        diffset = DiffSet.objects.get(pk=self.diffset.pk)
+        diffset.extra_data = {}
+        diffset.save(update_fields=('extra_data',))
+
+        with self.assertNumQueries(0):
+            ancestry = diffset.get_filediff_ancestry(self.filediffs)
+
+        self._check_ancestry(ancestry)
+        self.assertEqual(diffset.extra_data, {})
+
+    def _check_ancestry(self, ancestry):
+        """Check that the ancestry matches FileDiff.get_ancestors.
+
+        Args:
+            ancestry (reviewboard.diffviewer.commit_utils.FileDiffAncestry):
+                The ancestry to check.
+
+        Raises:
+            AssertionError:
+                The ancestry did not match.
+        """
+        for filediff in self.filediffs:
+            self.assertEqual(
+                ancestry.get_ancestors(filediff),
+                filediff.get_ancestors(minimal=False,
+                                       filediffs=self.filediffs,
+                                       update=False))
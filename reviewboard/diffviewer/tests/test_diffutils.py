@@ -1,11 +1,19 @@
-import kgb
+import subprocess
+import threading
+import time
 from itertools import zip_longest
 
+import kgb
+
 from django.contrib.auth.models import User
+from django.core.cache import cache
 from django.test.client import RequestFactory
+from django.utils.translation import get_language, override
 from djblets.testing.decorators import add_fixtures
 
+from reviewboard.diffviewer.chunk_generator import RawDiffChunkGenerator
 from reviewboard.diffviewer.diffutils import (
+    LINE_CHANGED_REGIONS_TOKEN_LEN,
     convert_line_endings,
     convert_to_unicode,
     get_diff_data_chunks_info,
@@ -22,8 +30,14 @@ from reviewboard.diffviewer.diffutils import (
     get_original_file_from_repo,
     get_sorted_filediffs,
     patch,
+    populate_diff_chunk,
+    populate_diff_chunks,
     split_line_endings,
     _PATCH_GARBAGE_INPUT,
+    _compute_line_changed_regions,
+    _generate_diff_file_chunks,
+    _get_cached_line_changed_regions,
+    _get_diff_file_chunk_generator,
     _get_last_header_in_chunks_before_line)
 from reviewboard.diffviewer.errors import PatchError
 from reviewboard.diffviewer.models import DiffCommit, FileDiff
@@ -1261,18 +1275,13 @@ class GetDiffFilesTests(BaseFileDiffAncestorTests):
         # assertion.
         self.assertEqual(len(self.filediffs), 9)
 
-        # Expecting 9 queries:
+        # Expecting 1 query:
         #
         # 1. Select all FileDiffs for a DiffSet.
-        # 2. Update extra_data on FileDiff id=1.
-        # 3. Update extra_data on FileDiff id=3.
-        # 4. Update extra_data on FileDiff id=6.
-        # 5. Update extra_data on FileDiff id=7.
-        # 6. Update extra_data on FileDiff id=2.
-        # 7. Update extra_data on FileDiff id=5.
-        # 8. Update extra_data on FileDiff id=8.
-        # 9. Update extra_data on FileDiff id=9.
-        with self.assertNumQueries(9):
+        #
+        # The ancestry of the FileDiffs was indexed when the commit series
+        # was finalized.
+        with self.assertNumQueries(1):
             files = get_diff_files(diffset=self.diffset,
                                    base_commit=diff_commit)
 
@@ -1331,18 +1340,13 @@ class GetDiffFilesTests(BaseFileDiffAncestorTests):
         # assertion.
         self.assertEqual(len(self.filediffs), 9)
 
-        # Expecting 9 queries:
+        # Expecting 1 query:
         #
         # 1. Select all FileDiffs for a DiffSet.
-        # 2. Update extra_data on FileDiff id=1.
-        # 3. Update extra_data on FileDiff id=3.
-        # 4. Update extra_data on FileDiff id=6.
-        # 5. Update extra_data on FileDiff id=7.
-        # 6. Update extra_data on FileDiff id=2.
-        # 7. Update extra_data on FileDiff id=5.
-        # 8. Update extra_data on FileDiff id=8.
-        # 9. Update extra_data on FileDiff id=9.
-        with self.assertNumQueries(9):
+        #
+        # The ancestry of the FileDiffs was indexed when the commit series
+        # was finalized.
+        with self.assertNumQueries(1):
             files = get_diff_files(diffset=self.diffset,
                                    tip_commit=tip_commit)
 
@@ -1442,17 +1446,13 @@ class GetDiffFilesTests(BaseFileDiffAncestorTests):
         # assertion.
         self.assertEqual(len(self.filediffs), 9)
 
-        # Expecting 8 queries:
+        # Expecting 1 query:
         #
         # 1. Select all FileDiffs for a DiffSet.
-        # 2. Update extra_data on FileDiff id=1.
-        # 3. Update extra_data on FileDiff id=3.
-        # 4. Update extra_data on FileDiff id=6.
-        # 5. Update extra_data on FileDiff id=7.
-        # 6. Update extra_data on FileDiff id=2.
-        # 7. Update extra_data on FileDiff id=5.
-        # 8. Update extra_data on FileDiff id=8.
-        with self.assertNumQueries(8):
+        #
+        # The ancestry of the FileDiffs was indexed when the commit series
+        # was finalized.
+        with self.assertNumQueries(1):
             files = get_diff_files(diffset=self.diffset,
                                    base_commit=base_commit,
                                    tip_commit=tip_commit)
@@ -1687,6 +1687,22 @@ class GetFileDiffsMatchTests(TestCase):
 
         self.assertTrue(get_filediffs_match(filediff1, filediff2))
 
+    def test_with_diffs_equal_compares_hashes(self):
+        """Testing get_filediffs_match with diffs equal compares stored
+        diff hashes without loading diffs
+        """
+        filediff1 = self.create_filediff(self.diffset, diff=b'abc')
+        filediff2 = self.create_filediff(self.diffset, diff=b'abc')
+        filediff3 = self.create_filediff(self.diffset, diff=b'def')
+
+        filediff1 = FileDiff.objects.get(pk=filediff1.pk)
+        filediff2 = FileDiff.objects.get(pk=filediff2.pk)
+        filediff3 = FileDiff.objects.get(pk=filediff3.pk)
+
+        with self.assertNumQueries(0):
+            self.assertTrue(get_filediffs_match(filediff1, filediff2))
+            self.assertFalse(get_filediffs_match(filediff1, filediff3))
+
     def test_with_deleted_true(self):
         """Testing get_filediffs_match with deleted flags both set"""
         self.assertTrue(get_filediffs_match(
@@ -2673,9 +2689,15 @@ class GetMatchedInterdiffFilesTests(TestCase):
             ])
 
 
-class GetLineChangedRegionsTests(TestCase):
+class GetLineChangedRegionsTests(kgb.SpyAgency, TestCase):
     """Unit tests for get_line_changed_regions."""
 
+    def setUp(self):
+        super().setUp()
+
+        _get_cached_line_changed_regions.cache_clear()
+        cache.clear()
+
     def test_get_line_changed_regions(self):
         """Testing get_line_changed_regions"""
         def deep_equal(A, B):
@@ -2707,6 +2729,103 @@ class GetLineChangedRegionsTests(TestCase):
         regions = get_line_changed_regions(old, new)
         deep_equal(regions, (None, None))
 
+    def test_with_long_lines(self):
+        """Testing get_line_changed_regions with long lines compares tokens"""
+        args = ', '.join(
+            'argument_%d' % i
+            for i in range(30)
+        )
+        old = 'result = compute(%s)' % args
+        new = 'result = compute(%s)' % args.replace('argument_17',
+                                                    'parameter_17')
+
+        self.assertGreaterEqual(len(old) + len(new),
+                                LINE_CHANGED_REGIONS_TOKEN_LEN)
+
+        start = old.index('argument_17')
+
+        self.assertEqual(
+            get_line_changed_regions(old, new),
+            ([(start, start + len('argument_17'))],
+             [(start, start + len('parameter_17'))]))
+
+    def test_with_long_lines_mostly_changed(self):
+        """Testing get_line_changed_regions with long lines that are mostly
+        different
+        """
+        old = ' '.join(
+            'old_%d' % i
+            for i in range(100)
+        )
+        new = ' '.join(
+            'new_%d' % i
+            for i in range(100)
+        )
+
+        self.assertEqual(get_line_changed_regions(old, new), (None, None))
+
+    def test_caches_results(self):
+        """Testing get_line_changed_regions caches results"""
+        self.spy_on(_compute_line_changed_regions)
+
+        old = 'submitter = models.ForeignKey(Person, verbose_name="Submitter")'
+        new = 'submitter = models.ForeignKey(User, verbose_name="Submitter")'
+
+        regions = get_line_changed_regions(old, new)
+        self.assertEqual(regions, ([(30, 36)], [(30, 34)]))
+
+        # Make sure the cached results can't be modified by callers.
+        regions[0].append((0, 1))
+
+        self.assertEqual(get_line_changed_regions(old, new),
+                         ([(30, 36)], [(30, 34)]))
+        self.assertSpyCallCount(_compute_line_changed_regions, 1)
+
+    def test_with_use_shared_cache(self):
+        """Testing get_line_changed_regions with use_shared_cache=True"""
+        self.spy_on(_compute_line_changed_regions)
+
+        args = ', '.join(
+            'argument_%d' % i
+            for i in range(50)
+        )
+        old = 'result = compute(%s)' % args
+        new = 'result = compute(%s)' % args.replace('argument_17',
+                                                    'parameter_17')
+        start = old.index('argument_17')
+        expected = (
+            [(start, start + len('argument_17'))],
+            [(start, start + len('parameter_17'))],
+        )
+
+        self.assertEqual(
+            get_line_changed_regions(old, new, use_shared_cache=True),
+            expected)
+
+        # Clear the in-process cache, so the results must come from the
+        # shared cache.
+        _get_cached_line_changed_regions.cache_clear()
+
+        self.assertEqual(
+            get_line_changed_regions(old, new, use_shared_cache=True),
+            expected)
+        self.assertSpyCallCount(_compute_line_changed_regions, 1)
+
+    def test_with_use_shared_cache_and_short_lines(self):
+        """Testing get_line_changed_regions with use_shared_cache=True and
+        short lines doesn't use the shared cache
+        """
+        self.spy_on(_compute_line_changed_regions)
+
+        old = 'submitter = models.ForeignKey(Person, verbose_name="Submitter")'
+        new = 'submitter = models.ForeignKey(User, verbose_name="Submitter")'
+
+        get_line_changed_regions(old, new, use_shared_cache=True)
+        _get_cached_line_changed_regions.cache_clear()
+        get_line_changed_regions(old, new, use_shared_cache=True)
+
+        self.assertSpyCallCount(_compute_line_changed_regions, 2)
+
 
 class GetDisplayedDiffLineRangesTests(TestCase):
     """Unit tests for get_displayed_diff_line_ranges."""
@@ -3284,7 +3403,7 @@ class DiffExpansionHeaderTests(TestCase):
                          lines[header['left']['line'] - 1][2])
 
 
-class PatchTests(TestCase):
+class PatchTests(kgb.SpyAgency, TestCase):
     """Unit tests for patch."""
 
     def test_patch(self):
@@ -3525,6 +3644,124 @@ class PatchTests(TestCase):
                         filename='README')
         self.assertEqual(patched, new)
 
+    def test_patch_in_process(self):
+        """Testing patch applies clean diffs without running patch(1)"""
+        old = (b'line 1\n'
+               b'line 2\n'
+               b'line 3\n'
+               b'line 4\n'
+               b'line 5')
+
+        new = (b'line 1\n'
+               b'line 2 changed\n'
+               b'line 3\n'
+               b'line 4\n'
+               b'line 5\n'
+               b'line 6\n')
+
+        diff = (b'diff --git a/test.txt b/test.txt\n'
+                b'index 1234567..89abcde 100644\n'
+                b'--- a/test.txt\n'
+                b'+++ b/test.txt\n'
+                b'@@ -1,3 +1,3 @@\n'
+                b' line 1\n'
+                b'-line 2\n'
+                b'+line 2 changed\n'
+                b' line 3\n'
+                b'@@ -4,2 +4,3 @@\n'
+                b' line 4\n'
+                b'-line 5\n'
+                b'\\ No newline at end of file\n'
+                b'+line 5\n'
+                b'+line 6\n')
+
+        self.spy_on(subprocess.Popen.__init__,
+                    owner=subprocess.Popen)
+
+        patched = patch(diff=diff,
+                        orig_file=old,
+                        filename='test.txt')
+        self.assertEqual(patched, new)
+        self.assertSpyNotCalled(subprocess.Popen.__init__)
+
+    def test_patch_in_process_new_file(self):
+        """Testing patch applies diffs creating files without running
+        patch(1)
+        """
+        diff = (b'--- /dev/null\n'
+                b'+++ test.txt\n'
+                b'@@ -0,0 +1,2 @@\n'
+                b'+line 1\n'
+                b'+line 2\n')
+
+        self.spy_on(subprocess.Popen.__init__,
+                    owner=subprocess.Popen)
+
+        patched = patch(diff=diff,
+                        orig_file=b'',
+                        filename='test.txt')
+        self.assertEqual(patched, b'line 1\nline 2\n')
+        self.assertSpyNotCalled(subprocess.Popen.__init__)
+
+    def test_patch_with_offset(self):
+        """Testing patch falls back to patch(1) for hunks applying at an
+        offset
+        """
+        old = (b'new line\n'
+               b'line 1\n'
+               b'line 2\n'
+               b'line 3\n')
+
+        new = (b'new line\n'
+               b'line 1\n'
+               b'line 2 changed\n'
+               b'line 3\n')
+
+        diff = (b'--- test.txt\n'
+                b'+++ test.txt\n'
+                b'@@ -1,3 +1,3 @@\n'
+                b' line 1\n'
+                b'-line 2\n'
+                b'+line 2 changed\n'
+                b' line 3\n')
+
+        self.spy_on(subprocess.Popen.__init__,
+                    owner=subprocess.Popen)
+
+        patched = patch(diff=diff,
+                        orig_file=old,
+                        filename='test.txt')
+        self.assertEqual(patched, new)
+        self.assertSpyCalled(subprocess.Popen.__init__)
+
+    def test_patch_with_rejects(self):
+        """Testing patch with hunks that fail to apply raises PatchError
+        with rejects
+        """
+        old = (b'line 1\n'
+               b'line 2\n'
+               b'line 3\n')
+
+        diff = (b'--- test.txt\n'
+                b'+++ test.txt\n'
+                b'@@ -1,3 +1,3 @@\n'
+                b' line 1\n'
+                b'-line X\n'
+                b'+line Y\n'
+                b' line 3\n')
+
+        with self.assertRaises(PatchError) as ctx:
+            patch(diff=diff,
+                  orig_file=old,
+                  filename='test.txt')
+
+        e = ctx.exception
+        self.assertEqual(e.filename, 'test.txt')
+        self.assertEqual(e.orig_file, old)
+        self.assertEqual(e.diff, diff)
+        self.assertIn(b'-line X', e.rejects)
+        self.assertIn('test.txt.rej', e.error_output)
+
 
 class GetFileDiffEncodingsTests(TestCase):
     """Unit tests for get_filediff_encodings."""
@@ -3553,6 +3790,161 @@ class GetFileDiffEncodingsTests(TestCase):
                          ['ascii', 'iso-8859-15'])
 
 
+class PopulateDiffChunkTests(kgb.SpyAgency, TestCase):
+    """Unit tests for populate_diff_chunk."""
+
+    def test_populate(self):
+        """Testing populate_diff_chunk"""
+        old = b''.join(
+            b'line %d\n' % i
+            for i in range(30)
+        )
+        new = old.replace(b'line 10\n', b'line ten\n')
+
+        def _create_generator():
+            return RawDiffChunkGenerator(old, new, 'file1', 'file2',
+                                         diff_settings=DiffSettings.create())
+
+        self.spy_on(_get_diff_file_chunk_generator,
+                    op=kgb.SpyOpReturn(_create_generator()))
+
+        expected_chunks = list(_create_generator().get_chunks())
+        diff_file = {}
+
+        populate_diff_chunk(diff_file=diff_file,
+                            chunk_index=1,
+                            diff_settings=DiffSettings.create())
+
+        self.assertEqual(diff_file, {
+            'chunks': [expected_chunks[1]],
+            'num_chunks': len(expected_chunks),
+            'changed_chunk_indexes': [1],
+            'num_changes': 1,
+            'simplified': False,
+            'whitespace_only': False,
+        })
+
+
+class PopulateDiffChunksTests(kgb.SpyAgency, TestCase):
+    """Unit tests for populate_diff_chunks."""
+
+    fixtures = ['test_scmtools']
+
+    def setUp(self):
+        super(PopulateDiffChunksTests, self).setUp()
+
+        repository = self.create_repository(tool_name='Test')
+        diffset = self.create_diffset(repository=repository)
+
+        self.files = [
+            {
+                'filediff': self.create_filediff(
+                    diffset,
+                    source_file='/file%d' % i,
+                    dest_file='/file%d' % i),
+                'interfilediff': None,
+                'force_interdiff': False,
+            }
+            for i in range(8)
+        ]
+        self.diff_settings = DiffSettings.create()
+        self.thread_names = set()
+
+        def _fake_generate_diff_file_chunks(diff_file, **kwargs):
+            filediff = diff_file['filediff']
+            self.thread_names.add(threading.current_thread().name)
+
+            # Finish the files out of order.
+            time.sleep((8 - filediff.pk % 8) * 0.005)
+
+            return (
+                [
+                    {
+                        'change': 'equal',
+                        'text': '%s:%s' % (filediff.source_file,
+                                           get_language()),
+                    },
+                    {
+                        'change': 'replace',
+                        'meta': {},
+                    },
+                ],
+                [],
+                0.5,
+            )
+
+        self.spy_on(_generate_diff_file_chunks,
+                    call_fake=_fake_generate_diff_file_chunks)
+
+    def test_populate(self):
+        """Testing populate_diff_chunks"""
+        populate_diff_chunks(files=self.files,
+                             diff_settings=self.diff_settings)
+
+        self.assertEqual(self.thread_names,
+                         {threading.current_thread().name})
+        self._check_files('en-us')
+
+    def test_populate_with_max_workers(self):
+        """Testing populate_diff_chunks with max_workers"""
+        with override('fr'):
+            populate_diff_chunks(files=self.files,
+                                 diff_settings=self.diff_settings,
+                                 max_workers=4)
+
+        self.assertEqual(len(self.thread_names), 4)
+        self.assertNotIn(threading.current_thread().name, self.thread_names)
+        self._check_files('fr')
+
+    def test_populate_with_max_workers_siteconfig(self):
+        """Testing populate_diff_chunks with
+        diffviewer_chunk_generation_max_workers setting
+        """
+        with self.siteconfig_settings({
+            'diffviewer_chunk_generation_max_workers': 3,
+        }):
+            populate_diff_chunks(files=self.files,
+                                 diff_settings=self.diff_settings)
+
+        self.assertEqual(len(self.thread_names), 3)
+        self._check_files('en-us')
+
+    def test_populate_with_max_workers_error(self):
+        """Testing populate_diff_chunks with max_workers and an error
+        generating chunks
+        """
+        _generate_diff_file_chunks.unspy()
+        self.spy_on(_generate_diff_file_chunks,
+                    op=kgb.SpyOpRaise(ValueError('Oh no')))
+
+        with self.assertRaisesMessage(ValueError, 'Oh no'):
+            populate_diff_chunks(files=self.files,
+                                 diff_settings=self.diff_settings,
+                                 max_workers=4)
+
+    def _check_files(self, language):
+        """Check the populated files.
+
+        Args:
+            language (str):
+                The language expected to be active when generating chunks.
+
+        Raises:
+            AssertionError:
+                The files were not populated correctly.
+        """
+        for diff_file in self.files:
+            self.assertTrue(diff_file['chunks_loaded'])
+            self.assertEqual(diff_file['chunks_load_time'], 0.5)
+            self.assertEqual(diff_file['num_chunks'], 2)
+            self.assertEqual(diff_file['num_changes'], 1)
+            self.assertEqual(diff_file['changed_chunk_indexes'], [1])
+            self.assertFalse(diff_file['whitespace_only'])
+            self.assertEqual(
+                diff_file['chunks'][0]['text'],
+                '%s:%s' % (diff_file['filediff'].source_file, language))
+
+
 class GetOriginalFileTests(BaseFileDiffAncestorTests):
     """Unit tests for get_original_file."""
 
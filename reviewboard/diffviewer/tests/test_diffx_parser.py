@@ -3169,3 +3169,111 @@ class DiffXParserTests(DiffParserTestingMixin, TestCase):
             b'- old line\r\n'
             b'+ new line 1\r\n'
             b'+ new line 2\r\n')
+
+    @add_fixtures(['test_scmtools'])
+    def test_iter_raw_diff(self):
+        """Testing DiffXParser.iter_raw_diff"""
+        repository = self.create_repository(tool_name='Test')
+        diffset = self.create_diffset(repository=repository)
+        diffset.extra_data = {
+            'diffx': {
+                'options': {
+                    'encoding': 'utf-8',
+                    'version': '1.0',
+                },
+                'preamble': 'Test preamble.\n',
+            },
+        }
+        diffset.save(update_fields=('extra_data',))
+
+        filediff = self.create_filediff(
+            diffset=diffset,
+            source_file='file1',
+            dest_file='file1',
+            save=False,
+            diff=(
+                b'--- /file1\n'
+                b'+++ /file1\n'
+                b'@@ -1 +1 @@\n'
+                b'-old\n'
+                b'+new\n'
+            ))
+        filediff.extra_data = {
+            'diffx': {
+                'diff_options': {
+                    'line_endings': 'unix',
+                },
+                'metadata': {
+                    'path': 'file1',
+                },
+                'metadata_options': {
+                    'format': 'json',
+                },
+            },
+        }
+        filediff.save()
+
+        filediff = self.create_filediff(
+            diffset=diffset,
+            source_file='file2',
+            dest_file='file2',
+            save=False,
+            diff=b'')
+        filediff.extra_data = {
+            'diffx': {
+                'metadata': {
+                    'path': 'file2',
+                },
+                'metadata_options': {
+                    'format': 'json',
+                },
+            },
+        }
+        filediff.save()
+
+        parser = DiffXParser(b'')
+        pieces = list(parser.iter_raw_diff(diffset))
+
+        self.assertEqual(
+            pieces,
+            [
+                b'#diffx: encoding=utf-8, version=1.0\n'
+                b'#.preamble: indent=4, length=19, line_endings=unix\n'
+                b'    Test preamble.\n'
+                b'#.change:\n'
+                b'#..file:\n'
+                b'#...meta: format=json, length=24\n'
+                b'{\n'
+                b'    "path": "file1"\n'
+                b'}\n'
+                b'#...diff: length=44, line_endings=unix\n'
+                b'--- /file1\n'
+                b'+++ /file1\n'
+                b'@@ -1 +1 @@\n'
+                b'-old\n'
+                b'+new\n',
+
+                b'#..file:\n'
+                b'#...meta: format=json, length=24\n'
+                b'{\n'
+                b'    "path": "file2"\n'
+                b'}\n',
+            ])
+        self.assertEqual(b''.join(pieces), parser.raw_diff(diffset))
+
+    @add_fixtures(['test_scmtools'])
+    def test_iter_raw_diff_with_custom_raw_diff(self):
+        """Testing DiffXParser.iter_raw_diff with subclass overriding
+        raw_diff
+        """
+        class CustomParser(DiffXParser):
+            def raw_diff(self, diffset_or_commit):
+                return b'custom diff'
+
+        repository = self.create_repository(tool_name='Test')
+        diffset = self.create_diffset(repository=repository)
+        self.create_filediff(diffset=diffset)
+
+        parser = CustomParser(b'')
+        self.assertEqual(list(parser.iter_raw_diff(diffset)),
+                         [b'custom diff'])
@@ -0,0 +1,336 @@
+"""Unit tests for reviewboard.diffviewer.filecache.
+
+Version Added:
+    6.0
+"""
+
+import hashlib
+import os
+import shutil
+import tempfile
+
+import kgb
+from django.core.cache import cache
+
+from reviewboard.diffviewer.diffutils import (get_original_file,
+                                              get_original_file_from_repo,
+                                              get_patched_file,
+                                              patch)
+from reviewboard.diffviewer.filecache import \
+    file_content_cache_backend_registry
+from reviewboard.diffviewer.filecache.cache_backend import \
+    CacheFileContentCacheBackend
+from reviewboard.diffviewer.filecache.local_disk import \
+    LocalDiskFileContentCacheBackend
+from reviewboard.testing import TestCase
+
+
+def _sha256(content):
+    return hashlib.sha256(content).hexdigest()
+
+
+class CacheFileContentCacheBackendTests(TestCase):
+    """Unit tests for CacheFileContentCacheBackend."""
+
+    def setUp(self):
+        super().setUp()
+
+        cache.clear()
+        self.backend = CacheFileContentCacheBackend()
+
+    def test_get_file_content(self):
+        """Testing CacheFileContentCacheBackend.get_file_content"""
+        content = b'file content\n'
+        sha256 = _sha256(content)
+
+        self.assertIsNone(self.backend.get_file_content(sha256))
+
+        self.backend.set_file_content(sha256, content)
+        self.assertEqual(self.backend.get_file_content(sha256), content)
+
+    def test_set_file_content_too_large(self):
+        """Testing CacheFileContentCacheBackend.set_file_content with
+        contents larger than max_content_size
+        """
+        content = b'x' * (self.backend.max_content_size + 1)
+        sha256 = _sha256(content)
+
+        self.backend.set_file_content(sha256, content)
+        self.assertIsNone(self.backend.get_file_content(sha256))
+
+
+class LocalDiskFileContentCacheBackendTests(TestCase):
+    """Unit tests for LocalDiskFileContentCacheBackend."""
+
+    def setUp(self):
+        super().setUp()
+
+        self.cache_dir = tempfile.mkdtemp(prefix='rb-tests-')
+        self.backend = LocalDiskFileContentCacheBackend()
+
+    def tearDown(self):
+        shutil.rmtree(self.cache_dir)
+
+        super().tearDown()
+
+    def test_get_file_content(self):
+        """Testing LocalDiskFileContentCacheBackend.get_file_content"""
+        content = b'file content\n'
+        sha256 = _sha256(content)
+
+        with self._settings():
+            self.assertIsNone(self.backend.get_file_content(sha256))
+
+            self.backend.set_file_content(sha256, content)
+            self.assertEqual(self.backend.get_file_content(sha256), content)
+
+        self.assertTrue(os.path.exists(
+            os.path.join(self.cache_dir, sha256[:2], sha256)))
+
+    def test_get_file_content_corrupt(self):
+        """Testing LocalDiskFileContentCacheBackend.get_file_content with
+        corrupt contents
+        """
+        content = b'file content\n'
+        sha256 = _sha256(content)
+        path = os.path.join(self.cache_dir, sha256[:2], sha256)
+
+        with self._settings():
+            self.backend.set_file_content(sha256, content)
+
+            with open(path, 'wb') as fp:
+                fp.write(b'file')
+
+            self.assertIsNone(self.backend.get_file_content(sha256))
+
+        self.assertFalse(os.path.exists(path))
+
+    def test_get_file_content_invalid_sha256(self):
+        """Testing LocalDiskFileContentCacheBackend.get_file_content with
+        an invalid SHA256 does not touch files outside the cache
+        """
+        victim_dir = tempfile.mkdtemp(prefix='rb-tests-')
+        victim_path = os.path.join(victim_dir, 'victim')
+
+        with open(victim_path, 'wb') as fp:
+            fp.write(b'victim\n')
+
+        try:
+            with self._settings():
+                for sha256 in (victim_path,
+                               '../' * 10 + victim_path.lstrip('/'),
+                               _sha256(b'x').upper(),
+                               _sha256(b'x')[:-1]):
+                    self.assertIsNone(self.backend.get_file_content(sha256))
+
+            self.assertTrue(os.path.exists(victim_path))
+        finally:
+            shutil.rmtree(victim_dir)
+
+    def test_set_file_content_invalid_sha256(self):
+        """Testing LocalDiskFileContentCacheBackend.set_file_content with
+        an invalid SHA256
+        """
+        with self._settings():
+            self.backend.set_file_content('../escaped', b'content\n')
+
+        self.assertFalse(os.path.exists(os.path.join(self.cache_dir,
+                                                     'escaped')))
+        self.assertEqual(os.listdir(self.cache_dir), [])
+
+    def test_set_file_content_too_large(self):
+        """Testing LocalDiskFileContentCacheBackend.set_file_content with
+        contents larger than the maximum cache size
+        """
+        content = b'x' * 101
+        sha256 = _sha256(content)
+
+        with self._settings(max_size=100):
+            self.backend.set_file_content(sha256, content)
+            self.assertIsNone(self.backend.get_file_content(sha256))
+
+    def test_set_file_content_evicts_lru(self):
+        """Testing LocalDiskFileContentCacheBackend.set_file_content evicts
+        least-recently used contents when exceeding the maximum cache size
+        """
+        contents = [
+            b'%d' % i * 40
+            for i in range(3)
+        ]
+        sha256s = [
+            _sha256(content)
+            for content in contents
+        ]
+
+        with self._settings(max_size=100):
+            self.backend.set_file_content(sha256s[0], contents[0])
+            self.backend.set_file_content(sha256s[1], contents[1])
+
+            # Make the second entry the least-recently used.
+            path = os.path.join(self.cache_dir, sha256s[1][:2], sha256s[1])
+            os.utime(path, (0, 0))
+
+            self.assertEqual(self.backend.get_file_content(sha256s[0]),
+                             contents[0])
+
+            self.backend.set_file_content(sha256s[2], contents[2])
+
+            self.assertEqual(self.backend.get_file_content(sha256s[0]),
+                             contents[0])
+            self.assertIsNone(self.backend.get_file_content(sha256s[1]))
+            self.assertEqual(self.backend.get_file_content(sha256s[2]),
+                             contents[2])
+
+    def _settings(self, max_size=1000):
+        """Return a context manager for the backend's settings.
+
+        Args:
+            max_size (int, optional):
+                The maximum size of the cache.
+
+        Returns:
+            contextlib.AbstractContextManager:
+            The context manager for the settings.
+        """
+        return self.siteconfig_settings({
+            'diffviewer_file_cache_backend': 'local-disk',
+            'diffviewer_file_cache_max_size': max_size,
+            'diffviewer_file_cache_path': self.cache_dir,
+        })
+
+
+class FileContentCacheBackendRegistryTests(TestCase):
+    """Unit tests for FileContentCacheBackendRegistry."""
+
+    def test_current_backend(self):
+        """Testing FileContentCacheBackendRegistry.current_backend"""
+        self.assertIsInstance(
+            file_content_cache_backend_registry.current_backend,
+            CacheFileContentCacheBackend)
+
+        with self.siteconfig_settings({
+            'diffviewer_file_cache_backend': 'local-disk',
+        }):
+            self.assertIsInstance(
+                file_content_cache_backend_registry.current_backend,
+                LocalDiskFileContentCacheBackend)
+
+    def test_current_backend_disabled(self):
+        """Testing FileContentCacheBackendRegistry.current_backend with
+        caching disabled
+        """
+        with self.siteconfig_settings({
+            'diffviewer_file_cache_backend': '',
+        }):
+            self.assertIsNone(
+                file_content_cache_backend_registry.current_backend)
+
+
+class FileContentCacheDiffUtilsTests(kgb.SpyAgency, TestCase):
+    """Unit tests for file content caching in diffutils."""
+
+    fixtures = ['test_scmtools']
+
+    def setUp(self):
+        super().setUp()
+
+        cache.clear()
+
+        repository = self.create_repository(tool_name='Test')
+        diffset = self.create_diffset(repository=repository)
+        self.filediff = self.create_filediff(diffset=diffset)
+        self.orig = b'original\n'
+        self.backend = file_content_cache_backend_registry.current_backend
+
+    def test_get_original_file_stores(self):
+        """Testing get_original_file stores the file in the file content
+        cache
+        """
+        self.spy_on(get_original_file_from_repo,
+                    op=kgb.SpyOpReturn(self.orig))
+
+        self.assertEqual(get_original_file(filediff=self.filediff),
+                         self.orig)
+        self.assertEqual(self.backend.get_file_content(_sha256(self.orig)),
+                         self.orig)
+
+    def test_get_original_file_cached(self):
+        """Testing get_original_file with a file in the file content cache"""
+        self.spy_on(get_original_file_from_repo,
+                    op=kgb.SpyOpReturn(b'uncached\n'))
+
+        self.filediff.extra_data['__file_cache_orig_sha256'] = \
+            _sha256(self.orig)
+        self.backend.set_file_content(_sha256(self.orig), self.orig)
+
+        self.assertEqual(get_original_file(filediff=self.filediff),
+                         self.orig)
+        self.assertSpyNotCalled(get_original_file_from_repo)
+
+    def test_get_original_file_ignores_public_sha256(self):
+        """Testing get_original_file ignores the client-settable
+        orig_sha256 for file content cache lookups
+        """
+        other = b'content from another repository\n'
+        self.spy_on(get_original_file_from_repo,
+                    op=kgb.SpyOpReturn(self.orig))
+
+        self.filediff.extra_data['orig_sha256'] = _sha256(other)
+        self.backend.set_file_content(_sha256(other), other)
+
+        self.assertEqual(get_original_file(filediff=self.filediff),
+                         self.orig)
+        self.assertSpyCalled(get_original_file_from_repo)
+
+    def test_get_original_file_cached_in_commit(self):
+        """Testing get_original_file with a file in the file content cache
+        for FileDiffs in a commit series
+        """
+        self.spy_on(get_original_file_from_repo,
+                    op=kgb.SpyOpReturn(b'uncached\n'))
+
+        commit = self.create_diffcommit(diffset=self.filediff.diffset)
+        self.filediff.commit = commit
+        self.filediff.extra_data['__file_cache_orig_sha256'] = \
+            _sha256(self.orig)
+        self.backend.set_file_content(_sha256(self.orig), self.orig)
+
+        self.assertEqual(get_original_file(filediff=self.filediff),
+                         self.orig)
+        self.assertSpyNotCalled(get_original_file_from_repo)
+
+    def test_get_patched_file_cached(self):
+        """Testing get_patched_file with a file in the file content cache"""
+        patched = b'patched\n'
+        self.spy_on(patch, op=kgb.SpyOpReturn(b'uncached\n'))
+
+        self.filediff.extra_data.update({
+            '__file_cache_orig_sha256': _sha256(self.orig),
+            '__file_cache_patched_sha256': _sha256(patched),
+        })
+        self.backend.set_file_content(_sha256(patched), patched)
+
+        self.assertEqual(get_patched_file(source_data=self.orig,
+                                          filediff=self.filediff),
+                         patched)
+        self.assertSpyNotCalled(patch)
+
+    def test_get_patched_file_cached_other_source(self):
+        """Testing get_patched_file ignores the file content cache when
+        patching a file other than the original
+        """
+        patched = b'patched\n'
+        self.spy_on(patch, op=kgb.SpyOpReturn(b'uncached\n'))
+
+        self.filediff.extra_data.update({
+            '__file_cache_orig_sha256': _sha256(self.orig),
+            '__file_cache_patched_sha256': _sha256(patched),
+        })
+        self.backend.set_file_content(_sha256(patched), patched)
+
+        self.assertEqual(get_patched_file(source_data=b'other\n',
+                                          filediff=self.filediff),
+                         b'uncached\n')
+        self.assertSpyCalled(patch)
+        self.assertEqual(self.backend.get_file_content(_sha256(b'uncached\n')),
+                         b'uncached\n')
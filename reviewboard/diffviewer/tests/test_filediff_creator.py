@@ -1,11 +1,17 @@
 """Tests for reviewboard.diffviewer.filediff_creator."""
 
+import threading
+import time
+
 import kgb
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.utils.timezone import now
 
 from reviewboard.diffviewer.filediff_creator import create_filediffs
 from reviewboard.diffviewer.models import DiffCommit, DiffSet
 from reviewboard.scmtools.core import Revision
+from reviewboard.scmtools.errors import FileNotFoundError, SCMError
 from reviewboard.scmtools.git import GitTool
 from reviewboard.testing import TestCase
 
@@ -271,3 +277,234 @@ class FileDiffCreatorTests(kgb.SpyAgency, TestCase):
                          '/readme')
         self.assertEqual(filediff.extra_data.get('parent_source_revision'),
                          '1234567')
+
+    def test_create_filediffs_stores_diff_data(self):
+        """Testing create_filediffs() stores diff data and line counts for
+        all files
+        """
+        repository = self.create_repository(tool_name='Git')
+        diffset = self.create_diffset(repository=repository)
+
+        diff = self._build_git_diff(num_files=3)
+        parent_diff = self._build_git_diff(num_files=1)
+
+        filediffs = create_filediffs(
+            diff_file_contents=diff,
+            parent_diff_file_contents=parent_diff,
+            repository=repository,
+            basedir='/',
+            base_commit_id='0' * 40,
+            diffset=diffset,
+            check_existence=False)
+
+        self.assertEqual(len(filediffs), 3)
+
+        filediffs = list(diffset.files.order_by('source_file'))
+        self.assertEqual(len(filediffs), 3)
+
+        for i, filediff in enumerate(filediffs):
+            self.assertEqual(filediff.source_file, 'file%d' % i)
+            self.assertEqual(filediff.diff,
+                             self._build_git_file_diff(i))
+            self.assertEqual(filediff.get_line_counts()['raw_insert_count'],
+                             i + 1)
+            self.assertEqual(filediff.get_line_counts()['raw_delete_count'],
+                             1)
+            self.assertEqual(filediff.diff_hash.insert_count, i + 1)
+            self.assertEqual(filediff.diff_hash.delete_count, 1)
+
+        self.assertEqual(filediffs[0].parent_diff,
+                         self._build_git_file_diff(0))
+        self.assertIsNone(filediffs[1].parent_diff_hash)
+        self.assertIsNone(filediffs[2].parent_diff_hash)
+
+    def test_create_filediffs_query_count(self):
+        """Testing create_filediffs() performs the same number of queries
+        regardless of the number of files
+        """
+        repository = self.create_repository(tool_name='Git')
+        query_counts = []
+
+        for num_files in (1, 20):
+            diffset = self.create_diffset(repository=repository)
+
+            with CaptureQueriesContext(connection) as ctx:
+                create_filediffs(
+                    diff_file_contents=self._build_git_diff(num_files),
+                    parent_diff_file_contents=None,
+                    repository=repository,
+                    basedir='/',
+                    base_commit_id='0' * 40,
+                    diffset=diffset,
+                    check_existence=False)
+
+            query_counts.append(len(ctx.captured_queries))
+
+        self.assertEqual(query_counts[0], query_counts[1])
+
+    def test_create_filediffs_check_existence_concurrent(self):
+        """Testing create_filediffs() with check_existence=True and
+        diffviewer_file_exists_max_workers > 1
+        """
+        repository = self.create_repository(tool_name='Git')
+        diffset = self.create_diffset(repository=repository)
+        checked = []
+        thread_names = set()
+
+        def _get_file_exists(path, revision, context):
+            checked.append((path, revision))
+            thread_names.add(threading.current_thread().name)
+
+            return True
+
+        with self.siteconfig_settings({
+            'diffviewer_file_exists_max_workers': 4,
+        }):
+            filediffs = create_filediffs(
+                diff_file_contents=self._build_git_diff(num_files=10),
+                parent_diff_file_contents=None,
+                repository=repository,
+                basedir='/',
+                base_commit_id='0' * 40,
+                diffset=diffset,
+                check_existence=True,
+                get_file_exists=_get_file_exists)
+
+        self.assertEqual(len(filediffs), 10)
+        self.assertEqual(
+            sorted(checked),
+            sorted(
+                ('/file%d' % i, '1234567')
+                for i in range(10)
+            ))
+        self.assertNotIn(threading.current_thread().name, thread_names)
+
+    def test_create_filediffs_check_existence_concurrent_not_found(self):
+        """Testing create_filediffs() with check_existence=True and
+        diffviewer_file_exists_max_workers > 1 reports the first missing
+        file in the diff
+        """
+        repository = self.create_repository(tool_name='Git')
+        diffset = self.create_diffset(repository=repository)
+
+        def _get_file_exists(path, revision, context):
+            if path == '/file2':
+                # Make sure that a later missing file is found first.
+                time.sleep(0.1)
+
+            return path not in ('/file2', '/file3')
+
+        with self.siteconfig_settings({
+            'diffviewer_file_exists_max_workers': 4,
+        }):
+            with self.assertRaises(FileNotFoundError) as ctx:
+                create_filediffs(
+                    diff_file_contents=self._build_git_diff(num_files=10),
+                    parent_diff_file_contents=None,
+                    repository=repository,
+                    basedir='/',
+                    base_commit_id='0' * 40,
+                    diffset=diffset,
+                    check_existence=True,
+                    get_file_exists=_get_file_exists)
+
+        self.assertEqual(ctx.exception.path, '/file2')
+        self.assertEqual(diffset.files.count(), 0)
+
+    def test_create_filediffs_check_existence_stops_on_not_found(self):
+        """Testing create_filediffs() with check_existence=True stops
+        checking files after a missing file
+        """
+        repository = self.create_repository(tool_name='Git')
+        diffset = self.create_diffset(repository=repository)
+        checked = []
+
+        def _get_file_exists(path, revision, context):
+            checked.append(path)
+
+            return path != '/file1'
+
+        with self.assertRaises(FileNotFoundError) as ctx:
+            create_filediffs(
+                diff_file_contents=self._build_git_diff(num_files=5),
+                parent_diff_file_contents=None,
+                repository=repository,
+                basedir='/',
+                base_commit_id='0' * 40,
+                diffset=diffset,
+                check_existence=True,
+                get_file_exists=_get_file_exists)
+
+        self.assertEqual(ctx.exception.path, '/file1')
+        self.assertEqual(checked, ['/file0', '/file1'])
+
+    def test_create_filediffs_check_existence_concurrent_error(self):
+        """Testing create_filediffs() with check_existence=True and
+        diffviewer_file_exists_max_workers > 1 raises errors from checks
+        """
+        repository = self.create_repository(tool_name='Git')
+        diffset = self.create_diffset(repository=repository)
+
+        def _get_file_exists(path, revision, context):
+            if path == '/file4':
+                raise SCMError('Oh no')
+
+            return True
+
+        with self.siteconfig_settings({
+            'diffviewer_file_exists_max_workers': 4,
+        }):
+            with self.assertRaisesMessage(SCMError, 'Oh no'):
+                create_filediffs(
+                    diff_file_contents=self._build_git_diff(num_files=10),
+                    parent_diff_file_contents=None,
+                    repository=repository,
+                    basedir='/',
+                    base_commit_id='0' * 40,
+                    diffset=diffset,
+                    check_existence=True,
+                    get_file_exists=_get_file_exists)
+
+    def _build_git_diff(self, num_files):
+        """Return a Git diff modifying several files.
+
+        Args:
+            num_files (int):
+                The number of files in the diff.
+
+        Returns:
+            bytes:
+            The diff.
+        """
+        return b''.join(
+            self._build_git_file_diff(i)
+            for i in range(num_files)
+        )
+
+    def _build_git_file_diff(self, index):
+        """Return a Git diff for a single file.
+
+        The file will have one deleted line, and ``index + 1`` inserted
+        lines.
+
+        Args:
+            index (int):
+                The index of the file.
+
+        Returns:
+            bytes:
+            The diff for the file.
+        """
+        return (
+            b'diff --git a/file%(index)d b/file%(index)d\n'
+            b'index 1234567..7654321 100644\n'
+            b'--- a/file%(index)d\n'
+            b'+++ b/file%(index)d\n'
+            b'@@ -1 +1,%(count)d @@\n'
+            b'-old line\n'
+            % {
+                b'index': index,
+                b'count': index + 1,
+            } +
+            b'+new line\n' * (index + 1)
+        )
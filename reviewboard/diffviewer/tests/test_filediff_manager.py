@@ -0,0 +1,378 @@
+"""Unit tests for reviewboard.diffviewer.managers.FileDiffManager."""
+
+import json
+import os
+import shutil
+import tempfile
+from concurrent.futures import Executor, Future
+
+import kgb
+from django.db.utils import IntegrityError, OperationalError
+from djblets.db.fields import Base64DecodedValue
+
+from reviewboard.diffviewer.models import (DiffSet, FileDiff,
+                                           LegacyFileDiffData)
+from reviewboard.testing import TestCase
+
+
+class InlineExecutor(Executor):
+    """An executor that runs all work immediately, in-process.
+
+    This stands in for the process pool used when migrating with multiple
+    workers, since worker processes can't access the test database.
+    """
+
+    def submit(self, fn, /, *args, **kwargs):
+        """Run a function and return a future for its result.
+
+        Args:
+            fn (callable):
+                The function to run.
+
+            *args (tuple):
+                Positional arguments for the function.
+
+            **kwargs (dict):
+                Keyword arguments for the function.
+
+        Returns:
+            concurrent.futures.Future:
+            The completed future.
+        """
+        future = Future()
+
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except Exception as e:
+            future.set_exception(e)
+
+        return future
+
+
+class FileDiffManagerTests(kgb.SpyAgency, TestCase):
+    """Unit tests for FileDiffManager."""
+
+    fixtures = ['test_scmtools']
+
+    def setUp(self):
+        super().setUp()
+
+        self.checkpoint_dir = tempfile.mkdtemp(prefix='rb-tests-')
+        self.checkpoint_path = os.path.join(self.checkpoint_dir,
+                                            'checkpoint.json')
+
+        repository = self.create_repository(tool_name='Test')
+        self.diffset = DiffSet.objects.create(name='test',
+                                              revision=1,
+                                              repository=repository)
+
+        self.spy_on(FileDiff.objects._create_migration_executor,
+                    op=kgb.SpyOpReturn(InlineExecutor()))
+
+    def tearDown(self):
+        shutil.rmtree(self.checkpoint_dir)
+
+        super().tearDown()
+
+    def test_migrate_all_with_workers(self):
+        """Testing FileDiffManager.migrate_all with workers > 1"""
+        filediffs = self._create_unmigrated_filediffs(5)
+        legacy_filediffs = self._create_legacy_filediffs(3)
+        progress = []
+
+        def _on_batch_done(total_diffs_migrated, total_count, **kwargs):
+            progress.append(total_diffs_migrated)
+
+        info = FileDiff.objects.migrate_all(
+            batch_done_cb=_on_batch_done,
+            workers=2,
+            partition_size=2,
+            checkpoint_path=self.checkpoint_path)
+
+        self.assertEqual(info['diffs_migrated'], 8)
+        self.assertEqual(FileDiff.objects.unmigrated().count(), 0)
+        self.assertEqual(LegacyFileDiffData.objects.count(), 0)
+
+        for filediff in filediffs + legacy_filediffs:
+            filediff = FileDiff.objects.get(pk=filediff.pk)
+            self.assertIsNotNone(filediff.diff_hash_id)
+            self.assertEqual(filediff.diff, self._build_diff(filediff))
+
+        # There are 3 FileDiff partitions (for IDs 100-105) and 3
+        # non-empty LegacyFileDiffData partitions, each with one batch to
+        # report, followed by the final report.
+        self.assertEqual(len(progress), 7)
+        self.assertEqual(progress[-1], 8)
+        self.assertEqual(progress, sorted(progress))
+
+        with open(self.checkpoint_path, 'r') as fp:
+            checkpoint = json.load(fp)
+
+        completed = checkpoint['completed']
+        self.assertEqual(checkpoint['last_pks'], [])
+        self.assertEqual(len(completed), 19)
+        self.assertIn(['filediffs', 100, 102], completed)
+        self.assertIn(['filediffs', 102, 104], completed)
+        self.assertIn(['filediffs', 104, 106], completed)
+        self.assertIn(['legacy_file_diff_data', '', '1'], completed)
+        self.assertIn(['legacy_file_diff_data', 'f', None], completed)
+
+    def test_migrate_all_with_workers_and_checkpoint(self):
+        """Testing FileDiffManager.migrate_all with workers > 1 skips
+        partitions in the checkpoint file
+        """
+        self._create_unmigrated_filediffs(4)
+
+        with open(self.checkpoint_path, 'w') as fp:
+            json.dump(
+                {
+                    'completed': [
+                        ['filediffs', 100, 102],
+                    ],
+                },
+                fp)
+
+        info = FileDiff.objects.migrate_all(
+            workers=2,
+            partition_size=2,
+            checkpoint_path=self.checkpoint_path)
+
+        self.assertEqual(info['diffs_migrated'], 2)
+        self.assertEqual(
+            list(FileDiff.objects.unmigrated().values_list('pk', flat=True)
+                 .order_by('pk')),
+            [100, 101])
+
+    def test_migrate_all_with_workers_and_max_diffs(self):
+        """Testing FileDiffManager.migrate_all with workers > 1 and
+        max_diffs doesn't record incomplete partitions
+        """
+        self._create_unmigrated_filediffs(4)
+
+        info = FileDiff.objects.migrate_all(
+            workers=2,
+            partition_size=3,
+            max_diffs=2,
+            checkpoint_path=self.checkpoint_path)
+
+        self.assertEqual(info['diffs_migrated'], 2)
+        self.assertEqual(FileDiff.objects.unmigrated().count(), 2)
+
+        with open(self.checkpoint_path, 'r') as fp:
+            checkpoint = json.load(fp)
+
+        self.assertEqual(checkpoint, {
+            'completed': [],
+            'last_pks': [
+                [['filediffs', 99, 102], 101],
+            ],
+        })
+
+        # Continuing should migrate the rest.
+        info = FileDiff.objects.migrate_all(
+            workers=2,
+            partition_size=3,
+            checkpoint_path=self.checkpoint_path)
+
+        self.assertEqual(info['diffs_migrated'], 2)
+        self.assertEqual(FileDiff.objects.unmigrated().count(), 0)
+
+        with open(self.checkpoint_path, 'r') as fp:
+            checkpoint = json.load(fp)
+
+        self.assertEqual(checkpoint, {
+            'completed': [
+                ['filediffs', 102, 105],
+            ],
+            'last_pks': [],
+        })
+
+    def test_migrate_all_with_workers_and_error(self):
+        """Testing FileDiffManager.migrate_all with workers > 1 and an error
+        migrating a partition
+        """
+        self._create_unmigrated_filediffs(4)
+
+        @self.spy_for(FileDiff.objects._migrate_partition,
+                      owner=FileDiff.objects)
+        def _migrate_partition(_self, partition, batch_size, max_diffs=None,
+                               after_pk=None, progress_queue=None):
+            if partition[1] == 100:
+                raise Exception('Oh no')
+
+            return FileDiff.objects._migrate_partition.call_original(
+                partition, batch_size, max_diffs, after_pk, progress_queue)
+
+        with self.assertRaisesMessage(Exception, 'Oh no'):
+            FileDiff.objects.migrate_all(
+                workers=2,
+                partition_size=2,
+                checkpoint_path=self.checkpoint_path)
+
+        self.assertEqual(
+            list(FileDiff.objects.unmigrated().values_list('pk', flat=True)
+                 .order_by('pk')),
+            [100, 101])
+
+        with open(self.checkpoint_path, 'r') as fp:
+            completed = json.load(fp)['completed']
+
+        self.assertEqual(completed, [
+            ['filediffs', 102, 104],
+        ])
+
+    def test_migrate_all_with_workers_and_partial_checkpoint(self):
+        """Testing FileDiffManager.migrate_all with workers > 1 resumes
+        partially-migrated partitions in the checkpoint file
+        """
+        self._create_unmigrated_filediffs(4)
+
+        with open(self.checkpoint_path, 'w') as fp:
+            json.dump(
+                {
+                    'completed': [],
+                    'last_pks': [
+                        [['filediffs', 100, 104], 101],
+                    ],
+                },
+                fp)
+
+        info = FileDiff.objects.migrate_all(
+            workers=2,
+            partition_size=4,
+            checkpoint_path=self.checkpoint_path)
+
+        self.assertEqual(info['diffs_migrated'], 2)
+        self.assertEqual(
+            list(FileDiff.objects.unmigrated().values_list('pk', flat=True)
+                 .order_by('pk')),
+            [100, 101])
+
+    def test_migrate_all_retries_batch(self):
+        """Testing FileDiffManager.migrate_all retries a batch that fails
+        with a database error
+        """
+        self._create_unmigrated_filediffs(2)
+        self._disable_retry_delay()
+
+        @self.spy_for(FileDiff.objects._migrate_filediff_batch,
+                      owner=FileDiff.objects)
+        def _migrate_filediff_batch(_self, batch):
+            result = FileDiff.objects._migrate_filediff_batch.call_original(
+                batch)
+
+            if len(FileDiff.objects._migrate_filediff_batch.calls) == 1:
+                raise OperationalError('deadlock detected')
+
+            return result
+
+        info = FileDiff.objects.migrate_all()
+
+        self.assertEqual(info['diffs_migrated'], 2)
+        self.assertEqual(FileDiff.objects.unmigrated().count(), 0)
+        self.assertSpyCallCount(FileDiff.objects._migrate_filediff_batch, 2)
+
+    def test_migrate_all_commits_each_batch(self):
+        """Testing FileDiffManager.migrate_all keeps committed batches when
+        a later batch fails after all retries
+        """
+        self._create_unmigrated_filediffs(4)
+        self._disable_retry_delay()
+
+        @self.spy_for(FileDiff.objects._migrate_filediff_batch,
+                      owner=FileDiff.objects)
+        def _migrate_filediff_batch(_self, batch):
+            result = FileDiff.objects._migrate_filediff_batch.call_original(
+                batch)
+
+            if batch[0].pk == 102:
+                raise IntegrityError('duplicate key')
+
+            return result
+
+        with self.assertRaises(IntegrityError):
+            FileDiff.objects.migrate_all(batch_size=2)
+
+        self.assertEqual(
+            list(FileDiff.objects.unmigrated().values_list('pk', flat=True)
+                 .order_by('pk')),
+            [102, 103])
+
+        # The first batch, and each attempt of the second.
+        self.assertSpyCallCount(
+            FileDiff.objects._migrate_filediff_batch,
+            2 + FileDiff.objects.MIGRATE_BATCH_RETRIES)
+
+    def _disable_retry_delay(self):
+        """Disable the delay between retries of a batch."""
+        FileDiff.objects.MIGRATE_BATCH_RETRY_DELAY = 0
+        self.addCleanup(delattr, FileDiff.objects,
+                        'MIGRATE_BATCH_RETRY_DELAY')
+
+    def _create_unmigrated_filediffs(self, count):
+        """Create FileDiffs storing their own diff content.
+
+        The FileDiffs will have IDs starting at 100.
+
+        Args:
+            count (int):
+                The number of FileDiffs to create.
+
+        Returns:
+            list of reviewboard.diffviewer.models.filediff.FileDiff:
+            The created FileDiffs.
+        """
+        return [
+            FileDiff.objects.create(pk=100 + i,
+                                    diffset=self.diffset,
+                                    source_file='file%d' % i,
+                                    dest_file='file%d' % i,
+                                    diff64=b'diff file%d\n' % i,
+                                    parent_diff64=b'')
+            for i in range(count)
+        ]
+
+    def _create_legacy_filediffs(self, count):
+        """Create FileDiffs storing content in LegacyFileDiffData.
+
+        The FileDiffs will have IDs starting at 200.
+
+        Args:
+            count (int):
+                The number of FileDiffs to create.
+
+        Returns:
+            list of reviewboard.diffviewer.models.filediff.FileDiff:
+            The created FileDiffs.
+        """
+        filediffs = []
+
+        for i in range(count):
+            filename = 'legacy%d' % i
+
+            filediffs.append(FileDiff.objects.create(
+                pk=200 + i,
+                diffset=self.diffset,
+                source_file=filename,
+                dest_file=filename,
+                diff64=b'',
+                parent_diff64=b'',
+                legacy_diff_hash=LegacyFileDiffData.objects.create(
+                    binary_hash='%x%s' % (i * 5, filename),
+                    binary=Base64DecodedValue(
+                        b'diff %s\n' % filename.encode('utf-8')))))
+
+        return filediffs
+
+    def _build_diff(self, filediff):
+        """Return the diff content stored for a created FileDiff.
+
+        Args:
+            filediff (reviewboard.diffviewer.models.filediff.FileDiff):
+                The FileDiff.
+
+        Returns:
+            bytes:
+            The diff content.
+        """
+        return b'diff %s\n' % filediff.source_file.encode('utf-8')
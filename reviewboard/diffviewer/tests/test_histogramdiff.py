@@ -0,0 +1,228 @@
+"""Unit tests for reviewboard.diffviewer.histogramdiff.
+
+Version Added:
+    6.0
+"""
+
+import os
+import random
+
+from reviewboard.diffviewer.differ import (DiffCompatVersion,
+                                           DiffTimeBudget,
+                                           get_default_diff_compat_version,
+                                           get_differ)
+from reviewboard.diffviewer.histogramdiff import HistogramDiffer
+from reviewboard.testing import TestCase
+
+
+class HistogramDifferTests(TestCase):
+    """Unit tests for reviewboard.diffviewer.histogramdiff.HistogramDiffer."""
+
+    def test_equals(self):
+        """Testing HistogramDiffer with equal chunk"""
+        self._test_diff(['1', '2', '3'],
+                        ['1', '2', '3'],
+                        [('equal', 0, 3, 0, 3)])
+
+    def test_delete(self):
+        """Testing HistogramDiffer with delete chunk"""
+        self._test_diff(['1', '2', '3'],
+                        [],
+                        [('delete', 0, 3, 0, 0)])
+
+    def test_insert(self):
+        """Testing HistogramDiffer with insert chunk"""
+        self._test_diff([],
+                        ['1', '2', '3'],
+                        [('insert', 0, 0, 0, 3)])
+
+    def test_replace_insert_between_lines(self):
+        """Testing HistogramDiffer with replace and insert between existing
+        lines
+        """
+        self._test_diff(['1', '2', '3', '7'],
+                        ['1', '2', '4', '5', '6', '7'],
+                        [('equal', 0, 2, 0, 2),
+                         ('replace', 2, 3, 2, 3),
+                         ('insert', 3, 3, 3, 5),
+                         ('equal', 3, 4, 5, 6)])
+
+    def test_reordered_functions(self):
+        """Testing HistogramDiffer with reordered functions"""
+        a = [
+            'def foo():',
+            '    return 1',
+            '',
+            'def bar():',
+            '    return 2',
+            '',
+        ]
+        b = [
+            'def bar():',
+            '    return 2',
+            '',
+            'def foo():',
+            '    return 1',
+            '',
+        ]
+
+        self._test_diff(a, b,
+                        [('insert', 0, 0, 0, 3),
+                         ('equal', 0, 2, 3, 5),
+                         ('delete', 2, 5, 5, 5),
+                         ('equal', 5, 6, 5, 6)])
+
+    def test_ignore_space(self):
+        """Testing HistogramDiffer with ignore_space=True"""
+        differ = HistogramDiffer(['  a', 'b', 'c'],
+                                 ['a', 'b', '  d'],
+                                 ignore_space=True,
+                                 compat_version=DiffCompatVersion.HISTOGRAM)
+
+        self.assertEqual(list(differ.get_opcodes()),
+                         [('equal', 0, 2, 0, 2),
+                          ('replace', 2, 3, 2, 3)])
+
+    def test_with_common_lines_fallback(self):
+        """Testing HistogramDiffer with only lines exceeding
+        MAX_CHAIN_LENGTH falls back to Myers
+        """
+        a = ['a', 'b'] * 100
+        b = ['b', 'a'] * 100
+
+        self._test_valid_opcodes(a, b)
+
+    def test_with_testdata(self):
+        """Testing HistogramDiffer produces valid opcodes with files from
+        testdata
+        """
+        testdata_dir = os.path.join(os.path.dirname(__file__), '..',
+                                    'testdata', 'move_detection')
+
+        with open(os.path.join(testdata_dir, 'bug-4371-old.js'), 'r') as fp:
+            old = fp.read().splitlines()
+
+        with open(os.path.join(testdata_dir, 'bug-4371-new.js'), 'r') as fp:
+            new = fp.read().splitlines()
+
+        self._test_valid_opcodes(old, new)
+        self._test_valid_opcodes(new, old)
+        self._test_valid_opcodes(old * 3, new * 2)
+
+    def test_with_random_changes(self):
+        """Testing HistogramDiffer produces valid opcodes with random
+        changes
+        """
+        rand = random.Random(4371)
+
+        for i in range(200):
+            alphabet_size = rand.choice([2, 5, 20, 200])
+            a = [
+                '%s' % rand.randrange(alphabet_size)
+                for j in range(rand.randrange(50))
+            ]
+            b = list(a)
+
+            for j in range(rand.randrange(10)):
+                value = '%s' % rand.randrange(alphabet_size * 2)
+                op = rand.random()
+
+                if b and op < 0.3:
+                    del b[rand.randrange(len(b))]
+                elif op < 0.6:
+                    b.insert(rand.randrange(len(b) + 1), value)
+                elif b:
+                    b[rand.randrange(len(b))] = value
+
+            self._test_valid_opcodes(a, b)
+
+    def test_with_expired_time_budget(self):
+        """Testing HistogramDiffer with an expired time budget"""
+        differ = HistogramDiffer(['1', '2', '3', '4', '5'],
+                                 ['1', '3', '2', '5', '4'],
+                                 compat_version=DiffCompatVersion.HISTOGRAM,
+                                 time_budget=DiffTimeBudget(0))
+
+        self.assertEqual(list(differ.get_opcodes()),
+                         [('equal', 0, 1, 0, 1),
+                          ('replace', 1, 5, 1, 5)])
+        self.assertTrue(differ.simplified)
+
+    def test_get_differ(self):
+        """Testing get_differ with DiffCompatVersion.HISTOGRAM"""
+        differ = get_differ(['1'], ['2'],
+                            compat_version=DiffCompatVersion.HISTOGRAM)
+        self.assertIsInstance(differ, HistogramDiffer)
+
+    def test_get_default_diff_compat_version(self):
+        """Testing get_default_diff_compat_version"""
+        self.assertEqual(get_default_diff_compat_version(),
+                         DiffCompatVersion.DEFAULT)
+
+        with self.siteconfig_settings({
+            'diffviewer_use_histogram_differ': True,
+        }):
+            self.assertEqual(get_default_diff_compat_version(),
+                             DiffCompatVersion.HISTOGRAM)
+
+    def _test_diff(self, a, b, expected):
+        """Test the opcodes generated for a diff.
+
+        Args:
+            a (list of str):
+                The original lines.
+
+            b (list of str):
+                The modified lines.
+
+            expected (list of tuple):
+                The expected opcodes.
+
+        Raises:
+            AssertionError:
+                The opcodes did not match.
+        """
+        differ = HistogramDiffer(a, b,
+                                 compat_version=DiffCompatVersion.HISTOGRAM)
+        self.assertEqual(list(differ.get_opcodes()), expected)
+
+    def _test_valid_opcodes(self, a, b):
+        """Test that the opcodes generated for a diff are valid.
+
+        The opcodes must cover both files in full, equal ranges must contain
+        equal lines, and replace ranges must be the same length on both
+        sides (matching the opcodes from MyersDiffer).
+
+        Args:
+            a (list of str):
+                The original lines.
+
+            b (list of str):
+                The modified lines.
+
+        Raises:
+            AssertionError:
+                The opcodes were not valid.
+        """
+        differ = HistogramDiffer(a, b,
+                                 compat_version=DiffCompatVersion.HISTOGRAM)
+        i = j = 0
+
+        for tag, i1, i2, j1, j2 in differ.get_opcodes():
+            self.assertEqual((i1, j1), (i, j))
+
+            if tag == 'equal':
+                self.assertEqual(a[i1:i2], b[j1:j2])
+            elif tag == 'replace':
+                self.assertEqual(i2 - i1, j2 - j1)
+            elif tag == 'insert':
+                self.assertEqual(i1, i2)
+            elif tag == 'delete':
+                self.assertEqual(j1, j2)
+            else:
+                self.fail('Unexpected opcode tag "%s"' % tag)
+
+            i = i2
+            j = j2
+
+        self.assertEqual((i, j), (len(a), len(b)))
@@ -1,10 +1,18 @@
-from reviewboard.diffviewer.myersdiff import MyersDiffer
+import os
+
+from reviewboard.diffviewer.differ import (DiffCompatVersion,
+                                           DiffTimeBudget,
+                                           DifferEngine,
+                                           get_differ)
+from reviewboard.diffviewer.myersdiff import ArrayMyersDiffer, MyersDiffer
 from reviewboard.testing import TestCase
 
 
 class MyersDifferTest(TestCase):
     """Unit tests for MyersDiffer."""
 
+    differ_cls = MyersDiffer
+
     def test_equals(self):
         """Testing MyersDiffer with equal chunk"""
         self._test_diff(['1', '2', '3'],
@@ -34,6 +42,99 @@ class MyersDifferTest(TestCase):
                          ('insert', 5, 5, 5, 9),
                          ('equal', 5, 8, 9, 12)])
 
+    def test_with_expired_time_budget(self):
+        """Testing MyersDiffer with an expired time budget"""
+        differ = self.differ_cls(['1', '2', '3', '4', '5'],
+                                 ['1', '3', '2', '5', '4'],
+                                 time_budget=DiffTimeBudget(0))
+
+        self.assertEqual(list(differ.get_opcodes()),
+                         [('equal', 0, 1, 0, 1),
+                          ('replace', 1, 5, 1, 5)])
+        self.assertTrue(differ.simplified)
+
+    def test_with_time_budget(self):
+        """Testing MyersDiffer with a time budget that doesn't expire"""
+        a = ['1', '2', '3', '4', '5']
+        b = ['1', '3', '2', '5', '4']
+        differ = self.differ_cls(a, b, time_budget=DiffTimeBudget(60))
+
+        self.assertEqual(list(differ.get_opcodes()),
+                         list(self.differ_cls(a, b).get_opcodes()))
+        self.assertFalse(differ.simplified)
+
     def _test_diff(self, a, b, expected):
-        opcodes = list(MyersDiffer(a, b).get_opcodes())
+        opcodes = list(self.differ_cls(a, b).get_opcodes())
         self.assertEqual(opcodes, expected)
+
+
+class ArrayMyersDifferTests(MyersDifferTest):
+    """Unit tests for ArrayMyersDiffer."""
+
+    differ_cls = ArrayMyersDiffer
+
+    def test_get_differ(self):
+        """Testing get_differ with DifferEngine.ARRAY"""
+        differ = get_differ(['1'], ['2'], engine=DifferEngine.ARRAY)
+        self.assertIsInstance(differ, ArrayMyersDiffer)
+
+    def test_matches_myers_differ_with_testdata(self):
+        """Testing ArrayMyersDiffer produces the same results as MyersDiffer
+        with files from testdata
+        """
+        testdata_dir = os.path.join(os.path.dirname(__file__), '..',
+                                    'testdata', 'move_detection')
+
+        with open(os.path.join(testdata_dir, 'bug-4371-old.js'), 'r') as fp:
+            old = fp.read().splitlines()
+
+        with open(os.path.join(testdata_dir, 'bug-4371-new.js'), 'r') as fp:
+            new = fp.read().splitlines()
+
+        for a, b in ((old, new), (new, old), (old * 4, new * 3)):
+            for ignore_space in (True, False):
+                self._test_matches_myers_differ(a, b, ignore_space)
+
+    def test_matches_myers_differ_with_discards(self):
+        """Testing ArrayMyersDiffer produces the same results as MyersDiffer
+        with discarded and repeated lines
+        """
+        a = ['%s' % (i % 7) for i in range(300)] + ['a', 'b', 'c']
+        b = (['x', 'y'] +
+             ['%s' % (i % 5) for i in range(250)] +
+             ['a', 'z', 'c', ''])
+
+        self._test_matches_myers_differ(a, b, ignore_space=False)
+        self._test_matches_myers_differ(b, a, ignore_space=False)
+
+    def _test_matches_myers_differ(self, a, b, ignore_space):
+        """Assert that ArrayMyersDiffer and MyersDiffer results match.
+
+        Args:
+            a (list of str):
+                The original lines.
+
+            b (list of str):
+                The modified lines.
+
+            ignore_space (bool):
+                Whether to ignore leading whitespace.
+
+        Raises:
+            AssertionError:
+                The results did not match.
+        """
+        differs = [
+            cls(a, b, ignore_space,
+                compat_version=DiffCompatVersion.DEFAULT)
+            for cls in (MyersDiffer, ArrayMyersDiffer)
+        ]
+
+        for differ in differs:
+            differ.add_interesting_lines_for_headers('test.js')
+
+        self.assertEqual(list(differs[1].get_opcodes()),
+                         list(differs[0].get_opcodes()))
+        self.assertEqual(differs[1].ratio(), differs[0].ratio())
+        self.assertEqual(differs[1].interesting_lines,
+                         differs[0].interesting_lines)
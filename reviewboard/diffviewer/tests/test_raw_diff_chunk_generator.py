@@ -1,9 +1,16 @@
-from reviewboard.diffviewer.chunk_generator import RawDiffChunkGenerator
+import kgb
+from django.core.cache import cache
+from djblets.cache.backend import cache_memoize, make_cache_key
+
+from reviewboard.diffviewer.chunk_generator import (CachedChunkLines,
+                                                    RawDiffChunkGenerator)
+from reviewboard.diffviewer.chunk_lines import LINES_FORMAT_VERSION
+from reviewboard.diffviewer.differ import DiffTimeBudget
 from reviewboard.diffviewer.settings import DiffSettings
 from reviewboard.testing import TestCase
 
 
-class RawDiffChunkGeneratorTests(TestCase):
+class RawDiffChunkGeneratorTests(kgb.SpyAgency, TestCase):
     """Unit tests for RawDiffChunkGenerator."""
 
     @property
@@ -144,6 +151,57 @@ class RawDiffChunkGeneratorTests(TestCase):
                 'numlines': 1,
             })
 
+    def test_get_chunks_with_expired_time_budget(self):
+        """Testing RawDiffChunkGenerator.get_chunks with an expired time
+        budget
+        """
+        @self.spy_for(DiffTimeBudget.__init__, owner=DiffTimeBudget)
+        def _init(_self, seconds):
+            DiffTimeBudget.__init__.call_original(_self, 0)
+
+        old = (
+            b'This is line 1\n'
+            b'Line 2.\n'
+            b'Line 3.\n'
+            b'la de da.\n'
+        )
+
+        new = (
+            b'This is line 1\n'
+            b'Line 3.\n'
+            b'Line 2.\n'
+            b'la de doo.\n'
+        )
+
+        generator = RawDiffChunkGenerator(old, new, 'file1', 'file2',
+                                          diff_settings=DiffSettings.create())
+        chunks = list(generator.get_chunks())
+
+        self.assertEqual(len(chunks), 2)
+        self.assertEqual(chunks[0]['change'], 'equal')
+        self.assertNotIn('simplified', chunks[0]['meta'])
+        self.assertEqual(
+            chunks[1],
+            {
+                'change': 'replace',
+                'collapsable': False,
+                'index': 1,
+                'lines': [
+                    [2, 2, 'Line 2.', [], 2, 'Line 3.', [], False],
+                    [3, 3, 'Line 3.', [], 3, 'Line 2.', [], False],
+                    [4, 4, 'la de da.', [], 4, 'la de doo.', [], False],
+                ],
+                'meta': {
+                    'left_headers': [],
+                    'right_headers': [],
+                    'simplified': ['coarse', 'intraline', 'moves'],
+                    'whitespace_chunk': False,
+                    'whitespace_lines': [],
+                },
+                'numlines': 3,
+            })
+        self.assertTrue(generator.get_chunks_info()['simplified'])
+
     def test_get_chunks_with_settings_syntax_highlighting_true(self):
         """Testing RawDiffChunkGenerator.get_chunks with
         DiffSettings.syntax_highlighting=True and syntax highlighting
@@ -490,6 +548,423 @@ class RawDiffChunkGeneratorTests(TestCase):
             },
         })
 
+    def test_get_chunks_with_cache_key_segments(self):
+        """Testing RawDiffChunkGenerator.get_chunks with cache_key stores
+        chunks in segments
+        """
+        expected_chunks = self._get_expected_chunks()
+        generator = self._create_segmented_generator()
+
+        self.assertEqual(list(generator.get_chunks('test-chunks')),
+                         expected_chunks)
+
+        # A new generator should load everything from cache.
+        generator = self._create_segmented_generator()
+        self.spy_on(generator.get_chunks_uncached)
+
+        index = generator._get_chunks_index('test-chunks')
+        self.assertNotIn('chunks', index)
+        self.assertEqual(index['num_chunks'], len(expected_chunks))
+        self.assertEqual(len(index['chunk_infos']), len(expected_chunks))
+        self.assertEqual(index['num_lines'], 60)
+        self.assertEqual(index['segment_num_lines'], 10)
+        self.assertEqual(
+            index['chunk_first_lines'],
+            [
+                chunk['lines'][0][0]
+                for chunk in expected_chunks
+            ])
+
+        for i in range(6):
+            self.assertIsNotNone(
+                cache.get(make_cache_key('test-chunks-segment-%d' % i)))
+
+        self.assertIsNone(
+            cache.get(make_cache_key('test-chunks-segment-6')))
+
+        self.assertEqual(list(generator.get_chunks('test-chunks')),
+                         expected_chunks)
+        self.assertSpyNotCalled(generator.get_chunks_uncached)
+
+    def test_get_chunks_with_cache_key_small(self):
+        """Testing RawDiffChunkGenerator.get_chunks with cache_key stores
+        chunks for small diffs in the index
+        """
+        generator = RawDiffChunkGenerator(b'a\nb\n', b'a\nc\n', 'file1',
+                                          'file2',
+                                          diff_settings=DiffSettings.create())
+        chunks = list(generator.get_chunks('test-chunks-small'))
+
+        index = generator._get_chunks_index('test-chunks-small')
+        self.assertEqual(index['chunks'], chunks)
+        self.assertIsNone(
+            cache.get(make_cache_key('test-chunks-small-segment-0')))
+
+    def test_get_chunks_with_evicted_segment(self):
+        """Testing RawDiffChunkGenerator.get_chunks with an evicted segment
+        regenerates only that segment
+        """
+        generator = self._create_segmented_generator()
+        expected_chunks = list(generator.get_chunks('test-chunks'))
+
+        cache.delete(make_cache_key('test-chunks-segment-1'))
+
+        generator = self._create_segmented_generator()
+        self.spy_on(generator.get_chunks_uncached)
+        self.spy_on(cache.set)
+        self.spy_on(cache.set_many)
+
+        self.assertEqual(list(generator.get_chunks('test-chunks')),
+                         expected_chunks)
+        self.assertSpyCallCount(generator.get_chunks_uncached, 1)
+        self.assertIsNotNone(
+            cache.get(make_cache_key('test-chunks-segment-1')))
+
+        # Only the evicted segment should have been stored.
+        segment_key = make_cache_key('test-chunks-segment-1')
+        stored_keys = [
+            call.args[0]
+            for call in cache.set.calls
+        ] + [
+            key
+            for call in cache.set_many.calls
+            for key in call.args[0]
+        ]
+
+        self.assertTrue(stored_keys)
+
+        for key in stored_keys:
+            self.assertTrue(key.startswith(segment_key))
+
+    def test_get_chunks_with_evicted_segment_and_time_budget(self):
+        """Testing RawDiffChunkGenerator.get_chunks with an evicted segment
+        regenerates the segment without a time budget
+        """
+        generator = self._create_segmented_generator()
+        expected_chunks = list(generator.get_chunks('test-chunks'))
+
+        cache.delete(make_cache_key('test-chunks-segment-1'))
+
+        # Any time budget would expire immediately.
+        @self.spy_for(DiffTimeBudget.__init__, owner=DiffTimeBudget)
+        def _init(_self, seconds):
+            DiffTimeBudget.__init__.call_original(_self, 0)
+
+        generator = self._create_segmented_generator()
+
+        self.assertEqual(list(generator.get_chunks('test-chunks')),
+                         expected_chunks)
+        self.assertSpyNotCalled(DiffTimeBudget.__init__)
+        self.assertIsNotNone(cache.get(make_cache_key('test-chunks-index')))
+
+    def test_get_chunks_with_cache_key_simplified(self):
+        """Testing RawDiffChunkGenerator.get_chunks with a cache key and a
+        simplified diff stores the chunks in the index
+        """
+        @self.spy_for(DiffTimeBudget.__init__, owner=DiffTimeBudget)
+        def _init(_self, seconds):
+            DiffTimeBudget.__init__.call_original(_self, 0)
+
+        generator = self._create_segmented_generator()
+        chunks = list(generator.get_chunks('test-chunks'))
+
+        self.assertTrue(generator.get_chunks_info('test-chunks')['simplified'])
+        self.assertIsNone(
+            cache.get(make_cache_key('test-chunks-segment-0')))
+
+        # The stored chunks are used, rather than a new diff.
+        generator = self._create_segmented_generator()
+        self.spy_on(generator.get_chunks_uncached)
+
+        self.assertEqual(list(generator.get_chunks('test-chunks')), chunks)
+        self.assertSpyNotCalled(generator.get_chunks_uncached)
+
+    def test_get_chunks_with_old_format_segment(self):
+        """Testing RawDiffChunkGenerator.get_chunks with a segment stored in
+        an older format regenerates the segment
+        """
+        generator = self._create_segmented_generator()
+        expected_chunks = list(generator.get_chunks('test-chunks'))
+        lines = generator._get_all_lines_uncached()
+
+        cache_memoize('test-chunks-segment-1',
+                      lambda: [list(line) for line in lines[10:20]],
+                      force_overwrite=True,
+                      large_data=True)
+
+        generator = self._create_segmented_generator()
+        self.spy_on(generator.get_chunks_uncached)
+
+        self.assertEqual(list(generator.get_chunks('test-chunks')),
+                         expected_chunks)
+        self.assertSpyCallCount(generator.get_chunks_uncached, 1)
+
+        # The segment should now be stored in the current format.
+        generator = self._create_segmented_generator()
+        self.spy_on(generator.get_chunks_uncached)
+
+        self.assertEqual(list(generator.get_chunks('test-chunks')),
+                         expected_chunks)
+        self.assertSpyNotCalled(generator.get_chunks_uncached)
+
+    def test_get_chunks_with_old_format_index(self):
+        """Testing RawDiffChunkGenerator.get_chunks with an index stored in
+        an older format rebuilds the index
+        """
+        generator = RawDiffChunkGenerator(b'a\nb\n', b'a\nc\n', 'file1',
+                                          'file2',
+                                          diff_settings=DiffSettings.create())
+        chunks = list(generator.get_chunks_uncached())
+
+        cache_memoize('test-chunks-small-index',
+                      lambda: dict(generator._build_chunks_index(chunks),
+                                   chunks=chunks),
+                      large_data=True)
+
+        generator = RawDiffChunkGenerator(b'a\nb\n', b'a\nc\n', 'file1',
+                                          'file2',
+                                          diff_settings=DiffSettings.create())
+        self.spy_on(generator.get_chunks_uncached)
+
+        self.assertEqual(list(generator.get_chunks('test-chunks-small')),
+                         chunks)
+        self.assertSpyCallCount(generator.get_chunks_uncached, 1)
+
+        index = generator._get_chunks_index('test-chunks-small')
+        self.assertEqual(index['lines_format'], LINES_FORMAT_VERSION)
+
+    def test_get_chunks_info(self):
+        """Testing RawDiffChunkGenerator.get_chunks_info"""
+        chunks = self._get_expected_chunks()
+        generator = self._create_segmented_generator()
+
+        self.assertEqual(
+            generator.get_chunks_info('test-chunks'),
+            {
+                'changed_chunk_indexes': [
+                    chunk['index']
+                    for chunk in chunks
+                    if chunk['change'] != 'equal'
+                ],
+                'num_chunks': len(chunks),
+                'simplified': False,
+                'whitespace_only': False,
+            })
+
+    def test_get_chunk_range(self):
+        """Testing RawDiffChunkGenerator.get_chunk_range"""
+        expected_chunks = self._get_expected_chunks()
+
+        # Populate the cache.
+        generator = self._create_segmented_generator()
+        list(generator.get_chunks('test-chunks'))
+
+        generator = self._create_segmented_generator()
+        self.spy_on(generator.get_chunks_uncached)
+        self.spy_on(generator._make_segment_cache_key)
+
+        self.assertEqual(list(generator.get_chunk_range(3, 5, 'test-chunks')),
+                         expected_chunks[3:5])
+        self.assertSpyNotCalled(generator.get_chunks_uncached)
+
+        # Only the segments containing the chunks should have been fetched.
+        self.assertEqual(
+            [
+                call.args[1]
+                for call in generator._make_segment_cache_key.calls
+            ],
+            [0, 1])
+
+        generator = self._create_segmented_generator()
+        self.assertEqual(list(generator.get_chunk_range(3, 5)),
+                         expected_chunks[3:5])
+
+    def test_get_chunk_range_with_lazy_lines(self):
+        """Testing RawDiffChunkGenerator.get_chunk_range with
+        lazy_lines=True
+        """
+        expected_chunks = \
+            list(self._get_large_chunk_generator().get_chunks_uncached())
+
+        # Populate the cache.
+        generator = self._get_large_chunk_generator()
+        list(generator.get_chunks('test-chunks'))
+
+        generator = self._get_large_chunk_generator()
+        self.spy_on(generator.get_chunks_uncached)
+        self.spy_on(generator._make_segment_cache_key)
+
+        chunks = list(generator.get_chunk_range(0, 1, 'test-chunks',
+                                                lazy_lines=True))
+        self.assertEqual(len(chunks), 1)
+
+        chunk = chunks[0]
+        lines = chunk['lines']
+        self.assertIsInstance(lines, CachedChunkLines)
+        self.assertEqual(len(lines), 95)
+        self.assertEqual(chunk['numlines'], 95)
+        self.assertEqual(chunk['change'], 'equal')
+        self.assertTrue(chunk['collapsable'])
+        self.assertSpyNotCalled(generator._make_segment_cache_key)
+
+        # Only the segments containing the accessed lines should be fetched.
+        expected_lines = expected_chunks[0]['lines']
+        self.assertEqual(lines[-1], expected_lines[-1])
+        self.assertEqual(list(lines[:3]), expected_lines[:3])
+        self.assertEqual(lines[40:60], expected_lines[40:60])
+        self.assertEqual(len(lines[40:60]), 20)
+        self.assertSpyNotCalled(generator.get_chunks_uncached)
+
+        self.assertEqual(
+            [
+                call.args[1]
+                for call in generator._make_segment_cache_key.calls
+            ],
+            [9, 0, 4, 5])
+
+        self.assertEqual(list(lines), expected_lines)
+
+    def test_get_chunks_in_line_range(self):
+        """Testing RawDiffChunkGenerator.get_chunks_in_line_range"""
+        expected_chunks = []
+
+        for chunk in self._get_expected_chunks():
+            lines = [
+                line
+                for line in chunk['lines']
+                if 18 <= line[0] <= 27
+            ]
+
+            if lines:
+                expected_chunks.append(dict(chunk,
+                                            lines=lines,
+                                            numlines=len(lines)))
+
+        self.assertGreater(len(expected_chunks), 1)
+
+        # Populate the cache.
+        generator = self._create_segmented_generator()
+        list(generator.get_chunks('test-chunks'))
+
+        generator = self._create_segmented_generator()
+        self.spy_on(generator.get_chunks_uncached)
+        self.spy_on(generator._make_segment_cache_key)
+
+        self.assertEqual(
+            list(generator.get_chunks_in_line_range(18, 10, 'test-chunks')),
+            expected_chunks)
+        self.assertSpyNotCalled(generator.get_chunks_uncached)
+
+        # Only the segments containing the lines should have been fetched.
+        self.assertEqual(
+            [
+                call.args[1]
+                for call in generator._make_segment_cache_key.calls
+            ],
+            [1, 2])
+
+        generator = self._create_segmented_generator()
+        self.assertEqual(
+            list(generator.get_chunks_in_line_range(18, 10)),
+            expected_chunks)
+
+    def test_get_chunks_in_line_range_in_large_chunk(self):
+        """Testing RawDiffChunkGenerator.get_chunks_in_line_range with a
+        range within a large chunk
+        """
+        expected_chunk = \
+            list(self._get_large_chunk_generator().get_chunks_uncached())[0]
+
+        # Populate the cache.
+        generator = self._get_large_chunk_generator()
+        list(generator.get_chunks('test-chunks'))
+
+        generator = self._get_large_chunk_generator()
+        self.spy_on(generator._make_segment_cache_key)
+
+        self.assertEqual(
+            list(generator.get_chunks_in_line_range(52, 5, 'test-chunks')),
+            [
+                dict(expected_chunk,
+                     lines=expected_chunk['lines'][51:56],
+                     numlines=5),
+            ])
+        self.assertEqual(
+            [
+                call.args[1]
+                for call in generator._make_segment_cache_key.calls
+            ],
+            [5])
+
+    def test_get_chunks_in_line_range_outside_diff(self):
+        """Testing RawDiffChunkGenerator.get_chunks_in_line_range with a
+        range outside of the diff
+        """
+        generator = self._create_segmented_generator()
+
+        self.assertEqual(
+            list(generator.get_chunks_in_line_range(61, 10, 'test-chunks')),
+            [])
+        self.assertEqual(
+            list(generator.get_chunks_in_line_range(1, 0, 'test-chunks')),
+            [])
+
+    def _get_expected_chunks(self):
+        """Return the uncached chunks for the segmented generator.
+
+        Returns:
+            list of dict:
+            The list of chunks.
+        """
+        return list(self._create_segmented_generator().get_chunks_uncached())
+
+    def _create_segmented_generator(self):
+        """Return a generator for a diff with many chunks.
+
+        The generator will store chunks in segments of 10 lines.
+
+        Returns:
+            reviewboard.diffviewer.chunk_generator.RawDiffChunkGenerator:
+            The new generator.
+        """
+        old = b''.join(
+            b'line %d\n' % i
+            for i in range(60)
+        )
+        new = b''.join(
+            b'line %d%s\n' % (i, b' changed' if i % 7 == 0 else b'')
+            for i in range(60)
+        )
+
+        generator = RawDiffChunkGenerator(old, new, 'file1', 'file2',
+                                          diff_settings=DiffSettings.create())
+        generator.CACHE_SEGMENT_NUM_LINES = 10
+
+        return generator
+
+    def _get_large_chunk_generator(self):
+        """Return a generator for a diff with a large unchanged chunk.
+
+        The diff will have a collapsable chunk of 95 unchanged lines,
+        followed by a change. The generator will store chunks in segments
+        of 10 lines.
+
+        Returns:
+            reviewboard.diffviewer.chunk_generator.RawDiffChunkGenerator:
+            The new generator.
+        """
+        old = b''.join(
+            b'line %d\n' % i
+            for i in range(101)
+        )
+        new = old.replace(b'line 100\n', b'line 100 changed\n')
+
+        generator = RawDiffChunkGenerator(old, new, 'file1', 'file2',
+                                          diff_settings=DiffSettings.create())
+        generator.CACHE_SEGMENT_NUM_LINES = 10
+
+        return generator
+
     def test_apply_pygments_with_lexer(self):
         """Testing RawDiffChunkGenerator._apply_pygments with valid lexer"""
         chunk_generator = RawDiffChunkGenerator(
@@ -503,6 +978,47 @@ class RawDiffChunkGeneratorTests(TestCase):
                                             filename='test.md'),
             ['This is <span class="gs">**bold**</span>'])
 
+    def test_apply_pygments_cached(self):
+        """Testing RawDiffChunkGenerator._apply_pygments shares highlighted
+        lines for identical file contents
+        """
+        generator1 = RawDiffChunkGenerator(
+            old=[],
+            new=[],
+            orig_filename='file1',
+            modified_filename='file2',
+            diff_settings=DiffSettings.create())
+        generator2 = RawDiffChunkGenerator(
+            old=[],
+            new=[],
+            orig_filename='file3',
+            modified_filename='file4',
+            diff_settings=DiffSettings.create(syntax_highlighting=True))
+
+        self.spy_on(generator1._highlight)
+        self.spy_on(generator2._highlight)
+
+        expected = ['This is <span class="gs">**bold**</span>']
+
+        self.assertEqual(
+            generator1._apply_pygments(data='This is **bold**\n',
+                                       filename='test.md'),
+            expected)
+        self.assertEqual(
+            generator2._apply_pygments(data='This is **bold**\n',
+                                       filename='other.md'),
+            expected)
+
+        self.assertSpyCallCount(generator1._highlight, 1)
+        self.assertSpyNotCalled(generator2._highlight)
+
+        # Different contents must be highlighted separately.
+        self.assertEqual(
+            generator2._apply_pygments(data='This is *italic*\n',
+                                       filename='other.md'),
+            ['This is <span class="ge">*italic*</span>'])
+        self.assertSpyCallCount(generator2._highlight, 1)
+
     def test_apply_pygments_without_lexer(self):
         """Testing RawDiffChunkGenerator._apply_pygments without valid lexer"""
         chunk_generator = RawDiffChunkGenerator(
@@ -1,5 +1,8 @@
 import bz2
+import zlib
 
+from reviewboard.diffviewer.compression import \
+    diff_compression_codec_registry
 from reviewboard.diffviewer.models import RawFileDiffData
 from reviewboard.testing import TestCase
 
@@ -53,3 +56,167 @@ class RawFileDiffDataManagerTests(TestCase):
 
         self.assertEqual(data, bz2.compress(self.large_diff, 9))
         self.assertEqual(compression, RawFileDiffData.COMPRESSION_BZIP2)
+
+    def test_process_diff_data_with_configured_codec(self):
+        """Testing RawFileDiffDataManager.process_diff_data with configured
+        codec and level
+        """
+        with self.siteconfig_settings({
+            'diffviewer_compression_codec': 'Z',
+            'diffviewer_compression_level': 1,
+        }):
+            data, compression = \
+                RawFileDiffData.objects.process_diff_data(self.large_diff)
+
+        self.assertEqual(data, zlib.compress(self.large_diff, 1))
+        self.assertEqual(compression, RawFileDiffData.COMPRESSION_ZLIB)
+
+    def test_process_diff_data_with_codec(self):
+        """Testing RawFileDiffDataManager.process_diff_data with codec"""
+        codec = diff_compression_codec_registry.get_codec('Z')
+        data, compression = RawFileDiffData.objects.process_diff_data(
+            self.large_diff,
+            codec=codec)
+
+        self.assertEqual(data, zlib.compress(self.large_diff, 6))
+        self.assertEqual(compression, RawFileDiffData.COMPRESSION_ZLIB)
+
+    def test_recompress_all(self):
+        """Testing RawFileDiffDataManager.recompress_all"""
+        raw_fdds = self._create_raw_fdds(3)
+        batches = []
+
+        def _on_batch_done(total_diffs_migrated, total_count, last_pk,
+                           **kwargs):
+            batches.append((total_diffs_migrated, total_count, last_pk))
+
+        codec = diff_compression_codec_registry.get_codec('Z')
+        info = RawFileDiffData.objects.recompress_all(
+            codec=codec,
+            batch_done_cb=_on_batch_done,
+            total_count=3,
+            batch_size=2)
+
+        self.assertEqual(info['diffs_migrated'], 3)
+        self.assertEqual(info['last_pk'], raw_fdds[-1].pk)
+        self.assertEqual(
+            batches,
+            [
+                (2, 3, raw_fdds[1].pk),
+                (3, 3, raw_fdds[2].pk),
+            ])
+
+        for raw_fdd in raw_fdds:
+            new_raw_fdd = RawFileDiffData.objects.get(pk=raw_fdd.pk)
+
+            self.assertEqual(new_raw_fdd.compression,
+                             RawFileDiffData.COMPRESSION_ZLIB)
+            self.assertEqual(new_raw_fdd.content, raw_fdd.content)
+
+        self.assertEqual(
+            info['old_diff_size'],
+            sum(len(raw_fdd.binary) for raw_fdd in raw_fdds))
+        self.assertEqual(
+            info['new_diff_size'],
+            sum(len(zlib.compress(raw_fdd.content, 6))
+                for raw_fdd in raw_fdds))
+
+    def test_recompress_all_resumes(self):
+        """Testing RawFileDiffDataManager.recompress_all skips entries
+        already recompressed
+        """
+        raw_fdds = self._create_raw_fdds(3)
+        codec = diff_compression_codec_registry.get_codec('Z')
+
+        info = RawFileDiffData.objects.recompress_all(codec=codec,
+                                                      max_diffs=2)
+        self.assertEqual(info['diffs_migrated'], 2)
+        self.assertEqual(info['last_pk'], raw_fdds[1].pk)
+        self.assertEqual(
+            RawFileDiffData.objects.get_recompression_count(codec), 1)
+
+        info = RawFileDiffData.objects.recompress_all(codec=codec)
+        self.assertEqual(info['diffs_migrated'], 1)
+        self.assertEqual(info['last_pk'], raw_fdds[2].pk)
+        self.assertEqual(
+            RawFileDiffData.objects.get_recompression_count(codec), 0)
+
+    def test_recompress_all_with_start_pk(self):
+        """Testing RawFileDiffDataManager.recompress_all with start_pk"""
+        raw_fdds = self._create_raw_fdds(3)
+        codec = diff_compression_codec_registry.get_codec('Z')
+
+        info = RawFileDiffData.objects.recompress_all(
+            codec=codec,
+            start_pk=raw_fdds[1].pk)
+
+        self.assertEqual(info['diffs_migrated'], 2)
+        self.assertEqual(
+            list(RawFileDiffData.objects.order_by('pk')
+                 .values_list('compression', flat=True)),
+            [
+                RawFileDiffData.COMPRESSION_BZIP2,
+                RawFileDiffData.COMPRESSION_ZLIB,
+                RawFileDiffData.COMPRESSION_ZLIB,
+            ])
+
+    def test_get_or_create_many_from_data(self):
+        """Testing RawFileDiffDataManager.get_or_create_many_from_data"""
+        existing_raw_fdd = RawFileDiffData.objects.get_or_create_from_data(
+            self.small_diff)[0]
+
+        with self.assertNumQueries(3):
+            raw_fdds = RawFileDiffData.objects.get_or_create_many_from_data(
+                [self.small_diff, self.large_diff, self.small_diff])
+
+        self.assertEqual(len(raw_fdds), 3)
+        self.assertEqual(raw_fdds[0], existing_raw_fdd)
+        self.assertEqual(raw_fdds[2], existing_raw_fdd)
+        self.assertIsNotNone(raw_fdds[1].pk)
+        self.assertEqual(raw_fdds[1].content, self.large_diff)
+        self.assertEqual(RawFileDiffData.objects.count(), 2)
+
+    def test_get_or_create_many_from_data_with_line_counts(self):
+        """Testing RawFileDiffDataManager.get_or_create_many_from_data with
+        line_counts
+        """
+        RawFileDiffData.objects.get_or_create_from_data(self.small_diff)
+
+        raw_fdds = RawFileDiffData.objects.get_or_create_many_from_data(
+            [self.small_diff, self.large_diff],
+            line_counts=[(1, 1), (10, 1)])
+
+        raw_fdds = [
+            RawFileDiffData.objects.get(pk=raw_fdd.pk)
+            for raw_fdd in raw_fdds
+        ]
+
+        self.assertEqual(raw_fdds[0].insert_count, 1)
+        self.assertEqual(raw_fdds[0].delete_count, 1)
+        self.assertEqual(raw_fdds[1].insert_count, 10)
+        self.assertEqual(raw_fdds[1].delete_count, 1)
+
+    def test_get_or_create_many_from_data_with_non_bytes(self):
+        """Testing RawFileDiffDataManager.get_or_create_many_from_data with
+        non-bytes data
+        """
+        with self.assertRaises(TypeError):
+            RawFileDiffData.objects.get_or_create_many_from_data(['diff'])
+
+    def _create_raw_fdds(self, count):
+        """Create bzip2-compressed RawFileDiffData entries.
+
+        Args:
+            count (int):
+                The number of entries to create.
+
+        Returns:
+            list of reviewboard.diffviewer.models.raw_file_diff_data.
+            RawFileDiffData:
+            The new entries.
+        """
+        return [
+            RawFileDiffData.objects.get_or_create_from_data(
+                self.large_diff + b'+blah %d\n' % i)[0]
+            for i in range(count)
+        ]
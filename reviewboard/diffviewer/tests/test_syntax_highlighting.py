@@ -0,0 +1,77 @@
+"""Unit tests for reviewboard.diffviewer.syntax_highlighting.
+
+Version Added:
+    6.0
+"""
+
+from pygments.lexers import PythonLexer, TextLexer
+
+from reviewboard.diffviewer.syntax_highlighting import (
+    get_cache_access_counts,
+    get_highlighted_lines)
+from reviewboard.testing import TestCase
+
+
+class GetHighlightedLinesTests(TestCase):
+    """Unit tests for get_highlighted_lines."""
+
+    def setUp(self):
+        super().setUp()
+
+        self.calls = []
+
+    def test_cache_hit(self):
+        """Testing get_highlighted_lines with highlighted lines in the cache
+        """
+        lexer = PythonLexer()
+
+        self.assertEqual(get_highlighted_lines('x = 1\n', lexer,
+                                               self._highlight),
+                         ['x = 1'])
+        self.assertEqual(get_highlighted_lines('x = 1\n', PythonLexer(),
+                                               self._highlight),
+                         ['x = 1'])
+
+        self.assertEqual(self.calls, [('x = 1\n', lexer)])
+        self.assertEqual(get_cache_access_counts(), {
+            'hits': 1,
+            'misses': 1,
+        })
+
+    def test_different_lexers(self):
+        """Testing get_highlighted_lines with the same contents and different
+        lexers
+        """
+        get_highlighted_lines('x = 1\n', PythonLexer(), self._highlight)
+        get_highlighted_lines('x = 1\n', TextLexer(), self._highlight)
+
+        self.assertEqual(len(self.calls), 2)
+        self.assertEqual(get_cache_access_counts(), {
+            'hits': 0,
+            'misses': 2,
+        })
+
+    def test_different_contents(self):
+        """Testing get_highlighted_lines with different contents"""
+        get_highlighted_lines('x = 1\n', PythonLexer(), self._highlight)
+        get_highlighted_lines('x = 2\n', PythonLexer(), self._highlight)
+
+        self.assertEqual(len(self.calls), 2)
+
+    def _highlight(self, data, lexer):
+        """Fake highlighting of contents, recording the call.
+
+        Args:
+            data (str):
+                The contents to highlight.
+
+            lexer (pygments.lexer.Lexer):
+                The lexer to use.
+
+        Returns:
+            list of str:
+            The lines of the contents.
+        """
+        self.calls.append((data, lexer))
+
+        return data.splitlines()
@@ -1,5 +1,7 @@
 """Unit tests for reviewboard.reviews.views.DownloadRawDiffView."""
 
+from django.http import StreamingHttpResponse
+
 from reviewboard.testing import TestCase
 
 
@@ -107,4 +109,6 @@ class DownloadRawDiffViewTests(TestCase):
             save=True)
 
         response = self.client.get('/r/%d/diff/raw/' % review_request.pk)
-        self.assertEqual(response.content, cumulative_diff)
+        self.assertIsInstance(response, StreamingHttpResponse)
+        self.assertEqual(b''.join(response.streaming_content),
+                         cumulative_diff)
@@ -3,7 +3,8 @@
 import logging
 from typing import Optional
 
-from django.http import Http404, HttpRequest, HttpResponse
+from django.http import (Http404, HttpRequest, HttpResponse,
+                         StreamingHttpResponse)
 from django.shortcuts import get_object_or_404
 from django.views.generic.base import View
 from djblets.util.http import set_last_modified
@@ -103,11 +104,16 @@ class DownloadRawDiffView(ReviewRequestViewMixin, View):
         revision: Optional[int] = None,
         *args,
         **kwargs,
-    ) -> HttpResponse:
+    ) -> StreamingHttpResponse:
         """Handle HTTP GET requests for this view.
 
         This will generate the raw diff file and send it to the client.
 
+        Version Changed:
+            6.0:
+            The diff is now streamed to the client one file at a time, rather
+            than being built in memory first.
+
         Args:
             request (django.http.HttpRequest):
                 The HTTP request from the client.
@@ -123,7 +129,7 @@ class DownloadRawDiffView(ReviewRequestViewMixin, View):
                 Keyword arguments passed to the handler.
 
         Returns:
-            django.http.HttpResponse:
+            django.http.StreamingHttpResponse:
             The HTTP response to send to the client.
         """
         review_request = self.review_request
@@ -132,9 +138,10 @@ class DownloadRawDiffView(ReviewRequestViewMixin, View):
         diffset = self.get_diff(revision, draft)
 
         tool = review_request.repository.get_scmtool()
-        data = tool.get_parser(b'').raw_diff(diffset)
+        parser = tool.get_parser(b'')
 
-        resp = HttpResponse(data, content_type='text/x-patch')
+        resp = StreamingHttpResponse(parser.iter_raw_diff(diffset),
+                                     content_type='text/x-patch')
 
         if diffset.name == 'diff':
             filename = 'rb%d.patch' % review_request.display_id
@@ -471,8 +471,7 @@ class GitDiffParser(DiffParser):
             return linenum, None
 
         file_info = ParsedDiffFile(parsed_diff_change=self.parsed_diff_change)
-        file_info.append_data(diff_git_line)
-        file_info.append_data(b'\n')
+        file_info.append_lines(lines, start_linenum, start_linenum + 1)
         file_info.binary = False
 
         # Assume the blob / commit information is provided globally. If
@@ -558,8 +557,7 @@ class GitDiffParser(DiffParser):
                 break
             elif self._is_binary_patch(linenum):
                 file_info.binary = True
-                file_info.append_data(lines[linenum])
-                file_info.append_data(b'\n')
+                file_info.append_lines(lines, linenum, linenum + 1)
                 empty_change = False
                 linenum += 1
                 break
@@ -600,10 +598,7 @@ class GitDiffParser(DiffParser):
                 else:
                     file_info.modified_filename = new_filename
 
-                file_info.append_data(orig_line)
-                file_info.append_data(b'\n')
-                file_info.append_data(new_line)
-                file_info.append_data(b'\n')
+                file_info.append_lines(lines, linenum, linenum + 2)
 
                 linenum += 2
                 changes_linenum = linenum
@@ -7,7 +7,7 @@ import kgb
 from djblets.testing.decorators import add_fixtures
 
 from reviewboard import get_manual_url
-from reviewboard.diffviewer.parser import DiffParserError
+from reviewboard.diffviewer.parser import DiffLines, DiffParserError
 from reviewboard.diffviewer.testing.mixins import DiffParserTestingMixin
 from reviewboard.scmtools.core import PRE_CREATION
 from reviewboard.scmtools.errors import SCMError, FileNotFoundError
@@ -662,6 +662,36 @@ class GitTests(DiffParserTestingMixin, kgb.SpyAgency, SCMTestCase):
             delete_count=1,
             data=diffs[6])
 
+    def test_complex_diff_with_line_offsets(self):
+        """Testing parsing Git diff with existing and new files using
+        line offsets
+        """
+        full_diff, diffs = self._read_diff_fixture(
+            'git_complex.diff',
+            expected_num_diffs=7)
+
+        parser = self.tool.get_parser(full_diff)
+        parser.lines = DiffLines(full_diff)
+        parsed_files = parser.parse()
+        expected_files = self.tool.get_parser(full_diff).parse()
+
+        self.assertEqual(len(parsed_files), 7)
+
+        for parsed_file, expected_file in zip(parsed_files, expected_files):
+            self.assert_parsed_diff_file(
+                parsed_file,
+                orig_filename=expected_file.orig_filename,
+                orig_file_details=expected_file.orig_file_details,
+                modified_filename=expected_file.modified_filename,
+                modified_file_details=expected_file.modified_file_details,
+                old_unix_mode=expected_file.old_unix_mode,
+                new_unix_mode=expected_file.new_unix_mode,
+                binary=expected_file.binary,
+                deleted=expected_file.deleted,
+                insert_count=expected_file.insert_count,
+                delete_count=expected_file.delete_count,
+                data=expected_file.data)
+
     def test_parse_diff_with_index_range(self):
         """Testing Git diff parsing with an index range"""
         diff = (
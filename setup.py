@@ -424,6 +424,7 @@ setup(
         'saml': ['python3-saml'],
         'subvertpy': ['subvertpy'],
         'swift': ['django-storage-swift'],
+        'zstd': ['zstandard'],
     },
     include_package_data=True,
     zip_safe=False,